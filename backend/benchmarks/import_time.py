@@ -0,0 +1,126 @@
+"""Check the cold-start import cost of the backend app.
+
+Runs ``python -X importtime -c "import interfaces_backend.main"`` in a fresh
+interpreter (what ``phi-server`` and the desktop sidecar pay before serving),
+prints the slowest top-level imports and fails when the total exceeds the
+budget or when a heavy dependency that routers import on first use (OpenCV,
+lerobot, huggingface_hub, verda, paramiko, psutil, pyserial) is loaded at
+import time.
+
+    python benchmarks/import_time.py [--budget-ms 3000] [--runs 3] [--top 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+TARGET_MODULE = "interfaces_backend.main"
+# Imported by the routers only inside the handlers that need them.
+LAZY_MODULES = (
+    "cv2",
+    "lerobot",
+    "huggingface_hub",
+    "verda",
+    "paramiko",
+    "psutil",
+    "serial",
+    "torch",
+)
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """Parse ``-X importtime`` lines (``import time: self | cumulative | name``)."""
+    entries: list[ImportEntry] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append(ImportEntry(stripped, self_us, cumulative_us, depth))
+    return entries
+
+
+def measure(module: str = TARGET_MODULE) -> list[ImportEntry]:
+    env = os.environ.copy()
+    env.setdefault("COMM_EXPORTER_MODE", "noop")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise SystemExit(f"import {module} failed:\n{tail}")
+    return parse_importtime(result.stderr)
+
+
+def total_ms(entries: list[ImportEntry]) -> float:
+    return sum(entry.cumulative_us for entry in entries if entry.depth == 0) / 1000
+
+
+def eager_heavy_modules(entries: list[ImportEntry]) -> list[str]:
+    found = {
+        entry.module.split(".", 1)[0]
+        for entry in entries
+        if entry.module.split(".", 1)[0] in LAZY_MODULES
+    }
+    return sorted(found)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=3000.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # The first run warms the bytecode and filesystem caches; report the best.
+    runs = [measure() for _ in range(max(args.runs, 1))]
+    best = min(runs, key=total_ms)
+    elapsed_ms = total_ms(best)
+
+    print(f"{'module':<48} {'cumulative':>12}")
+    roots = sorted((entry for entry in best if entry.depth == 0), key=lambda e: e.cumulative_us, reverse=True)
+    for entry in roots[: args.top]:
+        print(f"{entry.module:<48} {entry.cumulative_us / 1000:>9.1f} ms")
+    print(f"\nimport {TARGET_MODULE}: {elapsed_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failures: list[str] = []
+    heavy = eager_heavy_modules(best)
+    if heavy:
+        failures.append(f"heavy modules imported at startup: {', '.join(heavy)}")
+    if elapsed_ms > args.budget_ms:
+        failures.append(f"import time {elapsed_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        raise SystemExit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Benchmark profile work done while creating recording/inference sessions.
+
+``uncached`` replays what session setup did per session before profiles were
+compiled: re-parse every profile YAML to resolve the profile, then call each
+profile extractor (cameras, arm namespaces, topic suffixes, joint names,
+camera aliases, bridge config), each re-rendering ``${...}`` settings.
+``compiled`` resolves through the profile registry and reads the same values
+from :func:`compile_profile`. ``compiled (snapshot)`` compiles a stored
+snapshot dict, which costs a content hash per lookup.
+
+    python benchmarks/profile_session_setup.py [--profiles 8] [--iterations 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+import yaml  # noqa: E402
+
+from interfaces_backend.services import vlabor_profiles  # noqa: E402
+from interfaces_backend.services.vlabor_profiles import (  # noqa: E402
+    build_inference_bridge_config,
+    build_inference_camera_aliases,
+    build_inference_joint_names,
+    compile_profile,
+    extract_arm_namespaces,
+    extract_camera_specs,
+    extract_recorder_topic_suffixes,
+    resolve_profile_spec,
+)
+
+_ARMS = ("follower_left", "follower_right")
+_CAMERAS = ("top", "side", "wrist_left", "wrist_right")
+
+
+def _profile_yaml(name: str) -> str:
+    profile = {
+        "profile": {
+            "name": name,
+            "description": f"benchmark profile {name}",
+            "variables": {f"{camera}_topic": f"/{camera}_camera/image_raw/compressed" for camera in _CAMERAS},
+            "lerobot": {
+                **{
+                    arm: {
+                        "namespace": arm,
+                        "topic": f"/{arm}/joint_states_single",
+                        "action_topic": f"/{arm}/joint_ctrl_single",
+                        "joints": ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"],
+                    }
+                    for arm in _ARMS
+                },
+                "cameras": [
+                    {
+                        "name": f"cam_{camera}",
+                        "source": f"{camera}_camera",
+                        "topic": f"${{{camera}_topic}}",
+                        "enabled": "${cameras_enabled}",
+                    }
+                    for camera in _CAMERAS
+                ],
+            },
+            "teleop": {
+                "follower_arms": [{"namespace": arm, "label": arm} for arm in _ARMS],
+                "topic_mappings": [{"src": f"/leader/{arm}", "dst": f"/{arm}/joint_ctrl_single"} for arm in _ARMS],
+            },
+            "dashboard": {"arms": [{"namespace": arm, "label": arm, "role": "follower"} for arm in _ARMS]},
+            "actions": [
+                {
+                    "type": "include",
+                    "package": "fv_camera",
+                    "launch": "camera.launch.py",
+                    "args": {"node_name": f"{camera}_camera"},
+                    "enabled": True,
+                }
+                for camera in _CAMERAS
+            ],
+        }
+    }
+    return yaml.safe_dump(profile, sort_keys=False)
+
+
+def _uncached_setup(profiles_dir: Path, profile_name: str) -> None:
+    snapshot = None
+    for path in sorted(profiles_dir.glob("*.yaml")):
+        payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        candidate = vlabor_profiles._build_profile_snapshot(path, payload)  # noqa: SLF001
+        if candidate["name"] == profile_name:
+            snapshot = candidate
+    assert snapshot is not None
+    extract_camera_specs(snapshot)
+    arm_namespaces = extract_arm_namespaces(snapshot)
+    extract_recorder_topic_suffixes(snapshot, arm_namespaces=arm_namespaces)
+    build_inference_joint_names(snapshot)
+    build_inference_camera_aliases(snapshot)
+    build_inference_bridge_config(snapshot)
+
+
+def _compiled_setup(profile_name: str) -> None:
+    compiled = compile_profile(resolve_profile_spec(profile_name))
+    _ = (
+        compiled.recorder_cameras,
+        compiled.arm_namespaces,
+        compiled.recorder_topic_suffixes,
+        compiled.inference_joint_names,
+        compiled.inference_camera_aliases,
+        compiled.inference_bridge_config,
+    )
+
+
+def _time(label: str, iterations: int, run: Callable[[], None]) -> None:
+    run()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    per_call_us = (time.perf_counter() - started) / iterations * 1e6
+    print(f"{label:>20} {per_call_us:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiles_dir = Path(tmp) / "profiles"
+        profiles_dir.mkdir()
+        for index in range(max(args.profiles, 1)):
+            (profiles_dir / f"profile_{index}.yaml").write_text(_profile_yaml(f"profile_{index}"), encoding="utf-8")
+        defaults_file = Path(tmp) / "vlabor_profiles.yaml"
+        defaults_file.write_text("defaults:\n  cameras_enabled: 'true'\n", encoding="utf-8")
+        os.environ["VLABOR_PROFILES_DIR"] = str(profiles_dir)
+        os.environ["VLABOR_DEFAULTS_FILE"] = str(defaults_file)
+
+        target = "profile_0"
+        snapshot = resolve_profile_spec(target).snapshot
+        print(f"{'mode':>20} {'us/session':>12}")
+        _time("uncached", args.iterations, lambda: _uncached_setup(profiles_dir, target))
+        _time("compiled", args.iterations, lambda: _compiled_setup(target))
+        _time("compiled (snapshot)", args.iterations, lambda: compile_profile(snapshot))
+        vlabor_profiles.get_vlabor_profile_registry().close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark SSE fan-out cost for 1/10/100 subscribers of one bus channel.
+
+Compares events that are re-encoded by every subscriber's stream (the
+previous behaviour) with bus events that carry a pre-encoded frame. The
+``encodes`` column counts ``json.dumps`` calls in the SSE streams; both modes
+additionally encode each event once upstream (the producer's change check,
+which the bus now reuses).
+
+A second table reports the memory the bus retains for one ``training.job``
+sized channel (``--points`` metric rows per split) after
+``--retained-events`` publishes: while subscribed, and once the channel has
+been unsubscribed for longer than the resume window.
+
+    python benchmarks/realtime_fanout.py [--events 200] [--retained-events 40] [--points 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+from typing import Any
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from starlette.requests import Request  # noqa: E402
+
+from interfaces_backend.services.realtime_events import _RESUME_TTL_S, RealtimeEventBus  # noqa: E402
+from interfaces_backend.utils import sse  # noqa: E402
+from interfaces_backend.utils.sse import WIRE_KEYS, sse_queue_response  # noqa: E402
+
+SUBSCRIBER_COUNTS = (1, 10, 100)
+
+
+def _request() -> Request:
+    async def receive() -> dict:
+        await asyncio.Event().wait()
+        return {}
+
+    scope = {"type": "http", "method": "GET", "path": "/bench", "query_string": b"", "headers": []}
+    return Request(scope, receive)
+
+
+def _payload(index: int) -> dict[str, Any]:
+    # Roughly the shape and size (~6 KB) of an operate.status snapshot.
+    return {
+        "vlabor_status": {
+            "status": "running",
+            "services": [{"name": f"svc-{n}", "state": "up", "uptime_s": index + n} for n in range(20)],
+        },
+        "inference_runner_status": {
+            "runner_status": {"active": True, "session_id": "bench", "queue_length": index % 7},
+            "gpu_host_status": {"status": "running", "detail": "x" * 256},
+        },
+        "operate_status": {
+            "arms": [{"id": f"arm-{n}", "joints": [float(j) for j in range(8)]} for n in range(4)],
+            "tick": index,
+        },
+    }
+
+
+async def _drain(response, count: int) -> None:
+    iterator = response.body_iterator
+    for _ in range(count):
+        await iterator.__anext__()
+    await iterator.aclose()
+
+
+async def _run(subscribers: int, events: int, pre_encoded: bool) -> tuple[float, int]:
+    bus = RealtimeEventBus()
+    published = [
+        bus._store_event(topic="bench", key="k", payload=_payload(i))[0]  # noqa: SLF001
+        for i in range(events)
+    ]
+    if not pre_encoded:
+        published = [{k: v for k, v in event.items() if k not in WIRE_KEYS} for event in published]
+
+    encodes = 0
+    real_dumps = json.dumps
+
+    def counting_dumps(*args, **kwargs):
+        nonlocal encodes
+        encodes += 1
+        return real_dumps(*args, **kwargs)
+
+    sse.json.dumps = counting_dumps
+    try:
+        responses = []
+        for _ in range(subscribers):
+            queue: asyncio.Queue = asyncio.Queue()
+            for event in published:
+                queue.put_nowait(event)
+            responses.append(sse_queue_response(_request(), queue, delta=False))
+        started = time.perf_counter()
+        await asyncio.gather(*(_drain(response, events) for response in responses))
+        elapsed = time.perf_counter() - started
+    finally:
+        sse.json.dumps = real_dumps
+    return elapsed, encodes
+
+
+def _metrics_payload(index: int, points: int) -> dict[str, Any]:
+    # Shape of a training.job snapshot: job detail plus train/val metric series.
+    def series(split: str) -> list[dict[str, Any]]:
+        return [
+            {
+                "step": step,
+                "loss": 1.0 / (step + 1),
+                "split": split,
+                "ts": f"2026-10-16T00:{step // 60 % 60:02d}:{step % 60:02d}",
+            }
+            for step in range(index, index + points)
+        ]
+
+    return {
+        "job_detail": {"job_id": "bench", "status": "running", "step": index},
+        "metrics": {"train": series("train"), "val": series("val")},
+    }
+
+
+async def _retained(events: int, points: int) -> list[tuple[str, int]]:
+    now = [0.0]
+    bus = RealtimeEventBus(clock=lambda: now[0])
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        subscription = bus.subscribe("training.job", "bench")
+        for index in range(events):
+            await bus.publish("training.job", "bench", _metrics_payload(index, points))
+            subscription.queue.get_nowait()
+        rows = [("subscribed", tracemalloc.get_traced_memory()[0] - before)]
+        subscription.close()
+        now[0] += _RESUME_TTL_S + 1.0
+        # Any bus activity trims channels idle past the resume window.
+        bus.subscribe("other", "k").close()
+        rows.append(("idle past resume TTL", tracemalloc.get_traced_memory()[0] - before))
+    finally:
+        tracemalloc.stop()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--retained-events", type=int, default=40)
+    parser.add_argument("--points", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'subscribers':>11} {'mode':>12} {'encodes':>8} {'total ms':>9} {'us/frame':>9}")
+    for subscribers in SUBSCRIBER_COUNTS:
+        for pre_encoded in (False, True):
+            elapsed, encodes = asyncio.run(_run(subscribers, args.events, pre_encoded))
+            mode = "pre-encoded" if pre_encoded else "per-stream"
+            per_frame_us = elapsed / (subscribers * args.events) * 1e6
+            print(f"{subscribers:>11} {mode:>12} {encodes:>8} {elapsed * 1000:>9.1f} {per_frame_us:>9.1f}")
+
+    print()
+    print(f"{'training.job channel':>22} {'retained MB':>12}")
+    for phase, retained in asyncio.run(_retained(args.retained_events, args.points)):
+        print(f"{phase:>22} {retained / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Count DB round-trips per training job lifecycle, before and after the repository.
+
+Replays the saves and loads one job goes through (create, deploy, log
+uploads, status checks, completion and instance cleanup) against an
+in-memory ``training_jobs`` table that counts requests. ``select+write`` is
+the previous ``_save_job`` (SELECT, then UPDATE or INSERT); ``repository``
+is ``TrainingJobRepository``. A JWT-expired retry doubled the cost of a
+legacy save; the repository retries the single write only.
+
+    python benchmarks/training_job_writes.py [--jobs 20] [--status-checks 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from percus_ai.db import reset_request_session, set_request_session  # noqa: E402
+
+from interfaces_backend.services.training_job_repository import (  # noqa: E402
+    TRAINING_JOB_COLUMNS,
+    TrainingJobRepository,
+)
+
+
+class _Response:
+    def __init__(self, data: list[dict]) -> None:
+        self.data = data
+
+
+class _Query:
+    def __init__(self, db: _Database, op: str, payload: dict | None = None) -> None:
+        self.db = db
+        self.op = op
+        self.payload = payload
+        self.job_id: str | None = None
+
+    def eq(self, _column: str, value: str) -> _Query:
+        self.job_id = value
+        return self
+
+    async def execute(self) -> _Response:
+        self.db.requests[self.op] += 1
+        rows = self.db.rows
+        if self.op == "select":
+            row = rows.get(self.job_id)
+            return _Response([dict(row)] if row else [])
+        if self.op in ("insert", "upsert"):
+            rows.setdefault(self.payload["job_id"], {}).update(self.payload)
+        elif self.op == "update" and self.job_id in rows:
+            rows[self.job_id].update(self.payload)
+        return _Response([])
+
+
+class _Table:
+    def __init__(self, db: _Database) -> None:
+        self.db = db
+
+    def select(self, _columns: str) -> _Query:
+        return _Query(self.db, "select")
+
+    def insert(self, payload: dict) -> _Query:
+        return _Query(self.db, "insert", payload)
+
+    def update(self, payload: dict) -> _Query:
+        return _Query(self.db, "update", payload)
+
+    def upsert(self, payload: dict, on_conflict: str) -> _Query:
+        return _Query(self.db, "upsert", payload)
+
+
+class _Database:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict] = {}
+        self.requests: Counter[str] = Counter()
+
+    def table(self, _name: str) -> _Table:
+        return _Table(self)
+
+
+Load = Callable[[str], Awaitable[dict]]
+Save = Callable[..., Awaitable[None]]
+
+
+def _legacy_store(db: _Database) -> tuple[Load, Save]:
+    async def load(job_id: str) -> dict:
+        return (await db.table("training_jobs").select("*").eq("job_id", job_id).execute()).data[0]
+
+    async def save(job_data: dict, *, wait: bool = True) -> None:
+        job_data["updated_at"] = datetime.now().isoformat()
+        record = {k: v for k, v in job_data.items() if k in TRAINING_JOB_COLUMNS}
+        job_id = record["job_id"]
+        table = db.table("training_jobs")
+        if (await table.select("job_id").eq("job_id", job_id).execute()).data:
+            update = {k: v for k, v in record.items() if k != "job_id"}
+            await table.update(update).eq("job_id", job_id).execute()
+            return
+        await table.insert({**record, "owner_user_id": "user-1"}).execute()
+
+    return load, save
+
+
+def _repository_store(db: _Database) -> tuple[Load, Save]:
+    async def get_client() -> _Database:
+        return db
+
+    repository = TrainingJobRepository(get_client=get_client)
+
+    async def load(job_id: str) -> dict:
+        return await repository.load(job_id)
+
+    async def save(job_data: dict, *, wait: bool = True) -> None:
+        job_data["updated_at"] = datetime.now().isoformat()
+        await repository.save(job_data, wait=wait)
+
+    return load, save
+
+
+async def _lifecycle(job_id: str, load: Load, save: Save, status_checks: int) -> None:
+    # create_job
+    job = {"job_id": job_id, "job_name": job_id, "status": "starting", "training_config": {"steps": 1000}}
+    job["created_at"] = datetime.now().isoformat()
+    await save(job)
+
+    # _run_training_deployment: IP, running, SSH user, remote dir, start
+    job = await load(job_id)
+    job["ip"] = "10.0.0.1"
+    await save(job, wait=False)
+    job["status"] = "deploying"
+    await save(job, wait=False)
+    job["ssh_user"] = "root"
+    await save(job, wait=False)
+    job["remote_base_dir"] = "/root/.physical-ai"
+    await save(job, wait=False)
+    job["status"] = "starting"
+    await save(job)
+
+    # log uploads and SSH target refreshes re-save unchanged columns
+    for _ in range(status_checks):
+        job["log_r2_prefix"] = f"training_logs/{job_id}/"
+        await save(job)
+
+    # _mark_job_completed, then instance cleanup (_update_cleanup_status x2)
+    job = await load(job_id)
+    job["status"] = "completed"
+    job["termination_reason"] = "REMOTE_EXIT"
+    job["completed_at"] = datetime.now().isoformat()
+    await save(job)
+    for cleanup_status in ("running", "done"):
+        job = await load(job_id)
+        job["cleanup_status"] = cleanup_status
+        await save(job)
+
+
+async def _run(mode: str, jobs: int, status_checks: int) -> Counter[str]:
+    db = _Database()
+    load, save = (_legacy_store if mode == "select+write" else _repository_store)(db)
+    token = set_request_session({"user_id": "user-1"})
+    try:
+        await asyncio.gather(*(_lifecycle(f"job-{n}", load, save, status_checks) for n in range(jobs)))
+    finally:
+        reset_request_session(token)
+    return db.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--status-checks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'mode':>13} {'selects':>8} {'writes':>7} {'round-trips/job':>16}")
+    for mode in ("select+write", "repository"):
+        requests = asyncio.run(_run(mode, args.jobs, args.status_checks))
+        writes = sum(count for op, count in requests.items() if op != "select")
+        per_job = sum(requests.values()) / args.jobs
+        print(f"{mode:>13} {requests['select']:>8} {writes:>7} {per_job:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Analytics API router."""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from pathlib import Path
 import shutil
 
@@ -17,6 +18,8 @@ from interfaces_backend.models.analytics import (
     StorageStatsResponse,
 )
 from interfaces_backend.models.comm_overhead import (
+    CommHistoryResponse,
+    CommIngestStatsResponse,
     CommPointResponse,
     CommSummaryResponse,
     CommTraceResponse,
@@ -314,6 +317,32 @@ async def get_comm_overhead_summary(
     return CommSummaryResponse(**payload)
 
 
+@router.get("/comm-overhead/history", response_model=CommHistoryResponse)
+async def get_comm_overhead_history(
+    start: datetime,
+    end: datetime | None = None,
+    session_id: str | None = None,
+    arm: str | None = None,
+):
+    """Exact comm-overhead metrics for an absolute time range (persisted history)."""
+    end = end or datetime.now(timezone.utc)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    if end <= start:
+        raise HTTPException(status_code=422, detail="end must be after start")
+    store = get_comm_overhead_store()
+    payload = await asyncio.to_thread(
+        store.get_history,
+        start_ns=int(start.timestamp() * 1_000_000_000),
+        end_ns=int(end.timestamp() * 1_000_000_000),
+        session_id=session_id,
+        arm=arm,
+    )
+    return CommHistoryResponse(**payload)
+
+
 @router.get("/comm-overhead/points/{point_id}", response_model=CommPointResponse)
 async def get_comm_overhead_point(
     point_id: str,
@@ -348,3 +377,9 @@ async def get_comm_overhead_trace(
         limit=max(limit, 1),
     )
     return CommTraceResponse(**payload)
+
+
+@router.get("/comm-overhead/ingest", response_model=CommIngestStatsResponse)
+async def get_comm_overhead_ingest_stats():
+    store = get_comm_overhead_store()
+    return CommIngestStatsResponse(**store.get_ingest_stats())
@@ -4,9 +4,6 @@ import platform as py_platform
 from pathlib import Path
 from typing import List
 
-import cv2
-from serial.tools import list_ports
-
 from fastapi import APIRouter, Query
 
 from interfaces_backend.models.hardware import (
@@ -22,6 +19,8 @@ router = APIRouter(prefix="/api/hardware", tags=["hardware"])
 
 def _detect_cameras(max_cameras: int = 10) -> List[CameraInfo]:
     """Detect cameras using OpenCV."""
+    import cv2
+
     cameras = []
 
     for camera_id in range(max_cameras):
@@ -64,6 +63,8 @@ def _detect_cameras(max_cameras: int = 10) -> List[CameraInfo]:
 
 def _detect_serial_ports() -> List[SerialPortInfo]:
     """Detect serial ports using pyserial."""
+    from serial.tools import list_ports
+
     ports = []
     system = py_platform.system()
 
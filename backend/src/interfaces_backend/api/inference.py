@@ -646,7 +646,7 @@ async def set_inference_task(request: InferenceSetTaskRequest):
         raise HTTPException(status_code=400, detail="task must not be empty")
 
     try:
-        applied_from_step = get_inference_runtime_manager().set_task(
+        applied_from_step = await get_inference_runtime_manager().set_task_async(
             session_id=request.session_id, task=task
         )
     except RuntimeError as exc:
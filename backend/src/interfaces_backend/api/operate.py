@@ -2,92 +2,27 @@
 
 from __future__ import annotations
 
-import json
-import os
-import socket
-import subprocess
-from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter
 
 from interfaces_backend.models.operate import OperateServiceStatus, OperateStatusResponse
-from interfaces_backend.utils.docker_compose import (
-    build_compose_command,
-    get_lerobot_compose_file,
-    get_vlabor_compose_file,
-    get_vlabor_env_file,
+from interfaces_backend.services.operate_status import (
+    ContainerState,
+    LinkState,
+    get_operate_status_monitor,
 )
-from interfaces_backend.utils.torch_info import get_torch_info
 
 router = APIRouter(prefix="/api/operate", tags=["operate"])
 
-_ZMQ_ENDPOINT = os.environ.get(
-    "INFERENCE_BRIDGE_ZMQ_ENDPOINT",
-    os.environ.get("RUNNER_BRIDGE_ZMQ_ENDPOINT", "tcp://127.0.0.1:5556"),
-)
-
-
-def _check_tcp(host: str, port: int, timeout: float = 0.6) -> tuple[bool, str]:
-    try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True, "ok"
-    except Exception as exc:  # noqa: BLE001 - surfaced to UI
-        return False, str(exc)
-
-
-def _parse_tcp_endpoint(endpoint: str) -> Optional[tuple[str, int]]:
-    if not endpoint:
-        return None
-    raw = endpoint
-    if raw.startswith("tcp://"):
-        raw = raw[len("tcp://") :]
-    raw = raw.split("/")[0]
-    if ":" not in raw:
-        return None
-    host, port_str = raw.rsplit(":", 1)
-    host = host.strip() or "127.0.0.1"
-    if host in ("0.0.0.0", "*"):
-        host = "127.0.0.1"
-    try:
-        port = int(port_str)
-    except ValueError:
-        return None
-    return host, port
-
-
-def _resolve_compose_for_service(service: str) -> tuple[list[str], Path]:
-    if service == "vlabor":
-        compose_file = get_vlabor_compose_file()
-        return build_compose_command(compose_file, get_vlabor_env_file()), compose_file
-    compose_file = get_lerobot_compose_file()
-    return build_compose_command(compose_file), compose_file
-
-
-def _get_compose_status(service: str) -> OperateServiceStatus:
-    compose_cmd, compose_file = _resolve_compose_for_service(service)
-    if not compose_file.exists():
-        return OperateServiceStatus(name=service, status="unknown", message=f"{compose_file} not found")
-
-    result = subprocess.run(
-        [*compose_cmd, "ps", "--format", "json", service],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return OperateServiceStatus(name=service, status="unknown", message=result.stderr.strip() or "compose error")
-
-    try:
-        data = json.loads(result.stdout)
-    except Exception:
-        return OperateServiceStatus(name=service, status="unknown", message="compose parse failed")
 
-    entry = None
-    if isinstance(data, list):
-        entry = data[0] if data else None
-    elif isinstance(data, dict):
-        entry = data
+def _compose_status(service: str, state: Optional[ContainerState]) -> OperateServiceStatus:
+    if state is None:
+        return OperateServiceStatus(name=service, status="unknown", message="waiting for container state")
+    if state.error:
+        return OperateServiceStatus(name=service, status="unknown", message=state.error)
 
+    entry = state.entry
     if not entry:
         return OperateServiceStatus(name=service, status="stopped", message="service not running")
 
@@ -113,27 +48,25 @@ def _get_compose_status(service: str) -> OperateServiceStatus:
     )
 
 
-def _build_network_status() -> OperateServiceStatus:
-    zenoh_ok, zenoh_msg = _check_tcp("127.0.0.1", 7447)
-    rosbridge_ok, rosbridge_msg = _check_tcp("127.0.0.1", 9090)
-
-    zmq_host_port = _parse_tcp_endpoint(_ZMQ_ENDPOINT)
-    if zmq_host_port:
-        zmq_ok, zmq_msg = _check_tcp(zmq_host_port[0], zmq_host_port[1])
-    else:
-        zmq_ok = False
-        zmq_msg = "invalid endpoint"
-
-    details = {
-        "zenoh": {"status": "running" if zenoh_ok else "stopped", "message": zenoh_msg},
-        "rosbridge": {"status": "running" if rosbridge_ok else "stopped", "message": rosbridge_msg},
-        "zmq": {"status": "running" if zmq_ok else "stopped", "message": zmq_msg, "endpoint": _ZMQ_ENDPOINT},
-    }
-
-    if zenoh_ok and rosbridge_ok and zmq_ok:
+def _build_network_status(links: dict[str, LinkState]) -> OperateServiceStatus:
+    details: dict[str, object] = {}
+    reachable: list[bool] = []
+    for name in ("zenoh", "rosbridge", "zmq"):
+        link = links.get(name)
+        if link is None:
+            details[name] = {"status": "unknown", "message": "not probed yet"}
+            reachable.append(False)
+            continue
+        detail: dict[str, Any] = {"status": "running" if link.ok else "stopped", "message": link.message}
+        if link.endpoint is not None:
+            detail["endpoint"] = link.endpoint
+        details[name] = detail
+        reachable.append(link.ok)
+
+    if all(reachable):
         status = "running"
         message = "all links reachable"
-    elif zenoh_ok or rosbridge_ok or zmq_ok:
+    elif any(reachable):
         status = "degraded"
         message = "partial connectivity"
     else:
@@ -143,8 +76,9 @@ def _build_network_status() -> OperateServiceStatus:
     return OperateServiceStatus(name="network", status=status, message=message, details=details)
 
 
-def _build_driver_status() -> OperateServiceStatus:
-    info = get_torch_info()
+def _build_driver_status(info: Optional[dict[str, Any]]) -> OperateServiceStatus:
+    if info is None:
+        return OperateServiceStatus(name="driver", status="unknown", message="detecting PyTorch")
 
     torch_version = info.get("torch_version")
     cuda_available = bool(info.get("cuda_available"))
@@ -181,11 +115,16 @@ def _build_driver_status() -> OperateServiceStatus:
 
 @router.get("/status", response_model=OperateStatusResponse)
 async def get_operate_status():
+    """Assemble operate status from the background monitor's cached component states."""
+    monitor = get_operate_status_monitor()
+    monitor.ensure_started()
+    await monitor.wait_ready()
+
     backend = OperateServiceStatus(name="backend", status="running", message="ok")
-    vlabor = _get_compose_status("vlabor")
-    lerobot = _get_compose_status("lerobot-ros2")
-    network = _build_network_status()
-    driver = _build_driver_status()
+    vlabor = _compose_status("vlabor", monitor.container_state("vlabor"))
+    lerobot = _compose_status("lerobot-ros2", monitor.container_state("lerobot-ros2"))
+    network = _build_network_status(monitor.link_states())
+    driver = _build_driver_status(monitor.driver_info())
 
     return OperateStatusResponse(
         backend=backend,
@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import socket
-import subprocess
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 
@@ -20,9 +17,14 @@ from interfaces_backend.models.profile import (
     VlaborProfileSummary,
     VlaborStatusResponse,
 )
+from interfaces_backend.services.operate_status import get_operate_status_monitor
+from interfaces_backend.services.ros2_topic_monitor import (
+    MONITOR_CONNECTING,
+    Ros2TopicMonitor,
+    get_ros2_topic_monitor,
+)
 from interfaces_backend.services.vlabor_profiles import (
-    extract_status_arm_specs,
-    extract_status_camera_specs,
+    compile_profile,
     get_active_profile_spec,
     list_vlabor_profiles,
     set_active_profile_spec,
@@ -32,14 +34,12 @@ from interfaces_backend.services.vlabor_runtime import (
     restart_vlabor,
     stream_vlabor_script,
 )
-from interfaces_backend.utils.docker_compose import (
-    build_compose_command,
-    get_vlabor_compose_file,
-    get_vlabor_env_file,
-)
 from percus_ai.db import get_current_user_id
 
 router = APIRouter(prefix="/api/profiles", tags=["profiles"])
+_script_tasks: set[asyncio.Task] = set()
+# How long status requests right after startup wait for the first topic list.
+_FIRST_TOPIC_LIST_WAIT_S = 1.5
 
 
 def _require_user_id() -> str:
@@ -49,36 +49,12 @@ def _require_user_id() -> str:
         raise HTTPException(status_code=401, detail="Login required") from exc
 
 
-def _get_vlabor_compose_cmd(*, strict: bool) -> tuple[list[str], Path]:
-    compose_file = get_vlabor_compose_file()
-    if strict and not compose_file.exists():
-        raise HTTPException(status_code=500, detail=f"{compose_file} not found")
-    return build_compose_command(compose_file, get_vlabor_env_file()), compose_file
-
-
 def _get_vlabor_status() -> dict:
-    compose_cmd, compose_file = _get_vlabor_compose_cmd(strict=False)
-    if not compose_file.exists():
-        return {"status": "unknown", "service": "vlabor"}
-
-    result = subprocess.run(
-        [*compose_cmd, "ps", "--format", "json", "vlabor"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return {"status": "unknown", "service": "vlabor"}
-    try:
-        data = json.loads(result.stdout)
-    except Exception:
-        return {"status": "unknown", "service": "vlabor"}
-
-    entry = None
-    if isinstance(data, list):
-        entry = data[0] if data else None
-    elif isinstance(data, dict):
-        entry = data
-
+    """VLAbor container status from the operate monitor's cached compose state."""
+    monitor = get_operate_status_monitor()
+    monitor.ensure_started()
+    state = monitor.container_state("vlabor")
+    entry = state.entry if state is not None else None
     if not entry:
         return {"status": "unknown", "service": "vlabor"}
 
@@ -105,23 +81,29 @@ def _get_vlabor_status() -> dict:
     }
 
 
-def _fetch_ros2_topics() -> list[str]:
-    compose_cmd, compose_file = _get_vlabor_compose_cmd(strict=False)
-    if not compose_file.exists():
-        return []
-    cmd = [
-        *compose_cmd,
-        "exec",
-        "-T",
-        "vlabor",
-        "bash",
-        "-lc",
-        "source /opt/ros/humble/setup.sh && ros2 topic list",
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-    if result.returncode != 0:
-        return []
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+def _rate_topic(connected_topic: str | None, topic_set: set[str]) -> str | None:
+    """Topic sampled for a device's message rate.
+
+    Camera drivers publish ``camera_info`` alongside every frame, so a
+    camera's rate is measured on that small sibling when it is published;
+    otherwise the frames themselves are counted.
+    """
+    if not connected_topic:
+        return None
+    for suffix in ("/image_raw/compressed", "/image_raw"):
+        if connected_topic.endswith(suffix):
+            camera_info = f"{connected_topic[: -len(suffix)]}/camera_info"
+            if camera_info in topic_set:
+                return camera_info
+            break
+    return connected_topic
+
+
+def _message_rate(monitor: Ros2TopicMonitor, topic: str | None) -> float | None:
+    if not topic:
+        return None
+    rate = monitor.message_rate(topic)
+    return round(rate, 1) if rate is not None else None
 
 
 async def _stream_script_to_websocket(
@@ -132,14 +114,18 @@ async def _stream_script_to_websocket(
     timeout: int,
 ) -> tuple[bool, str | None]:
     queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue()
-    loop = asyncio.get_running_loop()
 
-    def _run() -> None:
-        for event in stream_vlabor_script(script_name, args, timeout=timeout):
-            loop.call_soon_threadsafe(queue.put_nowait, event)
-        loop.call_soon_threadsafe(queue.put_nowait, None)  # sentinel
+    async def _run() -> None:
+        try:
+            async for event in stream_vlabor_script(script_name, args, timeout=timeout):
+                queue.put_nowait(event)
+        finally:
+            queue.put_nowait(None)  # sentinel
 
-    loop.run_in_executor(None, _run)
+    # The script keeps running if the websocket goes away mid-restart.
+    task = asyncio.create_task(_run())
+    _script_tasks.add(task)
+    task.add_done_callback(_script_tasks.discard)
 
     saw_complete = False
     exit_code = ""
@@ -202,7 +188,7 @@ async def set_active_profile(request: VlaborProfileSelectRequest):
     previous = await get_active_profile_spec()
     active = await set_active_profile_spec(request.profile_name)
     try:
-        await asyncio.to_thread(restart_vlabor, profile=active.name, strict=True)
+        await restart_vlabor(profile=active.name, strict=True)
     except VlaborCommandError as exc:
         rollback_messages: list[str] = []
         try:
@@ -212,11 +198,7 @@ async def set_active_profile(request: VlaborProfileSelectRequest):
             rollback_messages.append(f"failed to revert active profile: {rollback_exc}")
 
         try:
-            rollback_result = await asyncio.to_thread(
-                restart_vlabor,
-                profile=previous.name,
-                strict=False,
-            )
+            rollback_result = await restart_vlabor(profile=previous.name, strict=False)
             if rollback_result.returncode == 0:
                 rollback_messages.append("VLAbor runtime rollback succeeded")
             else:
@@ -242,11 +224,19 @@ async def set_active_profile(request: VlaborProfileSelectRequest):
 async def get_active_profile_status():
     _require_user_id()
     active = await get_active_profile_spec()
-    topics = _fetch_ros2_topics()
+    monitor = get_ros2_topic_monitor()
+    monitor.ensure_started()
+    if monitor.state() == MONITOR_CONNECTING:
+        # Right after startup: give rosbridge a moment to answer the first
+        # topic list instead of reporting every device as disconnected.
+        await asyncio.to_thread(monitor.wait_for_topics, _FIRST_TOPIC_LIST_WAIT_S)
+    topics = monitor.topics()
     topic_set = set(topics)
+    compiled = compile_profile(active)
+    rate_topics: list[str] = []
 
     cameras = []
-    for spec in extract_status_camera_specs(active.snapshot):
+    for spec in compiled.status_camera_specs:
         name = str(spec.get("name") or "").strip()
         if not name:
             continue
@@ -254,6 +244,9 @@ async def get_active_profile_status():
         if not expected_topics:
             expected_topics = [f"/{name}/image_raw", f"/{name}/image_raw/compressed"]
         connected_topic = next((item for item in expected_topics if item in topic_set), None)
+        rate_topic = _rate_topic(connected_topic, topic_set)
+        if rate_topic:
+            rate_topics.append(rate_topic)
         cameras.append(
             ProfileDeviceStatusCamera(
                 name=name,
@@ -261,12 +254,13 @@ async def get_active_profile_status():
                 enabled=bool(spec.get("enabled", True)),
                 connected=bool(connected_topic),
                 connected_topic=connected_topic,
+                message_rate_hz=_message_rate(monitor, rate_topic),
                 topics=expected_topics,
             )
         )
 
     arms = []
-    for spec in extract_status_arm_specs(active.snapshot):
+    for spec in compiled.status_arm_specs:
         namespace = str(spec.get("name") or "").strip()
         if not namespace:
             continue
@@ -274,6 +268,8 @@ async def get_active_profile_status():
         if not expected_topics:
             expected_topics = [f"/{namespace}/joint_states", f"/{namespace}/joint_states_single"]
         connected_topic = next((item for item in expected_topics if item in topic_set), None)
+        if connected_topic:
+            rate_topics.append(connected_topic)
         arms.append(
             ProfileDeviceStatusArm(
                 name=namespace,
@@ -282,9 +278,12 @@ async def get_active_profile_status():
                 enabled=bool(spec.get("enabled", True)),
                 connected=bool(connected_topic),
                 connected_topic=connected_topic,
+                message_rate_hz=_message_rate(monitor, connected_topic),
                 topics=expected_topics,
             )
         )
+    # Rates of newly connected devices show up from the next refresh on.
+    monitor.track_rates(rate_topics)
 
     return VlaborActiveProfileStatusResponse(
         profile_name=active.name,
@@ -292,6 +291,7 @@ async def get_active_profile_status():
         cameras=cameras,
         arms=arms,
         topics=topics,
+        topic_monitor=monitor.state(),
     )
 
 
@@ -1,16 +1,17 @@
 """Storage API router for datasets/models (DB-backed)."""
 
+from __future__ import annotations
+
 import asyncio
 import logging
 from pathlib import Path
 import shutil
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
-from huggingface_hub import HfApi, snapshot_download, upload_folder
 from postgrest.exceptions import APIError
 from pydantic import ValidationError
 
@@ -44,12 +45,14 @@ from interfaces_backend.services.session_manager import require_user_id
 from interfaces_backend.services.vlabor_profiles import resolve_profile_spec
 from percus_ai.db import get_supabase_async_client, upsert_with_owner
 from percus_ai.storage.hash import compute_directory_hash, compute_directory_size
-from percus_ai.storage.hub import download_model, ensure_hf_token, get_local_model_info, upload_model
 from percus_ai.storage.naming import validate_dataset_name, generate_dataset_id
 from percus_ai.storage.paths import get_datasets_dir, get_models_dir
 from percus_ai.storage.r2_db_sync import ModelSyncCancelledError, R2DBSyncService
-from lerobot.datasets.aggregate import aggregate_datasets
-from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+
+# lerobot and huggingface_hub are imported on first use to keep backend
+# start-up fast.
+if TYPE_CHECKING:
+    from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/storage", tags=["storage"])
@@ -277,6 +280,9 @@ async def _merge_datasets(
 
     report({"type": "start", "step": "aggregate", "message": "Aggregating datasets"})
     roots = [datasets_dir / dataset_id for dataset_id in source_dataset_ids]
+    from lerobot.datasets.aggregate import aggregate_datasets
+    from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+
     try:
         aggregate_datasets(
             repo_ids=source_dataset_ids,
@@ -424,6 +430,8 @@ async def get_dataset_playback(dataset_id: str):
     if not dataset_path.exists():
         raise HTTPException(status_code=404, detail=f"Local dataset not found: {dataset_id}")
 
+    from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+
     try:
         metadata = LeRobotDatasetMetadata(dataset_id, root=dataset_path)
         return _build_playback_response(dataset_id, metadata)
@@ -446,6 +454,8 @@ async def get_dataset_playback_video(dataset_id: str, video_key: str, episode_in
     if not dataset_path.exists():
         raise HTTPException(status_code=404, detail=f"Local dataset not found: {dataset_id}")
 
+    from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+
     try:
         metadata = LeRobotDatasetMetadata(dataset_id, root=dataset_path)
     except Exception as exc:
@@ -892,6 +902,9 @@ async def _import_dataset_from_huggingface(
     request: HuggingFaceDatasetImportRequest,
     progress_callback: Optional[Callable[[dict], None]] = None,
 ) -> HuggingFaceTransferResponse:
+    from huggingface_hub import snapshot_download
+    from percus_ai.storage.hub import ensure_hf_token
+
     if not ensure_hf_token():
         raise HTTPException(status_code=400, detail="HF_TOKEN is required")
     dataset_id = request.dataset_id or generate_dataset_id()
@@ -959,6 +972,8 @@ async def _import_model_from_huggingface(
     request: HuggingFaceModelImportRequest,
     progress_callback: Optional[Callable[[dict], None]] = None,
 ) -> HuggingFaceTransferResponse:
+    from percus_ai.storage.hub import download_model, ensure_hf_token, get_local_model_info
+
     if not ensure_hf_token():
         raise HTTPException(status_code=400, detail="HF_TOKEN is required")
     model_id = request.model_id or str(uuid.uuid4())
@@ -1026,6 +1041,9 @@ async def _export_dataset_to_huggingface(
     request: HuggingFaceExportRequest,
     progress_callback: Optional[Callable[[dict], None]] = None,
 ) -> HuggingFaceTransferResponse:
+    from huggingface_hub import HfApi, upload_folder
+    from percus_ai.storage.hub import ensure_hf_token
+
     if not ensure_hf_token():
         raise HTTPException(status_code=400, detail="HF_TOKEN is required")
     if progress_callback:
@@ -1089,6 +1107,8 @@ async def _export_model_to_huggingface(
     request: HuggingFaceExportRequest,
     progress_callback: Optional[Callable[[dict], None]] = None,
 ) -> HuggingFaceTransferResponse:
+    from percus_ai.storage.hub import ensure_hf_token, upload_model
+
     if not ensure_hf_token():
         raise HTTPException(status_code=400, detail="HF_TOKEN is required")
     if progress_callback:
@@ -1,19 +1,34 @@
-"""SSE endpoints for WebUI state streaming."""
+"""SSE endpoints for WebUI state streaming.
+
+Each channel (topic, key) has a preparer that makes sure the channel has
+current state (starting its shared producer if needed); topics with
+per-user data also have an access check. The per-topic routes and the
+multiplexed ``/mux`` stream both go through them.
+
+Access is checked before subscribing: subscribing replays the channel's
+latest event, and on ``/mux`` the open stream may send it at once.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from functools import partial
+
 from fastapi import APIRouter, HTTPException, Request, Response
 
 from interfaces_backend.api.inference import get_inference_runner_status
 from interfaces_backend.api.operate import get_operate_status
 from interfaces_backend.api.profiles import get_active_profile_status, get_vlabor_status
-from interfaces_backend.api.training import get_job, get_job_metrics
+from interfaces_backend.api.training import get_job, get_job_metrics, require_job
+from interfaces_backend.models.stream import StreamChannelRequest, StreamChannelResponse
 from interfaces_backend.services.dataset_lifecycle import UPLOAD_TOPIC, get_dataset_lifecycle
 from interfaces_backend.services.model_sync_jobs import (
     MODEL_SYNC_JOB_TOPIC,
     get_model_sync_jobs_service,
 )
-from interfaces_backend.services.realtime_events import get_realtime_event_bus
+from interfaces_backend.services.operate_status import get_operate_status_monitor
+from interfaces_backend.services.realtime_events import RealtimeSubscription, get_realtime_event_bus
+from interfaces_backend.services.realtime_mux import RealtimeMuxConnection, get_realtime_mux_hub
 from interfaces_backend.services.realtime_producers import (
     ProducerBuilder,
     get_realtime_producer_hub,
@@ -22,6 +37,7 @@ from interfaces_backend.services.recorder_status_stream import (
     RECORDING_STATUS_TOPIC,
     get_recorder_status_stream,
 )
+from interfaces_backend.services.ros2_topic_monitor import get_ros2_topic_monitor
 from interfaces_backend.services.session_control_events import (
     SESSION_CONTROL_TOPIC,
     normalize_session_kind,
@@ -31,7 +47,11 @@ from interfaces_backend.services.startup_operations import (
     STARTUP_OPERATION_TOPIC,
     get_startup_operations_service,
 )
-from interfaces_backend.utils.sse import sse_queue_response
+from interfaces_backend.services.training_deployment import (
+    TRAINING_DEPLOY_TOPIC,
+    get_training_deployments_service,
+)
+from interfaces_backend.utils.sse import event_stream_response, last_event_id, sse_queue_response
 from percus_ai.db import get_current_user_id
 
 router = APIRouter(prefix="/api/stream", tags=["stream"])
@@ -41,6 +61,11 @@ PROFILE_VLABOR_TOPIC = "profiles.vlabor"
 OPERATE_STATUS_TOPIC = "operate.status"
 TRAINING_JOB_TOPIC = "training.job"
 
+# (user_id, key) -> None; publishes current state for the channel.
+ChannelPreparer = Callable[[str, str], Awaitable[None]]
+# (user_id, key) -> None; raises HTTPException when the channel is not accessible.
+ChannelAccessCheck = Callable[[str, str], Awaitable[None]]
+
 
 def _require_user_id() -> str:
     try:
@@ -49,18 +74,28 @@ def _require_user_id() -> str:
         raise HTTPException(status_code=401, detail="Login required") from exc
 
 
-async def _stream_with_shared_producer(
-    request: Request,
+def _subscribe(request: Request, topic: str, key: str) -> RealtimeSubscription:
+    return get_realtime_event_bus().subscribe(topic, key, last_event_id=last_event_id(request))
+
+
+def _subscription_response(request: Request, subscription: RealtimeSubscription):
+    return sse_queue_response(
+        request,
+        subscription.queue,
+        on_close=subscription.close,
+        resume_event=subscription.resume_event,
+    )
+
+
+async def _ensure_shared_producer(
     *,
     topic: str,
     key: str,
     build_payload: ProducerBuilder,
     interval: float,
     idle_ttl: float = 30.0,
-):
-    bus = get_realtime_event_bus()
+) -> None:
     hub = get_realtime_producer_hub()
-    subscription = bus.subscribe(topic, key)
     await hub.publish_once(topic=topic, key=key, build_payload=build_payload)
     hub.ensure_polling(
         topic=topic,
@@ -69,85 +104,104 @@ async def _stream_with_shared_producer(
         interval=interval,
         idle_ttl=idle_ttl,
     )
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
-    )
 
 
-@router.get("/profiles/active")
-async def stream_active_profile(request: Request):
-    _require_user_id()
+_operate_refresh_hooked = False
+
+
+def _hook_operate_refresh() -> None:
+    """Rebuild operate/VLAbor channels as soon as a monitored component changes."""
+    global _operate_refresh_hooked
+    monitor = get_operate_status_monitor()
+    monitor.ensure_started()
+    if _operate_refresh_hooked:
+        return
+    _operate_refresh_hooked = True
+    hub = get_realtime_producer_hub()
+
+    def refresh(component: str) -> None:
+        hub.request_refresh(OPERATE_STATUS_TOPIC, "global")
+        if component == "vlabor":
+            hub.request_refresh(PROFILE_VLABOR_TOPIC, "global")
+
+    monitor.add_listener(refresh)
+
+
+_ros2_topic_refresh_hooked = False
+
+
+def _hook_ros2_topic_refresh() -> None:
+    """Rebuild the active-profile channel as soon as the ROS 2 topic set changes."""
+    global _ros2_topic_refresh_hooked
+    monitor = get_ros2_topic_monitor()
+    monitor.ensure_started()
+    if _ros2_topic_refresh_hooked:
+        return
+    _ros2_topic_refresh_hooked = True
+    hub = get_realtime_producer_hub()
+    monitor.add_listener(lambda: hub.request_refresh(PROFILE_ACTIVE_TOPIC, "global"))
+
+
+# --------------------------------------------------------------------------- #
+# Channel preparers
+# --------------------------------------------------------------------------- #
+async def _prepare_active_profile(_user_id: str, key: str) -> None:
+    # Device connections are pushed on topic set changes; the poll refreshes
+    # message rates.
+    _hook_ros2_topic_refresh()
 
     async def build_payload() -> dict:
         status = await get_active_profile_status()
         return status.model_dump(mode="json")
 
-    return await _stream_with_shared_producer(
-        request,
+    await _ensure_shared_producer(
         topic=PROFILE_ACTIVE_TOPIC,
-        key="global",
+        key=key,
         build_payload=build_payload,
         interval=5.0,
         idle_ttl=45.0,
     )
 
 
-@router.get("/profiles/vlabor")
-async def stream_vlabor_status(request: Request):
-    _require_user_id()
+async def _prepare_vlabor_status(_user_id: str, key: str) -> None:
+    _hook_operate_refresh()
 
     async def build_payload() -> dict:
         status = await get_vlabor_status()
         return status.model_dump(mode="json")
 
-    return await _stream_with_shared_producer(
-        request,
+    await _ensure_shared_producer(
         topic=PROFILE_VLABOR_TOPIC,
-        key="global",
+        key=key,
         build_payload=build_payload,
         interval=2.0,
         idle_ttl=45.0,
     )
 
 
-@router.get("/recording/sessions/{session_id}")
-async def stream_recording_session(request: Request, session_id: str):
-    _require_user_id()
+async def _prepare_recording_session(_user_id: str, session_id: str) -> None:
     recorder_stream = get_recorder_status_stream()
     recorder_stream.ensure_started()
-    bus = get_realtime_event_bus()
-    subscription = bus.subscribe(RECORDING_STATUS_TOPIC, session_id)
-    await bus.publish(
+    await get_realtime_event_bus().publish(
         RECORDING_STATUS_TOPIC,
         session_id,
         await recorder_stream.build_session_snapshot(session_id),
     )
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
-    )
 
 
-@router.get("/recording/sessions/{session_id}/upload-status")
-async def stream_recording_upload_status(request: Request, session_id: str):
-    _require_user_id()
-    bus = get_realtime_event_bus()
+async def _prepare_recording_upload_status(_user_id: str, session_id: str) -> None:
     lifecycle = get_dataset_lifecycle()
-    subscription = bus.subscribe(UPLOAD_TOPIC, session_id)
-    await bus.publish(UPLOAD_TOPIC, session_id, lifecycle.get_dataset_upload_status(session_id))
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
+    await get_realtime_event_bus().publish(
+        UPLOAD_TOPIC,
+        session_id,
+        lifecycle.get_dataset_upload_status(session_id),
     )
 
 
-@router.get("/operate/status")
-async def stream_operate_status(request: Request):
-    _require_user_id()
+async def _prepare_operate_status(_user_id: str, key: str) -> None:
+    # Components are cached by the operate monitor; the poll only picks up
+    # inference runner changes, container and link changes are pushed.
+    _hook_operate_refresh()
 
     async def build_payload() -> dict:
         vlabor_status = await get_vlabor_status()
@@ -160,74 +214,39 @@ async def stream_operate_status(request: Request):
             "operate_status": operate_status.model_dump(mode="json"),
         }
 
-    return await _stream_with_shared_producer(
-        request,
+    await _ensure_shared_producer(
         topic=OPERATE_STATUS_TOPIC,
-        key="global",
+        key=key,
         build_payload=build_payload,
         interval=2.0,
         idle_ttl=45.0,
     )
 
 
-@router.get("/startup/operations/{operation_id}")
-async def stream_startup_operation(request: Request, operation_id: str):
-    user_id = _require_user_id()
-    operations = get_startup_operations_service()
-    snapshot = operations.get(user_id=user_id, operation_id=operation_id)
-    bus = get_realtime_event_bus()
-    subscription = bus.subscribe(STARTUP_OPERATION_TOPIC, operation_id)
-    await bus.publish(STARTUP_OPERATION_TOPIC, operation_id, snapshot.model_dump(mode="json"))
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
+async def _prepare_startup_operation(user_id: str, operation_id: str) -> None:
+    snapshot = get_startup_operations_service().get(user_id=user_id, operation_id=operation_id)
+    await get_realtime_event_bus().publish(
+        STARTUP_OPERATION_TOPIC,
+        operation_id,
+        snapshot.model_dump(mode="json"),
     )
 
 
-@router.get("/storage/model-sync/jobs/{job_id}")
-async def stream_model_sync_job(request: Request, job_id: str):
-    user_id = _require_user_id()
-    jobs = get_model_sync_jobs_service()
-    snapshot = jobs.get(user_id=user_id, job_id=job_id)
-    bus = get_realtime_event_bus()
-    subscription = bus.subscribe(MODEL_SYNC_JOB_TOPIC, job_id)
-    await bus.publish(MODEL_SYNC_JOB_TOPIC, job_id, snapshot.model_dump(mode="json"))
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
-    )
+async def _prepare_model_sync_job(user_id: str, job_id: str) -> None:
+    snapshot = get_model_sync_jobs_service().get(user_id=user_id, job_id=job_id)
+    await get_realtime_event_bus().publish(MODEL_SYNC_JOB_TOPIC, job_id, snapshot.model_dump(mode="json"))
 
 
-@router.get("/sessions/{session_kind}/{session_id}/events")
-async def stream_session_control_events(request: Request, session_kind: str, session_id: str):
-    _require_user_id()
+async def _prepare_session_control(_user_id: str, key: str) -> None:
+    # Push-only channel; only validate the "<kind>:<session_id>" key.
+    session_kind, _, _session_id = key.partition(":")
     try:
-        normalized_kind = normalize_session_kind(session_kind)
+        normalize_session_kind(session_kind)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    normalized_session_id = session_id.strip() or "global"
 
-    bus = get_realtime_event_bus()
-    subscription = bus.subscribe(
-        SESSION_CONTROL_TOPIC,
-        session_control_channel_key(
-            session_kind=normalized_kind,
-            session_id=normalized_session_id,
-        ),
-    )
-    return sse_queue_response(
-        request,
-        subscription.queue,
-        on_close=subscription.close,
-    )
-
-
-@router.get("/training/jobs/{job_id}")
-async def stream_training_job(request: Request, job_id: str, limit: int = 2000):
-    _require_user_id()
 
+async def _prepare_training_job(_user_id: str, job_id: str, *, limit: int = 2000) -> None:
     async def build_payload() -> dict:
         job_detail = await get_job(job_id)
         metrics = await get_job_metrics(job_id=job_id, response=Response(), limit=limit)
@@ -236,11 +255,228 @@ async def stream_training_job(request: Request, job_id: str, limit: int = 2000):
             "metrics": metrics.model_dump(mode="json"),
         }
 
-    return await _stream_with_shared_producer(
-        request,
+    await _ensure_shared_producer(
         topic=TRAINING_JOB_TOPIC,
         key=job_id,
         build_payload=build_payload,
         interval=5.0,
         idle_ttl=60.0,
     )
+
+
+async def _prepare_training_deploy(_user_id: str, job_id: str) -> None:
+    snapshot = get_training_deployments_service().get(job_id)
+    if snapshot is not None:
+        await get_realtime_event_bus().publish(
+            TRAINING_DEPLOY_TOPIC,
+            job_id,
+            snapshot.model_dump(mode="json"),
+        )
+
+
+_CHANNEL_PREPARERS: dict[str, ChannelPreparer] = {
+    PROFILE_ACTIVE_TOPIC: _prepare_active_profile,
+    PROFILE_VLABOR_TOPIC: _prepare_vlabor_status,
+    RECORDING_STATUS_TOPIC: _prepare_recording_session,
+    UPLOAD_TOPIC: _prepare_recording_upload_status,
+    OPERATE_STATUS_TOPIC: _prepare_operate_status,
+    STARTUP_OPERATION_TOPIC: _prepare_startup_operation,
+    MODEL_SYNC_JOB_TOPIC: _prepare_model_sync_job,
+    SESSION_CONTROL_TOPIC: _prepare_session_control,
+    TRAINING_JOB_TOPIC: _prepare_training_job,
+    TRAINING_DEPLOY_TOPIC: _prepare_training_deploy,
+}
+
+
+def _get_preparer(topic: str) -> ChannelPreparer:
+    preparer = _CHANNEL_PREPARERS.get(topic)
+    if preparer is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported stream topic: {topic}")
+    return preparer
+
+
+# Access checks
+# --------------------------------------------------------------------------- #
+async def _check_startup_operation_access(user_id: str, operation_id: str) -> None:
+    get_startup_operations_service().get(user_id=user_id, operation_id=operation_id)
+
+
+async def _check_model_sync_job_access(user_id: str, job_id: str) -> None:
+    get_model_sync_jobs_service().get(user_id=user_id, job_id=job_id)
+
+
+async def _check_training_job_access(_user_id: str, job_id: str) -> None:
+    # Rows are filtered by the user's session; raises 404 when not visible.
+    await require_job(job_id)
+
+
+_CHANNEL_ACCESS_CHECKS: dict[str, ChannelAccessCheck] = {
+    STARTUP_OPERATION_TOPIC: _check_startup_operation_access,
+    MODEL_SYNC_JOB_TOPIC: _check_model_sync_job_access,
+    TRAINING_JOB_TOPIC: _check_training_job_access,
+    TRAINING_DEPLOY_TOPIC: _check_training_job_access,
+}
+
+
+async def _check_access(topic: str, user_id: str, key: str) -> None:
+    check = _CHANNEL_ACCESS_CHECKS.get(topic)
+    if check is not None:
+        await check(user_id, key)
+
+
+async def _stream_channel(
+    request: Request,
+    topic: str,
+    key: str,
+    *,
+    prepare: ChannelPreparer | None = None,
+):
+    user_id = _require_user_id()
+    preparer = prepare or _get_preparer(topic)
+    await _check_access(topic, user_id, key)
+    subscription = _subscribe(request, topic, key)
+    try:
+        await preparer(user_id, key)
+    except BaseException:
+        subscription.close()
+        raise
+    return _subscription_response(request, subscription)
+
+
+# --------------------------------------------------------------------------- #
+# Per-channel streams
+# --------------------------------------------------------------------------- #
+@router.get("/profiles/active")
+async def stream_active_profile(request: Request):
+    return await _stream_channel(request, PROFILE_ACTIVE_TOPIC, "global")
+
+
+@router.get("/profiles/vlabor")
+async def stream_vlabor_status(request: Request):
+    return await _stream_channel(request, PROFILE_VLABOR_TOPIC, "global")
+
+
+@router.get("/recording/sessions/{session_id}")
+async def stream_recording_session(request: Request, session_id: str):
+    return await _stream_channel(request, RECORDING_STATUS_TOPIC, session_id)
+
+
+@router.get("/recording/sessions/{session_id}/upload-status")
+async def stream_recording_upload_status(request: Request, session_id: str):
+    return await _stream_channel(request, UPLOAD_TOPIC, session_id)
+
+
+@router.get("/operate/status")
+async def stream_operate_status(request: Request):
+    return await _stream_channel(request, OPERATE_STATUS_TOPIC, "global")
+
+
+@router.get("/startup/operations/{operation_id}")
+async def stream_startup_operation(request: Request, operation_id: str):
+    return await _stream_channel(request, STARTUP_OPERATION_TOPIC, operation_id)
+
+
+@router.get("/storage/model-sync/jobs/{job_id}")
+async def stream_model_sync_job(request: Request, job_id: str):
+    return await _stream_channel(request, MODEL_SYNC_JOB_TOPIC, job_id)
+
+
+@router.get("/sessions/{session_kind}/{session_id}/events")
+async def stream_session_control_events(request: Request, session_kind: str, session_id: str):
+    try:
+        normalized_kind = normalize_session_kind(session_kind)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    normalized_session_id = session_id.strip() or "global"
+    key = session_control_channel_key(session_kind=normalized_kind, session_id=normalized_session_id)
+    return await _stream_channel(request, SESSION_CONTROL_TOPIC, key)
+
+
+@router.get("/training/jobs/{job_id}")
+async def stream_training_job(request: Request, job_id: str, limit: int = 2000):
+    return await _stream_channel(
+        request,
+        TRAINING_JOB_TOPIC,
+        job_id,
+        prepare=partial(_prepare_training_job, limit=limit),
+    )
+
+
+@router.get("/training/jobs/{job_id}/deploy")
+async def stream_training_deploy(request: Request, job_id: str):
+    return await _stream_channel(request, TRAINING_DEPLOY_TOPIC, job_id)
+
+
+# --------------------------------------------------------------------------- #
+# Multiplexed stream
+# --------------------------------------------------------------------------- #
+@router.get("/mux")
+async def stream_multiplexed(request: Request):
+    """One SSE connection for many channels.
+
+    The first frame is ``event: hello`` with the ``connection_id`` used to
+    add and remove channels. Channel events are ``data:`` frames of the form
+    ``{"topic", "key", "seq", "id", "payload"}`` where ``seq`` counts events
+    per channel; a single ``: ping`` heartbeat covers all channels.
+    """
+    user_id = _require_user_id()
+    hub = get_realtime_mux_hub()
+    connection = hub.open(user_id)
+
+    async def frames():
+        try:
+            async for frame in connection.frames(request.is_disconnected):
+                yield frame
+        finally:
+            hub.close(connection.connection_id)
+
+    return event_stream_response(frames())
+
+
+def _channel_response(
+    connection: RealtimeMuxConnection,
+    topic: str,
+    key: str,
+    subscribed: bool,
+) -> StreamChannelResponse:
+    return StreamChannelResponse(
+        connection_id=connection.connection_id,
+        topic=topic,
+        key=key,
+        subscribed=subscribed,
+        channels=connection.channels(),
+    )
+
+
+def _require_connection(connection_id: str, user_id: str) -> RealtimeMuxConnection:
+    connection = get_realtime_mux_hub().get(connection_id, user_id=user_id)
+    if connection is None:
+        raise HTTPException(status_code=404, detail=f"Stream connection not found: {connection_id}")
+    return connection
+
+
+@router.post("/mux/{connection_id}/channels", response_model=StreamChannelResponse)
+async def subscribe_multiplexed_channel(connection_id: str, request: StreamChannelRequest):
+    user_id = _require_user_id()
+    connection = _require_connection(connection_id, user_id)
+    preparer = _get_preparer(request.topic)
+    await _check_access(request.topic, user_id, request.key)
+    try:
+        added = connection.subscribe(request.topic, request.key, last_event_id=request.last_event_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if added:
+        try:
+            await preparer(user_id, request.key)
+        except BaseException:
+            connection.unsubscribe(request.topic, request.key)
+            raise
+    return _channel_response(connection, request.topic, request.key, True)
+
+
+@router.delete("/mux/{connection_id}/channels", response_model=StreamChannelResponse)
+async def unsubscribe_multiplexed_channel(connection_id: str, topic: str, key: str = "global"):
+    user_id = _require_user_id()
+    connection = _require_connection(connection_id, user_id)
+    connection.unsubscribe(topic, key)
+    return _channel_response(connection, topic, key, False)
@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Query
-import psutil
 
 from interfaces_backend.utils.torch_info import get_torch_info
 from interfaces_backend.models.system import (
@@ -135,6 +134,8 @@ async def get_resources():
     disk_used_gb = 0.0
     disk_percent = 0.0
 
+    import psutil
+
     # CPU
     cpu_percent = psutil.cpu_percent(interval=0.1)
     cpu_count = psutil.cpu_count() or 1
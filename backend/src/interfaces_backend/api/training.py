@@ -1,5 +1,7 @@
 """Training jobs API router."""
 
+from __future__ import annotations
+
 import asyncio
 import inspect
 import json
@@ -12,10 +14,10 @@ import threading
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Callable, Literal, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Literal, Optional
 
-from verda import VerdaClient
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -26,8 +28,6 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.responses import PlainTextResponse
-from supabase import create_async_client
-from supabase._async.client import AsyncClient
 
 from interfaces_backend.core.request_auth import (
     ACCESS_COOKIE_NAME,
@@ -43,6 +43,7 @@ from interfaces_backend.models.training import (
     JobLogsResponse,
     JobProgressResponse,
     JobActionResponse,
+    JobStatus,
     JobStatusCheckResponse,
     JobStatusUpdate,
     JobCreateRequest,
@@ -75,6 +76,20 @@ from interfaces_backend.models.training import (
     RemoteCheckpointUploadRequest,
     RemoteCheckpointUploadResponse,
 )
+from interfaces_backend.services.ssh_connection_pool import SSHLease, get_ssh_connection_pool
+from interfaces_backend.services.training_deployment import (
+    DEPLOY_STEPS,
+    DeploymentCheckpoint,
+    DeploymentStepError,
+    TrainingDeployment,
+    get_training_deployments_service,
+    run_blocking,
+)
+from interfaces_backend.services.training_job_repository import (
+    TrainingJobPage,
+    TrainingJobRepository,
+)
+from interfaces_backend.services.training_status_reconciler import TrainingStatusReconciler
 from percus_ai.storage import get_project_root, get_models_dir
 from percus_ai.db import (
     get_current_user_id,
@@ -84,8 +99,13 @@ from percus_ai.db import (
     set_request_session,
     upsert_with_owner,
 )
-from percus_ai.training.ssh.client import SSHConnection
-from percus_ai.training.ssh.executor import RemoteExecutor, run_remote_command
+
+# verda, supabase and the SSH stack (paramiko) are imported on first use to
+# keep backend start-up fast; the names below are for annotations only.
+if TYPE_CHECKING:
+    from percus_ai.training.ssh.client import SSHConnection
+    from supabase._async.client import AsyncClient
+    from verda import VerdaClient
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +130,8 @@ async def _get_service_db_client() -> Optional[AsyncClient]:
 
     async with _service_client_lock:
         if _service_client is None:
+            from supabase import create_async_client
+
             _service_client = await create_async_client(supabase_url, service_key)
         return _service_client
 
@@ -125,6 +147,13 @@ router = APIRouter(prefix="/api/training", tags=["training"])
 
 # Thread pool for WebSocket operations
 _executor = ThreadPoolExecutor(max_workers=2)
+# Status reconciliation: Verda listing and per-job SSH checks.
+RECONCILE_MAX_CONCURRENCY = int(os.environ.get("TRAINING_RECONCILE_MAX_CONCURRENCY", "8"))
+RECONCILE_JOB_TIMEOUT_SEC = 45
+_reconcile_executor = ThreadPoolExecutor(
+    max_workers=RECONCILE_MAX_CONCURRENCY,
+    thread_name_prefix="training-reconcile",
+)
 
 DB_TABLE = "training_jobs"
 
@@ -319,7 +348,10 @@ class TrainingJobRealtimeManager:
         job_id, status = _extract_status_update(payload)
         if not job_id or not status:
             return
+        self.publish_status(job_id, status)
 
+    def publish_status(self, job_id: str, status: str) -> None:
+        """Deliver a status change to the job's subscribers (any thread)."""
         with self._subscribers_lock:
             subscribers = [
                 subscriber
@@ -349,6 +381,21 @@ def _get_training_job_realtime_manager() -> TrainingJobRealtimeManager:
     return _training_job_realtime_manager
 
 
+_training_job_repository: Optional[TrainingJobRepository] = None
+
+
+def _get_training_job_repository() -> TrainingJobRepository:
+    global _training_job_repository
+    if _training_job_repository is None:
+        _training_job_repository = TrainingJobRepository(
+            get_client=get_supabase_async_client,
+            get_fallback_client=_get_service_db_client,
+            use_fallback=_is_jwt_expired_error,
+            table=DB_TABLE,
+        )
+    return _training_job_repository
+
+
 # Remote scripts directory - contains setup_env.sh, run_training.sh, entry.py, etc.
 # These scripts are deployed to remote instances for training
 REMOTE_SCRIPTS_DIR = (
@@ -387,6 +434,8 @@ def _create_ssh_connection(
         raise RuntimeError(f"SSH鍵が見つかりません: {key_path}")
     if not key_path.is_file():
         raise RuntimeError(f"SSH鍵パスが不正です: {key_path}")
+    from percus_ai.training.ssh.client import SSHConnection
+
     conn = SSHConnection(host=ip, user=user, private_key_path=key_path)
     try:
         conn.connect(timeout_sec=timeout)
@@ -775,6 +824,8 @@ def _get_verda_client() -> Optional[VerdaClient]:
     if not client_id or not client_secret:
         return None
 
+    from verda import VerdaClient
+
     return VerdaClient(client_id, client_secret)
 
 
@@ -1046,6 +1097,27 @@ def _check_instance_via_api(instance_id: str) -> Optional[str]:
         return None
 
 
+def _fetch_instance_statuses() -> Optional[dict[str, str]]:
+    """Fetch the status of every Verda instance with one list call.
+
+    Returns:
+        Mapping of instance ID to status, or None if the API is unavailable
+    """
+    client = _get_verda_client()
+    if not client:
+        return None
+
+    try:
+        instances = client.instances.get()
+    except Exception as exc:
+        logger.warning("Failed to list Verda instances: %s", exc)
+        return None
+    return {
+        str(getattr(instance, "id", "")): str(getattr(instance, "status", "") or "")
+        for instance in instances
+    }
+
+
 async def _refresh_job_status_from_instance(job_data: dict) -> Optional[str]:
     instance_id = job_data.get("instance_id")
     if not instance_id:
@@ -1149,116 +1221,18 @@ async def _refresh_job_ssh_target_if_needed(job_data: dict) -> dict:
 
 async def _load_job(job_id: str, include_deleted: bool = False) -> Optional[dict]:
     """Load job from DB."""
-    async def _fetch_with(client: AsyncClient) -> list[dict]:
-        response = await client.table(DB_TABLE).select("*").eq("job_id", job_id).execute()
-        return response.data or []
-
-    client = await get_supabase_async_client()
-    try:
-        records = await _fetch_with(client)
-    except Exception as exc:
-        if not _is_jwt_expired_error(exc):
-            raise
-        service_client = await _get_service_db_client()
-        if service_client is None:
-            raise
-        logger.warning(
-            "JWT expired while loading training job %s; retrying with service key",
-            job_id,
-        )
-        records = await _fetch_with(service_client)
+    return await _get_training_job_repository().load(job_id, include_deleted=include_deleted)
 
-    if not records:
-        return None
-    record = records[0]
-    if not include_deleted and record.get("deleted_at"):
-        return None
-    return record
 
+async def _save_job(job_data: dict, *, wait: bool = True) -> None:
+    """Upsert job into DB.
 
-async def _save_job(job_data: dict) -> None:
-    """Upsert job into DB."""
+    Only changed columns are written and concurrent saves of a job are
+    coalesced; ``wait=False`` queues the save (write-behind) for progress
+    updates that don't need to be durable before continuing.
+    """
     job_data["updated_at"] = datetime.now().isoformat()
-
-    fixed_fields = {
-        "job_id",
-        "job_name",
-        "model_id",
-        "policy_type",
-        "dataset_id",
-        "profile_instance_id",
-        "profile_snapshot",
-        "status",
-        "failure_reason",
-        "termination_reason",
-        "cleanup_status",
-        "deleted_at",
-        "training_config",
-        "author",
-        "base_checkpoint",
-        "notes",
-        "instance_id",
-        "ip",
-        "mode",
-        "ssh_user",
-        "ssh_private_key",
-        "remote_base_dir",
-        "checkpoint_repo_id",
-        "gpu_model",
-        "gpus_per_instance",
-        "exit_code",
-        "completed_at",
-        "created_at",
-        "updated_at",
-        "started_at",
-        "summary",
-        "early_stopping",
-    }
-    record = {k: job_data.get(k) for k in fixed_fields if k in job_data}
-    job_id = record.get("job_id")
-    if not job_id:
-        raise ValueError("Missing job_id in record")
-
-    owner_user_id = (
-        str(job_data.get("owner_user_id") or "").strip()
-        or str((get_supabase_session() or {}).get("user_id") or "").strip()
-    )
-
-    async def _upsert_with(client: AsyncClient) -> None:
-        existing = (
-            await client.table(DB_TABLE).select("job_id").eq("job_id", job_id).execute()
-        ).data or []
-        if existing:
-            update_record = {
-                k: v
-                for k, v in record.items()
-                if k not in {"job_id", "owner_user_id"}
-            }
-            if update_record:
-                await client.table(DB_TABLE).update(update_record).eq("job_id", job_id).execute()
-            return
-
-        insert_record = dict(record)
-        if "owner_user_id" not in insert_record or not insert_record.get("owner_user_id"):
-            if not owner_user_id:
-                raise ValueError("owner_user_id is required for new training job insert")
-            insert_record["owner_user_id"] = owner_user_id
-        await client.table(DB_TABLE).insert(insert_record).execute()
-
-    client = await get_supabase_async_client()
-    try:
-        await _upsert_with(client)
-    except Exception as exc:
-        if not _is_jwt_expired_error(exc):
-            raise
-        service_client = await _get_service_db_client()
-        if service_client is None:
-            raise
-        logger.warning(
-            "JWT expired while saving training job %s; retrying with service key",
-            job_id,
-        )
-        await _upsert_with(service_client)
+    await _get_training_job_repository().save(job_data, wait=wait)
 
 
 def _run_async(coro):
@@ -1528,40 +1502,30 @@ async def _mark_job_completed(
     await _archive_job_metrics(job_id)
 
 
-async def _list_jobs(days: int = 365) -> list[dict]:
-    """List jobs from DB.
+async def _list_jobs_page(
+    days: int = 365,
+    *,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    statuses: Optional[list[str]] = None,
+) -> TrainingJobPage:
+    """List jobs from DB, newest first (list-view columns only).
 
     Args:
         days: Return jobs from past N days.
               Running/starting jobs are always included.
+        limit: Page size; None returns every job.
+        cursor: next_cursor of the previous page.
+        statuses: Only return jobs with these statuses.
     """
-    client = await get_supabase_async_client()
-    response = (
-        await client.table(DB_TABLE).select("*").is_("deleted_at", "null").execute()
-    )
-    jobs = response.data or []
-
     cutoff_date = datetime.now() - timedelta(days=days)
-    filtered = []
-    for job in jobs:
-        status = job.get("status")
-        if status in ("running", "starting"):
-            filtered.append(job)
-            continue
-        created_at = job.get("created_at")
-        if not created_at:
-            continue
-        try:
-            created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            if created.tzinfo:
-                created = created.replace(tzinfo=None)
-            if created >= cutoff_date:
-                filtered.append(job)
-        except Exception:
-            continue
-
-    filtered.sort(key=lambda j: j.get("created_at", ""), reverse=True)
-    return filtered
+    return await _get_training_job_repository().list_page(
+        limit=limit,
+        cursor=cursor,
+        created_since=cutoff_date.isoformat(),
+        statuses=statuses,
+        always_include_statuses=("running", "starting"),
+    )
 
 
 # --- SSH utilities for job monitoring (uses SSHConnection) ---
@@ -1654,7 +1618,7 @@ def _list_remote_checkpoint_dirs(job_data: dict) -> tuple[list[str], str]:
         names = [line.strip() for line in stdout.splitlines() if line.strip().isdigit()]
         return names, checkpoint_root
     finally:
-        conn.disconnect()
+        conn.release()
 
 
 def _register_job_for_checkpoint_if_needed(
@@ -1834,7 +1798,7 @@ async def _upload_selected_remote_checkpoint_with_progress(
                     detail=f"Checkpoint upload failed: {msg}",
                 )
         finally:
-            conn.disconnect()
+            conn.release()
             if temp_dir_obj is not None:
                 temp_dir_obj.cleanup()
     else:
@@ -1933,15 +1897,16 @@ async def _upload_selected_remote_checkpoint_with_progress(
 
 def _get_ssh_connection_for_job(
     job_data: dict, timeout: int = 30
-) -> Optional[SSHConnection]:
-    """Get SSHConnection for job instance.
+) -> Optional[SSHLease]:
+    """Borrow a pooled SSH connection to the job instance.
 
     Args:
         job_data: Job data dict containing ip, ssh_user, ssh_private_key
-        timeout: Connection timeout in seconds
+        timeout: Connection timeout in seconds (only for new handshakes)
 
     Returns:
-        Connected SSHConnection or None if connection fails
+        Lease on a connected SSHConnection (call ``release()`` when done)
+        or None if connection fails
     """
     ip = job_data.get("ip")
     if not ip:
@@ -1958,39 +1923,32 @@ def _get_ssh_connection_for_job(
         )
         return None
 
-    last_error: Optional[Exception] = None
-    for user in users:
-        for key_path in key_candidates:
-            try:
-                conn = SSHConnection(
-                    host=ip,
-                    user=user,
-                    private_key_path=key_path,
-                )
-                conn.connect(timeout_sec=timeout)
-                return conn
-            except SystemExit as exc:
-                last_error = exc
-            except Exception as exc:
-                last_error = exc
-
-    if last_error:
+    try:
+        return get_ssh_connection_pool().acquire(
+            ip,
+            [(user, str(key_path)) for user in users for key_path in key_candidates],
+            job_id=job_data.get("job_id"),
+            timeout=timeout,
+        )
+    except Exception as exc:
         logger.warning(
             "SSH connection failed for job %s (ip=%s, users=%s, keys=%s): %s",
             job_data.get("job_id"),
             ip,
             ",".join(users),
             ",".join(str(p) for p in key_candidates),
-            last_error,
-        )
-        logger.debug(
-            "Failed to connect SSH for job %s with all key/user candidates: %s",
-            job_data.get("job_id"),
-            last_error,
+            exc,
         )
     return None
 
 
+# One round-trip: "running" (training), "starting" (setup) or "stopped".
+REMOTE_STATUS_COMMAND = (
+    f"tmux has-session -t {TMUX_TRAIN_SESSION_NAME} 2>/dev/null && echo 'running' "
+    f"|| (tmux has-session -t {TMUX_SETUP_SESSION_NAME} 2>/dev/null && echo 'starting' || echo 'stopped')"
+)
+
+
 def _check_remote_status(job_data: dict) -> str:
     """Check remote process status via SSH."""
     conn = _get_ssh_connection_for_job(job_data)
@@ -1998,22 +1956,14 @@ def _check_remote_status(job_data: dict) -> str:
         return "unreachable"
 
     try:
-        train_cmd = f"tmux has-session -t {TMUX_TRAIN_SESSION_NAME} 2>/dev/null && echo 'running' || echo 'stopped'"
-        exit_code, stdout, stderr = conn.exec_command(train_cmd)
-        train_status = stdout.strip()
-        if train_status == "running":
-            return "running"
-
-        setup_cmd = f"tmux has-session -t {TMUX_SETUP_SESSION_NAME} 2>/dev/null && echo 'running' || echo 'stopped'"
-        exit_code, stdout, stderr = conn.exec_command(setup_cmd)
-        setup_status = stdout.strip()
-        if setup_status == "running":
-            return "starting"
-        return "stopped"
+        exit_code, stdout, stderr = conn.exec_command(REMOTE_STATUS_COMMAND)
+        status = stdout.strip()
+        return status if status in ("running", "starting", "stopped") else "error"
     except Exception:
+        conn.discard()
         return "error"
     finally:
-        conn.disconnect()
+        conn.release()
 
 
 def _get_remote_logs(
@@ -2035,7 +1985,7 @@ def _get_remote_logs(
     except Exception:
         return None
     finally:
-        conn.disconnect()
+        conn.release()
 
 
 def _get_remote_log_file(
@@ -2060,7 +2010,7 @@ def _get_remote_log_file(
     except Exception:
         return None
     finally:
-        conn.disconnect()
+        conn.release()
 
 
 def _should_try_r2_first(job_data: dict) -> bool:
@@ -2123,11 +2073,11 @@ async def _upload_remote_logs_to_r2(conn: SSHConnection, job_data: dict) -> None
         remote_path = f"{remote_run_dir}/{log_name}"
         local_path = Path("/tmp") / f"{job_id}_{log_name}"
         try:
-            conn.download_file(remote_path, local_path)
+            await run_blocking(conn.download_file, remote_path, local_path)
         except Exception as e:
             logger.warning(f"Failed to download log {remote_path}: {e}")
             continue
-        _upload_log_file_to_r2(r2, local_path, job_id)
+        await run_blocking(_upload_log_file_to_r2, r2, local_path, job_id)
         try:
             local_path.unlink()
         except Exception:
@@ -2273,7 +2223,7 @@ def _stop_remote_job(job_data: dict) -> bool:
     except Exception:
         return False
     finally:
-        conn.disconnect()
+        conn.release()
 
 
 # --- API Endpoints ---
@@ -3055,23 +3005,42 @@ async def websocket_verda_storage(websocket: WebSocket):
 
 
 @router.get("/jobs", response_model=JobListResponse)
-async def list_jobs(days: int = Query(365, ge=1, le=365)):
-    """List training jobs.
+async def list_jobs(
+    days: int = Query(365, ge=1, le=365),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    status: Optional[list[JobStatus]] = Query(None),
+):
+    """List training jobs, newest first.
 
     Args:
         days: Return jobs from past N days (running jobs always included)
+        limit: Page size; omit to return every job
+        cursor: next_cursor of the previous page
+        status: Only return jobs with these statuses (repeatable)
     """
-    jobs_data = await _list_jobs(days)
-    jobs = [JobInfo(**j) for j in jobs_data]
-    return JobListResponse(jobs=jobs, total=len(jobs))
+    _get_status_reconciler().ensure_started()
+    statuses = [value.value for value in status] if status else None
+    try:
+        page = await _list_jobs_page(days, limit=limit, cursor=cursor, statuses=statuses)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    jobs = [JobInfo(**j) for j in page.jobs]
+    return JobListResponse(jobs=jobs, total=len(jobs), next_cursor=page.next_cursor)
 
 
-@router.get("/jobs/{job_id}", response_model=JobDetailResponse)
-async def get_job(job_id: str):
-    """Get job details with remote status."""
+async def require_job(job_id: str) -> dict:
+    """Load a job visible to the current user; 404 otherwise."""
     job_data = await _load_job(job_id)
     if not job_data:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job_data
+
+
+@router.get("/jobs/{job_id}", response_model=JobDetailResponse)
+async def get_job(job_id: str):
+    """Get job details with remote status."""
+    job_data = await require_job(job_id)
 
     if job_data.get("status") in ("running", "starting", "deploying"):
         await _refresh_job_status_from_instance(job_data)
@@ -3803,107 +3772,154 @@ async def check_all_jobs_status():
 
     This will connect to Verda API and SSH to verify job status.
     """
-    jobs_data = await _list_jobs()
-    updates = []
-    checked = 0
+    reconciler = _get_status_reconciler()
+    reconciler.ensure_started()
+    return await reconciler.reconcile()
 
-    for job_data in jobs_data:
-        if job_data.get("status") not in ("running", "starting"):
-            continue
 
-        checked += 1
-        old_status = job_data["status"]
-        job_id = job_data["job_id"]
-        instance_id = job_data.get("instance_id")
+async def _reconcile_running_jobs() -> JobStatusCheckResponse:
+    """Reconcile running jobs with their instances and training processes.
 
-        # First check via Verda API
-        instance_status = _check_instance_via_api(instance_id) if instance_id else None
+    Instance statuses come from one Verda list call; jobs are then checked
+    concurrently (bounded by RECONCILE_MAX_CONCURRENCY, each within
+    RECONCILE_JOB_TIMEOUT_SEC). Status changes are pushed to realtime
+    subscribers.
+    """
+    jobs_data = (await _list_jobs_page(statuses=["running", "starting"])).jobs
+    if not jobs_data:
+        return JobStatusCheckResponse(updates=[], checked_count=0)
 
-        if instance_status is None:
-            # Instance not found (deleted or API error)
-            job_data["status"] = "terminated"
-            job_data["termination_reason"] = "INSTANCE_NOT_FOUND"
-            job_data["completed_at"] = datetime.now().isoformat()
-            await _save_job(job_data)
-            await _archive_job_metrics(job_id)
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status="terminated",
-                    instance_status="not_found",
-                    reason="Instance not found (deleted)",
-                )
-            )
-            continue
+    loop = asyncio.get_running_loop()
+    instance_statuses = await loop.run_in_executor(_reconcile_executor, _fetch_instance_statuses)
+    semaphore = asyncio.Semaphore(RECONCILE_MAX_CONCURRENCY)
 
-        if instance_status in ("offline", "error", "discontinued"):
-            # Instance terminated (spot preemption, error, etc.)
-            job_data["status"] = "terminated"
-            job_data["termination_reason"] = "INSTANCE_TERMINATED"
-            job_data["completed_at"] = datetime.now().isoformat()
-            await _save_job(job_data)
-            await _archive_job_metrics(job_id)
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status="terminated",
-                    instance_status=instance_status,
-                    reason=f"Instance is {instance_status}",
+    async def reconcile(job_data: dict) -> JobStatusUpdate:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    _reconcile_job_status(job_data, instance_statuses),
+                    RECONCILE_JOB_TIMEOUT_SEC,
                 )
+            except asyncio.TimeoutError:
+                reason = f"Status check timed out ({RECONCILE_JOB_TIMEOUT_SEC}s)"
+            except Exception as exc:
+                logger.warning("Status check failed for job %s: %s", job_data.get("job_id"), exc)
+                reason = f"Status check failed: {exc}"
+            return JobStatusUpdate(
+                job_id=job_data["job_id"],
+                old_status=job_data["status"],
+                new_status=job_data["status"],
+                instance_status=(instance_statuses or {}).get(job_data.get("instance_id"), "unknown"),
+                reason=reason,
             )
-            continue
 
-        if instance_status != "running":
-            # Still provisioning
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status=old_status,
-                    instance_status=instance_status,
-                    reason=f"Instance is {instance_status}",
-                )
-            )
-            continue
+    updates = await asyncio.gather(*(reconcile(job_data) for job_data in jobs_data))
 
-        # Instance is running, check training process via SSH
-        remote_status = _check_remote_status(job_data)
-
-        if remote_status == "stopped":
-            await _mark_job_completed(job_id, termination_reason="REMOTE_EXIT")
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status="completed",
-                    instance_status=instance_status,
-                    reason="Training process finished",
-                )
-            )
-        elif remote_status == "unreachable":
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status=old_status,
-                    instance_status=instance_status,
-                    reason="Could not connect via SSH",
-                )
-            )
-        else:
-            updates.append(
-                JobStatusUpdate(
-                    job_id=job_id,
-                    old_status=old_status,
-                    new_status=old_status,
-                    instance_status=instance_status,
-                    reason=f"Process status: {remote_status}",
-                )
-            )
+    realtime_manager = _get_training_job_realtime_manager()
+    for update in updates:
+        if update.new_status != update.old_status:
+            realtime_manager.publish_status(update.job_id, update.new_status)
+
+    return JobStatusCheckResponse(updates=list(updates), checked_count=len(jobs_data))
+
+
+async def _reconcile_job_status(
+    job_data: dict, instance_statuses: Optional[dict[str, str]]
+) -> JobStatusUpdate:
+    old_status = job_data["status"]
+    job_id = job_data["job_id"]
+    instance_id = job_data.get("instance_id")
+
+    if instance_statuses is None:
+        # Verda API unavailable: leave the job as is rather than terminating it.
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status=old_status,
+            instance_status="unknown",
+            reason="Verda API unavailable",
+        )
 
-    return JobStatusCheckResponse(updates=updates, checked_count=checked)
+    instance_status = instance_statuses.get(instance_id) if instance_id else None
+
+    if instance_status is None:
+        # Instance not found (deleted)
+        job_data["status"] = "terminated"
+        job_data["termination_reason"] = "INSTANCE_NOT_FOUND"
+        job_data["completed_at"] = datetime.now().isoformat()
+        await _save_job(job_data)
+        await _archive_job_metrics(job_id)
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status="terminated",
+            instance_status="not_found",
+            reason="Instance not found (deleted)",
+        )
+
+    if instance_status in ("offline", "error", "discontinued"):
+        # Instance terminated (spot preemption, error, etc.)
+        job_data["status"] = "terminated"
+        job_data["termination_reason"] = "INSTANCE_TERMINATED"
+        job_data["completed_at"] = datetime.now().isoformat()
+        await _save_job(job_data)
+        await _archive_job_metrics(job_id)
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status="terminated",
+            instance_status=instance_status,
+            reason=f"Instance is {instance_status}",
+        )
+
+    if instance_status != "running":
+        # Still provisioning
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status=old_status,
+            instance_status=instance_status,
+            reason=f"Instance is {instance_status}",
+        )
+
+    # Instance is running, check training process via SSH
+    loop = asyncio.get_running_loop()
+    remote_status = await loop.run_in_executor(_reconcile_executor, _check_remote_status, job_data)
+
+    if remote_status == "stopped":
+        await _mark_job_completed(job_id, termination_reason="REMOTE_EXIT")
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status="completed",
+            instance_status=instance_status,
+            reason="Training process finished",
+        )
+    if remote_status == "unreachable":
+        return JobStatusUpdate(
+            job_id=job_id,
+            old_status=old_status,
+            new_status=old_status,
+            instance_status=instance_status,
+            reason="Could not connect via SSH",
+        )
+    return JobStatusUpdate(
+        job_id=job_id,
+        old_status=old_status,
+        new_status=old_status,
+        instance_status=instance_status,
+        reason=f"Process status: {remote_status}",
+    )
+
+
+_status_reconciler: Optional[TrainingStatusReconciler] = None
+
+
+def _get_status_reconciler() -> TrainingStatusReconciler:
+    global _status_reconciler
+    if _status_reconciler is None:
+        _status_reconciler = TrainingStatusReconciler(_reconcile_running_jobs)
+    return _status_reconciler
 
 
 @router.post("/jobs", response_model=JobCreateResponse)
@@ -4605,6 +4621,8 @@ def _create_job_with_progress(
                     ),
                 }
             )
+            from percus_ai.training.ssh.executor import RemoteExecutor, run_remote_command
+
             conn: Optional[SSHConnection] = None
             start_time = time.time()
             ssh_deadline = start_time + SSH_WAIT_TIMEOUT_SEC
@@ -5012,243 +5030,294 @@ async def _deploy_and_start_training(
 ) -> None:
     """Background task to deploy and start training.
 
-    This waits for the instance IP, uploads files, and starts training.
-    Uses SSHConnection and RemoteExecutor for consistency with other code paths.
+    Records the deployment inputs in a checkpoint and runs the deployment
+    pipeline (see ``_run_training_deployment``).
     """
-    session = build_session_from_tokens(supabase_access_token, supabase_refresh_token)
-    token = set_request_session(session)
-    try:
-        job_data = await _load_job(job_id)
-        if not job_data:
-            return
+    deployments = get_training_deployments_service()
+    checkpoint = DeploymentCheckpoint(
+        job_id=job_id,
+        inputs={
+            "policy_type": request.policy.type if request.policy else None,
+            "supabase_access_token": supabase_access_token,
+            "supabase_refresh_token": supabase_refresh_token,
+            "supabase_user_id": supabase_user_id,
+        },
+    )
+    deployments.store.save(checkpoint)
+    deployments.start(job_id, partial(_run_training_deployment, checkpoint))
+
+
+def resume_training_deployments() -> list[str]:
+    """Resume deployments interrupted by a backend restart (startup hook)."""
+    deployments = get_training_deployments_service()
+    resumed: list[str] = []
+    for job_id in deployments.store.pending_job_ids():
+        checkpoint = deployments.store.load(job_id)
+        if checkpoint is None:
+            deployments.store.discard(job_id)
+            continue
+        logger.info(
+            "Resuming training deployment %s after %s",
+            job_id,
+            checkpoint.completed[-1] if checkpoint.completed else "(start)",
+        )
+        deployments.start(job_id, partial(_run_training_deployment, checkpoint))
+        resumed.append(job_id)
+    return resumed
 
-        client = _get_verda_client()
-        if not client:
-            job_data["status"] = "failed"
-            job_data["failure_reason"] = "VERDA_ERROR"
-            job_data["completed_at"] = datetime.now().isoformat()
-            await _save_job(job_data)
-            return
 
-        instance_id = job_data["instance_id"]
+class _TrainingDeployContext:
+    """State shared by the deployment steps of one job.
 
-        async def cleanup_on_failure(error_msg: str) -> None:
-            """Clean up instance on deployment failure."""
-            logger.warning(
-                f"Cleaning up instance {instance_id} due to failure: {error_msg}"
+    ``values`` is the checkpoint's step output (persisted after each step);
+    the SSH connection is runtime-only and re-opened when a resumed
+    deployment needs it.
+    """
+
+    def __init__(self, job_data: dict, client: VerdaClient, checkpoint: DeploymentCheckpoint) -> None:
+        self.job_data = job_data
+        self.job_id = checkpoint.job_id
+        self.instance_id = job_data["instance_id"]
+        self.client = client
+        self.inputs = checkpoint.inputs
+        self.values = checkpoint.values
+        self.conn: Optional[SSHConnection] = None
+
+    async def connection(self) -> SSHConnection:
+        if self.conn is None:
+            self.conn = await run_blocking(
+                _create_ssh_connection,
+                self.values["ip"],
+                self.values["ssh_user"],
+                self.job_data.get("ssh_private_key", str(Path.home() / ".ssh" / "id_rsa")),
+                timeout=SSH_CONNECT_ATTEMPT_TIMEOUT_SEC,
             )
-            await _update_cleanup_status(job_id, "running")
-            cleanup_ok = _delete_verda_instance(instance_id)
-            await _update_cleanup_status(job_id, "done" if cleanup_ok else "failed")
+        return self.conn
 
-        try:
-            # Wait for IP (up to 15 minutes)
-            ip = None
-            deadline = time.time() + IP_WAIT_TIMEOUT_SEC
-            while time.time() < deadline:
-                try:
-                    instance = client.instances.get_by_id(instance_id)
-                    if getattr(instance, "ip", None):
-                        ip = instance.ip
-                        break
-                except Exception:
-                    pass
-                time.sleep(IP_POLL_INTERVAL_SEC)
+    async def close(self) -> None:
+        if self.conn is not None:
+            conn, self.conn = self.conn, None
+            await run_blocking(conn.disconnect)
 
-            if not ip:
-                job_data["status"] = "failed"
-                job_data["failure_reason"] = "IP_TIMEOUT"
-                job_data["error_message"] = "IP取得タイムアウト"
-                job_data["completed_at"] = datetime.now().isoformat()
-                await _save_job(job_data)
-                await cleanup_on_failure("IP取得タイムアウト")
+
+async def _deploy_wait_for_ip(ctx: _TrainingDeployContext) -> None:
+    deadline = time.monotonic() + IP_WAIT_TIMEOUT_SEC
+    while time.monotonic() < deadline:
+        try:
+            instance = await run_blocking(ctx.client.instances.get_by_id, ctx.instance_id)
+            ip = getattr(instance, "ip", None)
+            if ip:
+                ctx.values["ip"] = ip
+                ctx.job_data["ip"] = ip
+                await _save_job(ctx.job_data, wait=False)
                 return
+        except Exception:
+            pass
+        await asyncio.sleep(IP_POLL_INTERVAL_SEC)
+    raise DeploymentStepError("IP_TIMEOUT", "IP取得タイムアウト")
 
-            # Update job with IP
-            job_data["ip"] = ip
-            await _save_job(job_data)
 
-            # Poll Verda status until instance becomes running
-            running = False
+async def _deploy_wait_for_running(ctx: _TrainingDeployContext) -> None:
+    status = ""
+    deadline = time.monotonic() + INSTANCE_RUNNING_WAIT_TIMEOUT_SEC
+    while time.monotonic() < deadline:
+        try:
+            instance = await run_blocking(ctx.client.instances.get_by_id, ctx.instance_id)
+            status = str(getattr(instance, "status", "") or "").strip().lower()
+            if status == "running":
+                ctx.job_data["status"] = "deploying"
+                await _save_job(ctx.job_data, wait=False)
+                return
+            if status in INSTANCE_TERMINAL_STATUSES:
+                raise DeploymentStepError(
+                    "INSTANCE_TERMINATED", f"インスタンスが終了状態です: {status}"
+                )
+        except DeploymentStepError:
+            raise
+        except Exception:
             status = ""
-            running_deadline = time.time() + INSTANCE_RUNNING_WAIT_TIMEOUT_SEC
-            while time.time() < running_deadline:
-                try:
-                    instance = client.instances.get_by_id(instance_id)
-                    status = str(getattr(instance, "status", "") or "").strip().lower()
-                    if status == "running":
-                        running = True
-                        break
-                    if status in INSTANCE_TERMINAL_STATUSES:
-                        break
-                except Exception:
-                    status = ""
-                time.sleep(INSTANCE_STATUS_POLL_INTERVAL_SEC)
+        await asyncio.sleep(INSTANCE_STATUS_POLL_INTERVAL_SEC)
+    raise DeploymentStepError("INSTANCE_RUNNING_TIMEOUT", "インスタンス起動待機タイムアウト")
+
+
+async def _deploy_wait_for_ssh(ctx: _TrainingDeployContext) -> None:
+    ssh_user = ctx.job_data.get("ssh_user", _get_default_ssh_user())
+    ssh_private_key = ctx.job_data.get("ssh_private_key", str(Path.home() / ".ssh" / "id_rsa"))
+    ssh_user_candidates = _build_ssh_user_candidates(ssh_user)
+    last_ssh_error = ""
+    deadline = time.monotonic() + SSH_WAIT_TIMEOUT_SEC
+    while time.monotonic() < deadline:
+        for candidate_user in ssh_user_candidates:
+            try:
+                ctx.conn = await run_blocking(
+                    _create_ssh_connection,
+                    ctx.values["ip"],
+                    candidate_user,
+                    ssh_private_key,
+                    timeout=SSH_CONNECT_ATTEMPT_TIMEOUT_SEC,
+                )
+            except Exception as exc:
+                last_ssh_error = f"user={candidate_user}: {type(exc).__name__}: {exc}"
+                if "SSH鍵が見つかりません" in str(exc) or "SSH鍵パスが不正" in str(exc):
+                    raise DeploymentStepError("SSH_TIMEOUT", f"SSH接続タイムアウト: {last_ssh_error}")
+                continue
+            ctx.values["ssh_user"] = candidate_user
+            if candidate_user != ssh_user:
+                ctx.job_data["ssh_user"] = candidate_user
+                await _save_job(ctx.job_data, wait=False)
+            return
+        await asyncio.sleep(SSH_CONNECT_RETRY_INTERVAL_SEC)
+    failure_msg = "SSH接続タイムアウト"
+    if last_ssh_error:
+        failure_msg = f"{failure_msg}: {last_ssh_error}"
+    raise DeploymentStepError("SSH_TIMEOUT", failure_msg)
+
+
+def _upload_deploy_files(
+    conn: SSHConnection,
+    remote_run_dir: str,
+    env_content: str,
+    instance_info: str,
+) -> None:
+    conn.mkdir_p(remote_run_dir)
 
-            if not running:
-                job_data["status"] = "failed"
-                if status in INSTANCE_TERMINAL_STATUSES:
-                    job_data["failure_reason"] = "INSTANCE_TERMINATED"
-                    failure_msg = f"インスタンスが終了状態です: {status}"
-                    job_data["error_message"] = failure_msg
-                else:
-                    job_data["failure_reason"] = "INSTANCE_RUNNING_TIMEOUT"
-                    failure_msg = "インスタンス起動待機タイムアウト"
-                    job_data["error_message"] = failure_msg
-                job_data["completed_at"] = datetime.now().isoformat()
-                await _save_job(job_data)
-                await cleanup_on_failure(failure_msg)
-                return
+    setup_env_path = REMOTE_SCRIPTS_DIR / "setup_env.sh"
+    entry_path = REMOTE_SCRIPTS_DIR / "entry.py"
+    run_training_path = REMOTE_SCRIPTS_DIR / "run_training.sh"
+    if setup_env_path.exists():
+        conn.upload_file(setup_env_path, f"{remote_run_dir}/setup_env.sh")
+    if entry_path.exists():
+        conn.upload_file(entry_path, f"{remote_run_dir}/entry.py")
+    if run_training_path.exists():
+        conn.upload_file(run_training_path, f"{remote_run_dir}/run_training.sh")
 
-            job_data["status"] = "deploying"
-            await _save_job(job_data)
+    conn.upload_content(env_content, f"{remote_run_dir}/.env")
+    conn.upload_content(instance_info, f"{remote_run_dir}/instance_info.env")
 
-            # SSH deployment using SSHConnection
-            ssh_user = job_data.get("ssh_user", _get_default_ssh_user())
-            ssh_private_key = job_data.get(
-                "ssh_private_key", str(Path.home() / ".ssh" / "id_rsa")
-            )
+    conn.exec_command(f"chmod +x {remote_run_dir}/setup_env.sh")
+    conn.exec_command(f"chmod +x {remote_run_dir}/run_training.sh")
 
-            # Wait for SSH to be ready (up to 5 minutes)
-            conn: Optional[SSHConnection] = None
-            ssh_deadline = time.time() + SSH_WAIT_TIMEOUT_SEC
-            last_ssh_error = ""
-            ssh_user_candidates = _build_ssh_user_candidates(ssh_user)
-            fatal_ssh_config_error = False
-            while time.time() < ssh_deadline:
-                connected_user: Optional[str] = None
-                for candidate_user in ssh_user_candidates:
-                    try:
-                        conn = _create_ssh_connection(
-                            ip,
-                            candidate_user,
-                            ssh_private_key,
-                            timeout=SSH_CONNECT_ATTEMPT_TIMEOUT_SEC,
-                        )
-                        connected_user = candidate_user
-                        break
-                    except Exception as exc:
-                        last_ssh_error = (
-                            f"user={candidate_user}: {type(exc).__name__}: {exc}"
-                        )
-                        if "SSH鍵が見つかりません" in str(exc) or "SSH鍵パスが不正" in str(exc):
-                            fatal_ssh_config_error = True
-                            break
-                if conn and connected_user:
-                    if connected_user != ssh_user:
-                        ssh_user = connected_user
-                        job_data["ssh_user"] = ssh_user
-                        await _save_job(job_data)
-                    break
-                if fatal_ssh_config_error:
-                    break
-                time.sleep(SSH_CONNECT_RETRY_INTERVAL_SEC)
 
-            if not conn:
-                job_data["status"] = "failed"
-                job_data["failure_reason"] = "SSH_TIMEOUT"
-                failure_msg = "SSH接続タイムアウト"
-                if last_ssh_error:
-                    failure_msg = f"{failure_msg}: {last_ssh_error}"
-                job_data["error_message"] = failure_msg
-                job_data["completed_at"] = datetime.now().isoformat()
-                await _save_job(job_data)
-                await cleanup_on_failure(failure_msg)
-                return
+async def _deploy_upload(ctx: _TrainingDeployContext) -> None:
+    conn = await ctx.connection()
+    home_dir = await run_blocking(conn.resolve_path, "$HOME") or "/root"
+    remote_base_dir = f"{home_dir}/.physical-ai"
+    remote_run_dir = f"{remote_base_dir}/run"
+    ctx.job_data["remote_base_dir"] = remote_base_dir
+    await _save_job(ctx.job_data, wait=False)
+
+    env_content = _generate_env_file(
+        ctx.job_id,
+        ctx.instance_id,
+        ctx.inputs.get("policy_type"),
+        supabase_access_token=ctx.inputs.get("supabase_access_token"),
+        supabase_refresh_token=ctx.inputs.get("supabase_refresh_token"),
+        supabase_user_id=ctx.inputs.get("supabase_user_id"),
+    )
+    instance_info = _generate_instance_info_env(ctx.job_id, ctx.instance_id, auto_delete=True)
+    await run_blocking(_upload_deploy_files, conn, remote_run_dir, env_content, instance_info)
+    ctx.values["remote_run_dir"] = remote_run_dir
 
-            try:
-                home_dir = conn.resolve_path("$HOME") or "/root"
-                remote_base_dir = f"{home_dir}/.physical-ai"
-                remote_run_dir = f"{remote_base_dir}/run"
-                job_data["remote_base_dir"] = remote_base_dir
-                await _save_job(job_data)
 
-                # Create remote directory
-                conn.mkdir_p(remote_run_dir)
+async def _deploy_setup(ctx: _TrainingDeployContext) -> None:
+    from percus_ai.training.ssh.executor import run_remote_command
 
-                # Upload remote scripts
-                setup_env_path = REMOTE_SCRIPTS_DIR / "setup_env.sh"
-                entry_path = REMOTE_SCRIPTS_DIR / "entry.py"
-                run_training_path = REMOTE_SCRIPTS_DIR / "run_training.sh"
+    conn = await ctx.connection()
+    setup_cmd = (
+        f"cd {ctx.values['remote_run_dir']} && "
+        f"timeout {SETUP_TIMEOUT_SEC}s bash setup_env.sh train 2>&1"
+    )
+    setup_exit_code = await run_blocking(run_remote_command, conn, setup_cmd, stream_output=False)
+    if setup_exit_code == 0:
+        return
+    await _upload_remote_logs_to_r2(conn, ctx.job_data)
+    if setup_exit_code == 124:
+        raise DeploymentStepError("SETUP_TIMEOUT", "環境構築がタイムアウトしました")
+    raise DeploymentStepError("SETUP_FAILED", f"環境構築に失敗しました (exit={setup_exit_code})")
 
-                if setup_env_path.exists():
-                    conn.upload_file(setup_env_path, f"{remote_run_dir}/setup_env.sh")
-                if entry_path.exists():
-                    conn.upload_file(entry_path, f"{remote_run_dir}/entry.py")
-                if run_training_path.exists():
-                    conn.upload_file(
-                        run_training_path, f"{remote_run_dir}/run_training.sh"
-                    )
 
-                # Generate and upload .env file
-                env_content = _generate_env_file(
-                    job_id,
-                    instance_id,
-                    request.policy.type if request.policy else None,
-                    supabase_access_token=supabase_access_token,
-                    supabase_refresh_token=supabase_refresh_token,
-                    supabase_user_id=supabase_user_id,
-                )
-                conn.upload_content(env_content, f"{remote_run_dir}/.env")
+async def _deploy_start(ctx: _TrainingDeployContext) -> None:
+    from percus_ai.training.ssh.executor import RemoteExecutor
 
-                # Generate and upload instance_info.env
-                instance_info = _generate_instance_info_env(
-                    job_id, instance_id, auto_delete=True
-                )
-                conn.upload_content(
-                    instance_info, f"{remote_run_dir}/instance_info.env"
-                )
+    conn = await ctx.connection()
+    executor = RemoteExecutor(conn, remote_base_dir=ctx.values["remote_run_dir"])
+    await run_blocking(
+        executor.run_background,
+        "bash run_training.sh train",
+        session_name=TMUX_TRAIN_SESSION_NAME,
+    )
+    ctx.job_data["status"] = "starting"
+    await _save_job(ctx.job_data)
 
-                # Make scripts executable
-                conn.exec_command(f"chmod +x {remote_run_dir}/setup_env.sh")
-                conn.exec_command(f"chmod +x {remote_run_dir}/run_training.sh")
 
-                # Run setup synchronously
-                setup_cmd = f"cd {remote_run_dir} && timeout {SETUP_TIMEOUT_SEC}s bash setup_env.sh train 2>&1"
-                setup_exit_code = run_remote_command(
-                    conn,
-                    setup_cmd,
-                    stream_output=False,
-                )
-                if setup_exit_code != 0:
-                    if setup_exit_code == 124:
-                        job_data["status"] = "failed"
-                        job_data["failure_reason"] = "SETUP_TIMEOUT"
-                        job_data["error_message"] = "環境構築がタイムアウトしました"
-                        job_data["completed_at"] = datetime.now().isoformat()
-                        await _save_job(job_data)
-                        await _upload_remote_logs_to_r2(conn, job_data)
-                        await cleanup_on_failure("環境構築がタイムアウトしました")
-                        return
-                    job_data["status"] = "failed"
-                    job_data["failure_reason"] = "SETUP_FAILED"
-                    job_data["error_message"] = (
-                        f"環境構築に失敗しました (exit={setup_exit_code})"
-                    )
-                    job_data["completed_at"] = datetime.now().isoformat()
-                    await _save_job(job_data)
-                    await _upload_remote_logs_to_r2(conn, job_data)
-                    await cleanup_on_failure("環境構築に失敗しました")
-                    return
+_DEPLOY_STEP_HANDLERS: dict[str, Callable[[_TrainingDeployContext], Awaitable[None]]] = {
+    "wait_ip": _deploy_wait_for_ip,
+    "wait_running": _deploy_wait_for_running,
+    "wait_ssh": _deploy_wait_for_ssh,
+    "upload": _deploy_upload,
+    "setup": _deploy_setup,
+    "start": _deploy_start,
+}
 
-                # Start training using RemoteExecutor with tmux
-                executor = RemoteExecutor(conn, remote_base_dir=remote_run_dir)
-                executor.run_background(
-                    "bash run_training.sh train", session_name=TMUX_TRAIN_SESSION_NAME
-                )
-                job_data["status"] = "starting"
-                await _save_job(job_data)
 
-            finally:
-                conn.disconnect()
+async def _fail_deployment(job_data: dict, failure_reason: str, error_message: str) -> None:
+    job_data["status"] = "failed"
+    job_data["failure_reason"] = failure_reason
+    job_data["error_message"] = error_message
+    job_data["completed_at"] = datetime.now().isoformat()
+    await _save_job(job_data)
 
-        except Exception as e:
+    instance_id = job_data["instance_id"]
+    job_id = job_data["job_id"]
+    logger.warning(f"Cleaning up instance {instance_id} due to failure: {error_message}")
+    await _update_cleanup_status(job_id, "running")
+    cleanup_ok = await run_blocking(_delete_verda_instance, instance_id)
+    await _update_cleanup_status(job_id, "done" if cleanup_ok else "failed")
+
+
+async def _run_training_deployment(checkpoint: DeploymentCheckpoint) -> None:
+    """Deploy a training job: wait-for-IP -> running -> SSH -> upload -> setup -> start.
+
+    Every step runs on the event loop with blocking Verda/SSH calls on the
+    deployment pool; completed steps are skipped when resuming a checkpoint.
+    """
+    job_id = checkpoint.job_id
+    deployments = get_training_deployments_service()
+    session = build_session_from_tokens(
+        checkpoint.inputs.get("supabase_access_token"),
+        checkpoint.inputs.get("supabase_refresh_token"),
+    )
+    token = set_request_session(session)
+    try:
+        job_data = await _load_job(job_id)
+        if not job_data or job_data.get("status") not in ("starting", "deploying"):
+            deployments.store.discard(job_id)
+            return
+
+        client = await run_blocking(_get_verda_client)
+        if not client:
+            deployments.store.discard(job_id)
             job_data["status"] = "failed"
-            job_data["failure_reason"] = "UNKNOWN"
-            job_data["error_message"] = str(e)
+            job_data["failure_reason"] = "VERDA_ERROR"
             job_data["completed_at"] = datetime.now().isoformat()
             await _save_job(job_data)
-            await cleanup_on_failure(str(e))
+            return
+
+        ctx = _TrainingDeployContext(job_data, client, checkpoint)
+        deployment = TrainingDeployment(
+            checkpoint,
+            [(name, partial(_DEPLOY_STEP_HANDLERS[name], ctx)) for name in DEPLOY_STEPS],
+            store=deployments.store,
+        )
+        deployments.track(deployment)
+        try:
+            await deployment.run()
+        except DeploymentStepError as exc:
+            await _fail_deployment(job_data, exc.failure_reason, str(exc))
+        except Exception as exc:
+            await _fail_deployment(job_data, "UNKNOWN", str(exc))
+        finally:
+            await ctx.close()
     finally:
         reset_request_session(token)
 
@@ -5815,7 +5884,8 @@ async def websocket_stream_logs(websocket: WebSocket, job_id: str):
     status_subscription_id = None
     status_queue = None
     realtime_manager = None
-    ssh_conn: Optional[SSHConnection] = None
+    ssh_conn: Optional[SSHLease] = None
+    channel = None
     try:
         try:
             realtime_manager = _get_training_job_realtime_manager()
@@ -5914,9 +5984,15 @@ async def websocket_stream_logs(websocket: WebSocket, job_id: str):
         except Exception:
             pass
     finally:
+        # The transport is pooled: close the tail -f channel, keep the connection.
+        if channel is not None:
+            try:
+                channel.close()
+            except Exception:
+                pass
         if ssh_conn:
             try:
-                ssh_conn.disconnect()
+                ssh_conn.release()
             except Exception:
                 pass
         if status_subscription_id and realtime_manager:
@@ -5998,7 +6074,7 @@ async def websocket_job_session(websocket: WebSocket, job_id: str):
         }
     )
 
-    ssh_conn: Optional[SSHConnection] = None
+    ssh_conn: Optional[SSHLease] = None
     log_channel = None
     is_streaming_logs = False
 
@@ -6139,7 +6215,7 @@ async def websocket_job_session(websocket: WebSocket, job_id: str):
                 pass
         if ssh_conn:
             try:
-                ssh_conn.disconnect()
+                ssh_conn.release()
             except Exception:
                 pass
         if status_subscription_id and realtime_manager:
@@ -6205,13 +6281,7 @@ async def _send_remote_status(websocket: WebSocket, ssh_client) -> None:
         loop = asyncio.get_event_loop()
         status = await loop.run_in_executor(
             _executor,
-            lambda: _exec_ssh_command(
-                ssh_client,
-                (
-                    f"tmux has-session -t {TMUX_TRAIN_SESSION_NAME} 2>/dev/null && echo 'running' "
-                    f"|| (tmux has-session -t {TMUX_SETUP_SESSION_NAME} 2>/dev/null && echo 'starting' || echo 'stopped')"
-                ),
-            ),
+            lambda: _exec_ssh_command(ssh_client, REMOTE_STATUS_COMMAND),
         )
         await websocket.send_json(
             {"type": "remote_status", "status": status.strip() if status else "unknown"}
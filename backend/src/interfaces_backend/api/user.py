@@ -7,9 +7,6 @@ from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter
-import cv2
-import lerobot
-from serial.tools import list_ports
 import yaml
 
 from interfaces_backend.models.user import (
@@ -448,6 +445,7 @@ async def validate_environment():
         errors.append("PyTorch is required")
 
     # Check LeRobot
+    import lerobot
     checks.append(EnvironmentCheckResult(
         name="LeRobot",
         passed=True,
@@ -456,6 +454,7 @@ async def validate_environment():
     ))
 
     # Check OpenCV
+    import cv2
     checks.append(EnvironmentCheckResult(
         name="OpenCV",
         passed=True,
@@ -486,6 +485,7 @@ async def validate_environment():
         warnings.append("No devices configured - run device setup")
 
     # Check serial ports
+    from serial.tools import list_ports
     ports = list(list_ports.comports())
     checks.append(EnvironmentCheckResult(
         name="Serial ports",
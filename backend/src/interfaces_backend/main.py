@@ -54,7 +54,7 @@ else:
     load_dotenv()
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi import Request
+from fastapi import Request, Response
 
 from interfaces_backend.api import (
     analytics_router,
@@ -78,15 +78,17 @@ from interfaces_backend.api import (
     user_router,
     webui_blueprints_router,
 )
-from interfaces_backend.services.lerobot_runtime import start_lerobot
+from interfaces_backend.api.training import resume_training_deployments
+from interfaces_backend.models.startup import BackendReadinessResponse
 from interfaces_backend.core.request_auth import (
     build_session_from_request,
     is_session_expired,
     refresh_session_from_request,
     set_session_cookies,
 )
-from interfaces_backend.services.vlabor_runtime import start_vlabor_on_backend_startup
-from interfaces_backend.services.vlabor_profiles import get_active_profile_spec
+from interfaces_backend.services.operate_status import get_operate_status_monitor
+from interfaces_backend.services.recorder_status_stream import get_recorder_status_stream
+from interfaces_backend.services.service_bringup import get_service_bringup
 from percus_ai.observability import (
     ArmId,
     CommOverheadReporter,
@@ -108,21 +110,15 @@ _COMM_REPORTER = CommOverheadReporter("backend")
 
 
 @app.on_event("startup")
-async def start_vlabor_container() -> None:
-    startup_logger = logging.getLogger("interfaces_backend.startup")
-    try:
-        active_profile = await get_active_profile_spec()
-        profile_name = active_profile.name
-    except Exception:
-        startup_logger.warning("Could not resolve active profile; starting VLAbor without profile")
-        profile_name = None
-    start_vlabor_on_backend_startup(profile=profile_name, logger=startup_logger)
-    lerobot_result = start_lerobot(strict=False)
-    if lerobot_result.returncode != 0:
-        detail = (lerobot_result.stderr or lerobot_result.stdout).strip()
-        startup_logger.warning("Failed to start lerobot stack on backend startup: %s", detail)
-    else:
-        startup_logger.info("lerobot stack started on backend startup")
+async def start_backend_services() -> None:
+    # Docker bring-up runs in the background so the server accepts requests
+    # immediately; progress is reported through /ready.
+    get_recorder_status_stream().ensure_started()
+    get_operate_status_monitor().ensure_started()
+    get_service_bringup().start()
+    # Training deployments interrupted by a restart continue from their
+    # last completed step.
+    resume_training_deployments()
 
 
 def _extract_request_session_id(request: Request) -> Optional[str]:
@@ -276,6 +272,15 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/ready", response_model=BackendReadinessResponse)
+async def ready(response: Response):
+    """Per-component readiness of services brought up on startup (503 until ready)."""
+    readiness = get_service_bringup().readiness()
+    if not readiness.ready:
+        response.status_code = 503
+    return readiness
+
+
 def main():
     parser = argparse.ArgumentParser(description="Physical AI Backend Server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind")
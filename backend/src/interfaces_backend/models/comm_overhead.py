@@ -25,6 +25,17 @@ class CommSummaryResponse(BaseModel):
     window_sec: int
     session_id: str | None = None
     arm: str | None = None
+    resolution_sec: int | None = Field(
+        None, description="Rollup bucket width used for the summary; null when computed from raw events"
+    )
+    points: list[PointMetrics] = Field(default_factory=list)
+
+
+class CommHistoryResponse(BaseModel):
+    start_ns: int
+    end_ns: int
+    session_id: str | None = None
+    arm: str | None = None
     points: list[PointMetrics] = Field(default_factory=list)
 
 
@@ -57,3 +68,19 @@ class CommTraceResponse(BaseModel):
     window_sec: int
     trace_id: str
     events: list[CommEventDigest] = Field(default_factory=list)
+
+
+class CommIngestStatsResponse(BaseModel):
+    file_path: str
+    tailer_running: bool = False
+    buffered_events: int = 0
+    lines_total: int = 0
+    events_total: int = 0
+    parse_errors_total: int = 0
+    rejected_lines_total: int = 0
+    fast_path_events_total: int = 0
+    bytes_total: int = 0
+    lag_bytes: int = 0
+    lag_ms: float = 0.0
+    lines_per_sec: float = 0.0
+    last_ingest_at: float | None = None
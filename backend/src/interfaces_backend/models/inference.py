@@ -54,6 +54,8 @@ class InferenceRunnerStatus(BaseModel):
     episode_time_s: float = 0.0
     reset_time_s: float = 0.0
     denoising_steps: Optional[int] = None
+    state_age_ms: Optional[int] = Field(None, description="Age of the cached worker state")
+    state_stale: bool = False
 
 
 class InferenceModelSyncStatus(BaseModel):
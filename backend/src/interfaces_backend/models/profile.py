@@ -33,6 +33,7 @@ class ProfileDeviceStatusCamera(BaseModel):
     enabled: bool = True
     connected: bool = False
     connected_topic: Optional[str] = None
+    message_rate_hz: Optional[float] = Field(None, description="messages/s on the connected topic")
     topics: List[str] = Field(default_factory=list)
 
 
@@ -43,6 +44,7 @@ class ProfileDeviceStatusArm(BaseModel):
     enabled: bool = True
     connected: bool = False
     connected_topic: Optional[str] = None
+    message_rate_hz: Optional[float] = Field(None, description="messages/s on the connected topic")
     topics: List[str] = Field(default_factory=list)
 
 
@@ -52,6 +54,10 @@ class VlaborActiveProfileStatusResponse(BaseModel):
     cameras: List[ProfileDeviceStatusCamera] = Field(default_factory=list)
     arms: List[ProfileDeviceStatusArm] = Field(default_factory=list)
     topics: List[str] = Field(default_factory=list)
+    topic_monitor: str = Field(
+        "connected",
+        description="connecting | connected | disconnected; device states are unknown while connecting",
+    )
 
 
 class VlaborStatusResponse(BaseModel):
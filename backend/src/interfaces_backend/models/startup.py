@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-StartupOperationKind = Literal["inference_start", "recording_create"]
+StartupOperationKind = Literal["inference_start", "recording_create", "service_bringup"]
 StartupOperationState = Literal["queued", "running", "completed", "failed"]
+ServiceReadinessState = Literal["pending", "starting", "ready", "failed", "skipped"]
 
 
 class StartupOperationDetail(BaseModel):
@@ -34,3 +35,15 @@ class StartupOperationStatusResponse(BaseModel):
     error: Optional[str] = None
     detail: StartupOperationDetail = Field(default_factory=StartupOperationDetail)
     updated_at: Optional[str] = None
+
+
+class ServiceReadiness(BaseModel):
+    name: str
+    state: ServiceReadinessState = "pending"
+    operation_id: Optional[str] = None
+    message: Optional[str] = None
+
+
+class BackendReadinessResponse(BaseModel):
+    ready: bool = Field(False, description="true when no component is pending or starting")
+    components: List[ServiceReadiness] = Field(default_factory=list)
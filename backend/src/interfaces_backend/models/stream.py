@@ -0,0 +1,21 @@
+"""Multiplexed realtime stream API models."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class StreamChannelRequest(BaseModel):
+    topic: str = Field(..., min_length=1)
+    key: str = Field("global", min_length=1)
+    last_event_id: Optional[str] = None
+
+
+class StreamChannelResponse(BaseModel):
+    connection_id: str
+    topic: str
+    key: str
+    subscribed: bool
+    channels: list[str] = Field(default_factory=list)
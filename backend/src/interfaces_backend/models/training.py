@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -82,6 +82,7 @@ class JobListResponse(BaseModel):
 
     jobs: list[JobInfo]
     total: int
+    next_cursor: Optional[str] = None  # set when another page follows
 
 
 class JobDetailResponse(BaseModel):
@@ -249,6 +250,30 @@ class JobCreateResponse(BaseModel):
     ip: Optional[str] = None
 
 
+TrainingDeployStepState = Literal["pending", "running", "completed", "failed"]
+TrainingDeployState = Literal["running", "completed", "failed"]
+
+
+class TrainingDeployStep(BaseModel):
+    """One step of a training deployment (wait_ip, ..., start)."""
+
+    name: str
+    state: TrainingDeployStepState = "pending"
+    elapsed_s: Optional[float] = Field(None, description="Step duration in seconds")
+
+
+class TrainingDeployStatus(BaseModel):
+    """Progress of a training deployment (published on ``training.deploy``)."""
+
+    job_id: str
+    state: TrainingDeployState = "running"
+    current_step: Optional[str] = None
+    resumed: bool = Field(False, description="Resumed from a checkpoint after a backend restart")
+    error: Optional[str] = None
+    steps: list[TrainingDeployStep] = Field(default_factory=list)
+    updated_at: Optional[str] = None
+
+
 class InstanceStatusResponse(BaseModel):
     """Response for instance status check."""
 
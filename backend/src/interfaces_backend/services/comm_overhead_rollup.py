@@ -0,0 +1,405 @@
+"""Multi-resolution rollups of comm-overhead events.
+
+Events are folded into fixed time buckets (1s / 10s / 1min / 5min) per
+``(point_id, session_id, arm)``. Each bucket keeps exact counters plus
+mergeable log-scale sketches for latency, queue depth and payload size, so
+long summary windows are answered by merging a bounded number of buckets
+instead of scanning raw events. Memory is bounded by the retained time span
+of each resolution, not by event volume.
+
+``add`` folds ingested event records; ``add_arrays`` folds aligned per-event
+NumPy columns (used to restore rollups from persisted segments) with grouped
+array reductions, one resolution at a time and only over the span each
+resolution retains.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Iterable
+
+import numpy as np
+
+from percus_ai.observability import EventStatus
+
+RollupKey = tuple[str, str, str]
+
+# (bucket width in seconds, number of buckets retained)
+_DEFAULT_RESOLUTIONS: tuple[tuple[int, int], ...] = (
+    (1, 15 * 60),
+    (10, 3 * 360),
+    (60, 24 * 60),
+    (300, 7 * 24 * 12),
+)
+# Prefer the finest resolution that answers a window with at most this many buckets.
+_MAX_BUCKETS_PER_QUERY = 300
+
+_RELATIVE_ACCURACY = 0.01
+_GAMMA = (1.0 + _RELATIVE_ACCURACY) / (1.0 - _RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+class LogSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch-style).
+
+    Positive values land in logarithmic bins ``ceil(log_gamma(v))``; quantiles
+    are reported as the bin midpoint, within ``_RELATIVE_ACCURACY`` of the
+    true value. Count, sum, sum of squares and max are tracked exactly.
+    """
+
+    __slots__ = ("bins", "zero_count", "count", "total", "total_sq", "max")
+
+    def __init__(self) -> None:
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.total_sq += value * value
+        if value > self.max or self.count == 1:
+            self.max = value
+        if value <= 0.0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / _LOG_GAMMA)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def merge(self, other: "LogSketch") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0 or other.max > self.max:
+            self.max = other.max
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.zero_count += other.zero_count
+        bins = self.bins
+        for index, count in other.bins.items():
+            bins[index] = bins.get(index, 0) + count
+
+    def _quantiles(self, ranks: list[int]) -> list[float]:
+        results: list[float] = []
+        pending = sorted(set(ranks))
+        values: dict[int, float] = {}
+        cumulative = self.zero_count
+        position = 0
+        while position < len(pending) and pending[position] < cumulative:
+            values[pending[position]] = 0.0
+            position += 1
+        for index in sorted(self.bins):
+            cumulative += self.bins[index]
+            representative = min(2.0 * _GAMMA**index / (_GAMMA + 1.0), self.max)
+            while position < len(pending) and pending[position] < cumulative:
+                values[pending[position]] = representative
+                position += 1
+            if position >= len(pending):
+                break
+        for rank in ranks:
+            results.append(values.get(rank, self.max))
+        return results
+
+    def stats(self) -> dict[str, float]:
+        """Nearest-rank p50/p95/p99 plus exact avg/max, matching the raw store's shape."""
+        if self.count == 0:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "avg": 0.0, "max": 0.0}
+        ranks = [max(0, min(self.count - 1, math.ceil((p / 100.0) * self.count) - 1)) for p in (50.0, 95.0, 99.0)]
+        p50, p95, p99 = self._quantiles(ranks)
+        return {
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "avg": float(self.total / self.count),
+            "max": float(self.max),
+        }
+
+    def stddev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        mean = self.total / self.count
+        return float(math.sqrt(max(self.total_sq / self.count - mean * mean, 0.0)))
+
+
+class RollupBucket:
+    """Aggregated comm-overhead metrics for one time bucket and key."""
+
+    __slots__ = ("sample_count", "drop_events", "drop_count_total", "latency_ms", "queue_depth", "payload_bytes")
+
+    def __init__(self) -> None:
+        self.sample_count = 0
+        self.drop_events = 0
+        self.drop_count_total = 0
+        self.latency_ms = LogSketch()
+        self.queue_depth = LogSketch()
+        self.payload_bytes = LogSketch()
+
+    def add(self, record: dict[str, Any]) -> None:
+        self.sample_count += 1
+        status = record["status"]
+        if status == EventStatus.DROP.value:
+            self.drop_events += 1
+        self.drop_count_total += int(record.get("drop_count") or 0)
+        latency_ns = record.get("latency_ns")
+        if status == EventStatus.OK.value and latency_ns is not None:
+            self.latency_ms.add(latency_ns / 1_000_000.0)
+        queue_depth = record.get("queue_depth")
+        if queue_depth is not None:
+            self.queue_depth.add(float(queue_depth))
+        payload_bytes = record.get("payload_bytes")
+        if payload_bytes is not None:
+            self.payload_bytes.add(float(payload_bytes))
+
+    def merge(self, other: "RollupBucket") -> None:
+        self.sample_count += other.sample_count
+        self.drop_events += other.drop_events
+        self.drop_count_total += other.drop_count_total
+        self.latency_ms.merge(other.latency_ms)
+        self.queue_depth.merge(other.queue_depth)
+        self.payload_bytes.merge(other.payload_bytes)
+
+    def to_point_metrics(self, point_id: str) -> dict[str, Any]:
+        drop_denominator = self.sample_count + self.drop_count_total
+        drop_rate = (
+            0.0
+            if drop_denominator <= 0
+            else float((self.drop_events + self.drop_count_total) / drop_denominator)
+        )
+        return {
+            "point_id": point_id,
+            "sample_count": self.sample_count,
+            "latency_ms": self.latency_ms.stats(),
+            "jitter_ms": self.latency_ms.stddev(),
+            "drop_rate": drop_rate,
+            "queue_depth": self.queue_depth.stats(),
+            "payload_bytes": self.payload_bytes.stats(),
+        }
+
+
+class _Resolution:
+    def __init__(self, width_sec: int, retained: int) -> None:
+        self.width_sec = int(width_sec)
+        self.width_ns = self.width_sec * 1_000_000_000
+        self.retained = int(retained)
+        self.slots: dict[int, dict[RollupKey, RollupBucket]] = {}
+        self.newest_slot: int | None = None
+
+    @property
+    def span_sec(self) -> int:
+        return self.width_sec * self.retained
+
+    def merge_slot(self, slot: int, buckets: dict[RollupKey, RollupBucket]) -> None:
+        if self.newest_slot is not None and slot <= self.newest_slot - self.retained:
+            return
+        target = self.slots.setdefault(slot, {})
+        for key, bucket in buckets.items():
+            existing = target.get(key)
+            if existing is None:
+                existing = RollupBucket()
+                target[key] = existing
+            existing.merge(bucket)
+        if self.newest_slot is None or slot > self.newest_slot:
+            self.newest_slot = slot
+
+    def evict(self, now_slot: int) -> None:
+        cutoff = max(now_slot, self.newest_slot or now_slot) - self.retained
+        for slot in [slot for slot in self.slots if slot <= cutoff]:
+            del self.slots[slot]
+
+
+def _sketches(groups: np.ndarray, values: np.ndarray, size: int) -> list[LogSketch]:
+    """One ``LogSketch`` per group id in ``range(size)`` from aligned (group, value) arrays."""
+    sketches = [LogSketch() for _ in range(size)]
+    if values.size == 0:
+        return sketches
+    counts = np.bincount(groups, minlength=size)
+    totals = np.bincount(groups, weights=values, minlength=size)
+    totals_sq = np.bincount(groups, weights=values * values, minlength=size)
+    zeros = np.bincount(groups[values <= 0.0], minlength=size)
+    maxima = np.full(size, -math.inf)
+    np.maximum.at(maxima, groups, values)
+    positive = values > 0.0
+    indexes = np.ceil(np.log(values[positive]) / _LOG_GAMMA).astype(np.int64)
+    pairs, pair_counts = np.unique(np.stack((groups[positive], indexes)), axis=1, return_counts=True)
+    for group, index, count in zip(*pairs.tolist(), pair_counts.tolist()):
+        sketches[group].bins[index] = count
+    for group in np.flatnonzero(counts).tolist():
+        sketch = sketches[group]
+        sketch.count = int(counts[group])
+        sketch.total = float(totals[group])
+        sketch.total_sq = float(totals_sq[group])
+        sketch.zero_count = int(zeros[group])
+        sketch.max = float(maxima[group])
+    return sketches
+
+
+def _aggregate_arrays(
+    slots: np.ndarray,
+    key_codes: np.ndarray,
+    keys: list[RollupKey],
+    *,
+    ok_mask: np.ndarray,
+    drop_mask: np.ndarray,
+    latency_ms: np.ndarray,
+    queue_depth: np.ndarray,
+    payload_bytes: np.ndarray,
+    drop_count: np.ndarray,
+) -> dict[int, dict[RollupKey, RollupBucket]]:
+    """Buckets per (slot, key) from aligned per-event arrays (NaN marks missing values)."""
+    if slots.size == 0:
+        return {}
+    unique, groups = np.unique(slots * len(keys) + key_codes, return_inverse=True)
+    groups = groups.reshape(-1)
+    size = int(unique.size)
+    samples = np.bincount(groups, minlength=size)
+    drops = np.bincount(groups[drop_mask], minlength=size)
+    drop_totals = np.bincount(groups, weights=drop_count, minlength=size)
+    latency_valid = ok_mask & ~np.isnan(latency_ms)
+    queue_valid = ~np.isnan(queue_depth)
+    payload_valid = ~np.isnan(payload_bytes)
+    latency = _sketches(groups[latency_valid], latency_ms[latency_valid], size)
+    queue = _sketches(groups[queue_valid], queue_depth[queue_valid], size)
+    payload = _sketches(groups[payload_valid], payload_bytes[payload_valid], size)
+
+    batch: dict[int, dict[RollupKey, RollupBucket]] = {}
+    for group, group_id in enumerate(unique.tolist()):
+        slot, key_code = divmod(group_id, len(keys))
+        bucket = RollupBucket()
+        bucket.sample_count = int(samples[group])
+        bucket.drop_events = int(drops[group])
+        bucket.drop_count_total = int(drop_totals[group])
+        bucket.latency_ms = latency[group]
+        bucket.queue_depth = queue[group]
+        bucket.payload_bytes = payload[group]
+        batch.setdefault(slot, {})[keys[key_code]] = bucket
+    return batch
+
+
+class CommOverheadRollup:
+    """Thread-safe multi-resolution rollup of comm-overhead event records."""
+
+    def __init__(self, resolutions: Iterable[tuple[int, int]] = _DEFAULT_RESOLUTIONS) -> None:
+        self._lock = threading.Lock()
+        self._resolutions = sorted(
+            (_Resolution(width, retained) for width, retained in resolutions),
+            key=lambda resolution: resolution.width_sec,
+        )
+
+    def add(self, records: list[dict[str, Any]]) -> None:
+        """Fold records in ``CommEvent.model_dump(mode="json")`` shape into every resolution."""
+        if not records:
+            return
+        finest_ns = self._resolutions[0].width_ns
+        # Pre-aggregate the batch per finest bucket so each resolution only
+        # merges one bucket per (slot, key) instead of touching every event.
+        batch: dict[int, dict[RollupKey, RollupBucket]] = {}
+        for record in records:
+            slot = record["timestamp_ns"] // finest_ns
+            key = (record["point_id"], record["session_id"], record["arm"])
+            buckets = batch.setdefault(slot, {})
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = RollupBucket()
+                buckets[key] = bucket
+            bucket.add(record)
+
+        now_ns = time.time_ns()
+        with self._lock:
+            for resolution in self._resolutions:
+                ratio = resolution.width_ns // finest_ns
+                for slot, buckets in batch.items():
+                    resolution.merge_slot(slot // ratio, buckets)
+                resolution.evict(now_ns // resolution.width_ns)
+
+    def add_arrays(
+        self,
+        timestamp_ns: np.ndarray,
+        key_codes: np.ndarray,
+        keys: list[RollupKey],
+        *,
+        ok_mask: np.ndarray,
+        drop_mask: np.ndarray,
+        latency_ms: np.ndarray,
+        queue_depth: np.ndarray,
+        payload_bytes: np.ndarray,
+        drop_count: np.ndarray,
+    ) -> None:
+        """Fold aligned per-event arrays into every resolution.
+
+        ``keys[key_codes[i]]`` is the ``(point_id, session_id, arm)`` key of
+        event ``i``; NaN marks missing latency, queue depth and payload size.
+        """
+        if timestamp_ns.size == 0:
+            return
+        columns = {
+            "ok_mask": ok_mask,
+            "drop_mask": drop_mask,
+            "latency_ms": latency_ms,
+            "queue_depth": queue_depth,
+            "payload_bytes": payload_bytes,
+            "drop_count": drop_count,
+        }
+        now_ns = time.time_ns()
+        batches: list[tuple[_Resolution, dict[int, dict[RollupKey, RollupBucket]]]] = []
+        for resolution in self._resolutions:
+            slots = timestamp_ns // resolution.width_ns
+            # Older slots would be evicted right away; skip aggregating them.
+            keep = slots > now_ns // resolution.width_ns - resolution.retained
+            kept = {name: values[keep] for name, values in columns.items()}
+            batches.append((resolution, _aggregate_arrays(slots[keep], key_codes[keep], keys, **kept)))
+        with self._lock:
+            for resolution, batch in batches:
+                for slot, buckets in batch.items():
+                    resolution.merge_slot(slot, buckets)
+                resolution.evict(now_ns // resolution.width_ns)
+
+    def resolution_for(self, window_sec: int) -> int | None:
+        """Bucket width used to answer ``window_sec``, or ``None`` if no resolution covers it."""
+        candidates = [resolution for resolution in self._resolutions if resolution.span_sec >= window_sec]
+        if not candidates:
+            return None
+        for resolution in candidates:
+            if math.ceil(window_sec / resolution.width_sec) <= _MAX_BUCKETS_PER_QUERY:
+                return resolution.width_sec
+        return candidates[-1].width_sec
+
+    def summarize(
+        self,
+        *,
+        window_sec: int,
+        session_id: str | None = None,
+        arm: str | None = None,
+        now_ns: int | None = None,
+    ) -> tuple[int | None, dict[str, RollupBucket]]:
+        """Merge buckets overlapping the window, grouped by point id.
+
+        Returns the bucket width used and merged buckets keyed by point id.
+        The oldest bucket may extend up to one bucket width before the window.
+        """
+        width_sec = self.resolution_for(window_sec)
+        if width_sec is None:
+            return None, {}
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        merged: dict[str, RollupBucket] = {}
+        with self._lock:
+            resolution = next(r for r in self._resolutions if r.width_sec == width_sec)
+            first_slot = (now_ns - int(window_sec * 1_000_000_000)) // resolution.width_ns
+            for slot, buckets in resolution.slots.items():
+                if slot < first_slot:
+                    continue
+                for (point_id, bucket_session, bucket_arm), bucket in buckets.items():
+                    if session_id and bucket_session != session_id:
+                        continue
+                    if arm and bucket_arm != arm:
+                        continue
+                    target = merged.get(point_id)
+                    if target is None:
+                        target = RollupBucket()
+                        merged[point_id] = target
+                    target.merge(bucket)
+        return width_sec, merged
@@ -0,0 +1,321 @@
+"""Persistent, time-partitioned segment store for comm-overhead events.
+
+Layout under the store root::
+
+    2026-10-16/seg-<first_ts_ns>-<n>.arrow   # uncompressed Arrow IPC, memory-mapped on read
+    2026-10-15/compacted.parquet             # closed days, zstd Parquet
+    checkpoint.json                          # collector file position of the last flushed row
+
+Ingested records are buffered and flushed to a new Arrow segment once the
+buffer reaches ``segment_max_rows`` rows or ``segment_max_age_sec`` seconds.
+``compact()`` merges small segments of the current day and rewrites closed
+days as a single Parquet file, then enforces the retention window.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_MAX_ROWS = 50_000
+_SEGMENT_MAX_AGE_SEC = 30.0
+_COMPACT_MIN_SEGMENTS = 16
+_DEFAULT_RETENTION_DAYS = 30
+_CHECKPOINT_FILE = "checkpoint.json"
+_COMPACTED_FILE = "compacted.parquet"
+
+SCHEMA = pa.schema(
+    [
+        pa.field("timestamp_ns", pa.int64(), nullable=False),
+        pa.field("point_id", pa.string(), nullable=False),
+        pa.field("session_id", pa.string(), nullable=False),
+        pa.field("trace_id", pa.string(), nullable=False),
+        pa.field("arm", pa.string(), nullable=False),
+        pa.field("status", pa.string(), nullable=False),
+        pa.field("latency_ns", pa.int64()),
+        pa.field("obs_id", pa.string()),
+        pa.field("frame_id", pa.string()),
+        pa.field("chunk_id", pa.string()),
+        pa.field("queue_depth", pa.int64()),
+        pa.field("payload_bytes", pa.int64()),
+        pa.field("drop_count", pa.int64()),
+        pa.field("tags", pa.string()),
+    ]
+)
+
+
+def _partition_name(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1_000_000_000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _records_to_table(records: list[dict[str, Any]]) -> pa.Table:
+    columns: dict[str, list[Any]] = {name: [] for name in SCHEMA.names}
+    for record in records:
+        for name in SCHEMA.names:
+            if name == "tags":
+                tags = record.get("tags") or {}
+                columns[name].append(json.dumps(tags, ensure_ascii=False, separators=(",", ":")) if tags else None)
+            else:
+                columns[name].append(record.get(name))
+    return pa.Table.from_pydict(columns, schema=SCHEMA)
+
+
+def table_to_records(table: pa.Table) -> list[dict[str, Any]]:
+    """Convert a segment table back to ``CommEvent.model_dump(mode="json")``-shaped records."""
+    records = table.to_pylist()
+    for record in records:
+        tags = record.get("tags")
+        record["tags"] = json.loads(tags) if tags else {}
+    return records
+
+
+class CommOverheadSegmentStore:
+    """Append-only Arrow/Parquet history for comm-overhead events."""
+
+    def __init__(
+        self,
+        root_dir: str | Path,
+        *,
+        segment_max_rows: int = _SEGMENT_MAX_ROWS,
+        segment_max_age_sec: float = _SEGMENT_MAX_AGE_SEC,
+        retention_days: int | None = None,
+    ) -> None:
+        self._root = Path(root_dir)
+        self._segment_max_rows = max(int(segment_max_rows), 1)
+        self._segment_max_age_sec = max(float(segment_max_age_sec), 0.0)
+        if retention_days is None:
+            retention_days = int(os.environ.get("COMM_OVERHEAD_RETENTION_DAYS", _DEFAULT_RETENTION_DAYS))
+        self._retention_days = max(int(retention_days), 1)
+        self._lock = threading.RLock()
+        self._pending: list[dict[str, Any]] = []
+        self._pending_since: float | None = None
+        self._pending_position: dict[str, Any] | None = None
+        self._segment_counter = 0
+
+    @property
+    def root_dir(self) -> Path:
+        return self._root
+
+    def read_checkpoint(self) -> dict[str, Any] | None:
+        """Collector file position (``inode``/``offset``) covered by flushed segments."""
+        path = self._root / _CHECKPOINT_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def append(self, records: list[dict[str, Any]], *, position: dict[str, Any]) -> None:
+        """Buffer records; ``position`` is the collector file position after them."""
+        with self._lock:
+            if records and self._pending_since is None:
+                self._pending_since = time.monotonic()
+            self._pending.extend(records)
+            self._pending_position = dict(position)
+
+    def maybe_flush(self) -> bool:
+        with self._lock:
+            if not self._pending:
+                if self._pending_position is not None:
+                    self._write_checkpoint(self._pending_position)
+                    self._pending_position = None
+                return False
+            age = time.monotonic() - (self._pending_since or time.monotonic())
+            if len(self._pending) < self._segment_max_rows and age < self._segment_max_age_sec:
+                return False
+            self.flush()
+            return True
+
+    def flush(self) -> None:
+        """Write all buffered records to new Arrow segments and advance the checkpoint."""
+        with self._lock:
+            pending = self._pending
+            position = self._pending_position
+            self._pending = []
+            self._pending_since = None
+            self._pending_position = None
+            by_partition: dict[str, list[dict[str, Any]]] = {}
+            for record in pending:
+                by_partition.setdefault(_partition_name(record["timestamp_ns"]), []).append(record)
+            for partition, records in by_partition.items():
+                for start in range(0, len(records), self._segment_max_rows):
+                    self._write_segment(partition, records[start : start + self._segment_max_rows])
+            if position is not None:
+                self._write_checkpoint(position)
+
+    def _write_segment(self, partition: str, records: list[dict[str, Any]]) -> Path:
+        table = _records_to_table(records)
+        directory = self._root / partition
+        directory.mkdir(parents=True, exist_ok=True)
+        self._segment_counter += 1
+        first_ts = min(record["timestamp_ns"] for record in records)
+        path = directory / f"seg-{first_ts:020d}-{os.getpid()}-{self._segment_counter:06d}.arrow"
+        self._write_ipc(path, table)
+        return path
+
+    @staticmethod
+    def _write_ipc(path: Path, table: pa.Table) -> None:
+        tmp_path = path.with_suffix(".arrow.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    def _write_checkpoint(self, position: dict[str, Any]) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        path = self._root / _CHECKPOINT_FILE
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(position), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _partitions(self) -> list[Path]:
+        if not self._root.is_dir():
+            return []
+        return sorted(path for path in self._root.iterdir() if path.is_dir() and len(path.name) == 10)
+
+    @staticmethod
+    def _segment_files(partition: Path) -> list[Path]:
+        return sorted(partition.glob("seg-*.arrow"))
+
+    @staticmethod
+    def _read_ipc(path: Path) -> pa.Table:
+        # Memory-mapped and zero-copy: no decoding beyond the Arrow footer.
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def load_recent(self, max_rows: int) -> pa.Table:
+        """Newest ``max_rows`` persisted rows, oldest first."""
+        tables: list[pa.Table] = []
+        remaining = max(int(max_rows), 0)
+        with self._lock:
+            for partition in reversed(self._partitions()):
+                if remaining <= 0:
+                    break
+                files = self._segment_files(partition)
+                compacted = partition / _COMPACTED_FILE
+                for path in reversed(files):
+                    if remaining <= 0:
+                        break
+                    table = self._read_ipc(path)
+                    tables.append(table.slice(max(table.num_rows - remaining, 0)))
+                    remaining -= table.num_rows
+                if remaining > 0 and compacted.exists():
+                    table = pq.read_table(compacted, schema=SCHEMA)
+                    tables.append(table.slice(max(table.num_rows - remaining, 0)))
+                    remaining -= table.num_rows
+        if not tables:
+            return SCHEMA.empty_table()
+        table = pa.concat_tables(reversed(tables))
+        # Sorting copies every column; segments are usually already in order,
+        # and then the memory-mapped buffers are returned as they are.
+        timestamps = table["timestamp_ns"]
+        if table.num_rows > 1 and not pc.all(pc.greater_equal(timestamps[1:], timestamps[:-1])).as_py():
+            table = table.sort_by("timestamp_ns")
+        return table
+
+    def read_range(
+        self,
+        start_ns: int,
+        end_ns: int,
+        *,
+        columns: Iterable[str] | None = None,
+        session_id: str | None = None,
+        arm: str | None = None,
+    ) -> pa.Table:
+        """Persisted and buffered rows with ``start_ns <= timestamp_ns < end_ns``."""
+        selected = list(columns) if columns is not None else SCHEMA.names
+        expression = (ds.field("timestamp_ns") >= start_ns) & (ds.field("timestamp_ns") < end_ns)
+        if session_id:
+            expression &= ds.field("session_id") == session_id
+        if arm:
+            expression &= ds.field("arm") == arm
+
+        first_partition = _partition_name(start_ns)
+        last_partition = _partition_name(max(end_ns - 1, start_ns))
+        tables: list[pa.Table] = []
+        with self._lock:
+            ipc_files: list[str] = []
+            parquet_files: list[str] = []
+            for partition in self._partitions():
+                if partition.name < first_partition or partition.name > last_partition:
+                    continue
+                ipc_files.extend(str(path) for path in self._segment_files(partition))
+                compacted = partition / _COMPACTED_FILE
+                if compacted.exists():
+                    parquet_files.append(str(compacted))
+            if ipc_files:
+                tables.append(ds.dataset(ipc_files, schema=SCHEMA, format="ipc").to_table(columns=selected, filter=expression))
+            if parquet_files:
+                tables.append(
+                    ds.dataset(parquet_files, schema=SCHEMA, format="parquet").to_table(columns=selected, filter=expression)
+                )
+            if self._pending:
+                pending = _records_to_table(self._pending).filter(expression)
+                tables.append(pending.select(selected))
+        if not tables:
+            return SCHEMA.empty_table().select(selected)
+        return pa.concat_tables(tables)
+
+    def compact(self, *, now: datetime | None = None) -> None:
+        """Merge small segments, rewrite closed days as Parquet, drop expired days."""
+        now = now or datetime.now(timezone.utc)
+        today = now.strftime("%Y-%m-%d")
+        oldest_kept = (now - timedelta(days=self._retention_days)).strftime("%Y-%m-%d")
+        with self._lock:
+            for partition in self._partitions():
+                try:
+                    if partition.name < oldest_kept:
+                        self._remove_partition(partition)
+                    elif partition.name < today:
+                        self._compact_closed_day(partition)
+                    else:
+                        self._merge_segments(partition)
+                except Exception:  # noqa: BLE001 - keep remaining partitions usable
+                    logger.exception("Comm overhead segment compaction failed: %s", partition)
+
+    @staticmethod
+    def _remove_partition(partition: Path) -> None:
+        for path in partition.iterdir():
+            path.unlink()
+        partition.rmdir()
+
+    def _compact_closed_day(self, partition: Path) -> None:
+        files = self._segment_files(partition)
+        if not files:
+            return
+        tables = [self._read_ipc(path) for path in files]
+        compacted = partition / _COMPACTED_FILE
+        if compacted.exists():
+            tables.insert(0, pq.read_table(compacted, schema=SCHEMA))
+        table = pa.concat_tables(tables).sort_by("timestamp_ns")
+        tmp_path = partition / f"{_COMPACTED_FILE}.tmp"
+        pq.write_table(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, compacted)
+        for path in files:
+            path.unlink()
+
+    def _merge_segments(self, partition: Path) -> None:
+        files = self._segment_files(partition)
+        if len(files) < _COMPACT_MIN_SEGMENTS:
+            return
+        table = pa.concat_tables([self._read_ipc(path) for path in files]).sort_by("timestamp_ns")
+        first_ts = table["timestamp_ns"][0].as_py()
+        self._segment_counter += 1
+        merged = partition / f"seg-{first_ts:020d}-{os.getpid()}-{self._segment_counter:06d}.arrow"
+        self._write_ipc(merged, table)
+        for path in files:
+            if path != merged:
+                path.unlink()
@@ -1,20 +1,55 @@
 from __future__ import annotations
 
 import json
+import logging
 import math
 import os
 import threading
 import time
-from collections import defaultdict, deque
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from percus_ai.observability import CommEvent, EventStatus, PointId
+import numpy as np
+
+from percus_ai.observability import ArmId, CommEvent, EventStatus, PointId
+
+from interfaces_backend.services.comm_overhead_rollup import CommOverheadRollup, RollupKey
+from interfaces_backend.services.comm_overhead_segments import CommOverheadSegmentStore, table_to_records
 
 
 _DEFAULT_WINDOW_SEC = 900
 _DEFAULT_LIMIT = 500
 _DEFAULT_MAX_EVENTS = 200_000
+_DEFAULT_POLL_INTERVAL_SEC = 0.5
+_READ_BATCH_BYTES = 1024 * 1024
+_RATE_SAMPLE_SEC = 1.0
+# Windows up to this size are summarised exactly from raw events; longer
+# windows are answered from the pre-aggregated rollup buckets.
+_RAW_SUMMARY_MAX_WINDOW_SEC = 60
+_COMPACT_INTERVAL_SEC = 600.0
+_ROLLUP_RESTORE_SEC = 24 * 60 * 60
+_ROLLUP_RESTORE_COLUMNS = (
+    "timestamp_ns",
+    "point_id",
+    "session_id",
+    "arm",
+    "status",
+    "latency_ns",
+    "queue_depth",
+    "payload_bytes",
+    "drop_count",
+)
+
+_REQUIRED_FIELDS = frozenset({"point_id", "timestamp_ns", "session_id", "trace_id", "arm", "status"})
+_OPTIONAL_INT_FIELDS = ("latency_ns", "queue_depth", "payload_bytes", "drop_count")
+_OPTIONAL_STR_FIELDS = ("obs_id", "frame_id", "chunk_id")
+_KNOWN_FIELDS = _REQUIRED_FIELDS | set(_OPTIONAL_INT_FIELDS) | set(_OPTIONAL_STR_FIELDS) | {"tags"}
+_RECORD_DEFAULTS: dict[str, Any] = {name: None for name in (*_OPTIONAL_INT_FIELDS, *_OPTIONAL_STR_FIELDS)}
+_EMPTY_TAGS: dict[str, Any] = {}
+
+logger = logging.getLogger(__name__)
 
 
 def _extract_otlp_value(value: dict[str, Any]) -> Any:
@@ -61,41 +96,536 @@ def _to_int(value: Any) -> int | None:
         return None
 
 
-def _percentile(values: list[float], p: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    rank = max(0, min(len(ordered) - 1, math.ceil((p / 100.0) * len(ordered)) - 1))
-    return float(ordered[rank])
+_EMPTY_STATS = {"p50": 0.0, "p95": 0.0, "p99": 0.0, "avg": 0.0, "max": 0.0}
+_PERCENTILES = (50.0, 95.0, 99.0)
+
+_POINT_CODES = {point.value: code for code, point in enumerate(PointId)}
+_POINTS_BY_CODE = list(PointId)
+_ARM_CODES = {arm.value: code for code, arm in enumerate(ArmId)}
+_STATUS_CODES = {status.value: code for code, status in enumerate(EventStatus)}
+_STATUS_OK = _STATUS_CODES[EventStatus.OK.value]
+_STATUS_DROP = _STATUS_CODES[EventStatus.DROP.value]
+
+
+def _decode_lines(lines: list[bytes]) -> tuple[list[Any], int]:
+    """Decode JSONL rows, returning (decoded rows, decode error count).
+
+    Well-formed batches are decoded with a single ``json.loads`` call; on any
+    error the batch falls back to per-line decoding so one bad row only costs
+    itself.
+    """
+    if not lines:
+        return [], 0
+    try:
+        rows = json.loads(b"[" + b",".join(lines) + b"]")
+        if isinstance(rows, list) and len(rows) == len(lines):
+            return rows, 0
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        pass
+    rows = []
+    errors = 0
+    for line in lines:
+        try:
+            rows.append(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            errors += 1
+    return rows, errors
+
 
+def _is_optional_int(value: Any) -> bool:
+    return value is None or (type(value) is int)
 
-def _build_stats(values: list[float]) -> dict[str, float]:
-    if not values:
-        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "avg": 0.0, "max": 0.0}
+
+def _trusted_record(data: dict[str, Any]) -> dict[str, Any] | None:
+    """Accept a canonical collector row without running pydantic validation.
+
+    Returns the row normalised to the ``CommEvent.model_dump(mode="json")``
+    shape, or ``None`` for anything else so callers fall back to
+    ``CommEvent.model_validate``.
+    """
+    if not _REQUIRED_FIELDS.issubset(data) or not _KNOWN_FIELDS.issuperset(data):
+        return None
+    if (
+        data["point_id"] not in _POINT_CODES
+        or data["arm"] not in _ARM_CODES
+        or data["status"] not in _STATUS_CODES
+        or type(data["timestamp_ns"]) is not int
+        or type(data["session_id"]) is not str
+        or type(data["trace_id"]) is not str
+    ):
+        return None
+    for name in _OPTIONAL_INT_FIELDS:
+        value = data.get(name)
+        if value is not None and type(value) is not int:
+            return None
+    for name in _OPTIONAL_STR_FIELDS:
+        value = data.get(name)
+        if value is not None and type(value) is not str:
+            return None
+    if type(data.get("tags", _EMPTY_TAGS)) is not dict:
+        return None
+    record = dict(_RECORD_DEFAULTS)
+    record["tags"] = {}
+    record.update(data)
+    return record
+
+
+def _build_stats(values: np.ndarray) -> dict[str, float]:
+    """Nearest-rank p50/p95/p99 plus avg/max, computed with one partition pass."""
+    size = int(values.size)
+    if size == 0:
+        return dict(_EMPTY_STATS)
+    ranks = [max(0, min(size - 1, math.ceil((p / 100.0) * size) - 1)) for p in _PERCENTILES]
+    partitioned = np.partition(values, sorted(set(ranks)))
     return {
-        "p50": _percentile(values, 50.0),
-        "p95": _percentile(values, 95.0),
-        "p99": _percentile(values, 99.0),
-        "avg": float(sum(values) / len(values)),
-        "max": float(max(values)),
+        "p50": float(partitioned[ranks[0]]),
+        "p95": float(partitioned[ranks[1]]),
+        "p99": float(partitioned[ranks[2]]),
+        "avg": float(values.mean()),
+        "max": float(values.max()),
     }
 
 
-def _stddev(values: list[float]) -> float:
-    if len(values) < 2:
+def _stddev(values: np.ndarray) -> float:
+    if values.size < 2:
         return 0.0
-    mean = sum(values) / len(values)
-    var = sum((v - mean) ** 2 for v in values) / len(values)
-    return float(math.sqrt(var))
+    return float(values.std())
+
+
+def _point_metrics(
+    point_id: str,
+    *,
+    ok_mask: np.ndarray,
+    drop_mask: np.ndarray,
+    latency_ms: np.ndarray,
+    queue_depth: np.ndarray,
+    payload_bytes: np.ndarray,
+    drop_count: np.ndarray,
+) -> dict[str, Any]:
+    """Point metrics from aligned per-event arrays (NaN marks missing values)."""
+    latency_values = latency_ms[ok_mask & ~np.isnan(latency_ms)]
+    queue_values = queue_depth[~np.isnan(queue_depth)]
+    payload_values = payload_bytes[~np.isnan(payload_bytes)]
+
+    sample_count = int(ok_mask.size)
+    drop_events = int(np.count_nonzero(drop_mask))
+    drop_count_total = int(drop_count.sum())
+    drop_denominator = sample_count + drop_count_total
+    drop_rate = 0.0 if drop_denominator <= 0 else float((drop_events + drop_count_total) / drop_denominator)
+
+    return {
+        "point_id": point_id,
+        "sample_count": sample_count,
+        "latency_ms": _build_stats(latency_values),
+        "jitter_ms": _stddev(latency_values),
+        "drop_rate": drop_rate,
+        "queue_depth": _build_stats(queue_values),
+        "payload_bytes": _build_stats(payload_values),
+    }
+
+
+def _float_column(table: Any, name: str, scale: float = 1.0) -> np.ndarray:
+    values = table[name].to_numpy(zero_copy_only=False).astype(np.float64)
+    return values / scale if scale != 1.0 else values
+
+
+def _not_none(value: int | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _dictionary_column(column: Any) -> tuple[np.ndarray, list[str]]:
+    """Dictionary-encode a string column: (per-row indices, distinct values)."""
+    encoded = column.combine_chunks().dictionary_encode()
+    return encoded.indices.to_numpy(zero_copy_only=False), encoded.dictionary.to_pylist()
+
+
+def _coded_column(column: Any, code_of: Callable[[str], int]) -> np.ndarray:
+    """Map a string column to integer codes, looking up each distinct value once."""
+    indices, values = _dictionary_column(column)
+    lookup = np.fromiter((code_of(value) for value in values), dtype=np.int64, count=len(values))
+    return lookup[indices]
+
+
+def _rollup_keys(table: Any) -> tuple[np.ndarray, list[RollupKey]]:
+    """Per-row codes into the distinct ``(point_id, session_id, arm)`` keys of ``table``."""
+    points, point_ids = _dictionary_column(table["point_id"])
+    sessions, session_ids = _dictionary_column(table["session_id"])
+    arms, arm_ids = _dictionary_column(table["arm"])
+    combined = (points.astype(np.int64) * len(session_ids) + sessions) * len(arm_ids) + arms
+    unique, key_codes = np.unique(combined, return_inverse=True)
+    keys = []
+    for code in unique.tolist():
+        rest, arm = divmod(code, len(arm_ids))
+        point, session = divmod(rest, len(session_ids))
+        keys.append((point_ids[point], session_ids[session], arm_ids[arm]))
+    return key_codes.reshape(-1), keys
+
+
+class _Interner:
+    """Maps string ids to dense integer codes for the columnar buffer."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+
+    def intern(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int | None:
+        return self._codes.get(value)
+
+    def rebuild(self, live_codes: np.ndarray) -> np.ndarray:
+        """Drop ids no longer referenced and return the remapped code column."""
+        unique, remapped = np.unique(live_codes, return_inverse=True)
+        self._values = [self._values[int(code)] for code in unique]
+        self._codes = {value: code for code, value in enumerate(self._values)}
+        return remapped.astype(live_codes.dtype, copy=False)
+
+
+class _EventColumns:
+    """Append-only columnar ring buffer of comm events.
+
+    Live events occupy the contiguous slice ``[start, end)`` of preallocated
+    NumPy columns so window filters and aggregations work on array views.
+    When the tail reaches the end of the arrays, the newest events are moved
+    back to the front (amortised O(1) per append).
+
+    Each event also gets a monotonically increasing sequence number
+    (``seq = seq_offset + position``); the secondary indexes store sequence
+    numbers so they survive compaction.
+
+    Events appended from a segment table keep no per-event record: ``tables``
+    holds ``(first seq, table)`` and ``event()`` materialises rows on demand.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(int(capacity), 1)
+        size = self.capacity + max(self.capacity // 4, 1024)
+        self.timestamp_ns = np.zeros(size, dtype=np.int64)
+        # Running max of timestamp_ns: monotonic, so window starts can be
+        # found with a binary search even if events arrive slightly out of order.
+        self.timestamp_max_ns = np.zeros(size, dtype=np.int64)
+        self.latency_ms = np.full(size, math.nan, dtype=np.float64)
+        self.queue_depth = np.full(size, math.nan, dtype=np.float64)
+        self.payload_bytes = np.full(size, math.nan, dtype=np.float64)
+        self.drop_count = np.zeros(size, dtype=np.int64)
+        self.status = np.zeros(size, dtype=np.int8)
+        self.point = np.zeros(size, dtype=np.int16)
+        self.arm = np.zeros(size, dtype=np.int16)
+        self.session = np.zeros(size, dtype=np.int32)
+        self.trace = np.zeros(size, dtype=np.int32)
+        self.events = np.empty(size, dtype=object)
+        self.tables: list[tuple[int, Any]] = []
+        self.sessions = _Interner()
+        self.traces = _Interner()
+        self.by_point: dict[int, list[int]] = {}
+        self.by_session: dict[int, list[int]] = {}
+        self.by_trace: dict[int, list[int]] = {}
+        self.start = 0
+        self.end = 0
+        self.seq_offset = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        """Append events in ``CommEvent.model_dump(mode="json")`` shape."""
+        if not records:
+            return
+        if len(records) > self.capacity:
+            records = records[-self.capacity :]
+        count = len(records)
+        if self.end + count > self.timestamp_ns.size:
+            self._compact(keep=self.capacity - count)
+
+        lo = self.end
+        hi = lo + count
+        self._set_timestamps(lo, np.fromiter((r["timestamp_ns"] for r in records), dtype=np.int64, count=count))
+        self.latency_ms[lo:hi] = [
+            math.nan if r["latency_ns"] is None else r["latency_ns"] / 1_000_000.0 for r in records
+        ]
+        self.queue_depth[lo:hi] = [_not_none(r["queue_depth"]) for r in records]
+        self.payload_bytes[lo:hi] = [_not_none(r["payload_bytes"]) for r in records]
+        self.drop_count[lo:hi] = [int(r["drop_count"] or 0) for r in records]
+        self.status[lo:hi] = [_STATUS_CODES[r["status"]] for r in records]
+        self.arm[lo:hi] = [_ARM_CODES[r["arm"]] for r in records]
+        for offset, record in enumerate(records):
+            seq = self.seq_offset + lo + offset
+            point_code = _POINT_CODES[record["point_id"]]
+            session_code = self.sessions.intern(record["session_id"])
+            trace_code = self.traces.intern(record["trace_id"])
+            self.point[lo + offset] = point_code
+            self.session[lo + offset] = session_code
+            self.trace[lo + offset] = trace_code
+            self.by_point.setdefault(point_code, []).append(seq)
+            self.by_session.setdefault(session_code, []).append(seq)
+            self.by_trace.setdefault(trace_code, []).append(seq)
+            self.events[lo + offset] = record
+
+        self.end = hi
+        self.start = max(self.start, self.end - self.capacity)
+
+    def append_table(self, table: Any) -> None:
+        """Append the rows of a segment table (``SCHEMA`` columns, arrival order).
+
+        Numeric columns come straight from the Arrow arrays and string ids are
+        interned once per distinct value, so no per-event record is built.
+        """
+        count = table.num_rows
+        if count == 0:
+            return
+        if count > self.capacity:
+            table = table.slice(count - self.capacity)
+            count = self.capacity
+        if self.end + count > self.timestamp_ns.size:
+            self._compact(keep=self.capacity - count)
+
+        lo = self.end
+        hi = lo + count
+        self._set_timestamps(lo, table["timestamp_ns"].to_numpy())
+        self.latency_ms[lo:hi] = _float_column(table, "latency_ns", 1_000_000.0)
+        self.queue_depth[lo:hi] = _float_column(table, "queue_depth")
+        self.payload_bytes[lo:hi] = _float_column(table, "payload_bytes")
+        self.drop_count[lo:hi] = np.nan_to_num(_float_column(table, "drop_count"))
+        self.status[lo:hi] = _coded_column(table["status"], _STATUS_CODES.__getitem__)
+        self.arm[lo:hi] = _coded_column(table["arm"], _ARM_CODES.__getitem__)
+        self.point[lo:hi] = _coded_column(table["point_id"], _POINT_CODES.__getitem__)
+        self.session[lo:hi] = _coded_column(table["session_id"], self.sessions.intern)
+        self.trace[lo:hi] = _coded_column(table["trace_id"], self.traces.intern)
+        for index, codes in ((self.by_point, self.point), (self.by_session, self.session), (self.by_trace, self.trace)):
+            for code, seqs in self._build_index(codes[lo:hi], self.seq_offset + lo).items():
+                index.setdefault(code, []).extend(seqs)
+        self.events[lo:hi] = None
+        self.tables.append((self.seq_offset + lo, table))
+
+        self.end = hi
+        self.start = max(self.start, self.end - self.capacity)
+
+    def event(self, position: int) -> dict[str, Any]:
+        """The event at ``position`` in ``CommEvent.model_dump(mode="json")`` shape."""
+        record = self.events[position]
+        if record is not None:
+            return dict(record)
+        seq = self.seq_offset + position
+        first_seq, table = self.tables[bisect_right(self.tables, seq, key=lambda item: item[0]) - 1]
+        return table_to_records(table.slice(seq - first_seq, 1))[0]
+
+    def _set_timestamps(self, lo: int, timestamps: np.ndarray) -> None:
+        hi = lo + timestamps.size
+        self.timestamp_ns[lo:hi] = timestamps
+        running = np.maximum.accumulate(timestamps)
+        if lo > self.start:
+            np.maximum(running, self.timestamp_max_ns[lo - 1], out=running)
+        self.timestamp_max_ns[lo:hi] = running
+
+    def _compact(self, *, keep: int) -> None:
+        """Move the newest ``keep`` live events to the front and rebuild indexes."""
+        keep = max(0, min(keep, len(self)))
+        lo = self.end - keep
+        for column in (
+            self.timestamp_ns,
+            self.timestamp_max_ns,
+            self.latency_ms,
+            self.queue_depth,
+            self.payload_bytes,
+            self.drop_count,
+            self.status,
+            self.point,
+            self.arm,
+            self.session,
+            self.trace,
+            self.events,
+        ):
+            column[:keep] = column[lo : self.end]
+        self.events[keep:] = None
+        self.seq_offset += lo
+        self.start = 0
+        self.end = keep
+        self.tables = [(first, table) for first, table in self.tables if first + table.num_rows > self.seq_offset]
+
+        self.session[:keep] = self.sessions.rebuild(self.session[:keep])
+        self.trace[:keep] = self.traces.rebuild(self.trace[:keep])
+        self.by_point = self._build_index(self.point[:keep], self.seq_offset)
+        self.by_session = self._build_index(self.session[:keep], self.seq_offset)
+        self.by_trace = self._build_index(self.trace[:keep], self.seq_offset)
+
+    @staticmethod
+    def _build_index(codes: np.ndarray, first_seq: int) -> dict[int, list[int]]:
+        if codes.size == 0:
+            return {}
+        order = np.argsort(codes, kind="stable")
+        unique, first = np.unique(codes[order], return_index=True)
+        seqs = order.astype(np.int64) + first_seq
+        return {
+            int(code): chunk.tolist()
+            for code, chunk in zip(unique, np.split(seqs, first[1:]))
+        }
+
+    def window_start(self, threshold_ns: int) -> int:
+        """First position that may hold an event at or after ``threshold_ns``."""
+        live = self.timestamp_max_ns[self.start : self.end]
+        return self.start + int(np.searchsorted(live, threshold_ns, side="left"))
+
+    def indexed_positions(self, index: dict[int, list[int]], code: int | None, lo: int) -> np.ndarray:
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        seqs = index.get(code)
+        if not seqs:
+            return np.empty(0, dtype=np.int64)
+        first = bisect_left(seqs, self.seq_offset + lo)
+        return np.asarray(seqs[first:], dtype=np.int64) - self.seq_offset
 
 
 class CommOverheadStore:
-    def __init__(self, file_path: str | None = None, max_events: int = _DEFAULT_MAX_EVENTS) -> None:
+    """Comm-overhead event store fed from the collector JSONL file.
+
+    ``start()`` launches a polling tailer thread that ingests new lines in
+    batches; query methods only read already-ingested data. ``refresh()``
+    performs one synchronous catch-up pass (used by the tailer and tests).
+
+    Ingested events are also persisted to Arrow/Parquet segments. On the
+    first refresh the newest segments are memory-mapped back into the
+    in-memory buffer and tailing resumes from the checkpointed file offset,
+    so a restart does not re-parse the collector file. Restoring works on the
+    Arrow columns: neither the buffer nor the rollups build per-event records.
+    """
+
+    def __init__(
+        self,
+        file_path: str | None = None,
+        max_events: int = _DEFAULT_MAX_EVENTS,
+        poll_interval_sec: float = _DEFAULT_POLL_INTERVAL_SEC,
+        segments_dir: str | None = None,
+        persist: bool = True,
+    ) -> None:
         self._file_path = Path(file_path or os.environ.get("COMM_COLLECTOR_FILE_PATH", "/data/trace/collector/comm_events.jsonl"))
-        self._events: deque[CommEvent] = deque(maxlen=max_events)
+        self._segments: CommOverheadSegmentStore | None = None
+        if persist:
+            self._segments = CommOverheadSegmentStore(
+                segments_dir
+                or os.environ.get("COMM_OVERHEAD_SEGMENTS_DIR")
+                or self._file_path.parent / "segments"
+            )
+        self._restored = False
+        self._last_compaction = time.monotonic()
+        self._columns = _EventColumns(max_events)
+        self._rollup = CommOverheadRollup()
         self._lock = threading.RLock()
+        self._ingest_lock = threading.Lock()
         self._inode: tuple[int, int] | None = None
         self._offset = 0
+        self._poll_interval_sec = max(float(poll_interval_sec), 0.05)
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._stats: dict[str, Any] = {
+            "lines_total": 0,
+            "events_total": 0,
+            "parse_errors_total": 0,
+            "rejected_lines_total": 0,
+            "fast_path_events_total": 0,
+            "bytes_total": 0,
+            "lag_bytes": 0,
+            "lag_ms": 0.0,
+            "lines_per_sec": 0.0,
+            "last_ingest_at": None,
+        }
+        self._rate_started_at = time.monotonic()
+        self._rate_lines = 0
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._tail_loop,
+                name="comm-overhead-tailer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=timeout)
+        if self._segments is not None:
+            with self._ingest_lock:
+                self._persist(self._segments.flush)
+
+    def _tail_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+                if self._segments is not None and time.monotonic() - self._last_compaction >= _COMPACT_INTERVAL_SEC:
+                    self._last_compaction = time.monotonic()
+                    self._persist(self._segments.compact)
+            except Exception:  # noqa: BLE001 - keep tailing forever
+                logger.exception("Comm overhead ingest failed: %s", self._file_path)
+            self._stop_event.wait(self._poll_interval_sec)
+
+    def _persist(self, action: Any) -> None:
+        try:
+            action()
+        except Exception:  # noqa: BLE001 - persistence is best effort
+            logger.exception("Comm overhead segment store failed: %s", self._segments.root_dir if self._segments else None)
+
+    def _restore(self) -> None:
+        """Reload persisted events and the collector checkpoint (first refresh only)."""
+        self._restored = True
+        segments = self._segments
+        if segments is None:
+            return
+        try:
+            checkpoint = segments.read_checkpoint()
+            now_ns = time.time_ns()
+            history = segments.read_range(
+                now_ns - _ROLLUP_RESTORE_SEC * 1_000_000_000,
+                now_ns + 1,
+                columns=_ROLLUP_RESTORE_COLUMNS,
+            )
+            recent = segments.load_recent(self._columns.capacity)
+            self._restore_rollup(history)
+        except Exception:  # noqa: BLE001 - fall back to re-reading the collector file
+            logger.exception("Failed to restore comm overhead segments: %s", segments.root_dir)
+            return
+        with self._lock:
+            self._columns.append_table(recent)
+        if checkpoint:
+            inode = checkpoint.get("inode")
+            if isinstance(inode, list) and len(inode) == 2:
+                self._inode = (int(inode[0]), int(inode[1]))
+                self._offset = int(checkpoint.get("offset") or 0)
+
+    def _restore_rollup(self, table: Any) -> None:
+        if table.num_rows == 0:
+            return
+        key_codes, keys = _rollup_keys(table)
+        status = _coded_column(table["status"], _STATUS_CODES.__getitem__)
+        self._rollup.add_arrays(
+            table["timestamp_ns"].to_numpy(),
+            key_codes,
+            keys,
+            ok_mask=status == _STATUS_OK,
+            drop_mask=status == _STATUS_DROP,
+            latency_ms=_float_column(table, "latency_ns", 1_000_000.0),
+            queue_depth=_float_column(table, "queue_depth"),
+            payload_bytes=_float_column(table, "payload_bytes"),
+            drop_count=np.nan_to_num(_float_column(table, "drop_count")),
+        )
+
+    def get_ingest_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["buffered_events"] = len(self._columns)
+        stats["file_path"] = str(self._file_path)
+        stats["tailer_running"] = self._thread is not None and self._thread.is_alive()
+        return stats
 
     def _parse_comm_event_dict(self, data: dict[str, Any]) -> CommEvent | None:
         if "point_id" not in data:
@@ -172,23 +702,35 @@ class CommOverheadStore:
                         events.append(event)
         return events
 
-    def _parse_line(self, line: str) -> list[CommEvent]:
-        try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
-            return []
-
-        if not isinstance(data, dict):
-            return []
-
-        direct = self._parse_comm_event_dict(data)
-        if direct is not None:
-            return [direct]
-
-        return self._parse_otlp_trace(data)
+    def _parse_rows(self, rows: list[Any]) -> tuple[list[dict[str, Any]], int, int]:
+        """Convert decoded rows to event records, returning (records, fast-path count, rejected rows)."""
+        records: list[dict[str, Any]] = []
+        fast = 0
+        rejected = 0
+        for data in rows:
+            if not isinstance(data, dict):
+                rejected += 1
+                continue
+            record = _trusted_record(data)
+            if record is not None:
+                records.append(record)
+                fast += 1
+                continue
+            direct = self._parse_comm_event_dict(data)
+            if direct is not None:
+                records.append(direct.model_dump(mode="json"))
+                continue
+            parsed = self._parse_otlp_trace(data)
+            if not parsed:
+                rejected += 1
+            records.extend(event.model_dump(mode="json") for event in parsed)
+        return records, fast, rejected
 
     def refresh(self) -> None:
-        with self._lock:
+        """Ingest everything appended to the collector file since the last call."""
+        with self._ingest_lock:
+            if not self._restored:
+                self._restore()
             path = self._file_path
             if not path.exists():
                 return
@@ -201,18 +743,63 @@ class CommOverheadStore:
                 self._inode = inode
                 self._offset = 0
 
-            with path.open("r", encoding="utf-8") as handle:
+            with path.open("rb") as handle:
                 handle.seek(self._offset)
-                for raw_line in handle:
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    events = self._parse_line(line)
-                    for event in events:
-                        self._events.append(event)
-                self._offset = handle.tell()
-
-    def _filtered_events(
+                while True:
+                    lines = handle.readlines(_READ_BATCH_BYTES)
+                    if not lines:
+                        break
+                    if not lines[-1].endswith(b"\n"):
+                        # Partial trailing line: leave it for the next pass.
+                        handle.seek(-len(lines[-1]), os.SEEK_CUR)
+                        lines.pop()
+                        if not lines:
+                            break
+                    records = self._ingest_batch(lines)
+                    self._offset = handle.tell()
+                    if self._segments is not None:
+                        self._segments.append(records, position={"inode": list(inode), "offset": self._offset})
+                self._update_lag(path)
+            if self._segments is not None:
+                self._persist(self._segments.maybe_flush)
+
+    def _ingest_batch(self, raw_lines: list[bytes]) -> list[dict[str, Any]]:
+        byte_count = sum(len(line) for line in raw_lines)
+        lines = [stripped for stripped in (line.strip() for line in raw_lines) if stripped]
+        rows, decode_errors = _decode_lines(lines)
+        records, fast, rejected = self._parse_rows(rows)
+        self._rollup.add(records)
+        ingested_ns = time.time_ns()
+        with self._lock:
+            self._columns.append(records)
+            stats = self._stats
+            stats["lines_total"] += len(lines)
+            stats["events_total"] += len(records)
+            stats["parse_errors_total"] += decode_errors
+            stats["rejected_lines_total"] += rejected
+            stats["fast_path_events_total"] += fast
+            stats["bytes_total"] += byte_count
+            if records:
+                stats["lag_ms"] = max(ingested_ns - records[-1]["timestamp_ns"], 0) / 1_000_000.0
+            stats["last_ingest_at"] = ingested_ns / 1_000_000_000.0
+            self._rate_lines += len(lines)
+        return records
+
+    def _update_lag(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = self._offset
+        now = time.monotonic()
+        with self._lock:
+            self._stats["lag_bytes"] = max(size - self._offset, 0)
+            elapsed = now - self._rate_started_at
+            if elapsed >= _RATE_SAMPLE_SEC:
+                self._stats["lines_per_sec"] = self._rate_lines / elapsed
+                self._rate_started_at = now
+                self._rate_lines = 0
+
+    def _select(
         self,
         *,
         window_sec: int,
@@ -220,61 +807,142 @@ class CommOverheadStore:
         arm: str | None = None,
         point_id: PointId | None = None,
         trace_id: str | None = None,
-    ) -> list[CommEvent]:
-        now = time.time_ns()
-        threshold = now - int(window_sec * 1_000_000_000)
-        with self._lock:
-            events = list(self._events)
+    ) -> np.ndarray:
+        """Return buffer positions matching the filters, in arrival order.
+
+        Must be called with ``self._lock`` held.
+        """
+        columns = self._columns
+        threshold = time.time_ns() - int(window_sec * 1_000_000_000)
+        lo = columns.window_start(threshold)
+
+        if trace_id:
+            positions = columns.indexed_positions(columns.by_trace, columns.traces.lookup(trace_id), lo)
+        elif point_id:
+            positions = columns.indexed_positions(columns.by_point, _POINT_CODES[point_id.value], lo)
+        elif session_id:
+            positions = columns.indexed_positions(columns.by_session, columns.sessions.lookup(session_id), lo)
+        else:
+            positions = np.arange(lo, columns.end, dtype=np.int64)
+
+        if positions.size == 0:
+            return positions
+        mask = columns.timestamp_ns[positions] >= threshold
+        if session_id:
+            session_code = columns.sessions.lookup(session_id)
+            if session_code is None:
+                return positions[:0]
+            mask &= columns.session[positions] == session_code
+        if arm:
+            arm_code = _ARM_CODES.get(arm)
+            if arm_code is None:
+                return positions[:0]
+            mask &= columns.arm[positions] == arm_code
+        if point_id:
+            mask &= columns.point[positions] == _POINT_CODES[point_id.value]
+        return positions[mask]
+
+    def _aggregate_point(self, point_id: str, positions: np.ndarray) -> dict[str, Any]:
+        columns = self._columns
+        status = columns.status[positions]
+        return _point_metrics(
+            point_id,
+            ok_mask=status == _STATUS_OK,
+            drop_mask=status == _STATUS_DROP,
+            latency_ms=columns.latency_ms[positions],
+            queue_depth=columns.queue_depth[positions],
+            payload_bytes=columns.payload_bytes[positions],
+            drop_count=columns.drop_count[positions],
+        )
+
+    def _dump_events(self, positions: np.ndarray) -> list[dict[str, Any]]:
+        return [self._columns.event(int(pos)) for pos in positions]
 
-        filtered: list[CommEvent] = []
-        for event in events:
-            if event.timestamp_ns < threshold:
-                continue
-            if session_id and event.session_id != session_id:
-                continue
-            if arm and event.arm.value != arm:
-                continue
-            if point_id and event.point_id != point_id:
-                continue
-            if trace_id and event.trace_id != trace_id:
-                continue
-            filtered.append(event)
-        return filtered
-
-    def _aggregate_point(self, point_id: str, events: list[CommEvent]) -> dict[str, Any]:
-        latency_values = [float(e.latency_ns) / 1_000_000.0 for e in events if e.status == EventStatus.OK and e.latency_ns is not None]
-        queue_values = [float(e.queue_depth) for e in events if e.queue_depth is not None]
-        payload_values = [float(e.payload_bytes) for e in events if e.payload_bytes is not None]
+    def get_summary(self, *, window_sec: int = _DEFAULT_WINDOW_SEC, session_id: str | None = None, arm: str | None = None) -> dict[str, Any]:
+        resolution_sec: int | None = None
+        if window_sec > _RAW_SUMMARY_MAX_WINDOW_SEC:
+            resolution_sec, buckets = self._rollup.summarize(window_sec=window_sec, session_id=session_id, arm=arm)
+        if resolution_sec is not None:
+            points = [
+                buckets[point_id.value].to_point_metrics(point_id.value)
+                if point_id.value in buckets
+                else self._empty_point(point_id.value)
+                for point_id in _POINTS_BY_CODE
+            ]
+        else:
+            points = []
+            with self._lock:
+                positions = self._select(window_sec=window_sec, session_id=session_id, arm=arm)
+                point_codes = self._columns.point[positions]
+                for code, point_id in enumerate(_POINTS_BY_CODE):
+                    points.append(self._aggregate_point(point_id.value, positions[point_codes == code]))
 
-        drop_events = sum(1 for e in events if e.status == EventStatus.DROP)
-        drop_count_total = sum(int(e.drop_count or 0) for e in events)
-        drop_denominator = len(events) + drop_count_total
-        drop_rate = 0.0 if drop_denominator <= 0 else float((drop_events + drop_count_total) / drop_denominator)
+        return {
+            "window_sec": int(window_sec),
+            "session_id": session_id,
+            "arm": arm,
+            "resolution_sec": resolution_sec,
+            "points": points,
+        }
 
+    @staticmethod
+    def _empty_point(point_id: str) -> dict[str, Any]:
         return {
             "point_id": point_id,
-            "sample_count": len(events),
-            "latency_ms": _build_stats(latency_values),
-            "jitter_ms": _stddev(latency_values),
-            "drop_rate": drop_rate,
-            "queue_depth": _build_stats(queue_values),
-            "payload_bytes": _build_stats(payload_values),
+            "sample_count": 0,
+            "latency_ms": dict(_EMPTY_STATS),
+            "jitter_ms": 0.0,
+            "drop_rate": 0.0,
+            "queue_depth": dict(_EMPTY_STATS),
+            "payload_bytes": dict(_EMPTY_STATS),
         }
 
-    def get_summary(self, *, window_sec: int = _DEFAULT_WINDOW_SEC, session_id: str | None = None, arm: str | None = None) -> dict[str, Any]:
-        self.refresh()
-        events = self._filtered_events(window_sec=window_sec, session_id=session_id, arm=arm)
-
-        grouped: dict[str, list[CommEvent]] = defaultdict(list)
-        for event in events:
-            grouped[event.point_id.value].append(event)
-
+    def get_history(
+        self,
+        *,
+        start_ns: int,
+        end_ns: int,
+        session_id: str | None = None,
+        arm: str | None = None,
+    ) -> dict[str, Any]:
+        """Exact point metrics for an absolute time range from persisted segments."""
         points: list[dict[str, Any]] = []
-        for point_id in PointId:
-            points.append(self._aggregate_point(point_id.value, grouped.get(point_id.value, [])))
+        if self._segments is not None:
+            table = self._segments.read_range(
+                start_ns,
+                end_ns,
+                columns=("point_id", "status", "latency_ns", "queue_depth", "payload_bytes", "drop_count"),
+                session_id=session_id,
+                arm=arm,
+            )
+        else:
+            table = None
+        if table is not None and table.num_rows:
+            point_ids = table["point_id"].to_numpy(zero_copy_only=False)
+            status = table["status"].to_numpy(zero_copy_only=False)
+            latency_ms = _float_column(table, "latency_ns", 1_000_000.0)
+            queue_depth = _float_column(table, "queue_depth")
+            payload_bytes = _float_column(table, "payload_bytes")
+            drop_count = np.nan_to_num(_float_column(table, "drop_count")).astype(np.int64)
+            for point_id in _POINTS_BY_CODE:
+                mask = point_ids == point_id.value
+                points.append(
+                    _point_metrics(
+                        point_id.value,
+                        ok_mask=status[mask] == EventStatus.OK.value,
+                        drop_mask=status[mask] == EventStatus.DROP.value,
+                        latency_ms=latency_ms[mask],
+                        queue_depth=queue_depth[mask],
+                        payload_bytes=payload_bytes[mask],
+                        drop_count=drop_count[mask],
+                    )
+                )
+        else:
+            points = [self._empty_point(point_id.value) for point_id in _POINTS_BY_CODE]
 
         return {
-            "window_sec": int(window_sec),
+            "start_ns": int(start_ns),
+            "end_ns": int(end_ns),
             "session_id": session_id,
             "arm": arm,
             "points": points,
@@ -289,29 +957,32 @@ class CommOverheadStore:
         arm: str | None = None,
         recent_limit: int = 50,
     ) -> dict[str, Any]:
-        self.refresh()
-        events = self._filtered_events(window_sec=window_sec, session_id=session_id, arm=arm, point_id=point_id)
-        events_sorted = sorted(events, key=lambda e: e.timestamp_ns, reverse=True)
+        with self._lock:
+            positions = self._select(window_sec=window_sec, session_id=session_id, arm=arm, point_id=point_id)
+            point = self._aggregate_point(point_id.value, positions)
+            order = np.argsort(-self._columns.timestamp_ns[positions], kind="stable")
+            recent_events = self._dump_events(positions[order[:recent_limit]])
 
         return {
             "window_sec": int(window_sec),
             "session_id": session_id,
             "arm": arm,
-            "point": self._aggregate_point(point_id.value, events),
-            "recent_events": [event.model_dump(mode="json") for event in events_sorted[:recent_limit]],
+            "point": point,
+            "recent_events": recent_events,
         }
 
     def get_trace(self, *, trace_id: str, window_sec: int = _DEFAULT_WINDOW_SEC, limit: int = _DEFAULT_LIMIT) -> dict[str, Any]:
-        self.refresh()
-        events = self._filtered_events(window_sec=window_sec, trace_id=trace_id)
-        events_sorted = sorted(events, key=lambda e: e.timestamp_ns)
-        if limit > 0:
-            events_sorted = events_sorted[:limit]
+        with self._lock:
+            positions = self._select(window_sec=window_sec, trace_id=trace_id)
+            order = np.argsort(self._columns.timestamp_ns[positions], kind="stable")
+            if limit > 0:
+                order = order[:limit]
+            events = self._dump_events(positions[order])
 
         return {
             "window_sec": int(window_sec),
             "trace_id": trace_id,
-            "events": [event.model_dump(mode="json") for event in events_sorted],
+            "events": events,
         }
 
 
@@ -324,4 +995,5 @@ def get_comm_overhead_store() -> CommOverheadStore:
     with _store_lock:
         if _store is None:
             _store = CommOverheadStore()
+        _store.start()
     return _store
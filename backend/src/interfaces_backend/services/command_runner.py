@@ -0,0 +1,243 @@
+"""Shared async subprocess runner for docker compose and VLAbor scripts.
+
+Compose commands and VLAbor scripts invoked from the API go through
+``AsyncCommandRunner`` so they never block the event loop:
+
+- ``run`` executes a command with ``asyncio.create_subprocess_exec`` under a
+  bounded concurrency limit;
+- ``run_shared`` collapses identical in-flight commands into one process
+  (single-flight) and can cache the result for a short TTL, which is how
+  ``docker compose ps`` status queries are served;
+- ``stream_lines`` yields output lines as they arrive;
+- ``exclusive`` serializes commands that must not overlap (VLAbor scripts).
+
+asyncio primitives are bound to one event loop, so the semaphore, in-flight
+table and named locks are kept per loop; cached results are shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+_MAX_CONCURRENCY = int(os.environ.get("PHI_COMMAND_MAX_CONCURRENCY", "4"))
+# ``docker compose ps`` answers are reused for this long across callers.
+COMPOSE_PS_CACHE_TTL_S = 1.0
+# Docker progress output rewrites one line with \r; allow long physical lines.
+_STREAM_LINE_LIMIT = 1024 * 1024
+
+_CommandKey = tuple[tuple[str, ...], Optional[str]]
+
+
+@dataclass
+class _LoopState:
+    semaphore: asyncio.Semaphore
+    inflight: dict[_CommandKey, asyncio.Future] = field(default_factory=dict)
+    locks: dict[str, asyncio.Lock] = field(default_factory=dict)
+
+
+def _decode(data: bytes | None) -> str:
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+def _command_key(cmd: Sequence[str], cwd: Path | str | None) -> _CommandKey:
+    return tuple(str(part) for part in cmd), str(cwd) if cwd is not None else None
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class CommandLineStream:
+    """Async iterator over a command's merged stdout/stderr lines.
+
+    ``returncode`` is set once iteration finishes. Raises
+    ``subprocess.TimeoutExpired`` (after killing the process) on timeout.
+    """
+
+    def __init__(
+        self,
+        runner: AsyncCommandRunner,
+        cmd: Sequence[str],
+        *,
+        cwd: Path | str | None,
+        timeout: float | None,
+    ) -> None:
+        self._runner = runner
+        self._cmd = [str(part) for part in cmd]
+        self._cwd = cwd
+        self._timeout = timeout
+        self.returncode: int | None = None
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        deadline = None if self._timeout is None else loop.time() + self._timeout
+        async with self._runner._state().semaphore:  # noqa: SLF001
+            process = await asyncio.create_subprocess_exec(
+                *self._cmd,
+                cwd=self._cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=_STREAM_LINE_LIMIT,
+            )
+            try:
+                assert process.stdout is not None
+                while True:
+                    remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+                    try:
+                        raw_line = await asyncio.wait_for(process.stdout.readline(), remaining)
+                    except asyncio.TimeoutError:
+                        raise subprocess.TimeoutExpired(self._cmd, self._timeout) from None
+                    if not raw_line:
+                        break
+                    yield _decode(raw_line).rstrip("\n")
+                remaining = None if deadline is None else max(deadline - loop.time(), 0.0)
+                try:
+                    self.returncode = await asyncio.wait_for(process.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise subprocess.TimeoutExpired(self._cmd, self._timeout) from None
+            finally:
+                await _terminate(process)
+
+
+class AsyncCommandRunner:
+    """Runs external commands without blocking the event loop."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_concurrency = max(int(max_concurrency), 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._cache: dict[_CommandKey, tuple[float, subprocess.CompletedProcess[str]]] = {}
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: Path | str | None = None,
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run ``cmd`` to completion, like ``subprocess.run(capture_output=True, text=True)``.
+
+        Raises ``subprocess.TimeoutExpired`` (after killing the process) on timeout.
+        """
+        args = [str(part) for part in cmd]
+        async with self._state().semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(args, timeout) from None
+            finally:
+                # Also reached on cancellation: never leave the child running.
+                await _terminate(process)
+        return subprocess.CompletedProcess(args, process.returncode, _decode(stdout), _decode(stderr))
+
+    async def run_shared(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: Path | str | None = None,
+        timeout: float | None = None,
+        ttl_s: float = 0.0,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a read-only query once for all concurrent callers.
+
+        Callers arriving while the same command is running await its result;
+        completed results are reused for ``ttl_s`` seconds.
+        """
+        key = _command_key(cmd, cwd)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > self._clock():
+                return cached[1]
+        state = self._state()
+        future = state.inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run_and_cache(key, cmd, cwd=cwd, timeout=timeout, ttl_s=ttl_s))
+            state.inflight[key] = future
+            future.add_done_callback(lambda _future: state.inflight.pop(key, None))
+        # One caller giving up must not cancel the command for the others.
+        return await asyncio.shield(future)
+
+    def invalidate(self) -> None:
+        """Drop cached results, e.g. after a command changed container state."""
+        with self._lock:
+            self._cache.clear()
+
+    def stream_lines(
+        self,
+        cmd: Sequence[str],
+        *,
+        cwd: Path | str | None = None,
+        timeout: float | None = None,
+    ) -> CommandLineStream:
+        return CommandLineStream(self, cmd, cwd=cwd, timeout=timeout)
+
+    def exclusive(self, name: str) -> asyncio.Lock:
+        """Lock shared by every command that must not overlap with others named ``name``."""
+        state = self._state()
+        lock = state.locks.get(name)
+        if lock is None:
+            lock = state.locks[name] = asyncio.Lock()
+        return lock
+
+    async def _run_and_cache(
+        self,
+        key: _CommandKey,
+        cmd: Sequence[str],
+        *,
+        cwd: Path | str | None,
+        timeout: float | None,
+        ttl_s: float,
+    ) -> subprocess.CompletedProcess[str]:
+        result = await self.run(cmd, cwd=cwd, timeout=timeout)
+        if ttl_s > 0:
+            with self._lock:
+                self._cache[key] = (self._clock() + ttl_s, result)
+        return result
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState(semaphore=asyncio.Semaphore(self._max_concurrency))
+            return state
+
+
+_runner: AsyncCommandRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_command_runner() -> AsyncCommandRunner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = AsyncCommandRunner()
+    return _runner
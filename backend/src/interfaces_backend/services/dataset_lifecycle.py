@@ -12,12 +12,10 @@ import logging
 import os
 import threading
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import yaml
 from fastapi import HTTPException
-from supabase import create_async_client
-from supabase._async.client import AsyncClient
 
 from interfaces_backend.models.inference import InferenceModelSyncStatus
 from interfaces_backend.services.realtime_events import get_realtime_event_bus
@@ -25,6 +23,9 @@ from percus_ai.db import get_supabase_async_client, upsert_with_owner
 from percus_ai.storage.paths import get_datasets_dir, get_user_config_path
 from percus_ai.storage.r2_db_sync import R2DBSyncService
 
+if TYPE_CHECKING:
+    from supabase._async.client import AsyncClient
+
 logger = logging.getLogger(__name__)
 UPLOAD_TOPIC = "recording.upload"
 
@@ -50,6 +51,8 @@ class DatasetLifecycle:
                 return self._service_client
             async with self._service_client_lock:
                 if self._service_client is None:
+                    from supabase import create_async_client
+
                     self._service_client = await create_async_client(supabase_url, service_key)
                 return self._service_client
         return await get_supabase_async_client()
@@ -0,0 +1,235 @@
+"""Buffered JSONL writer for inference worker event logs.
+
+Events are serialized into an in-memory buffer and written to a file that
+stays open for the whole worker session. The buffer is flushed when it
+reaches ``flush_bytes`` or is older than ``flush_interval_s``; the active file
+is rotated once it exceeds ``max_bytes``. Rotated segments are named
+``<name>.<seq>`` with an increasing sequence number and are never renamed
+afterwards, so they can be gzip-compressed in a background thread while
+rotation continues; only the newest ``max_segments`` are kept.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_BYTES = int(os.environ.get("INFERENCE_EVENT_LOG_FLUSH_BYTES", str(64 * 1024)))
+_FLUSH_INTERVAL_S = float(os.environ.get("INFERENCE_EVENT_LOG_FLUSH_INTERVAL_S", "1.0"))
+_MAX_BYTES = int(os.environ.get("INFERENCE_EVENT_LOG_MAX_BYTES", str(32 * 1024 * 1024)))
+_MAX_SEGMENTS = int(os.environ.get("INFERENCE_EVENT_LOG_MAX_SEGMENTS", "5"))
+_MAX_BUFFERED_EVENTS = int(os.environ.get("INFERENCE_EVENT_LOG_MAX_BUFFERED", "10000"))
+_COMPRESS = os.environ.get("INFERENCE_EVENT_LOG_COMPRESS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"blob_bytes": len(value)}
+    return str(value)
+
+
+class BufferedEventLogWriter:
+    """Append-only JSONL event log with size/time-based flushing and rotation."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush_bytes: int = _FLUSH_BYTES,
+        flush_interval_s: float = _FLUSH_INTERVAL_S,
+        max_bytes: int = _MAX_BYTES,
+        max_segments: int = _MAX_SEGMENTS,
+        max_buffered_events: int = _MAX_BUFFERED_EVENTS,
+        compress: bool = _COMPRESS,
+    ) -> None:
+        self._path = Path(path)
+        self._flush_bytes = max(int(flush_bytes), 1)
+        self._flush_interval_s = max(float(flush_interval_s), 0.0)
+        self._max_bytes = max(int(max_bytes), 1)
+        self._max_segments = max(int(max_segments), 1)
+        self._max_buffered_events = max(int(max_buffered_events), 1)
+        self._compress = bool(compress)
+        self._lock = threading.Lock()
+        self._file: Optional[Any] = None
+        self._file_bytes = 0
+        self._buffer: list[str] = []
+        self._buffer_bytes = 0
+        self._buffer_since: Optional[float] = None
+        self._closed = False
+        self._segment_pattern = re.compile(rf"^{re.escape(self._path.name)}\.(\d+)(\.gz)?$")
+        self._next_segment = self._scan_next_segment()
+        self._compress_threads: list[threading.Thread] = []
+        self._written = 0
+        self._dropped = 0
+        self._flushes = 0
+        self._rotations = 0
+        self._write_errors = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, event: dict[str, Any]) -> None:
+        """Buffer one event; flushes synchronously only when a threshold is reached."""
+        line = json.dumps(event, ensure_ascii=True, default=_json_default) + "\n"
+        with self._lock:
+            if self._closed or len(self._buffer) >= self._max_buffered_events:
+                self._dropped += 1
+                return
+            if self._buffer_since is None:
+                self._buffer_since = time.monotonic()
+            self._buffer.append(line)
+            self._buffer_bytes += len(line)
+            if self._buffer_bytes >= self._flush_bytes:
+                self._flush_locked()
+
+    def maybe_flush(self) -> None:
+        """Flush if the oldest buffered event exceeds the flush interval."""
+        with self._lock:
+            if self._buffer_since is None:
+                return
+            if time.monotonic() - self._buffer_since < self._flush_interval_s:
+                return
+            self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+            self._close_file_locked()
+            threads = list(self._compress_threads)
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "path": str(self._path),
+                "written_events": self._written,
+                "dropped_events": self._dropped,
+                "buffered_events": len(self._buffer),
+                "flushes": self._flushes,
+                "rotations": self._rotations,
+                "write_errors": self._write_errors,
+                "file_bytes": self._file_bytes,
+            }
+
+    # -- internals --------------------------------------------------------------
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        lines = self._buffer
+        try:
+            if self._file is None:
+                self._open_file_locked()
+            data = "".join(lines)
+            self._file.write(data)
+            self._file.flush()
+        except OSError as exc:
+            # Keep the buffer for the next attempt; write() drops once it is full.
+            self._write_errors += 1
+            self._close_file_locked()
+            logger.warning("Failed to write inference event log %s: %s", self._path, exc)
+            return
+        self._written += len(lines)
+        self._file_bytes += len(data)
+        self._flushes += 1
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_since = None
+        if self._file_bytes >= self._max_bytes:
+            self._rotate_locked()
+
+    def _open_file_locked(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("a", encoding="utf-8")
+        self._file_bytes = self._file.tell()
+
+    def _close_file_locked(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        try:
+            entries = list(self._path.parent.iterdir())
+        except OSError:
+            return []
+        segments = []
+        for entry in entries:
+            match = self._segment_pattern.match(entry.name)
+            if match:
+                segments.append((int(match.group(1)), entry))
+        return sorted(segments)
+
+    def _scan_next_segment(self) -> int:
+        segments = self._segments()
+        return segments[-1][0] + 1 if segments else 1
+
+    def _rotate_locked(self) -> None:
+        self._close_file_locked()
+        rotated = self._path.with_name(f"{self._path.name}.{self._next_segment}")
+        try:
+            self._path.rename(rotated)
+        except OSError as exc:
+            self._write_errors += 1
+            logger.warning("Failed to rotate inference event log %s: %s", self._path, exc)
+            return
+        self._next_segment += 1
+        self._rotations += 1
+        self._file_bytes = 0
+        self._prune_segments_locked()
+        if self._compress:
+            self._compress_threads = [thread for thread in self._compress_threads if thread.is_alive()]
+            thread = threading.Thread(
+                target=self._compress_segment,
+                args=(rotated,),
+                name="inference-event-log-compress",
+                daemon=True,
+            )
+            self._compress_threads.append(thread)
+            thread.start()
+
+    def _prune_segments_locked(self) -> None:
+        segments = self._segments()
+        indexes = sorted({index for index, _ in segments})
+        expired = set(indexes[: max(len(indexes) - self._max_segments, 0)])
+        for index, segment in segments:
+            if index not in expired:
+                continue
+            try:
+                segment.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _compress_segment(path: Path) -> None:
+        target = Path(f"{path}.gz")
+        tmp_target = Path(f"{target}.tmp")
+        try:
+            with path.open("rb") as source, gzip.open(tmp_target, "wb") as sink:
+                shutil.copyfileobj(source, sink)
+            os.replace(tmp_target, target)
+            path.unlink()
+        except OSError as exc:
+            tmp_target.unlink(missing_ok=True)
+            logger.warning("Failed to compress inference event log segment %s: %s", path, exc)
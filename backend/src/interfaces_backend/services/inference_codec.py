@@ -0,0 +1,94 @@
+"""Wire encoding for inference worker control and event messages.
+
+Two encodings are supported and negotiated per worker session:
+
+- ``json``: a single UTF-8 JSON frame (protocol default, always accepted).
+- ``msgpack``: a msgpack header frame followed by zero or more blob frames.
+  ``bytes`` values of at least ``BLOB_FRAME_MIN_BYTES`` are moved out of the
+  header into their own frames and referenced by a msgpack extension type, so
+  large detail payloads are neither copied into the header nor re-encoded.
+
+Decoding sniffs the first byte of the header frame, so a receiver accepts
+either encoding regardless of what was negotiated.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Sequence
+
+import msgpack
+import zmq
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+SUPPORTED_ENCODINGS = (ENCODING_MSGPACK, ENCODING_JSON)
+BLOB_FRAME_MIN_BYTES = 16 * 1024
+
+_BLOB_EXT_CODE = 1
+_JSON_FIRST_BYTES = frozenset(b'{["')
+
+
+def _buffer(frame: Any) -> memoryview:
+    if isinstance(frame, zmq.Frame):
+        return frame.buffer
+    return memoryview(frame)
+
+
+def frames_nbytes(frames: Sequence[Any]) -> int:
+    """Total encoded size of a multipart message."""
+    return sum(_buffer(frame).nbytes for frame in frames)
+
+
+def _extract_blobs(value: Any, blobs: list[Any]) -> Any:
+    if isinstance(value, dict):
+        return {key: _extract_blobs(item, blobs) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_extract_blobs(item, blobs) for item in value]
+    if isinstance(value, (bytes, bytearray, memoryview)) and len(value) >= BLOB_FRAME_MIN_BYTES:
+        blobs.append(value)
+        return msgpack.ExtType(_BLOB_EXT_CODE, len(blobs).to_bytes(4, "little"))
+    return value
+
+
+def encode_message(message: dict[str, Any], encoding: str) -> list[Any]:
+    """Encode ``message`` as multipart frames (header first)."""
+    if encoding == ENCODING_MSGPACK:
+        blobs: list[Any] = []
+        header = msgpack.packb(_extract_blobs(message, blobs), use_bin_type=True)
+        return [header, *blobs]
+    return [json.dumps(message, ensure_ascii=True).encode("utf-8")]
+
+
+def decode_message(frames: Sequence[Any], *, keep_blobs: bool = True) -> Any:
+    """Decode a multipart message in either encoding.
+
+    Blob frames are returned as zero-copy ``memoryview`` objects; with
+    ``keep_blobs=False`` they are replaced by ``{"blob_bytes": <size>}`` so the
+    result stays JSON-serializable.
+    """
+    if not frames:
+        raise ValueError("empty message")
+    header = _buffer(frames[0])
+    if header.nbytes == 0:
+        raise ValueError("empty message header")
+    if header[0] in _JSON_FIRST_BYTES:
+        return json.loads(header.tobytes())
+
+    blobs = frames[1:]
+
+    def ext_hook(code: int, data: bytes) -> Any:
+        if code != _BLOB_EXT_CODE:
+            return msgpack.ExtType(code, data)
+        index = int.from_bytes(data, "little") - 1
+        if not 0 <= index < len(blobs):
+            raise ValueError(f"missing blob frame {index + 1}")
+        blob = _buffer(blobs[index])
+        return blob if keep_blobs else {"blob_bytes": blob.nbytes}
+
+    try:
+        return msgpack.unpackb(header, ext_hook=ext_hook, raw=False)
+    except ValueError:
+        raise
+    except Exception as exc:  # msgpack raises several non-ValueError types
+        raise ValueError(f"invalid msgpack message: {exc}") from exc
@@ -0,0 +1,218 @@
+"""Pipelined ZMQ control client for the inference worker.
+
+A single ``DEALER`` socket is owned by a dedicated I/O thread. Callers from
+any thread (or event loop) submit requests and get a future back; replies are
+matched by ``request_id`` so several commands can be in flight at once, each
+with its own deadline. A timed-out request is simply forgotten: its late reply
+is discarded, and the socket never needs to be rebuilt.
+
+The worker's control socket may be ``REP`` or ``ROUTER``. Every message is
+sent with an empty delimiter frame so a ``REP`` peer sees a regular request.
+Replies without a ``request_id`` are matched in send order, which is what a
+``REP`` peer guarantees. Messages are pre-encoded multipart frames (see
+``inference_codec``); replies are decoded in either encoding.
+"""
+
+from __future__ import annotations
+
+import queue
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+import zmq
+
+from interfaces_backend.services.inference_codec import decode_message, frames_nbytes
+
+_IDLE_POLL_MS = 100
+# Bound on remembered send order (expired requests whose replies never arrived).
+_MAX_TRACKED_REPLIES = 4096
+
+
+class ControlTimeoutError(TimeoutError):
+    """No reply arrived before the request deadline."""
+
+
+class ControlClosedError(RuntimeError):
+    """The control client was closed while a request was pending."""
+
+
+@dataclass(frozen=True)
+class ControlReply:
+    message: Any
+    nbytes: int
+
+
+@dataclass
+class _PendingRequest:
+    request_id: str
+    frames: list[Any]
+    deadline: float
+    future: Future = field(default_factory=Future)
+
+
+class InferenceControlClient:
+    """Thread-safe, pipelined request/reply client over a ``DEALER`` socket."""
+
+    def __init__(self, ctx: zmq.Context, endpoint: str, *, name: str = "inference-ctrl") -> None:
+        self._ctx = ctx
+        self._endpoint = endpoint
+        self._outbox: queue.SimpleQueue[_PendingRequest] = queue.SimpleQueue()
+        self._closed = threading.Event()
+        # Writing to the socketpair wakes the I/O thread out of zmq.Poller.poll().
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    def submit(self, request_id: str, frames: list[Any], timeout_ms: int) -> Future:
+        """Queue an encoded request; returns a future resolving to a :class:`ControlReply`."""
+        pending = _PendingRequest(
+            request_id=str(request_id),
+            frames=list(frames),
+            deadline=time.monotonic() + max(int(timeout_ms), 1) / 1000.0,
+        )
+        if self._closed.is_set():
+            pending.future.set_exception(ControlClosedError("control client is closed"))
+            return pending.future
+        self._outbox.put(pending)
+        self._wake()
+        return pending.future
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+    # -- I/O thread -----------------------------------------------------------
+
+    def _wake(self) -> None:
+        try:
+            self._wake_send.send(b"\0")
+        except (BlockingIOError, OSError):
+            # Buffer full means a wake-up is already pending.
+            pass
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_recv.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run(self) -> None:
+        sock = self._ctx.socket(zmq.DEALER)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.connect(self._endpoint)
+        poller = zmq.Poller()
+        poller.register(sock, zmq.POLLIN)
+        poller.register(self._wake_recv.fileno(), zmq.POLLIN)
+
+        pending: dict[str, _PendingRequest] = {}
+        # Request ids in send order, including expired ones, for replies without request_id.
+        sent_order: deque[str] = deque(maxlen=_MAX_TRACKED_REPLIES)
+        try:
+            while not self._closed.is_set():
+                timeout_ms = _IDLE_POLL_MS
+                if pending:
+                    next_deadline = min(item.deadline for item in pending.values())
+                    timeout_ms = max(min(int((next_deadline - time.monotonic()) * 1000) + 1, _IDLE_POLL_MS), 0)
+                events = dict(poller.poll(timeout_ms))
+                if self._wake_recv.fileno() in events:
+                    self._drain_wake()
+                self._send_queued(sock, pending, sent_order)
+                if sock in events:
+                    self._receive_replies(sock, pending, sent_order)
+                self._expire(pending)
+        finally:
+            sock.close(0)
+            self._wake_recv.close()
+            self._wake_send.close()
+            self._fail_all(pending)
+
+    def _send_queued(
+        self,
+        sock: zmq.Socket,
+        pending: dict[str, _PendingRequest],
+        sent_order: deque[str],
+    ) -> None:
+        while True:
+            try:
+                item = self._outbox.get_nowait()
+            except queue.Empty:
+                return
+            if item.future.done():
+                continue
+            try:
+                sock.send_multipart([b"", *item.frames], flags=zmq.NOBLOCK, copy=False)
+            except zmq.ZMQError as exc:
+                item.future.set_exception(RuntimeError(f"control send failed: {exc}"))
+                continue
+            pending[item.request_id] = item
+            sent_order.append(item.request_id)
+
+    def _receive_replies(
+        self,
+        sock: zmq.Socket,
+        pending: dict[str, _PendingRequest],
+        sent_order: deque[str],
+    ) -> None:
+        while True:
+            try:
+                frames = sock.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                return
+            # Strip the empty delimiter frame added by REP/ROUTER peers.
+            if frames and len(frames[0]) == 0:
+                frames = frames[1:]
+            try:
+                reply = decode_message(frames)
+            except ValueError:
+                # Undecodable replies still consume their slot in send order.
+                if sent_order:
+                    sent_order.popleft()
+                continue
+            request_id = str(reply.get("request_id") or "") if isinstance(reply, dict) else ""
+            if request_id:
+                try:
+                    sent_order.remove(request_id)
+                except ValueError:
+                    pass
+            elif sent_order:
+                request_id = sent_order.popleft()
+            item = pending.pop(request_id, None)
+            if item is not None and not item.future.done():
+                item.future.set_result(ControlReply(message=reply, nbytes=frames_nbytes(frames)))
+
+    @staticmethod
+    def _expire(pending: dict[str, _PendingRequest]) -> None:
+        now = time.monotonic()
+        for request_id in [key for key, item in pending.items() if item.deadline <= now]:
+            item = pending.pop(request_id)
+            if not item.future.done():
+                item.future.set_exception(ControlTimeoutError(f"no reply within deadline ({request_id})"))
+
+    def _fail_all(self, pending: dict[str, _PendingRequest]) -> None:
+        for item in pending.values():
+            if not item.future.done():
+                item.future.set_exception(ControlClosedError("control client is closed"))
+        pending.clear()
+        while True:
+            try:
+                item = self._outbox.get_nowait()
+            except queue.Empty:
+                return
+            if not item.future.done():
+                item.future.set_exception(ControlClosedError("control client is closed"))
@@ -18,14 +18,14 @@ from fastapi import HTTPException
 from interfaces_backend.services.dataset_lifecycle import DatasetLifecycle
 from interfaces_backend.services.inference_runtime import InferenceRuntimeManager
 from interfaces_backend.services.recorder_bridge import RecorderBridge
+from interfaces_backend.services.recorder_status_stream import RecorderStatusStream
 from interfaces_backend.services.session_manager import SessionState
 from interfaces_backend.services.vlabor_dashboard_bridge import (
     VlaborDashboardBridge,
     get_vlabor_dashboard_bridge,
 )
 from interfaces_backend.services.vlabor_profiles import (
-    extract_arm_namespaces,
-    extract_recorder_topic_suffixes,
+    compile_profile,
     save_session_profile_binding,
 )
 from percus_ai.storage.naming import generate_dataset_id
@@ -33,6 +33,8 @@ from percus_ai.storage.naming import generate_dataset_id
 logger = logging.getLogger(__name__)
 
 _ACTIVE_RECORDER_STATES = {"warming", "recording", "paused", "resetting", "resetting_paused"}
+# Upper bound between checks that the monitored session still exists.
+_MONITOR_RECHECK_S = 1.0
 
 
 @dataclass
@@ -66,6 +68,7 @@ class InferenceRecordingController:
         dataset: DatasetLifecycle,
         runtime: InferenceRuntimeManager,
         dashboard: VlaborDashboardBridge | None = None,
+        status_stream: RecorderStatusStream | None = None,
         batch_size: int = 20,
         default_episode_time_s: float = 60.0,
         default_reset_time_s: float = 10.0,
@@ -74,6 +77,7 @@ class InferenceRecordingController:
         self._dataset = dataset
         self._runtime = runtime
         self._dashboard = dashboard or get_vlabor_dashboard_bridge()
+        self._status_stream = status_stream or RecorderStatusStream(recorder=recorder)
         self._batch_size = max(int(batch_size), 1)
         self._default_episode_time_s = max(float(default_episode_time_s), 1.0)
         self._default_reset_time_s = max(float(default_reset_time_s), 0.0)
@@ -179,7 +183,7 @@ class InferenceRecordingController:
         recorder_state: str,
     ) -> None:
         if state.inference_paused != inference_paused:
-            self._runtime.set_paused(session_id=state.worker_session_id, paused=inference_paused)
+            await self._runtime.set_paused_async(session_id=state.worker_session_id, paused=inference_paused)
             state.inference_paused = inference_paused
         if state.teleop_enabled != teleop_enabled:
             await self._dashboard.set_teleop_enabled(enabled=teleop_enabled)
@@ -213,20 +217,24 @@ class InferenceRecordingController:
         )
 
     async def _monitor_loop(self, inference_session_id: str) -> None:
+        version = 0
         while True:
+            with self._lock:
+                state = self._states.get(inference_session_id)
+            if state is None:
+                return
+            snapshot = await self._status_stream.wait_for_change(version, timeout_s=_MONITOR_RECHECK_S)
+            if snapshot is None:
+                continue
+            version = snapshot.version
             with self._lock:
                 state = self._states.get(inference_session_id)
             if state is None:
                 return
             try:
-                status = self._recorder.status()
-            except Exception:
-                status = None
-            try:
-                await self._sync_mode_from_status(state, status)
+                await self._sync_mode_from_status(state, snapshot.status)
             except Exception as exc:
                 logger.warning("Failed to sync inference/teleop mode: %s", exc)
-            await asyncio.sleep(0.3)
 
     async def start(
         self,
@@ -241,12 +249,10 @@ class InferenceRecordingController:
             logger.warning("Skip inference recording: profile is not resolved")
             return None
 
-        cameras = self._recorder.build_cameras(session.profile.snapshot)
-        arm_namespaces = extract_arm_namespaces(session.profile.snapshot)
-        topic_suffixes = extract_recorder_topic_suffixes(
-            session.profile.snapshot,
-            arm_namespaces=arm_namespaces,
-        )
+        cameras = self._recorder.build_cameras(session.profile)
+        compiled = compile_profile(session.profile)
+        arm_namespaces = list(compiled.arm_namespaces)
+        topic_suffixes = dict(compiled.recorder_topic_suffixes)
         if not cameras:
             logger.warning("Skip inference recording: no recorder cameras resolved")
             return None
@@ -384,7 +390,7 @@ class InferenceRecordingController:
             normalized_task = task.strip()
             if not normalized_task:
                 raise HTTPException(status_code=400, detail="task must not be empty")
-            self._runtime.set_task(session_id=effective_worker_session_id, task=normalized_task)
+            await self._runtime.set_task_async(session_id=effective_worker_session_id, task=normalized_task)
             state.task = normalized_task
 
         if episode_time_s is not None:
@@ -398,7 +404,7 @@ class InferenceRecordingController:
             state.reset_time_s = float(reset_time_s)
 
         if denoising_steps is not None:
-            self._runtime.set_policy_options(
+            await self._runtime.set_policy_options_async(
                 session_id=effective_worker_session_id,
                 denoising_steps=int(denoising_steps),
             )
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import json
 import os
 import subprocess
@@ -23,6 +26,15 @@ from interfaces_backend.models.inference import (
     InferenceRunnerStatus,
     InferenceRunnerStatusResponse,
 )
+from interfaces_backend.services.inference_codec import (
+    ENCODING_JSON,
+    SUPPORTED_ENCODINGS,
+    decode_message,
+    encode_message,
+    frames_nbytes,
+)
+from interfaces_backend.services.event_log_writer import BufferedEventLogWriter
+from interfaces_backend.services.inference_control import ControlReply, InferenceControlClient
 from interfaces_backend.utils.torch_info import get_torch_info
 from percus_ai.environment.env_manager import EnvironmentManager
 from percus_ai.observability import ArmId, CommOverheadReporter, EventStatus, PointId, resolve_ids
@@ -30,12 +42,25 @@ from percus_ai.storage.paths import get_models_dir, get_project_root
 
 _PROTOCOL_NAME = "infer_v2"
 _PROTOCOL_VERSION = 3
+# Wire encodings offered to the worker in preference order; the worker picks one
+# in its reply to the startup ``get_state`` probe. JSON is used until then.
+_OFFERED_ENCODINGS = [
+    name.strip()
+    for name in os.environ.get("INFERENCE_IPC_ENCODINGS", ",".join(SUPPORTED_ENCODINGS)).split(",")
+    if name.strip() in SUPPORTED_ENCODINGS
+]
 _IPC_BASE_DIR = Path("/tmp/percus_infer")
 _DEFAULT_BRIDGE_ENDPOINT = os.environ.get("INFERENCE_BRIDGE_ZMQ_ENDPOINT", "tcp://127.0.0.1:5556")
 _CTRL_TIMEOUT_MS = int(os.environ.get("INFERENCE_CTRL_TIMEOUT_MS", "1200"))
 _START_SESSION_TIMEOUT_MS = int(os.environ.get("INFERENCE_START_SESSION_TIMEOUT_MS", "120000"))
 _STARTUP_TIMEOUT_S = float(os.environ.get("INFERENCE_STARTUP_TIMEOUT_S", "20.0"))
 _ACTION_HZ = float(os.environ.get("INFERENCE_ACTION_HZ", "30.0"))
+# Worker state is pushed as ``type == "state"`` events; when none arrives within
+# this interval the event thread falls back to a background ``get_state`` request.
+_STATE_REFRESH_INTERVAL_S = float(os.environ.get("INFERENCE_STATE_REFRESH_INTERVAL_S", "1.0"))
+# Cached state older than this is reported as stale.
+_STATE_STALE_AFTER_S = float(os.environ.get("INFERENCE_STATE_STALE_AFTER_S", "5.0"))
+_ACTIVE_RUNNER_STATES = {"starting", "handshaking", "ready", "running", "paused"}
 _COMM_REPORTER = CommOverheadReporter("backend")
 
 
@@ -84,7 +109,7 @@ class InferenceRuntimeManager:
         self._worker_proc: Optional[subprocess.Popen] = None
         self._worker_log: Optional[Any] = None
 
-        self._ctrl_socket: Optional[zmq.Socket] = None
+        self._ctrl_client: Optional[InferenceControlClient] = None
         self._event_socket: Optional[zmq.Socket] = None
         self._ctrl_endpoint: Optional[str] = None
         self._event_endpoint: Optional[str] = None
@@ -104,11 +129,15 @@ class InferenceRuntimeManager:
         self._queue_length = 0
         self._last_error: Optional[str] = None
         self._last_event: Optional[dict[str, Any]] = None
+        self._state_updated_at: Optional[float] = None
+        self._state_refresh: Optional[Future] = None
+        self._wire_encoding = ENCODING_JSON
         self._event_history: deque[dict[str, Any]] = deque(maxlen=200)
         self._request_seq = 0
         self._worker_log_path: Optional[Path] = None
         self._worker_trace_path: Optional[Path] = None
         self._event_log_path: Optional[Path] = None
+        self._event_log: Optional[BufferedEventLogWriter] = None
 
         atexit.register(self.shutdown)
 
@@ -117,7 +146,7 @@ class InferenceRuntimeManager:
     # --------------------------------------------------------------------- #
     def is_active(self) -> bool:
         with self._lock:
-            return self._runner_state in {"starting", "handshaking", "ready", "running", "paused"}
+            return self._runner_state in _ACTIVE_RUNNER_STATES
 
     def list_models(self) -> list[InferenceModelInfo]:
         with self._lock:
@@ -171,14 +200,15 @@ class InferenceRuntimeManager:
         return InferenceDeviceCompatibilityResponse(devices=devices, recommended=recommended)
 
     def get_status(self) -> InferenceRunnerStatusResponse:
-        self._refresh_state_from_worker()
-
+        """Cached runner status; never waits on worker IPC."""
         with self._lock:
+            self._check_worker_alive_locked()
             proc = self._worker_proc
             pid = proc.pid if proc else None
             proc_alive = proc is not None and proc.poll() is None
+            state_age_ms = self._state_age_ms_locked()
 
-            runner_active = self._runner_state in {"starting", "handshaking", "ready", "running", "paused"}
+            runner_active = self._runner_state in _ACTIVE_RUNNER_STATES
             runner = InferenceRunnerStatus(
                 active=runner_active,
                 session_id=self._session_id,
@@ -186,6 +216,8 @@ class InferenceRuntimeManager:
                 queue_length=self._queue_length,
                 last_error=self._last_error,
                 denoising_steps=self._denoising_steps,
+                state_age_ms=state_age_ms,
+                state_stale=self._is_state_stale(proc_alive, state_age_ms),
             )
 
             if proc_alive and runner_active:
@@ -207,8 +239,9 @@ class InferenceRuntimeManager:
         return InferenceRunnerStatusResponse(runner_status=runner, gpu_host_status=gpu_host)
 
     def get_diagnostics(self) -> dict[str, Any]:
-        self._refresh_state_from_worker()
         with self._lock:
+            self._check_worker_alive_locked()
+            state_age_ms = self._state_age_ms_locked()
             session_id = self._session_id
             state = self._runner_state
             task = self._task
@@ -218,11 +251,14 @@ class InferenceRuntimeManager:
             worker_log_path = str(self._worker_log_path) if self._worker_log_path else None
             worker_trace_path = str(self._worker_trace_path) if self._worker_trace_path else None
             event_log_path = str(self._event_log_path) if self._event_log_path else None
+            event_log = self._event_log
             recent_events = list(self._event_history)
             last_error = self._last_error
             proc = self._worker_proc
             pid = proc.pid if proc else None
             alive = proc is not None and proc.poll() is None
+        state_stale = self._is_state_stale(alive, state_age_ms)
+        event_log_stats = event_log.stats() if event_log is not None else None
 
         checks = [
             {
@@ -237,6 +273,12 @@ class InferenceRuntimeManager:
                 "ok": state == "running",
                 "detail": state,
             },
+            {
+                "key": "worker_state_fresh",
+                "description": "cached worker state is fresh",
+                "ok": not state_stale,
+                "detail": f"age_ms={state_age_ms}" if state_age_ms is not None else "no state received",
+            },
             {
                 "key": "last_error_empty",
                 "description": "last_error is empty",
@@ -260,6 +302,8 @@ class InferenceRuntimeManager:
         return {
             "session_id": session_id,
             "state": state,
+            "state_age_ms": state_age_ms,
+            "state_stale": state_stale,
             "task": task,
             "control": {
                 "ctrl_endpoint": ctrl_endpoint,
@@ -270,6 +314,7 @@ class InferenceRuntimeManager:
                 "worker_log_path": worker_log_path,
                 "worker_trace_path": worker_trace_path,
                 "event_log_path": event_log_path,
+                "event_log": event_log_stats,
                 "bridge_trace_path": os.environ.get("INFERENCE_BRIDGE_TRACE_LOG_PATH", ""),
             },
             "recent_events": recent_events,
@@ -395,6 +440,7 @@ class InferenceRuntimeManager:
         ]
 
         event_log_path.touch(exist_ok=True)
+        event_log = BufferedEventLogWriter(event_log_path)
         worker_log = open(log_path, "a", encoding="utf-8")
         worker_proc = subprocess.Popen(
             worker_cmd,
@@ -420,35 +466,47 @@ class InferenceRuntimeManager:
             self._queue_length = 0
             self._last_error = None
             self._last_event = None
+            self._state_updated_at = None
+            self._wire_encoding = ENCODING_JSON
             self._request_seq = 0
             self._event_history.clear()
             self._worker_log_path = log_path
             self._worker_trace_path = worker_trace_path
             self._event_log_path = event_log_path
+            self._event_log = event_log
 
-            self._connect_ctrl_socket_locked()
+            self._connect_ctrl_client_locked()
             self._start_event_listener_locked()
 
-        start_deadline = time.monotonic() + _STARTUP_TIMEOUT_S
-        while time.monotonic() < start_deadline:
+        # A single probe stays queued on the DEALER socket until the worker binds.
+        # It also offers binary encodings; workers that ignore the offer stay on JSON.
+        probe = self._submit_ctrl_command(
+            "get_state",
+            {"protocol": self._protocol_descriptor(encodings=_OFFERED_ENCODINGS)},
+            timeout_ms=int(_STARTUP_TIMEOUT_S * 1000),
+            raise_on_error=False,
+        )
+        while True:
             if worker_proc.poll() is not None:
                 with self._lock:
                     self._last_error = f"worker exited during startup (code={worker_proc.returncode})"
                     self._runner_state = "error"
                 self._cleanup_worker_resources()
                 raise RuntimeError("Worker exited before startup completed")
-
             try:
-                self._send_ctrl_command("get_state", {}, timeout_ms=300, raise_on_error=False)
+                probe.result(timeout=0.2)
                 break
+            except FutureTimeoutError:
+                continue
             except Exception:
-                time.sleep(0.2)
-        else:
+                break
+        if probe.exception() is not None:
             with self._lock:
                 self._last_error = "worker startup timeout"
                 self._runner_state = "error"
             self._cleanup_worker_resources()
             raise RuntimeError("Timed out waiting for worker control socket")
+        self._negotiate_encoding(probe.result())
 
         model_policy_options = dict(active_policy_options)
         if denoising_steps_value is not None:
@@ -472,7 +530,7 @@ class InferenceRuntimeManager:
                 "bridge_stream_config": dict(bridge_stream_config or {}),
             },
             "execution_hz": _ACTION_HZ,
-            "protocol": {"name": _PROTOCOL_NAME, "version": _PROTOCOL_VERSION},
+            "protocol": self._protocol_descriptor(),
         }
         if progress_callback is not None:
             progress_callback("launch_worker", 94.0, "ワーカーとハンドシェイクしています...", None)
@@ -509,31 +567,32 @@ class InferenceRuntimeManager:
             self._queue_length = 0
         return True
 
-    def set_task(self, session_id: str, task: str) -> int:
+    def _require_running_session(self, session_id: str) -> None:
         with self._lock:
             if not self._session_id or session_id != self._session_id:
                 raise RuntimeError("Active session not found")
             if not self._worker_proc or self._worker_proc.poll() is not None:
                 raise RuntimeError("Worker process is not running")
 
-        payload = {"task": task}
-        response = self._send_ctrl_command("set_task", payload, timeout_ms=1000)
+    def _apply_task(self, task: str, response: dict[str, Any]) -> int:
         applied_from_step = int(response.get("applied_from_step", 0))
         with self._lock:
             self._task = task
         return applied_from_step
 
-    def set_policy_options(
-        self,
-        session_id: str,
-        *,
-        denoising_steps: Optional[int] = None,
-    ) -> int:
+    def set_task(self, session_id: str, task: str) -> int:
+        self._require_running_session(session_id)
+        response = self._send_ctrl_command("set_task", {"task": task}, timeout_ms=1000)
+        return self._apply_task(task, response)
+
+    async def set_task_async(self, session_id: str, task: str) -> int:
+        self._require_running_session(session_id)
+        response = await self._send_ctrl_command_async("set_task", {"task": task}, timeout_ms=1000)
+        return self._apply_task(task, response)
+
+    def _policy_options_payload(self, session_id: str, denoising_steps: Optional[int]) -> dict[str, Any]:
+        self._require_running_session(session_id)
         with self._lock:
-            if not self._session_id or session_id != self._session_id:
-                raise RuntimeError("Active session not found")
-            if not self._worker_proc or self._worker_proc.poll() is not None:
-                raise RuntimeError("Worker process is not running")
             policy_type = str(self._policy_type or "").strip().lower()
         if policy_type not in {"pi0", "pi05"}:
             raise RuntimeError("denoising_steps is only supported for pi0/pi05")
@@ -542,41 +601,61 @@ class InferenceRuntimeManager:
                 raise RuntimeError("denoising_steps must be an integer")
             if denoising_steps < 1:
                 raise RuntimeError("denoising_steps must be >= 1")
-
-        payload = {
+        return {
             "policy_options": {
                 "denoising_steps": denoising_steps,
             }
         }
-        response = self._send_ctrl_command(
-            "set_policy_options",
-            payload,
-            timeout_ms=1000,
-        )
+
+    def _apply_policy_options(self, denoising_steps: Optional[int], response: dict[str, Any]) -> int:
         applied_from_step = int(response.get("applied_from_step", 0))
         with self._lock:
             self._denoising_steps = denoising_steps
         return applied_from_step
 
-    def set_paused(self, session_id: str, *, paused: bool) -> int:
+    def set_policy_options(
+        self,
+        session_id: str,
+        *,
+        denoising_steps: Optional[int] = None,
+    ) -> int:
+        payload = self._policy_options_payload(session_id, denoising_steps)
+        response = self._send_ctrl_command("set_policy_options", payload, timeout_ms=1000)
+        return self._apply_policy_options(denoising_steps, response)
+
+    async def set_policy_options_async(
+        self,
+        session_id: str,
+        *,
+        denoising_steps: Optional[int] = None,
+    ) -> int:
+        payload = self._policy_options_payload(session_id, denoising_steps)
+        response = await self._send_ctrl_command_async("set_policy_options", payload, timeout_ms=1000)
+        return self._apply_policy_options(denoising_steps, response)
+
+    def _check_can_pause(self, session_id: str) -> None:
+        self._require_running_session(session_id)
         with self._lock:
-            if not self._session_id or session_id != self._session_id:
-                raise RuntimeError("Active session not found")
-            if not self._worker_proc or self._worker_proc.poll() is not None:
-                raise RuntimeError("Worker process is not running")
             current_state = str(self._runner_state or "").strip().lower()
         if current_state not in {"running", "paused", "ready"}:
             raise RuntimeError(f"Cannot set paused while runner state is {current_state or 'unknown'}")
-        response = self._send_ctrl_command(
-            "set_paused",
-            {"paused": bool(paused)},
-            timeout_ms=1000,
-        )
+
+    def _apply_paused(self, paused: bool, response: dict[str, Any]) -> int:
         applied_from_step = int(response.get("applied_from_step", 0))
         with self._lock:
             self._runner_state = "paused" if paused else "running"
         return applied_from_step
 
+    def set_paused(self, session_id: str, *, paused: bool) -> int:
+        self._check_can_pause(session_id)
+        response = self._send_ctrl_command("set_paused", {"paused": bool(paused)}, timeout_ms=1000)
+        return self._apply_paused(paused, response)
+
+    async def set_paused_async(self, session_id: str, *, paused: bool) -> int:
+        self._check_can_pause(session_id)
+        response = await self._send_ctrl_command_async("set_paused", {"paused": bool(paused)}, timeout_ms=1000)
+        return self._apply_paused(paused, response)
+
     def shutdown(self) -> None:
         try:
             self.stop()
@@ -590,59 +669,72 @@ class InferenceRuntimeManager:
         self._request_seq += 1
         return f"req-{self._request_seq:08d}"
 
-    def _connect_ctrl_socket_locked(self) -> None:
-        if self._ctrl_socket is not None:
-            try:
-                self._ctrl_socket.close(0)
-            except Exception:
-                pass
+    def _protocol_descriptor(self, encodings: Optional[list[str]] = None) -> dict[str, Any]:
+        with self._lock:
+            descriptor: dict[str, Any] = {
+                "name": _PROTOCOL_NAME,
+                "version": _PROTOCOL_VERSION,
+                "encoding": self._wire_encoding,
+            }
+        if encodings is not None:
+            descriptor["encodings"] = list(encodings)
+        return descriptor
+
+    def _negotiate_encoding(self, probe_reply: dict[str, Any]) -> None:
+        selected = str(probe_reply.get("encoding") or ENCODING_JSON)
+        if selected not in _OFFERED_ENCODINGS:
+            selected = ENCODING_JSON
+        with self._lock:
+            self._wire_encoding = selected
+
+    def _connect_ctrl_client_locked(self) -> None:
+        if self._ctrl_client is not None:
+            self._ctrl_client.close()
         if not self._ctrl_endpoint:
             raise RuntimeError("Control endpoint is not set")
-        sock = self._ctx.socket(zmq.REQ)
-        sock.setsockopt(zmq.LINGER, 0)
-        sock.connect(self._ctrl_endpoint)
-        self._ctrl_socket = sock
+        self._ctrl_client = InferenceControlClient(self._ctx, self._ctrl_endpoint)
 
-    def _send_ctrl_command(
+    def _prepare_ctrl_command(
         self,
         command_type: str,
         payload: dict[str, Any],
-        timeout_ms: int = _CTRL_TIMEOUT_MS,
-        raise_on_error: bool = True,
-    ) -> dict[str, Any]:
+        timeout_ms: int,
+    ) -> tuple[InferenceControlClient, str, list[Any], Any]:
         session_id, trace_id = resolve_ids(self._session_id, None)
-        payload_size = len(json.dumps(payload, ensure_ascii=True).encode("utf-8"))
+        with self._lock:
+            client = self._ctrl_client
+            encoding = self._wire_encoding
+            request_id = self._next_request_id_locked()
+        request = {
+            "type": command_type,
+            "session_id": session_id,
+            "trace_id": trace_id,
+            "request_id": request_id,
+            "timestamp_ns": _now_ns(),
+            "payload": payload,
+        }
+        frames = encode_message(request, encoding)
         timer = _COMM_REPORTER.timed(
             point_id=PointId.CP_03,
             session_id=session_id,
             trace_id=trace_id,
             arm=ArmId.NONE,
-            payload_bytes=payload_size,
-            tags={"command_type": command_type, "timeout_ms": timeout_ms},
+            payload_bytes=frames_nbytes(frames),
+            tags={"command_type": command_type, "timeout_ms": timeout_ms, "encoding": encoding},
         )
-        with self._lock:
-            if not self._ctrl_socket:
-                timer.error("control socket is not connected")
-                raise RuntimeError("Control socket is not connected")
-            request_id = self._next_request_id_locked()
-            request = {
-                "type": command_type,
-                "session_id": session_id,
-                "trace_id": trace_id,
-                "request_id": request_id,
-                "timestamp_ns": _now_ns(),
-                "payload": payload,
-            }
-            self._ctrl_socket.setsockopt(zmq.SNDTIMEO, timeout_ms)
-            self._ctrl_socket.setsockopt(zmq.RCVTIMEO, timeout_ms)
-            try:
-                self._ctrl_socket.send_json(request)
-                response = self._ctrl_socket.recv_json()
-            except Exception as exc:
-                self._connect_ctrl_socket_locked()
-                timer.error(str(exc))
-                raise RuntimeError(f"control command '{command_type}' failed: {exc}") from exc
+        if client is None:
+            timer.error("control socket is not connected")
+            raise RuntimeError("Control socket is not connected")
+        return client, request_id, frames, timer
 
+    @staticmethod
+    def _finish_ctrl_command(
+        command_type: str,
+        reply: ControlReply,
+        timer: Any,
+        raise_on_error: bool,
+    ) -> dict[str, Any]:
+        response = reply.message
         if not isinstance(response, dict):
             timer.error("invalid response type")
             raise RuntimeError(f"Invalid control response for '{command_type}'")
@@ -657,9 +749,65 @@ class InferenceRuntimeManager:
             timer.error(str(detail), extra_tags={"ok": ok})
             raise RuntimeError(f"Worker rejected '{command_type}': {detail}")
 
-        timer.success(extra_tags={"ok": ok, "response_type": str(response.get("type") or "")})
+        timer.success(
+            extra_tags={
+                "ok": ok,
+                "response_type": str(response.get("type") or ""),
+                "response_bytes": reply.nbytes,
+            }
+        )
         return response_payload
 
+    def _submit_ctrl_command(
+        self,
+        command_type: str,
+        payload: dict[str, Any],
+        timeout_ms: int = _CTRL_TIMEOUT_MS,
+        raise_on_error: bool = True,
+    ) -> Future:
+        """Send a control command without waiting; the future resolves to the response payload."""
+        client, request_id, frames, timer = self._prepare_ctrl_command(command_type, payload, timeout_ms)
+        result: Future = Future()
+
+        def on_reply(reply: Future) -> None:
+            try:
+                response = reply.result()
+            except Exception as exc:
+                timer.error(str(exc))
+                error = RuntimeError(f"control command '{command_type}' failed: {exc}")
+                error.__cause__ = exc
+                result.set_exception(error)
+                return
+            try:
+                result.set_result(self._finish_ctrl_command(command_type, response, timer, raise_on_error))
+            except Exception as exc:
+                result.set_exception(exc)
+
+        client.submit(request_id, frames, timeout_ms).add_done_callback(on_reply)
+        return result
+
+    def _send_ctrl_command(
+        self,
+        command_type: str,
+        payload: dict[str, Any],
+        timeout_ms: int = _CTRL_TIMEOUT_MS,
+        raise_on_error: bool = True,
+    ) -> dict[str, Any]:
+        future = self._submit_ctrl_command(command_type, payload, timeout_ms, raise_on_error)
+        # The control client enforces the deadline; the margin only guards against a stuck I/O thread.
+        return future.result(timeout=timeout_ms / 1000.0 + 1.0)
+
+    async def _send_ctrl_command_async(
+        self,
+        command_type: str,
+        payload: dict[str, Any],
+        timeout_ms: int = _CTRL_TIMEOUT_MS,
+        raise_on_error: bool = True,
+    ) -> dict[str, Any]:
+        return await asyncio.wrap_future(
+            self._submit_ctrl_command(command_type, payload, timeout_ms, raise_on_error)
+        )
+
     def _start_event_listener_locked(self) -> None:
         self._event_stop.clear()
 
@@ -691,13 +839,22 @@ class InferenceRuntimeManager:
 
             try:
                 if sock.poll(200) == 0:
+                    self._refresh_state_if_due()
+                    event_log = self._event_log
+                    if event_log is not None:
+                        event_log.maybe_flush()
                     continue
-                event = sock.recv_json(flags=zmq.NOBLOCK)
+                frames = sock.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+                event = decode_message(frames, keep_blobs=False)
             except Exception:
                 continue
 
             if not isinstance(event, dict):
                 continue
+            if event.get("type") == "state":
+                state_payload = event.get("payload")
+                self._apply_worker_state(state_payload if isinstance(state_payload, dict) else event)
+                continue
 
             severity = str(event.get("severity") or "")
             code = str(event.get("code") or "")
@@ -721,7 +878,7 @@ class InferenceRuntimeManager:
                 arm=ArmId.NONE,
                 status=status,
                 latency_ns=max(_now_ns() - event_timestamp_ns, 0),
-                payload_bytes=len(json.dumps(event, ensure_ascii=True).encode("utf-8")),
+                payload_bytes=frames_nbytes(frames),
                 tags={
                     "event_type": str(event.get("type") or ""),
                     "severity": severity,
@@ -740,40 +897,36 @@ class InferenceRuntimeManager:
                         self._last_error = f"{message}{suffix}"
                 if severity == "fatal":
                     self._runner_state = "error"
-                event_log_path = self._event_log_path
+                event_log = self._event_log
 
-            if event_log_path:
-                try:
-                    with event_log_path.open("a", encoding="utf-8") as fh:
-                        fh.write(json.dumps(event, ensure_ascii=True) + "\n")
-                except OSError:
-                    pass
+            if event_log is not None:
+                event_log.write(event)
+                event_log.maybe_flush()
 
     # --------------------------------------------------------------------- #
     # State refresh and cleanup
     # --------------------------------------------------------------------- #
-    def _refresh_state_from_worker(self) -> None:
-        with self._lock:
-            proc = self._worker_proc
-            session_id = self._session_id
-            proc_alive = proc is not None and proc.poll() is None
-
-        if not session_id or not proc:
+    def _check_worker_alive_locked(self) -> None:
+        proc = self._worker_proc
+        if not self._session_id or proc is None or proc.poll() is None:
             return
-
+        if self._runner_state not in {"stopped", "error"}:
+            self._runner_state = "error"
+            if not self._last_error:
+                self._last_error = f"worker exited unexpectedly (code={proc.returncode})"
+
+    def _state_age_ms_locked(self) -> Optional[int]:
+        if self._state_updated_at is None:
+            return None
+        return max(int((time.monotonic() - self._state_updated_at) * 1000), 0)
+
+    @staticmethod
+    def _is_state_stale(proc_alive: bool, state_age_ms: Optional[int]) -> bool:
         if not proc_alive:
-            with self._lock:
-                if self._runner_state not in {"stopped", "error"}:
-                    self._runner_state = "error"
-                    if not self._last_error:
-                        self._last_error = f"worker exited unexpectedly (code={proc.returncode})"
-            return
-
-        try:
-            state = self._send_ctrl_command("get_state", {}, timeout_ms=500, raise_on_error=False)
-        except Exception:
-            return
+            return False
+        return state_age_ms is None or state_age_ms > _STATE_STALE_AFTER_S * 1000
 
+    def _apply_worker_state(self, state: dict[str, Any]) -> None:
         with self._lock:
             worker_state = state.get("state")
             if isinstance(worker_state, str) and worker_state:
@@ -787,6 +940,45 @@ class InferenceRuntimeManager:
             last_error = state.get("last_error")
             if isinstance(last_error, str) and last_error:
                 self._last_error = last_error
+            self._state_updated_at = time.monotonic()
+
+    def _refresh_state_if_due(self) -> None:
+        """Request worker state in the background unless it was pushed recently."""
+        with self._lock:
+            updated_at = self._state_updated_at
+            inflight = self._state_refresh
+            self._check_worker_alive_locked()
+            proc = self._worker_proc
+            proc_alive = self._session_id is not None and proc is not None and proc.poll() is None
+        if not proc_alive or (inflight is not None and not inflight.done()):
+            return
+        if updated_at is not None and time.monotonic() - updated_at < _STATE_REFRESH_INTERVAL_S:
+            return
+        try:
+            future = self._submit_ctrl_command("get_state", {}, timeout_ms=500, raise_on_error=False)
+        except Exception:
+            return
+        future.add_done_callback(
+            lambda done: self._apply_worker_state(done.result()) if done.exception() is None else None
+        )
+        with self._lock:
+            self._state_refresh = future
+
+    def _refresh_state_from_worker(self) -> None:
+        with self._lock:
+            self._check_worker_alive_locked()
+            proc = self._worker_proc
+            session_id = self._session_id
+            proc_alive = proc is not None and proc.poll() is None
+
+        if not session_id or not proc_alive:
+            return
+
+        try:
+            state = self._send_ctrl_command("get_state", {}, timeout_ms=500, raise_on_error=False)
+        except Exception:
+            return
+        self._apply_worker_state(state)
 
     def _cleanup_worker_resources(self) -> None:
         with self._lock:
@@ -807,6 +999,13 @@ class InferenceRuntimeManager:
 
         self._event_stop.set()
 
+        with self._lock:
+            ctrl_client = self._ctrl_client
+            self._ctrl_client = None
+            self._state_refresh = None
+        if ctrl_client is not None:
+            ctrl_client.close()
+
         with self._lock:
             if self._event_socket is not None:
                 try:
@@ -815,13 +1014,6 @@ class InferenceRuntimeManager:
                     pass
                 self._event_socket = None
 
-            if self._ctrl_socket is not None:
-                try:
-                    self._ctrl_socket.close(0)
-                except Exception:
-                    pass
-                self._ctrl_socket = None
-
             thread = self._event_thread
             self._event_thread = None
 
@@ -845,9 +1037,13 @@ class InferenceRuntimeManager:
             self._worker_log_path = None
             self._worker_trace_path = None
             self._event_log_path = None
+            event_log = self._event_log
+            self._event_log = None
 
         if thread is not None and thread.is_alive():
             thread.join(timeout=1.0)
+        if event_log is not None:
+            event_log.close()
 
 
 _runtime_manager: Optional[InferenceRuntimeManager] = None
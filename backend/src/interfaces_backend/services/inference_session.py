@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+import copy
 import logging
 import threading
 from typing import Any
@@ -23,18 +23,16 @@ from interfaces_backend.services.recording_session import (
     get_recording_session_manager,
 )
 from interfaces_backend.services.recorder_bridge import RecorderBridge, get_recorder_bridge
+from interfaces_backend.services.recorder_status_stream import (
+    RecorderStatusStream,
+    get_recorder_status_stream,
+)
 from interfaces_backend.services.session_manager import (
     BaseSessionManager,
     SessionProgressCallback,
     SessionState,
 )
-from interfaces_backend.services.vlabor_profiles import (
-    build_inference_bridge_config,
-    build_inference_camera_aliases,
-    build_inference_joint_names,
-    extract_arm_namespaces,
-    extract_recorder_topic_suffixes,
-)
+from interfaces_backend.services.vlabor_profiles import compile_profile
 
 logger = logging.getLogger(__name__)
 _ACTIVE_RECORDER_STATES = {"warming", "recording", "paused", "resetting", "resetting_paused"}
@@ -51,16 +49,21 @@ class InferenceSessionManager(BaseSessionManager):
         recorder: RecorderBridge | None = None,
         dataset: DatasetLifecycle | None = None,
         recording_sessions: RecordingSessionManager | None = None,
+        status_stream: RecorderStatusStream | None = None,
     ) -> None:
         super().__init__()
         self._runtime = runtime or get_inference_runtime_manager()
         self._recorder = recorder or get_recorder_bridge()
         self._dataset = dataset or get_dataset_lifecycle()
         self._recording_sessions = recording_sessions or get_recording_session_manager()
+        self._status_stream = status_stream or (
+            get_recorder_status_stream() if recorder is None else RecorderStatusStream(recorder=self._recorder)
+        )
         self._recording_controller = InferenceRecordingController(
             recorder=self._recorder,
             dataset=self._dataset,
             runtime=self._runtime,
+            status_stream=self._status_stream,
         )
 
     def _drop_session_state(self, session_id: str) -> None:
@@ -105,12 +108,10 @@ class InferenceSessionManager(BaseSessionManager):
         reset_time_s: float,
     ) -> dict[str, Any]:
         profile_snapshot = state.profile.snapshot if state.profile else {}
-        cameras = self._recorder.build_cameras(profile_snapshot)
-        arm_namespaces = extract_arm_namespaces(profile_snapshot)
-        topic_suffixes = extract_recorder_topic_suffixes(
-            profile_snapshot,
-            arm_namespaces=arm_namespaces,
-        )
+        compiled = compile_profile(state.profile or profile_snapshot)
+        cameras = self._recorder.build_cameras(state.profile or profile_snapshot)
+        arm_namespaces = list(compiled.arm_namespaces)
+        topic_suffixes = dict(compiled.recorder_topic_suffixes)
         payload: dict[str, Any] = {
             "dataset_id": dataset_id,
             "dataset_name": f"eval-{state.id[:8]}",
@@ -261,7 +262,7 @@ class InferenceSessionManager(BaseSessionManager):
             task_value=task_value,
             recording_status=recording_status,
         )
-        self._runtime.set_paused(session_id=worker_session_id, paused=False)
+        await self._runtime.set_paused_async(session_id=worker_session_id, paused=False)
         state.extras["recording_started"] = True
 
     async def create(
@@ -278,14 +279,15 @@ class InferenceSessionManager(BaseSessionManager):
         )
         worker_session_id = ""
         try:
-            joint_names = build_inference_joint_names(state.profile.snapshot)
+            compiled = compile_profile(state.profile)
+            joint_names = list(compiled.inference_joint_names)
             if not joint_names:
                 raise HTTPException(
                     status_code=400,
                     detail="No inference joints configured in active profile",
                 )
-            camera_key_aliases = build_inference_camera_aliases(state.profile.snapshot)
-            bridge_stream_config = build_inference_bridge_config(state.profile.snapshot)
+            camera_key_aliases = dict(compiled.inference_camera_aliases)
+            bridge_stream_config = copy.deepcopy(compiled.inference_bridge_config)
             self._validate_inference_bridge_resolution(
                 profile_name=state.profile.name,
                 profile_source=getattr(state.profile, "source_path", "unknown"),
@@ -393,7 +395,7 @@ class InferenceSessionManager(BaseSessionManager):
                 message="推論セッション情報を保存しています...",
             )
             try:
-                self._runtime.set_paused(session_id=worker_session_id, paused=True)
+                await self._runtime.set_paused_async(session_id=worker_session_id, paused=True)
             except RuntimeError as exc:
                 raise HTTPException(status_code=400, detail=str(exc)) from exc
             except Exception as exc:
@@ -435,10 +437,7 @@ class InferenceSessionManager(BaseSessionManager):
             try:
                 recorder_result = self._recorder.stop(save_current=True)
                 if recorder_result.get("success", False):
-                    final_status = await asyncio.to_thread(
-                        self._recorder.wait_until_finalized,
-                        dataset_id,
-                    )
+                    final_status = await self._status_stream.wait_until_finalized(dataset_id)
                     if self._is_recorder_active_for_dataset(final_status, dataset_id):
                         logger.warning(
                             "Inference recording stop timed out before finalize: "
@@ -457,10 +456,7 @@ class InferenceSessionManager(BaseSessionManager):
                     )
             except HTTPException as exc:
                 if exc.status_code == 503:
-                    final_status = await asyncio.to_thread(
-                        self._recorder.wait_until_finalized,
-                        dataset_id,
-                    )
+                    final_status = await self._status_stream.wait_until_finalized(dataset_id)
                     if not self._is_recorder_active_for_dataset(final_status, dataset_id):
                         logger.info(
                             "Recorder stop request timed out but session is already inactive: "
@@ -533,7 +529,7 @@ class InferenceSessionManager(BaseSessionManager):
                 normalized_task = task.strip()
                 if not normalized_task:
                     raise HTTPException(status_code=400, detail="task must not be empty")
-                self._runtime.set_task(session_id=worker_session_id, task=normalized_task)
+                await self._runtime.set_task_async(session_id=worker_session_id, task=normalized_task)
                 next_task = normalized_task
             if episode_time_s is not None:
                 if episode_time_s <= 0:
@@ -544,7 +540,7 @@ class InferenceSessionManager(BaseSessionManager):
                     raise HTTPException(status_code=400, detail="reset_time_s must be >= 0")
                 next_reset_time_s = float(reset_time_s)
             if denoising_steps is not None:
-                self._runtime.set_policy_options(
+                await self._runtime.set_policy_options_async(
                     session_id=worker_session_id,
                     denoising_steps=int(denoising_steps),
                 )
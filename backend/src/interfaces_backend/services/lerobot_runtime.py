@@ -6,11 +6,15 @@ lerobot-ros2, rosbridge.
 
 from __future__ import annotations
 
-import json
 import logging
 import subprocess
 
-from interfaces_backend.utils.docker_compose import build_compose_command, get_lerobot_compose_file
+from interfaces_backend.services.command_runner import COMPOSE_PS_CACHE_TTL_S, get_command_runner
+from interfaces_backend.utils.docker_compose import (
+    build_compose_command,
+    get_lerobot_compose_file,
+    parse_compose_ps_entry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,7 @@ class LerobotCommandError(RuntimeError):
     """Raised when a lerobot stack command fails."""
 
 
-def start_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
+async def start_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
     """Start the lerobot-ros2 Docker stack (all compose services)."""
     compose_file = get_lerobot_compose_file()
     if not compose_file.exists():
@@ -27,17 +31,15 @@ def start_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
             raise LerobotCommandError(message)
         return subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr=message)
     compose_cmd = build_compose_command(compose_file)
-    result = subprocess.run(
-        [*compose_cmd, "up", "-d", "--build"],
-        capture_output=True,
-        text=True,
-    )
+    runner = get_command_runner()
+    result = await runner.run([*compose_cmd, "up", "-d", "--build"])
+    runner.invalidate()
     if result.returncode != 0 and strict:
         raise LerobotCommandError(f"lerobot stack start failed: {result.stderr.strip()}")
     return result
 
 
-def stop_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
+async def stop_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
     """Stop the lerobot-ros2 Docker stack (``docker compose down``)."""
     compose_file = get_lerobot_compose_file()
     if not compose_file.exists():
@@ -45,44 +47,36 @@ def stop_lerobot(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
             raise LerobotCommandError(f"Compose file not found: {compose_file}")
         return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
     compose_cmd = build_compose_command(compose_file)
-    result = subprocess.run(
-        [*compose_cmd, "down"],
-        capture_output=True,
-        text=True,
-    )
+    runner = get_command_runner()
+    result = await runner.run([*compose_cmd, "down"])
+    runner.invalidate()
     if result.returncode != 0 and strict:
         raise LerobotCommandError(f"lerobot stack stop failed: {result.stderr.strip()}")
     return result
 
 
-def get_lerobot_service_state(service: str) -> dict:
+async def get_lerobot_service_state(service: str) -> dict:
     """Return docker compose service state as a dict (empty on failure)."""
     compose_file = get_lerobot_compose_file()
     if not compose_file.exists():
         return {}
     compose_cmd = build_compose_command(compose_file)
-    result = subprocess.run(
+    result = await get_command_runner().run_shared(
         [*compose_cmd, "ps", "--format", "json", service],
-        capture_output=True,
-        text=True,
+        ttl_s=COMPOSE_PS_CACHE_TTL_S,
     )
     if result.returncode != 0 or not result.stdout:
         return {}
     try:
-        data = json.loads(result.stdout)
-    except Exception:
+        return parse_compose_ps_entry(result.stdout) or {}
+    except ValueError:
         return {}
-    if isinstance(data, list):
-        return data[0] if data else {}
-    if isinstance(data, dict):
-        return data
-    return {}
 
 
-def stop_lerobot_on_backend_startup(logger: logging.Logger | None = None) -> None:
+async def stop_lerobot_on_backend_startup(logger: logging.Logger | None = None) -> None:
     """Best-effort shutdown of stale lerobot containers on backend startup."""
     active_logger = logger or logging.getLogger(__name__)
-    result = stop_lerobot(strict=False)
+    result = await stop_lerobot(strict=False)
     if result.returncode != 0:
         detail = (result.stderr or result.stdout).strip() or f"exit code={result.returncode}"
         active_logger.warning("lerobot startup cleanup failed: %s", detail)
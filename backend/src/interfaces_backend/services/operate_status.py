@@ -0,0 +1,413 @@
+"""Background watchers behind the operate status (containers, links, driver).
+
+``OperateStatusMonitor`` keeps the latest state of every operate component
+so API handlers never run ``docker compose ps``, TCP probes or torch
+detection themselves:
+
+- container states follow ``docker compose events`` and are re-read with
+  ``docker compose ps`` only when a container lifecycle event arrives;
+- TCP links (zenoh, rosbridge, inference ZMQ) are probed by a background
+  thread;
+- torch/CUDA info is collected once.
+
+Each change is published on ``operate.component/<name>`` and reported to
+listeners, so streams push only when something actually changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import subprocess
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from interfaces_backend.services.realtime_events import RealtimeEventBus, get_realtime_event_bus
+from interfaces_backend.utils.docker_compose import (
+    build_compose_command,
+    get_lerobot_compose_file,
+    get_vlabor_compose_file,
+    get_vlabor_env_file,
+    parse_compose_ps_entry,
+)
+from interfaces_backend.utils.torch_info import get_torch_info
+
+OPERATE_COMPONENT_TOPIC = "operate.component"
+COMPOSE_SERVICES = ("vlabor", "lerobot-ros2")
+ZMQ_ENDPOINT = os.environ.get(
+    "INFERENCE_BRIDGE_ZMQ_ENDPOINT",
+    os.environ.get("RUNNER_BRIDGE_ZMQ_ENDPOINT", "tcp://127.0.0.1:5556"),
+)
+
+_LINK_PROBE_INTERVAL_S = 2.0
+# Re-read container state this often while `docker compose events` is unavailable.
+_COMPOSE_RESYNC_INTERVAL_S = 30.0
+# Container lifecycle actions that can change `docker compose ps` output
+# (exec_* events from `docker compose exec` are deliberately ignored).
+_CONTAINER_STATE_ACTIONS = (
+    "create",
+    "start",
+    "restart",
+    "stop",
+    "die",
+    "kill",
+    "pause",
+    "unpause",
+    "destroy",
+    "oom",
+    "health_status",
+)
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class ContainerState:
+    """``entry`` is the ``docker compose ps --format json`` row, None when absent."""
+
+    service: str
+    entry: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LinkState:
+    name: str
+    ok: bool
+    message: str
+    endpoint: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LinkTarget:
+    name: str
+    host_port: Optional[tuple[str, int]]
+    endpoint: Optional[str] = None
+
+
+def check_tcp(host: str, port: int, timeout: float = 0.6) -> tuple[bool, str]:
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True, "ok"
+    except Exception as exc:  # noqa: BLE001 - surfaced to UI
+        return False, str(exc)
+
+
+def parse_tcp_endpoint(endpoint: str) -> Optional[tuple[str, int]]:
+    if not endpoint:
+        return None
+    raw = endpoint
+    if raw.startswith("tcp://"):
+        raw = raw[len("tcp://") :]
+    raw = raw.split("/")[0]
+    if ":" not in raw:
+        return None
+    host, port_str = raw.rsplit(":", 1)
+    host = host.strip() or "127.0.0.1"
+    if host in ("0.0.0.0", "*"):
+        host = "127.0.0.1"
+    try:
+        port = int(port_str)
+    except ValueError:
+        return None
+    return host, port
+
+
+def resolve_compose_for_service(service: str) -> tuple[list[str], Path]:
+    if service == "vlabor":
+        compose_file = get_vlabor_compose_file()
+        return build_compose_command(compose_file, get_vlabor_env_file()), compose_file
+    compose_file = get_lerobot_compose_file()
+    return build_compose_command(compose_file), compose_file
+
+
+def read_container_state(service: str) -> ContainerState:
+    """Blocking ``docker compose ps`` for one service (watcher threads only)."""
+    compose_cmd, compose_file = resolve_compose_for_service(service)
+    if not compose_file.exists():
+        return ContainerState(service=service, error=f"{compose_file} not found")
+
+    result = subprocess.run(
+        [*compose_cmd, "ps", "--format", "json", service],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return ContainerState(service=service, error=result.stderr.strip() or "compose error")
+    try:
+        entry = parse_compose_ps_entry(result.stdout)
+    except ValueError:
+        return ContainerState(service=service, error="compose parse failed")
+    return ContainerState(service=service, entry=entry or None)
+
+
+def is_container_state_event(event: dict[str, Any]) -> bool:
+    if str(event.get("type") or "container") != "container":
+        return False
+    action = str(event.get("action") or "")
+    return action.startswith(_CONTAINER_STATE_ACTIONS)
+
+
+def default_link_targets() -> list[LinkTarget]:
+    return [
+        LinkTarget(name="zenoh", host_port=("127.0.0.1", 7447)),
+        LinkTarget(name="rosbridge", host_port=("127.0.0.1", 9090)),
+        LinkTarget(name="zmq", host_port=parse_tcp_endpoint(ZMQ_ENDPOINT), endpoint=ZMQ_ENDPOINT),
+    ]
+
+
+def probe_link(target: LinkTarget) -> LinkState:
+    if target.host_port is None:
+        return LinkState(name=target.name, ok=False, message="invalid endpoint", endpoint=target.endpoint)
+    ok, message = check_tcp(*target.host_port)
+    return LinkState(name=target.name, ok=ok, message=message, endpoint=target.endpoint)
+
+
+class ContainerStateWatcher:
+    """Keeps one compose service's container state current from ``docker compose events``."""
+
+    def __init__(
+        self,
+        service: str,
+        on_state: Callable[[ContainerState], None],
+        *,
+        resync_interval_s: float = _COMPOSE_RESYNC_INTERVAL_S,
+    ) -> None:
+        self.service = service
+        self._on_state = on_state
+        self._resync_interval_s = max(float(resync_interval_s), 1.0)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._process: subprocess.Popen[str] | None = None
+        self._stopped = threading.Event()
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"container-watch-{self.service}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._lock:
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    def refresh(self) -> ContainerState:
+        try:
+            state = read_container_state(self.service)
+        except Exception as exc:  # noqa: BLE001 - docker may be unavailable
+            state = ContainerState(service=self.service, error=str(exc))
+        self._on_state(state)
+        return state
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            compose_cmd, compose_file = resolve_compose_for_service(self.service)
+            if not compose_file.exists():
+                self.refresh()
+            else:
+                try:
+                    self._follow_events(compose_cmd)
+                except Exception as exc:  # noqa: BLE001 - keep watching forever
+                    logger.warning("docker compose events failed for %s: %s", self.service, exc)
+                    self.refresh()
+            self._stopped.wait(self._resync_interval_s)
+
+    def _follow_events(self, compose_cmd: list[str]) -> None:
+        process = subprocess.Popen(
+            [*compose_cmd, "events", "--json", self.service],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        with self._lock:
+            self._process = process
+        try:
+            assert process.stdout is not None
+            # Read the current state once subscribed so no transition is missed.
+            self.refresh()
+            for line in process.stdout:
+                if self._stopped.is_set():
+                    return
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(event, dict) and is_container_state_event(event):
+                    self.refresh()
+        finally:
+            with self._lock:
+                self._process = None
+            if process.poll() is None:
+                process.terminate()
+            process.wait()
+
+
+class OperateStatusMonitor:
+    """Cached operate component states, updated by background watchers."""
+
+    def __init__(
+        self,
+        bus: RealtimeEventBus | None = None,
+        *,
+        services: tuple[str, ...] = COMPOSE_SERVICES,
+        link_targets: list[LinkTarget] | None = None,
+        link_interval_s: float = _LINK_PROBE_INTERVAL_S,
+    ) -> None:
+        self._bus = bus or get_realtime_event_bus()
+        self._lock = threading.RLock()
+        self._services = tuple(services)
+        self._link_targets = list(link_targets) if link_targets is not None else default_link_targets()
+        self._link_interval_s = max(float(link_interval_s), 0.05)
+        self._containers: dict[str, ContainerState] = {}
+        self._links: dict[str, LinkState] = {}
+        self._driver: dict[str, Any] | None = None
+        self._listeners: dict[int, Listener] = {}
+        self._next_listener_id = 0
+        self._watchers: list[ContainerStateWatcher] = []
+        self._threads: list[threading.Thread] = []
+        self._started = False
+        self._stopped = threading.Event()
+        self._ready = threading.Event()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._watchers = [
+                ContainerStateWatcher(service, self.set_container_state) for service in self._services
+            ]
+            self._threads = [
+                threading.Thread(target=self._run_link_probes, name="operate-link-monitor", daemon=True),
+                threading.Thread(target=self._load_driver_info, name="operate-driver-info", daemon=True),
+            ]
+        for watcher in self._watchers:
+            watcher.ensure_started()
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        for watcher in self._watchers:
+            watcher.stop()
+
+    async def wait_ready(self, timeout_s: float = 5.0) -> bool:
+        """Wait until every component has reported once; False on timeout."""
+        if self._ready.is_set():
+            return True
+        return await asyncio.to_thread(self._ready.wait, timeout_s)
+
+    def add_listener(self, listener: Listener) -> Callable[[], None]:
+        """Call ``listener(component)`` (from a watcher thread) on every change."""
+        with self._lock:
+            listener_id = self._next_listener_id
+            self._next_listener_id += 1
+            self._listeners[listener_id] = listener
+
+        def remove() -> None:
+            with self._lock:
+                self._listeners.pop(listener_id, None)
+
+        return remove
+
+    def container_state(self, service: str) -> ContainerState | None:
+        with self._lock:
+            return self._containers.get(service)
+
+    def link_states(self) -> dict[str, LinkState]:
+        with self._lock:
+            return dict(self._links)
+
+    def driver_info(self) -> dict[str, Any] | None:
+        with self._lock:
+            return dict(self._driver) if self._driver is not None else None
+
+    def set_container_state(self, state: ContainerState) -> None:
+        with self._lock:
+            if self._containers.get(state.service) == state:
+                return
+            self._containers[state.service] = state
+        self._changed(state.service, asdict(state))
+
+    def set_link_state(self, state: LinkState) -> None:
+        with self._lock:
+            if self._links.get(state.name) == state:
+                return
+            self._links[state.name] = state
+            links = dict(self._links)
+        self._changed("network", {name: asdict(link) for name, link in links.items()})
+
+    def set_driver_info(self, info: dict[str, Any]) -> None:
+        with self._lock:
+            if self._driver == info:
+                return
+            self._driver = dict(info)
+        self._changed("driver", dict(info))
+
+    def _changed(self, component: str, payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._version += 1
+            listeners = list(self._listeners.values())
+            if not self._ready.is_set() and self._is_complete():
+                self._ready.set()
+        self._bus.publish_threadsafe(OPERATE_COMPONENT_TOPIC, component, payload)
+        for listener in listeners:
+            try:
+                listener(component)
+            except Exception:  # noqa: BLE001 - one listener must not break the others
+                logger.exception("Operate status listener failed")
+
+    def _is_complete(self) -> bool:
+        return (
+            all(service in self._containers for service in self._services)
+            and all(target.name in self._links for target in self._link_targets)
+            and self._driver is not None
+        )
+
+    def _run_link_probes(self) -> None:
+        while not self._stopped.is_set():
+            for target in self._link_targets:
+                self.set_link_state(probe_link(target))
+            self._stopped.wait(self._link_interval_s)
+
+    def _load_driver_info(self) -> None:
+        try:
+            info = get_torch_info()
+        except Exception as exc:  # noqa: BLE001 - surfaced as driver error
+            info = {"error": str(exc)}
+        self.set_driver_info(info)
+
+
+_monitor: OperateStatusMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_operate_status_monitor() -> OperateStatusMonitor:
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = OperateStatusMonitor()
+    return _monitor
@@ -3,15 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
+from interfaces_backend.utils.sse import WIRE_KEYS, format_sse_event
+
 
 Channel = tuple[str, str]
 
+_HISTORY_SIZE = 8
+# The replay tail of a channel is also capped by encoded size; the newest
+# event is always kept.
+_HISTORY_MAX_BYTES = 512 * 1024
+# How long a channel without subscribers keeps its tail for reconnecting
+# clients before it is trimmed back to the latest event.
+_RESUME_TTL_S = 60.0
+
+
+def encode_payload(payload: Any) -> str:
+    """Canonical JSON encoding used for SSE frames and change detection."""
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True)
+
 
 @dataclass
 class RealtimeSubscription:
@@ -20,6 +39,8 @@ class RealtimeSubscription:
     queue: asyncio.Queue[dict[str, Any]]
     _bus: "RealtimeEventBus"
     _subscriber_id: str
+    # Event matching the client's Last-Event-ID; stream deltas are based on it.
+    resume_event: dict[str, Any] | None = None
     _closed: bool = False
 
     def close(self) -> None:
@@ -29,37 +50,181 @@ class RealtimeSubscription:
         self._bus.unsubscribe(self.topic, self.key, self._subscriber_id)
 
 
-class RealtimeEventBus:
-    """Simple latest-state event bus with per-channel subscriptions."""
+class _ChannelHistory:
+    """Replay tail of one channel, oldest first, with encoded sizes."""
+
+    __slots__ = ("events", "sizes", "total_bytes")
+
+    def __init__(self) -> None:
+        self.events: deque[dict[str, Any]] = deque()
+        self.sizes: deque[int] = deque()
+        self.total_bytes = 0
+
+    def append(self, event: dict[str, Any], size: int, *, max_events: int, max_bytes: int) -> None:
+        if self.events:
+            # Only the newest event keeps its wire forms; replaying an older
+            # one (rare) re-encodes it from the payload.
+            previous = self.events[-1]
+            self.events[-1] = {key: value for key, value in previous.items() if key not in WIRE_KEYS}
+        self.events.append(event)
+        self.sizes.append(size)
+        self.total_bytes += size
+        while len(self.events) > 1 and (len(self.events) > max_events or self.total_bytes > max_bytes):
+            self._drop_oldest()
+
+    def trim_to_latest(self) -> None:
+        while len(self.events) > 1:
+            self._drop_oldest()
+
+    def _drop_oldest(self) -> None:
+        self.events.popleft()
+        self.total_bytes -= self.sizes.popleft()
+
+
+class _ChannelBacklog:
+    """Pending events per channel; ``len()`` is the total (asyncio.Queue relies on it)."""
 
     def __init__(self) -> None:
+        self.channels: dict[Channel, deque[dict[str, Any]]] = {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class ChannelQueue(asyncio.Queue):
+    """Queue shared by several channels with a separate bound per channel.
+
+    Used by multiplexed streams: a burst on one channel drops that channel's
+    oldest events only, never another channel's. Channels are served
+    round-robin.
+    """
+
+    def __init__(self, *, max_per_channel: int = 32) -> None:
+        self._max_per_channel = max(int(max_per_channel), 1)
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = _ChannelBacklog()
+
+    def _put(self, item: dict[str, Any]) -> None:
+        backlog = self._queue
+        channel = (item.get("topic", ""), item.get("key", ""))
+        pending = backlog.channels.get(channel)
+        if pending is None:
+            pending = backlog.channels[channel] = deque()
+        if len(pending) >= self._max_per_channel:
+            pending.popleft()
+            backlog.size -= 1
+        pending.append(item)
+        backlog.size += 1
+
+    def _get(self) -> dict[str, Any]:
+        backlog = self._queue
+        channel, pending = next(iter(backlog.channels.items()))
+        item = pending.popleft()
+        backlog.size -= 1
+        # Re-insert at the end so channels take turns.
+        del backlog.channels[channel]
+        if pending:
+            backlog.channels[channel] = pending
+        return item
+
+    def discard(self, topic: str, key: str) -> None:
+        pending = self._queue.channels.pop((topic, key), None)
+        if pending:
+            self._queue.size -= len(pending)
+
+
+class RealtimeEventBus:
+    """Simple latest-state event bus with per-channel subscriptions.
+
+    Every event carries an ``id`` (``<bus epoch>:<seq>``) and a short tail
+    of each channel (``history_size`` events, ``history_max_bytes`` of
+    encoded payload) is kept, so a reconnecting client that sends
+    ``Last-Event-ID`` receives only the events it missed. Ids from another
+    bus instance (e.g. before a backend restart) never match. A channel
+    whose subscribers are gone for ``resume_ttl_s`` keeps only its latest
+    event.
+
+    Payloads are encoded once at publish time: events carry the canonical
+    JSON (``encoded``) and the ready-to-send SSE frame (``frame``), which
+    every subscriber reuses, plus a ``deltas`` cache shared by delta-mode
+    streams. Only the newest event of a channel keeps these in the history.
+    Events and payloads must not be mutated after publishing.
+    ``channel_seq`` numbers the events of each channel consecutively.
+    """
+
+    def __init__(
+        self,
+        *,
+        history_size: int = _HISTORY_SIZE,
+        history_max_bytes: int = _HISTORY_MAX_BYTES,
+        resume_ttl_s: float = _RESUME_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._lock = threading.RLock()
         self._loop: asyncio.AbstractEventLoop | None = None
-        self._latest: dict[Channel, dict[str, Any]] = {}
+        self._history_size = max(int(history_size), 1)
+        self._history_max_bytes = max(int(history_max_bytes), 0)
+        self._resume_ttl_s = max(float(resume_ttl_s), 0.0)
+        self._clock = clock
+        self._history: dict[Channel, _ChannelHistory] = {}
+        # Channels without subscribers that still hold a replay tail.
+        self._idle_since: dict[Channel, float] = {}
         self._subscribers: dict[Channel, dict[str, asyncio.Queue[dict[str, Any]]]] = {}
+        self._epoch = uuid4().hex[:8]
         self._seq = 0
 
-    def subscribe(self, topic: str, key: str, *, max_queue_size: int = 32) -> RealtimeSubscription:
+    def subscribe(
+        self,
+        topic: str,
+        key: str,
+        *,
+        max_queue_size: int = 32,
+        last_event_id: str | None = None,
+        queue: asyncio.Queue[dict[str, Any]] | None = None,
+    ) -> RealtimeSubscription:
+        """Subscribe to a channel; pass ``queue`` to share one queue between channels."""
         loop = asyncio.get_running_loop()
         channel = (topic, key)
         subscriber_id = uuid4().hex
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue_size)
-        latest: dict[str, Any] | None = None
+        if queue is None:
+            queue = asyncio.Queue(maxsize=max_queue_size)
         with self._lock:
             self._loop = loop
             bucket = self._subscribers.setdefault(channel, {})
             bucket[subscriber_id] = queue
-            latest = self._latest.get(channel)
-        if latest is not None:
-            self._queue_put_latest(queue, latest)
+            self._idle_since.pop(channel, None)
+            self._trim_idle_locked()
+            resume_event, backlog = self._backlog_locked(channel, last_event_id)
+        for event in backlog:
+            self._queue_put_latest(queue, event)
         return RealtimeSubscription(
             topic=topic,
             key=key,
             queue=queue,
             _bus=self,
             _subscriber_id=subscriber_id,
+            resume_event=resume_event,
         )
 
+    def _backlog_locked(
+        self,
+        channel: Channel,
+        last_event_id: str | None,
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        history = self._history.get(channel)
+        if history is None or not history.events:
+            return None, []
+        if last_event_id:
+            events = list(history.events)
+            for index, event in enumerate(events):
+                if event["id"] == last_event_id:
+                    return event, events[index + 1 :]
+        # Unknown or expired id: start from the latest state.
+        return None, [history.events[-1]]
+
     def unsubscribe(self, topic: str, key: str, subscriber_id: str) -> None:
         channel = (topic, key)
         with self._lock:
@@ -69,6 +234,22 @@ class RealtimeEventBus:
             bucket.pop(subscriber_id, None)
             if not bucket:
                 self._subscribers.pop(channel, None)
+                if channel in self._history:
+                    # Keep collecting a tail for clients that reconnect soon.
+                    self._idle_since[channel] = self._clock()
+            self._trim_idle_locked()
+
+    def _trim_idle_locked(self) -> None:
+        """Trim channels unsubscribed for ``resume_ttl_s`` back to their latest event."""
+        if not self._idle_since:
+            return
+        cutoff = self._clock() - self._resume_ttl_s
+        for channel, idle_since in list(self._idle_since.items()):
+            if idle_since <= cutoff:
+                del self._idle_since[channel]
+                history = self._history.get(channel)
+                if history is not None:
+                    history.trim_to_latest()
 
     def subscriber_count(self, topic: str, key: str) -> int:
         channel = (topic, key)
@@ -78,17 +259,32 @@ class RealtimeEventBus:
                 return 0
             return len(bucket)
 
-    async def publish(self, topic: str, key: str, payload: dict[str, Any]) -> None:
-        """Publish from event-loop context."""
-        event = self._build_event(topic=topic, key=key, payload=payload)
-        queues = self._store_and_get_queues(topic=topic, key=key, event=event)
+    async def publish(
+        self,
+        topic: str,
+        key: str,
+        payload: dict[str, Any],
+        *,
+        encoded: str | None = None,
+    ) -> None:
+        """Publish from event-loop context.
+
+        ``encoded`` may pass an already computed :func:`encode_payload` result.
+        """
+        event, queues = self._store_event(topic=topic, key=key, payload=payload, encoded=encoded)
         for queue in queues:
             self._queue_put_latest(queue, event)
 
-    def publish_threadsafe(self, topic: str, key: str, payload: dict[str, Any]) -> None:
+    def publish_threadsafe(
+        self,
+        topic: str,
+        key: str,
+        payload: dict[str, Any],
+        *,
+        encoded: str | None = None,
+    ) -> None:
         """Publish safely from any thread."""
-        event = self._build_event(topic=topic, key=key, payload=payload)
-        queues = self._store_and_get_queues(topic=topic, key=key, event=event)
+        event, queues = self._store_event(topic=topic, key=key, payload=payload, encoded=encoded)
         with self._lock:
             loop = self._loop
         if loop is None or not loop.is_running() or not queues:
@@ -100,30 +296,43 @@ class RealtimeEventBus:
 
         loop.call_soon_threadsafe(dispatch)
 
-    def _store_and_get_queues(
+    def _store_event(
         self,
         *,
         topic: str,
         key: str,
-        event: dict[str, Any],
-    ) -> list[asyncio.Queue[dict[str, Any]]]:
+        payload: dict[str, Any],
+        encoded: str | None = None,
+    ) -> tuple[dict[str, Any], list[asyncio.Queue[dict[str, Any]]]]:
+        """Number the event, append it to the channel history and return its subscriber queues."""
+        if encoded is None:
+            encoded = encode_payload(payload)
         channel = (topic, key)
         with self._lock:
-            self._latest[channel] = event
-            bucket = self._subscribers.get(channel) or {}
-            return list(bucket.values())
-
-    def _build_event(self, *, topic: str, key: str, payload: dict[str, Any]) -> dict[str, Any]:
-        with self._lock:
+            history = self._history.get(channel)
+            if history is None:
+                history = self._history[channel] = _ChannelHistory()
             self._seq += 1
-            seq = self._seq
-        return {
-            "topic": topic,
-            "key": key,
-            "seq": seq,
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "payload": payload,
-        }
+            event_id = f"{self._epoch}:{self._seq}"
+            event = {
+                "topic": topic,
+                "key": key,
+                "seq": self._seq,
+                "channel_seq": history.events[-1]["channel_seq"] + 1 if history.events else 1,
+                "id": event_id,
+                "ts": datetime.now(timezone.utc).isoformat(),
+                "payload": payload,
+                "encoded": encoded,
+                "frame": format_sse_event(encoded, None, event_id).encode("utf-8"),
+                "deltas": {},
+            }
+            history.append(event, len(encoded), max_events=self._history_size, max_bytes=self._history_max_bytes)
+            bucket = self._subscribers.get(channel)
+            if not bucket and channel not in self._idle_since:
+                # Nobody can resume from a tail nobody received.
+                history.trim_to_latest()
+            self._trim_idle_locked()
+            return event, list((bucket or {}).values())
 
     @staticmethod
     def _queue_put_latest(queue: asyncio.Queue[dict[str, Any]], event: dict[str, Any]) -> None:
@@ -0,0 +1,171 @@
+"""Multiplexed realtime connections: many bus channels over one SSE stream.
+
+A connection owns one :class:`ChannelQueue` that every channel subscription
+feeds, so a browser needs a single HTTP connection and a single heartbeat no
+matter how many channels it follows. Channels are added and removed while the
+stream is open (via separate HTTP requests addressed by ``connection_id``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+from interfaces_backend.services.realtime_events import (
+    Channel,
+    ChannelQueue,
+    RealtimeEventBus,
+    RealtimeSubscription,
+    encode_payload,
+    get_realtime_event_bus,
+)
+from interfaces_backend.utils.sse import format_sse_event
+
+_MAX_CHANNELS_PER_CONNECTION = 64
+_HEARTBEAT_S = 25.0
+
+
+def channel_name(topic: str, key: str) -> str:
+    return f"{topic}/{key}"
+
+
+def _event_frame(event: dict[str, Any]) -> bytes:
+    # The payload is spliced in from the bus encoding rather than re-serialized.
+    encoded = event.get("encoded")
+    if not isinstance(encoded, str):
+        encoded = encode_payload(event.get("payload"))
+    header = json.dumps(
+        {
+            "topic": event.get("topic"),
+            "key": event.get("key"),
+            "seq": event.get("channel_seq"),
+            "id": event.get("id"),
+        },
+        ensure_ascii=False,
+    )
+    return format_sse_event(f'{header[:-1]}, "payload": {encoded}}}', None).encode("utf-8")
+
+
+class RealtimeMuxConnection:
+    """One client connection subscribed to a dynamic set of bus channels."""
+
+    def __init__(
+        self,
+        bus: RealtimeEventBus,
+        *,
+        user_id: str,
+        max_channels: int = _MAX_CHANNELS_PER_CONNECTION,
+        heartbeat: float = _HEARTBEAT_S,
+    ) -> None:
+        self.connection_id = uuid4().hex
+        self.user_id = user_id
+        self._bus = bus
+        self._max_channels = max(int(max_channels), 1)
+        self._heartbeat = heartbeat
+        self._queue = ChannelQueue()
+        self._subscriptions: dict[Channel, RealtimeSubscription] = {}
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def channels(self) -> list[str]:
+        return [channel_name(topic, key) for topic, key in self._subscriptions]
+
+    def subscribe(self, topic: str, key: str, *, last_event_id: str | None = None) -> bool:
+        """Add a channel; returns False if it was already subscribed."""
+        if self._closed:
+            raise RuntimeError("connection is closed")
+        channel = (topic, key)
+        if channel in self._subscriptions:
+            return False
+        if len(self._subscriptions) >= self._max_channels:
+            raise ValueError(f"too many channels on one connection (max {self._max_channels})")
+        self._subscriptions[channel] = self._bus.subscribe(
+            topic,
+            key,
+            last_event_id=last_event_id,
+            queue=self._queue,
+        )
+        return True
+
+    def unsubscribe(self, topic: str, key: str) -> bool:
+        subscription = self._subscriptions.pop((topic, key), None)
+        if subscription is None:
+            return False
+        subscription.close()
+        self._queue.discard(topic, key)
+        return True
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for subscription in self._subscriptions.values():
+            subscription.close()
+        self._subscriptions.clear()
+
+    async def frames(self, is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[bytes]:
+        """SSE frames: a ``hello`` event, then channel events and shared heartbeats."""
+        hello = json.dumps({"connection_id": self.connection_id})
+        yield format_sse_event(hello, "hello").encode("utf-8")
+        while not self._closed:
+            if await is_disconnected():
+                return
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout=self._heartbeat)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            if (event.get("topic"), event.get("key")) not in self._subscriptions:
+                continue
+            yield _event_frame(event)
+
+
+class RealtimeMuxHub:
+    """Registry of open multiplexed connections."""
+
+    def __init__(self, bus: RealtimeEventBus | None = None) -> None:
+        self._bus = bus or get_realtime_event_bus()
+        self._lock = threading.Lock()
+        self._connections: dict[str, RealtimeMuxConnection] = {}
+
+    def open(self, user_id: str) -> RealtimeMuxConnection:
+        connection = RealtimeMuxConnection(self._bus, user_id=user_id)
+        with self._lock:
+            self._connections[connection.connection_id] = connection
+        return connection
+
+    def get(self, connection_id: str, *, user_id: str) -> RealtimeMuxConnection | None:
+        with self._lock:
+            connection = self._connections.get(connection_id)
+        if connection is None or connection.closed or connection.user_id != user_id:
+            return None
+        return connection
+
+    def close(self, connection_id: str) -> None:
+        with self._lock:
+            connection = self._connections.pop(connection_id, None)
+        if connection is not None:
+            connection.close()
+
+    def connection_count(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+
+_mux_hub: RealtimeMuxHub | None = None
+_mux_hub_lock = threading.Lock()
+
+
+def get_realtime_mux_hub() -> RealtimeMuxHub:
+    global _mux_hub
+    with _mux_hub_lock:
+        if _mux_hub is None:
+            _mux_hub = RealtimeMuxHub()
+    return _mux_hub
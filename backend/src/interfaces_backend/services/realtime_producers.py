@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import threading
 import time
@@ -11,7 +10,11 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
-from interfaces_backend.services.realtime_events import RealtimeEventBus, get_realtime_event_bus
+from interfaces_backend.services.realtime_events import (
+    RealtimeEventBus,
+    encode_payload,
+    get_realtime_event_bus,
+)
 
 ProducerBuilder = Callable[[], Awaitable[dict[str, Any]]]
 
@@ -21,6 +24,8 @@ logger = logging.getLogger(__name__)
 @dataclass
 class _ProducerEntry:
     task: asyncio.Task[None]
+    wake: asyncio.Event
+    loop: asyncio.AbstractEventLoop
 
 
 class RealtimeProducerHub:
@@ -45,6 +50,7 @@ class RealtimeProducerHub:
             entry = self._producers.get(channel)
             if entry is not None and not entry.task.done():
                 return
+            wake = asyncio.Event()
             task = asyncio.create_task(
                 self._run_polling_loop(
                     topic=topic,
@@ -52,9 +58,29 @@ class RealtimeProducerHub:
                     build_payload=build_payload,
                     interval=max(float(interval), 0.05),
                     idle_ttl=max(float(idle_ttl), 1.0),
+                    wake=wake,
                 )
             )
-            self._producers[channel] = _ProducerEntry(task=task)
+            self._producers[channel] = _ProducerEntry(
+                task=task,
+                wake=wake,
+                loop=asyncio.get_running_loop(),
+            )
+
+    def request_refresh(self, topic: str, key: str) -> None:
+        """Rebuild a polling channel now instead of at its next interval.
+
+        Safe to call from any thread; a no-op when the channel has no producer.
+        """
+        with self._lock:
+            entry = self._producers.get((topic, key))
+        if entry is None or entry.task.done():
+            return
+        try:
+            entry.loop.call_soon_threadsafe(entry.wake.set)
+        except RuntimeError:
+            # Producer loop already closed.
+            return
 
     async def publish_once(
         self,
@@ -74,6 +100,7 @@ class RealtimeProducerHub:
         build_payload: ProducerBuilder,
         interval: float,
         idle_ttl: float,
+        wake: asyncio.Event,
     ) -> None:
         channel = (topic, key)
         last_payload_encoded: str | None = None
@@ -85,10 +112,11 @@ class RealtimeProducerHub:
                     key=key,
                     build_payload=build_payload,
                 )
-                encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+                # The change-detection encoding is handed to the bus and reused for every subscriber.
+                encoded = encode_payload(payload)
                 if encoded != last_payload_encoded:
                     last_payload_encoded = encoded
-                    await self._bus.publish(topic, key, payload)
+                    await self._bus.publish(topic, key, payload, encoded=encoded)
 
                 if self._bus.subscriber_count(topic, key) > 0:
                     idle_started_at = None
@@ -98,7 +126,11 @@ class RealtimeProducerHub:
                     elif time.monotonic() - idle_started_at >= idle_ttl:
                         return
 
-                await asyncio.sleep(interval)
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
         finally:
             with self._lock:
                 current = self._producers.get(channel)
@@ -6,13 +6,15 @@ recording.py and inference.py.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import threading
 import time
-import urllib.error
-import urllib.request
+import weakref
 
+import httpx
 from fastapi import HTTPException
 
 from interfaces_backend.services.lerobot_runtime import (
@@ -20,7 +22,7 @@ from interfaces_backend.services.lerobot_runtime import (
     get_lerobot_service_state,
     start_lerobot,
 )
-from interfaces_backend.services.vlabor_profiles import extract_camera_specs
+from interfaces_backend.services.vlabor_profiles import VlaborProfileSpec, compile_profile
 from percus_ai.observability import ArmId, CommOverheadReporter, PointId, resolve_ids
 
 _RECORDER_URL = os.environ.get("LEROBOT_RECORDER_URL", "http://127.0.0.1:8082")
@@ -29,14 +31,37 @@ _ACTIVE_RECORDER_STATES = {"warming", "recording", "paused", "resetting", "reset
 _UPDATE_TIMEOUT_S = 20.0
 _UPDATE_MAX_ATTEMPTS = 3
 _UPDATE_RETRY_BASE_DELAY_S = 0.4
+_DEFAULT_TIMEOUT_S = 10.0
+# Per-endpoint request timeouts. Status is polled frequently, so it fails fast.
+_ENDPOINT_TIMEOUTS_S = {
+    "/api/session/status": 3.0,
+    "/api/session/start": 30.0,
+    "/api/session/stop": 30.0,
+    "/api/session/update": _UPDATE_TIMEOUT_S,
+}
+_POOL_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
 logger = logging.getLogger(__name__)
 
 
 class RecorderBridge:
     """HTTP client for the lerobot_session_recorder service."""
 
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._base_url = base_url or _RECORDER_URL
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client_lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        # httpx.AsyncClient is bound to the loop it was first used on; keep one per loop.
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
 
     # -- public API -----------------------------------------------------------
 
@@ -64,6 +89,9 @@ class RecorderBridge:
     def status(self) -> dict:
         return self._call("/api/session/status")
 
+    async def status_async(self) -> dict:
+        return await self._acall("/api/session/status")
+
     def websocket_url(self) -> str:
         base = self._base_url.rstrip("/")
         if base.startswith("https://"):
@@ -108,6 +136,38 @@ class RecorderBridge:
 
         return latest_status
 
+    async def wait_until_finalized_async(
+        self,
+        dataset_id: str,
+        timeout_s: float = 30.0,
+        poll_interval_s: float = 0.5,
+    ) -> dict | None:
+        """Async variant of :meth:`wait_until_finalized` (does not block the event loop)."""
+        deadline = time.time() + max(timeout_s, 0.0)
+        interval = max(poll_interval_s, 0.1)
+        latest_status: dict | None = None
+
+        while time.time() < deadline:
+            try:
+                status = await self.status_async()
+            except HTTPException as exc:
+                if exc.status_code != 503:
+                    raise
+                await asyncio.sleep(interval)
+                continue
+
+            latest_status = status
+            state = str(status.get("state") or "").strip().lower()
+            status_dataset_id = str(status.get("dataset_id") or "").strip()
+            if not status_dataset_id or status_dataset_id != dataset_id:
+                return status
+            if state not in _ACTIVE_RECORDER_STATES:
+                return status
+
+            await asyncio.sleep(interval)
+
+        return latest_status
+
     def redo_episode(self) -> dict:
         return self._call("/api/episode/redo", {})
 
@@ -119,21 +179,21 @@ class RecorderBridge:
 
     # -- infrastructure -------------------------------------------------------
 
-    def ensure_running(self) -> None:
+    async def ensure_running_async(self) -> None:
         """Make sure the recorder is reachable, starting Docker if needed."""
         try:
-            self._call("/api/session/status")
+            await self.status_async()
             return
         except HTTPException as exc:
             if exc.status_code != 503:
                 raise
 
         try:
-            start_lerobot(strict=True)
+            await start_lerobot(strict=True)
         except LerobotCommandError as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-        service_state = get_lerobot_service_state("lerobot-ros2")
+        service_state = await get_lerobot_service_state("lerobot-ros2")
         if service_state:
             state_raw = (service_state.get("State") or "").lower()
             if "running" not in state_raw:
@@ -144,13 +204,13 @@ class RecorderBridge:
         last_error: HTTPException | None = None
         while time.time() < deadline:
             try:
-                self._call("/api/session/status")
+                await self.status_async()
                 return
             except HTTPException as exc:
                 last_error = exc
                 if exc.status_code != 503:
                     raise
-            time.sleep(1)
+            await asyncio.sleep(1)
 
         detail = "Recorder unreachable after start"
         if last_error and last_error.detail:
@@ -160,17 +220,9 @@ class RecorderBridge:
     # -- helpers --------------------------------------------------------------
 
     @staticmethod
-    def build_cameras(profile_snapshot: dict) -> list[dict]:
-        """Build the camera list for the recorder from a profile snapshot."""
-        cameras: list[dict] = []
-        for spec in extract_camera_specs(profile_snapshot):
-            if not bool(spec.get("enabled", True)):
-                continue
-            name = str(spec.get("name") or "").strip()
-            topic = str(spec.get("topic") or "").strip()
-            if name and topic:
-                cameras.append({"name": name, "topic": topic})
-        return cameras
+    def build_cameras(profile: VlaborProfileSpec | dict) -> list[dict]:
+        """Build the camera list for the recorder from a profile or profile snapshot."""
+        return [dict(camera) for camera in compile_profile(profile).recorder_cameras]
 
     # -- internal HTTP --------------------------------------------------------
 
@@ -179,7 +231,7 @@ class RecorderBridge:
         path: str,
         payload: dict | None = None,
         *,
-        timeout_s: float = 10.0,
+        timeout_s: float | None = None,
         max_attempts: int = 1,
         retry_base_delay_s: float = 0.4,
     ) -> dict:
@@ -204,14 +256,55 @@ class RecorderBridge:
 
         raise HTTPException(status_code=503, detail=f"Recorder request timed out: {path}")
 
-    def _call(self, path: str, payload: dict | None = None, *, timeout_s: float = 10.0) -> dict:
-        url = f"{self._base_url}{path}"
+    def _http_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    base_url=self._base_url,
+                    limits=_POOL_LIMITS,
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _async_http_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    base_url=self._base_url,
+                    limits=_POOL_LIMITS,
+                    transport=self._async_transport,
+                )
+                self._async_clients[loop] = client
+            return client
+
+    def close(self) -> None:
+        with self._client_lock:
+            client = self._client
+            self._client = None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    @staticmethod
+    def _timeout_for(path: str, timeout_s: float | None) -> float:
+        if timeout_s is None:
+            timeout_s = _ENDPOINT_TIMEOUTS_S.get(path, _DEFAULT_TIMEOUT_S)
+        return max(float(timeout_s), 0.1)
+
+    @staticmethod
+    def _prepare(path: str, payload: dict | None):
         data = None
-        headers: dict[str, str] = {}
         method = "GET"
         if payload is not None:
             data = json.dumps(payload).encode("utf-8")
-            headers["Content-Type"] = "application/json"
             method = "POST"
 
         session_hint = None
@@ -229,33 +322,63 @@ class RecorderBridge:
             payload_bytes=len(data) if data is not None else 0,
             tags={"method": method, "path": path},
         )
+        return method, data, timer
 
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    @staticmethod
+    def _handle_response(path: str, response: httpx.Response, timer) -> dict:
+        body_bytes = response.content
+        if response.status_code >= 400:
+            detail = body_bytes.decode("utf-8", errors="replace") or response.reason_phrase
+            timer.error(detail, extra_tags={"status_code": response.status_code})
+            raise HTTPException(status_code=response.status_code, detail=detail)
+        timer.success(
+            extra_tags={"status_code": response.status_code, "response_bytes": len(body_bytes)}
+        )
+        body = body_bytes.decode("utf-8")
         try:
-            with urllib.request.urlopen(req, timeout=max(float(timeout_s), 0.1)) as resp:
-                body_bytes = resp.read()
-                timer.success(
-                    extra_tags={"status_code": resp.status, "response_bytes": len(body_bytes)}
-                )
-        except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8") if exc.fp else str(exc)
-            timer.error(detail, extra_tags={"status_code": exc.code})
-            raise HTTPException(status_code=exc.code, detail=detail) from exc
-        except TimeoutError as exc:
-            timer.error(str(exc), extra_tags={"status_code": 503})
+            return json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            return {"raw": body}
+
+    @staticmethod
+    def _raise_transport_error(path: str, exc: Exception, timer) -> None:
+        timer.error(str(exc), extra_tags={"status_code": 503})
+        if isinstance(exc, httpx.TimeoutException):
             raise HTTPException(
                 status_code=503,
                 detail=f"Recorder request timed out: {path}",
             ) from exc
-        except urllib.error.URLError as exc:
-            timer.error(str(exc), extra_tags={"status_code": 503})
-            raise HTTPException(status_code=503, detail=f"Recorder unreachable: {exc}") from exc
+        raise HTTPException(status_code=503, detail=f"Recorder unreachable: {exc}") from exc
 
-        body = body_bytes.decode("utf-8")
+    def _call(self, path: str, payload: dict | None = None, *, timeout_s: float | None = None) -> dict:
+        method, data, timer = self._prepare(path, payload)
+        headers = {"Content-Type": "application/json"} if data is not None else {}
         try:
-            return json.loads(body) if body else {}
-        except json.JSONDecodeError:
-            return {"raw": body}
+            response = self._http_client().request(
+                method,
+                path,
+                content=data,
+                headers=headers,
+                timeout=self._timeout_for(path, timeout_s),
+            )
+        except httpx.HTTPError as exc:
+            self._raise_transport_error(path, exc, timer)
+        return self._handle_response(path, response, timer)
+
+    async def _acall(self, path: str, payload: dict | None = None, *, timeout_s: float | None = None) -> dict:
+        method, data, timer = self._prepare(path, payload)
+        headers = {"Content-Type": "application/json"} if data is not None else {}
+        try:
+            response = await self._async_http_client().request(
+                method,
+                path,
+                content=data,
+                headers=headers,
+                timeout=self._timeout_for(path, timeout_s),
+            )
+        except httpx.HTTPError as exc:
+            self._raise_transport_error(path, exc, timer)
+        return self._handle_response(path, response, timer)
 
 
 # -- singleton ----------------------------------------------------------------
@@ -1,4 +1,10 @@
-"""Realtime recorder status bridge (recorder WebSocket -> event bus)."""
+"""Realtime recorder status bridge (recorder WebSocket -> event bus).
+
+``RecorderStatusStream`` is the single source of recorder state for the
+backend: the websocket feed updates a versioned snapshot, session watchers
+await predicates on it, and HTTP polling is only used while the websocket
+is disconnected.
+"""
 
 from __future__ import annotations
 
@@ -6,7 +12,9 @@ import asyncio
 import json
 import logging
 import threading
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
 
 import websockets
 
@@ -14,9 +22,24 @@ from interfaces_backend.services.recorder_bridge import RecorderBridge, get_reco
 from interfaces_backend.services.realtime_events import RealtimeEventBus, get_realtime_event_bus
 
 RECORDING_STATUS_TOPIC = "recording.session_status"
+_ACTIVE_RECORDER_STATES = {"warming", "recording", "paused", "resetting", "resetting_paused"}
+# Minimum spacing of HTTP status polls while the websocket is down.
+_FALLBACK_POLL_INTERVAL_S = 0.5
 
 logger = logging.getLogger(__name__)
 
+StatusPredicate = Callable[[dict[str, Any]], bool]
+
+
+@dataclass(frozen=True)
+class RecorderStatusSnapshot:
+    """Latest recorder status; ``version`` increases with every status received."""
+
+    version: int
+    status: dict[str, Any] | None
+    source: str
+    received_at: float
+
 
 class RecorderStatusStream:
     """Consumes recorder websocket status and publishes per-session updates."""
@@ -25,6 +48,8 @@ class RecorderStatusStream:
         self,
         recorder: RecorderBridge | None = None,
         bus: RealtimeEventBus | None = None,
+        *,
+        fallback_poll_interval_s: float = _FALLBACK_POLL_INTERVAL_S,
     ) -> None:
         self._recorder = recorder or get_recorder_bridge()
         self._bus = bus or get_realtime_event_bus()
@@ -32,6 +57,13 @@ class RecorderStatusStream:
         self._thread: threading.Thread | None = None
         self._latest_status: dict[str, Any] | None = None
         self._last_active_dataset_id: str | None = None
+        self._version = 0
+        self._source = "none"
+        self._received_at = 0.0
+        self._connected = False
+        self._fallback_poll_interval_s = max(float(fallback_poll_interval_s), 0.05)
+        self._last_fallback_poll = float("-inf")
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
 
     def ensure_started(self) -> None:
         with self._lock:
@@ -44,18 +76,110 @@ class RecorderStatusStream:
             )
             self._thread.start()
 
+    @property
+    def connected(self) -> bool:
+        with self._lock:
+            return self._connected
+
+    def snapshot(self) -> RecorderStatusSnapshot:
+        with self._lock:
+            return RecorderStatusSnapshot(
+                version=self._version,
+                status=dict(self._latest_status) if self._latest_status is not None else None,
+                source=self._source,
+                received_at=self._received_at,
+            )
+
     async def build_session_snapshot(self, session_id: str) -> dict[str, Any]:
         status = self._latest_status_snapshot()
         if status is None:
-            try:
-                status = await asyncio.to_thread(self._recorder.status)
-                if isinstance(status, dict):
-                    with self._lock:
-                        self._latest_status = dict(status)
-            except Exception:
-                status = None
+            await self._poll_http()
+            status = self._latest_status_snapshot()
         return self._to_session_payload(session_id=session_id, status=status)
 
+    async def wait_for(
+        self,
+        predicate: StatusPredicate,
+        *,
+        after_version: int = 0,
+        timeout_s: float | None = None,
+    ) -> RecorderStatusSnapshot | None:
+        """Wait for a snapshot newer than ``after_version`` whose status matches ``predicate``.
+
+        Returns ``None`` on timeout. While the websocket is disconnected the
+        status is refreshed over HTTP, at most once per fallback interval.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_s is None else loop.time() + max(float(timeout_s), 0.0)
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            while True:
+                event.clear()
+                snapshot = self.snapshot()
+                if snapshot.version > after_version and snapshot.status is not None and predicate(snapshot.status):
+                    return snapshot
+                wait_s = None if deadline is None else deadline - loop.time()
+                if wait_s is not None and wait_s <= 0:
+                    return None
+                if not self.connected:
+                    if await self._poll_http():
+                        continue
+                    wait_s = (
+                        self._fallback_poll_interval_s
+                        if wait_s is None
+                        else min(wait_s, self._fallback_poll_interval_s)
+                    )
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=wait_s)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+    async def wait_for_change(
+        self,
+        after_version: int,
+        *,
+        timeout_s: float | None = None,
+    ) -> RecorderStatusSnapshot | None:
+        return await self.wait_for(lambda _status: True, after_version=after_version, timeout_s=timeout_s)
+
+    async def wait_until_finalized(self, dataset_id: str, timeout_s: float = 30.0) -> dict[str, Any] | None:
+        """Event-driven equivalent of :meth:`RecorderBridge.wait_until_finalized`."""
+
+        def finalized(status: dict[str, Any]) -> bool:
+            status_dataset_id = str(status.get("dataset_id") or "").strip()
+            state = str(status.get("state") or "").strip().lower()
+            return status_dataset_id != dataset_id or state not in _ACTIVE_RECORDER_STATES
+
+        # Without the websocket the cached status may predate the stop request.
+        after_version = 0 if self.connected else self.snapshot().version
+        snapshot = await self.wait_for(finalized, after_version=after_version, timeout_s=timeout_s)
+        if snapshot is not None:
+            return snapshot.status
+        return self._latest_status_snapshot()
+
+    async def _poll_http(self) -> bool:
+        """Fetch status over HTTP unless another caller did so recently; True if fetched."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_fallback_poll < self._fallback_poll_interval_s:
+                return False
+            self._last_fallback_poll = now
+        try:
+            status = await self._recorder.status_async()
+        except Exception as exc:  # noqa: BLE001 - recorder may be down; waiters retry
+            logger.debug("Recorder status fallback poll failed: %s", exc)
+            return False
+        if not isinstance(status, dict):
+            return False
+        self._handle_status(status, source="http")
+        return True
+
     def _thread_entry(self) -> None:
         asyncio.run(self._run_forever())
 
@@ -71,12 +195,15 @@ class RecorderStatusStream:
                     ping_timeout=20.0,
                 ) as ws:
                     reconnect_delay_s = 1.0
+                    self._set_connected(True)
                     async for message in ws:
                         payload = self._parse_payload(message)
                         if payload is None:
                             continue
                         self._handle_status(payload)
+                self._set_connected(False)
             except Exception as exc:  # noqa: BLE001 - keep reconnecting forever
+                self._set_connected(False)
                 logger.warning("Recorder websocket disconnected: %s", exc)
                 await asyncio.sleep(reconnect_delay_s)
                 reconnect_delay_s = min(reconnect_delay_s * 2.0, 5.0)
@@ -96,12 +223,38 @@ class RecorderStatusStream:
             return parsed if isinstance(parsed, dict) else None
         return message if isinstance(message, dict) else None
 
-    def _handle_status(self, status: dict[str, Any]) -> None:
+    def _set_connected(self, connected: bool) -> None:
+        with self._lock:
+            if self._connected == connected:
+                return
+            self._connected = connected
+            waiters = list(self._waiters)
+        # Wake waiters so they switch between websocket updates and HTTP fallback.
+        self._notify(waiters)
+
+    @staticmethod
+    def _notify(waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Waiter loop already closed.
+                continue
+
+    def _handle_status(self, status: dict[str, Any], *, source: str = "websocket") -> None:
         with self._lock:
+            changed = status != self._latest_status
             self._latest_status = dict(status)
+            self._version += 1
+            self._source = source
+            self._received_at = time.time()
+            waiters = list(self._waiters)
             previous_active = self._last_active_dataset_id
             active_dataset_id = str(status.get("dataset_id") or "").strip() or None
             self._last_active_dataset_id = active_dataset_id
+        self._notify(waiters)
+        if not changed:
+            return
 
         if active_dataset_id:
             self._bus.publish_threadsafe(
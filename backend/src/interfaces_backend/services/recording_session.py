@@ -12,19 +12,22 @@ from fastapi import HTTPException
 
 from interfaces_backend.services.dataset_lifecycle import DatasetLifecycle, get_dataset_lifecycle
 from interfaces_backend.services.recorder_bridge import RecorderBridge, get_recorder_bridge
+from interfaces_backend.services.recorder_status_stream import (
+    RecorderStatusStream,
+    get_recorder_status_stream,
+)
 from interfaces_backend.services.session_manager import (
     BaseSessionManager,
     SessionProgressCallback,
     SessionState,
 )
-from interfaces_backend.services.vlabor_profiles import (
-    extract_arm_namespaces,
-    extract_recorder_topic_suffixes,
-)
+from interfaces_backend.services.vlabor_profiles import compile_profile
 from percus_ai.storage.naming import generate_dataset_id
 
 logger = logging.getLogger(__name__)
 _ACTIVE_RECORDER_STATES = {"warming", "recording", "paused", "resetting", "resetting_paused"}
+# Upper bound between checks that the watched session still exists.
+_COMPLETION_RECHECK_S = 2.0
 
 
 class RecordingSessionManager(BaseSessionManager):
@@ -34,10 +37,14 @@ class RecordingSessionManager(BaseSessionManager):
         self,
         recorder: RecorderBridge | None = None,
         dataset: DatasetLifecycle | None = None,
+        status_stream: RecorderStatusStream | None = None,
     ) -> None:
         super().__init__()
         self._recorder = recorder or get_recorder_bridge()
         self._dataset = dataset or get_dataset_lifecycle()
+        self._status_stream = status_stream or (
+            get_recorder_status_stream() if recorder is None else RecorderStatusStream(recorder=self._recorder)
+        )
         self._completion_watchers: dict[str, asyncio.Task[None]] = {}
 
     def _generate_id(self) -> str:
@@ -146,12 +153,10 @@ class RecordingSessionManager(BaseSessionManager):
             message="録画ペイロードを組み立てています...",
         )
 
-        cameras = self._recorder.build_cameras(state.profile.snapshot)
-        arm_namespaces = extract_arm_namespaces(state.profile.snapshot)
-        topic_suffixes = extract_recorder_topic_suffixes(
-            state.profile.snapshot,
-            arm_namespaces=arm_namespaces,
-        )
+        cameras = self._recorder.build_cameras(state.profile)
+        compiled = compile_profile(state.profile)
+        arm_namespaces = list(compiled.arm_namespaces)
+        topic_suffixes = dict(compiled.recorder_topic_suffixes)
         self._validate_recorder_resolution(
             profile_name=state.profile.name,
             profile_source=getattr(state.profile, "source_path", "unknown"),
@@ -207,7 +212,7 @@ class RecordingSessionManager(BaseSessionManager):
     async def start(self, session_id: str, **kwargs: Any) -> SessionState:
         state = await super().start(session_id, **kwargs)
 
-        self._recorder.ensure_running()
+        await self._recorder.ensure_running_async()
         payload = state.extras["recorder_payload"]
         recorder_status: dict[str, Any] | None = None
         try:
@@ -348,10 +353,7 @@ class RecordingSessionManager(BaseSessionManager):
                     }
 
         if stop_requested and recorder_result.get("success", False):
-            final_status = await asyncio.to_thread(
-                self._recorder.wait_until_finalized,
-                state.id,
-            )
+            final_status = await self._status_stream.wait_until_finalized(state.id)
             if final_status:
                 recorder_result["status"] = final_status
                 final_state = str(final_status.get("state") or "").strip().lower()
@@ -414,27 +416,21 @@ class RecordingSessionManager(BaseSessionManager):
         self._completion_watchers.pop(session_id, None)
 
     async def _watch_completion(self, session_id: str) -> None:
+        def completed(status: dict[str, Any]) -> bool:
+            recorder_state = str(status.get("state") or "").strip().lower()
+            recorder_dataset_id = str(status.get("dataset_id") or "").strip()
+            return recorder_state == "completed" and recorder_dataset_id == session_id
+
         try:
             while True:
-                await asyncio.sleep(2.0)
                 if self.status(session_id) is None:
                     return
-                try:
-                    recorder_status = await asyncio.to_thread(self._recorder.status)
-                except HTTPException as exc:
-                    if exc.status_code == 503:
-                        continue
-                    logger.warning(
-                        "recording session %s completion watcher error: %s",
-                        session_id,
-                        exc.detail,
-                    )
-                    continue
-
-                recorder_state = str(recorder_status.get("state") or "").strip().lower()
-                recorder_dataset_id = str(recorder_status.get("dataset_id") or "").strip()
-                if recorder_state != "completed" or recorder_dataset_id != session_id:
+                snapshot = await self._status_stream.wait_for(completed, timeout_s=_COMPLETION_RECHECK_S)
+                if snapshot is None:
                     continue
+                if self.status(session_id) is None:
+                    return
+                recorder_status = snapshot.status
 
                 logger.info("recording session %s completed; finalizing upload", session_id)
                 try:
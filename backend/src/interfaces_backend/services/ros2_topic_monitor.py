@@ -0,0 +1,362 @@
+"""Long-lived ROS 2 topic presence monitor (rosbridge -> cached topic set).
+
+``Ros2TopicMonitor`` replaces ``docker compose exec vlabor ros2 topic list``:
+a single rosbridge websocket asks ``/rosapi/topics`` for the topic graph and
+keeps the latest topic set, so API handlers read it without spawning a ROS
+client. Message rates are sampled by subscribing only to the topics callers
+ask to track (the connected device topics of the active profile).
+
+Rate subscriptions use rosbridge's ``cbor-raw`` compression: each message
+arrives as one binary frame carrying the serialized ROS message, and only
+the frame's ``op`` and ``topic`` header is read to count it. Images are never
+base64-encoded by rosbridge nor JSON-decoded here, and no ``queue_length``
+is set so rosbridge does not drop messages before they are counted.
+
+Topic set changes are published on ``ros2.topics/global`` and reported to
+listeners, so device connection state is pushed as soon as it changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import websockets
+
+from interfaces_backend.services.realtime_events import RealtimeEventBus, get_realtime_event_bus
+
+ROS2_TOPICS_TOPIC = "ros2.topics"
+ROSBRIDGE_URL = os.environ.get("ROSBRIDGE_URL", "ws://127.0.0.1:9090")
+
+_TOPIC_LIST_INTERVAL_S = 2.0
+_RATE_WINDOW_S = 5.0
+_TOPICS_REQUEST_ID = "ros2-topic-monitor:topics"
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[], None]
+
+# ``state()`` values.
+MONITOR_CONNECTING = "connecting"
+MONITOR_CONNECTED = "connected"
+MONITOR_DISCONNECTED = "disconnected"
+
+
+def _cbor_text(data: bytes, pos: int) -> tuple[str, int] | None:
+    """Decode the CBOR text string at ``pos``; None for any other item."""
+    if pos >= len(data) or data[pos] >> 5 != 3:
+        return None
+    info = data[pos] & 0x1F
+    pos += 1
+    if info < 24:
+        length = info
+    elif info <= 27:
+        size = 1 << (info - 24)
+        length = int.from_bytes(data[pos : pos + size], "big")
+        pos += size
+    else:
+        return None
+    end = pos + length
+    if end > len(data):
+        return None
+    return data[pos:end].decode("utf-8", "replace"), end
+
+
+def cbor_publish_topic(frame: bytes) -> str | None:
+    """Topic of a ``cbor-raw`` publish frame, read from its header only.
+
+    rosbridge encodes ``{"op": "publish", "topic": ..., "msg": ...}`` in that
+    order, so the leading text pairs are enough; ``msg`` is never decoded.
+    """
+    if not frame or frame[0] >> 5 != 5:
+        return None
+    info = frame[0] & 0x1F
+    pos = 1 + (1 << (info - 24) if 24 <= info <= 27 else 0)
+    fields: dict[str, str] = {}
+    while len(fields) < 2:
+        key = _cbor_text(frame, pos)
+        value = _cbor_text(frame, key[1]) if key else None
+        if value is None:
+            return None
+        fields[key[0]], pos = value
+    if fields.get("op") != "publish":
+        return None
+    return fields.get("topic") or None
+
+
+class TopicRateMeter:
+    """Message rate of one topic over a sliding time window."""
+
+    def __init__(self, window_s: float = _RATE_WINDOW_S) -> None:
+        self._window_s = max(float(window_s), 0.1)
+        self._stamps: deque[float] = deque()
+
+    def record(self, now: float) -> None:
+        self._stamps.append(now)
+        self._trim(now)
+
+    def rate(self, now: float) -> float:
+        self._trim(now)
+        if len(self._stamps) < 2:
+            return 0.0
+        span = self._stamps[-1] - self._stamps[0]
+        if span <= 0:
+            return 0.0
+        return (len(self._stamps) - 1) / span
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self._window_s
+        while self._stamps and self._stamps[0] < cutoff:
+            self._stamps.popleft()
+
+
+class Ros2TopicMonitor:
+    """Cached ROS 2 topic set and per-topic message rates from rosbridge."""
+
+    def __init__(
+        self,
+        bus: RealtimeEventBus | None = None,
+        *,
+        url: str = ROSBRIDGE_URL,
+        list_interval_s: float = _TOPIC_LIST_INTERVAL_S,
+        rate_window_s: float = _RATE_WINDOW_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._bus = bus or get_realtime_event_bus()
+        self._url = url
+        self._list_interval_s = max(float(list_interval_s), 0.1)
+        self._rate_window_s = rate_window_s
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._connected = False
+        self._listed = threading.Event()
+        self._started_at: float | None = None
+        self._topics: frozenset[str] = frozenset()
+        self._tracked: frozenset[str] = frozenset()
+        self._meters: dict[str, TopicRateMeter] = {}
+        self._listeners: dict[int, Listener] = {}
+        self._next_listener_id = 0
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._thread_entry,
+                name="ros2-topic-monitor",
+                daemon=True,
+            )
+            self._thread.start()
+            if self._started_at is None:
+                self._started_at = self._clock()
+
+    @property
+    def connected(self) -> bool:
+        with self._lock:
+            return self._connected
+
+    def state(self) -> str:
+        """``connecting`` until the first topic list arrives, then ``connected``/``disconnected``."""
+        if not self._listed.is_set():
+            return MONITOR_CONNECTING
+        return MONITOR_CONNECTED if self.connected else MONITOR_DISCONNECTED
+
+    def wait_for_topics(self, timeout_s: float) -> bool:
+        """Block until the first topic list arrived (True), at most ``timeout_s`` after start.
+
+        Once that grace period is over this returns at once, so callers are
+        not delayed while rosbridge is down.
+        """
+        with self._lock:
+            started_at = self._started_at
+        elapsed = self._clock() - started_at if started_at is not None else 0.0
+        return self._listed.wait(max(timeout_s - elapsed, 0.0))
+
+    def topics(self) -> list[str]:
+        with self._lock:
+            return sorted(self._topics)
+
+    def add_listener(self, listener: Listener) -> Callable[[], None]:
+        """Call ``listener()`` (from the monitor thread) when the topic set changes."""
+        with self._lock:
+            listener_id = self._next_listener_id
+            self._next_listener_id += 1
+            self._listeners[listener_id] = listener
+
+        def remove() -> None:
+            with self._lock:
+                self._listeners.pop(listener_id, None)
+
+        return remove
+
+    def track_rates(self, topics: Iterable[str]) -> None:
+        """Replace the set of topics whose message rate is sampled."""
+        tracked = frozenset(topic for topic in topics if topic)
+        with self._lock:
+            if tracked == self._tracked:
+                return
+            self._tracked = tracked
+            for topic in list(self._meters):
+                if topic not in tracked:
+                    del self._meters[topic]
+            for topic in tracked:
+                self._meters.setdefault(topic, TopicRateMeter(self._rate_window_s))
+        self._wake_loop()
+
+    def message_rate(self, topic: str) -> float | None:
+        """Messages per second over the rate window; None while not tracked."""
+        with self._lock:
+            meter = self._meters.get(topic)
+            if meter is None:
+                return None
+            return meter.rate(self._clock())
+
+    def set_topics(self, topics: Iterable[str], *, listed: bool = False) -> None:
+        topic_set = frozenset(str(topic) for topic in topics if topic)
+        first_list = listed and not self._listed.is_set()
+        if first_list:
+            self._listed.set()
+        with self._lock:
+            if topic_set == self._topics and not first_list:
+                return
+            self._topics = topic_set
+            listeners = list(self._listeners.values())
+        self._bus.publish_threadsafe(ROS2_TOPICS_TOPIC, "global", {"topics": sorted(topic_set)})
+        self._wake_loop()
+        for listener in listeners:
+            try:
+                listener()
+            except Exception:  # noqa: BLE001 - one listener must not break the others
+                logger.exception("ROS 2 topic listener failed")
+
+    def record_message(self, topic: str) -> None:
+        with self._lock:
+            meter = self._meters.get(topic)
+            if meter is not None:
+                meter.record(self._clock())
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """Apply one rosbridge protocol message."""
+        op = message.get("op")
+        if op == "publish":
+            self.record_message(str(message.get("topic") or ""))
+        elif op == "service_response" and message.get("id") == _TOPICS_REQUEST_ID:
+            if message.get("result") is False:
+                logger.debug("rosapi topics request failed: %s", message.get("values"))
+                return
+            values = message.get("values") or {}
+            self.set_topics(values.get("topics") or [], listed=True)
+
+    def _wake_loop(self) -> None:
+        with self._lock:
+            loop, wake = self._loop, self._wake
+        if loop is None or wake is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # Monitor loop already closed.
+            pass
+
+    def _thread_entry(self) -> None:
+        asyncio.run(self._run_forever())
+
+    async def _run_forever(self) -> None:
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+        reconnect_delay_s = 1.0
+        while True:
+            try:
+                async with websockets.connect(
+                    self._url,
+                    open_timeout=5.0,
+                    ping_interval=20.0,
+                    ping_timeout=20.0,
+                    max_size=None,
+                ) as ws:
+                    reconnect_delay_s = 1.0
+                    self._set_connected(True)
+                    await self._serve(ws)
+            except Exception as exc:  # noqa: BLE001 - keep reconnecting forever
+                logger.debug("rosbridge connection lost: %s", exc)
+            self._set_connected(False)
+            await asyncio.sleep(reconnect_delay_s)
+            reconnect_delay_s = min(reconnect_delay_s * 2.0, 5.0)
+
+    async def _serve(self, ws: Any) -> None:
+        wake = self._wake
+        assert wake is not None
+        reader = asyncio.create_task(self._read(ws))
+        subscribed: set[str] = set()
+        try:
+            while not reader.done():
+                wake.clear()
+                await self._send(ws, {"op": "call_service", "id": _TOPICS_REQUEST_ID, "service": "/rosapi/topics"})
+                # Subscribing to a topic missing from the graph would make
+                # rosbridge wait for its type, so only sample present topics.
+                with self._lock:
+                    wanted = set(self._tracked & self._topics)
+                for topic in sorted(wanted - subscribed):
+                    await self._send(
+                        ws,
+                        {"op": "subscribe", "id": f"rate:{topic}", "topic": topic, "compression": "cbor-raw"},
+                    )
+                for topic in sorted(subscribed - wanted):
+                    await self._send(ws, {"op": "unsubscribe", "id": f"rate:{topic}", "topic": topic})
+                subscribed = wanted
+                waker = asyncio.create_task(wake.wait())
+                await asyncio.wait({reader, waker}, timeout=self._list_interval_s, return_when=asyncio.FIRST_COMPLETED)
+                waker.cancel()
+            reader.result()
+        finally:
+            reader.cancel()
+
+    async def _read(self, ws: Any) -> None:
+        async for raw in ws:
+            if isinstance(raw, bytes):
+                topic = cbor_publish_topic(raw)
+                if topic:
+                    self.record_message(topic)
+                continue
+            try:
+                message = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(message, dict):
+                self.handle_message(message)
+
+    @staticmethod
+    async def _send(ws: Any, message: dict[str, Any]) -> None:
+        await ws.send(json.dumps(message))
+
+    def _set_connected(self, connected: bool) -> None:
+        with self._lock:
+            if self._connected == connected:
+                return
+            self._connected = connected
+        if not connected:
+            # Without rosbridge nothing can be confirmed as present.
+            self.set_topics([])
+
+
+_monitor: Ros2TopicMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_ros2_topic_monitor() -> Ros2TopicMonitor:
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = Ros2TopicMonitor()
+    return _monitor
@@ -0,0 +1,159 @@
+"""Background bring-up of the docker stacks the backend drives.
+
+The FastAPI startup hook only schedules ``ServiceBringup.start``, so the
+HTTP server accepts connections (``/health``) right away while VLAbor and
+the lerobot stack are pulled and started. Each component runs as a
+``service_bringup`` startup operation (progress on ``startup.operation``)
+and its readiness is summarized by ``/ready``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import subprocess
+import threading
+from collections.abc import Awaitable, Callable
+
+from interfaces_backend.models.startup import (
+    BackendReadinessResponse,
+    ServiceReadiness,
+    ServiceReadinessState,
+)
+from interfaces_backend.services.lerobot_runtime import start_lerobot
+from interfaces_backend.services.startup_operations import (
+    SYSTEM_OPERATION_USER_ID,
+    StartupOperationsService,
+    get_startup_operations_service,
+)
+from interfaces_backend.services.vlabor_profiles import get_active_profile_spec
+from interfaces_backend.services.vlabor_runtime import start_vlabor_on_backend_startup
+
+logger = logging.getLogger("interfaces_backend.startup")
+
+# Returns the command result, or None when the component was skipped.
+BringupStep = Callable[[], Awaitable["subprocess.CompletedProcess[str] | None"]]
+
+
+async def _start_vlabor() -> subprocess.CompletedProcess[str] | None:
+    try:
+        active_profile = await get_active_profile_spec()
+        profile_name = active_profile.name
+    except Exception:
+        logger.warning("Could not resolve active profile; starting VLAbor without profile")
+        profile_name = None
+    return await start_vlabor_on_backend_startup(profile=profile_name, logger=logger)
+
+
+async def _start_lerobot() -> subprocess.CompletedProcess[str] | None:
+    result = await start_lerobot(strict=False)
+    if result.returncode != 0:
+        detail = (result.stderr or result.stdout).strip()
+        logger.warning("Failed to start lerobot stack on backend startup: %s", detail)
+    else:
+        logger.info("lerobot stack started on backend startup")
+    return result
+
+
+DEFAULT_STEPS: tuple[tuple[str, str, BringupStep], ...] = (
+    ("vlabor", "VLAbor", _start_vlabor),
+    ("lerobot", "lerobot stack", _start_lerobot),
+)
+
+
+class ServiceBringup:
+    """Starts backend-managed services in the background and tracks readiness."""
+
+    def __init__(
+        self,
+        operations: StartupOperationsService | None = None,
+        *,
+        steps: tuple[tuple[str, str, BringupStep], ...] = DEFAULT_STEPS,
+    ) -> None:
+        self._operations = operations or get_startup_operations_service()
+        self._steps = steps
+        self._lock = threading.Lock()
+        self._components = {name: ServiceReadiness(name=name) for name, _label, _step in steps}
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> asyncio.Task:
+        """Schedule bring-up on the running loop (idempotent)."""
+        with self._lock:
+            if self._task is None:
+                self._task = asyncio.get_running_loop().create_task(self._run())
+            return self._task
+
+    def readiness(self) -> BackendReadinessResponse:
+        with self._lock:
+            components = [component.model_copy() for component in self._components.values()]
+        return BackendReadinessResponse(
+            ready=all(component.state not in ("pending", "starting") for component in components),
+            components=components,
+        )
+
+    async def _run(self) -> None:
+        # Steps run in order, as the blocking startup hook did: the lerobot
+        # stack comes up after VLAbor.
+        for name, label, step in self._steps:
+            await self._run_step(name, label, step)
+
+    async def _run_step(self, name: str, label: str, step: BringupStep) -> None:
+        accepted = self._operations.create(user_id=SYSTEM_OPERATION_USER_ID, kind="service_bringup")
+        operation_id = accepted.operation_id
+        self._set(name, "starting", operation_id=operation_id, message=f"{label} を起動しています。")
+        self._operations.set_running(
+            operation_id=operation_id,
+            phase=f"start_{name}",
+            progress_percent=10.0,
+            message=f"{label} を起動しています。",
+        )
+        try:
+            result = await step()
+        except Exception as exc:  # noqa: BLE001 - reported through readiness
+            logger.exception("%s bring-up failed", label)
+            self._finish(name, operation_id, "failed", f"{label} の起動に失敗しました。", error=str(exc))
+            return
+
+        if result is None:
+            self._finish(name, operation_id, "skipped", f"{label} の起動をスキップしました。")
+        elif result.returncode != 0:
+            detail = (result.stderr or result.stdout).strip() or f"exit code={result.returncode}"
+            self._finish(name, operation_id, "failed", f"{label} の起動に失敗しました。", error=detail)
+        else:
+            self._finish(name, operation_id, "ready", f"{label} を起動しました。")
+
+    def _finish(
+        self,
+        name: str,
+        operation_id: str,
+        state: ServiceReadinessState,
+        message: str,
+        *,
+        error: str | None = None,
+    ) -> None:
+        self._set(name, state, operation_id=operation_id, message=error or message)
+        if error is not None:
+            self._operations.fail(operation_id=operation_id, message=message, error=error)
+        else:
+            self._operations.complete(operation_id=operation_id, message=message)
+
+    def _set(self, name: str, state: ServiceReadinessState, *, operation_id: str, message: str) -> None:
+        with self._lock:
+            self._components[name] = ServiceReadiness(
+                name=name,
+                state=state,
+                operation_id=operation_id,
+                message=message,
+            )
+
+
+_bringup: ServiceBringup | None = None
+_bringup_lock = threading.Lock()
+
+
+def get_service_bringup() -> ServiceBringup:
+    global _bringup
+    with _bringup_lock:
+        if _bringup is None:
+            _bringup = ServiceBringup()
+    return _bringup
@@ -18,6 +18,7 @@ from fastapi import HTTPException
 
 from interfaces_backend.services.vlabor_profiles import (
     VlaborProfileSpec,
+    compile_profile,
     get_active_profile_spec,
     resolve_profile_spec,
     save_session_profile_binding,
@@ -98,6 +99,8 @@ class BaseSessionManager(ABC):
             message="プロファイルを解決しています...",
         )
         resolved = await self._resolve_profile(profile)
+        # Compile once here; subclasses read their derived specs from the cache.
+        compile_profile(resolved)
 
         self._emit_progress(
             progress_callback,
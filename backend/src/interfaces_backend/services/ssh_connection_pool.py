@@ -0,0 +1,310 @@
+"""Pooled SSH connections to training instances.
+
+Status checks, log fetches, checkpoint listings and stop requests used to
+open a fresh SSH connection per call, trying every (user, private key)
+candidate with a full handshake. ``SSHConnectionPool`` keeps one connected
+``SSHConnection`` per (ip, user, key) and lends it out:
+
+- the credential that worked is remembered per job and tried first;
+- every command opens its own channel on the shared transport, so
+  concurrent callers multiplex over one connection;
+- transports send keepalives, dead ones are replaced on the next acquire,
+  and connections idle for ``idle_ttl_s`` are closed by a reaper thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from percus_ai.training.ssh.client import SSHConnection
+
+logger = logging.getLogger(__name__)
+
+SSH_POOL_IDLE_TTL_S = float(os.environ.get("PHI_SSH_POOL_IDLE_TTL_S", "300"))
+SSH_POOL_KEEPALIVE_S = int(os.environ.get("PHI_SSH_POOL_KEEPALIVE_S", "30"))
+
+# (ip, user, private key path)
+PoolKey = tuple[str, str, str]
+# (ip, user, private key path, timeout) -> connected SSHConnection
+ConnectFn = Callable[[str, str, str, float], "SSHConnection"]
+
+
+def _open_connection(ip: str, user: str, key_path: str, timeout: float) -> SSHConnection:
+    from percus_ai.training.ssh.client import SSHConnection
+
+    conn = SSHConnection(host=ip, user=user, private_key_path=key_path)
+    conn.connect(timeout_sec=timeout)
+    return conn
+
+
+def _transport(conn: SSHConnection) -> Any:
+    client = getattr(conn, "client", None)
+    return client.get_transport() if client is not None else None
+
+
+def _close_quietly(conn: SSHConnection) -> None:
+    try:
+        conn.disconnect()
+    except Exception:  # noqa: BLE001 - already broken
+        pass
+
+
+@dataclass
+class _PooledConnection:
+    conn: SSHConnection
+    refs: int = 0
+    last_used: float = 0.0
+    evicted: bool = False
+
+
+class SSHLease:
+    """A pooled connection borrowed by one caller.
+
+    Attribute access is forwarded to the underlying ``SSHConnection``.
+    ``release`` (or leaving a ``with`` block) returns it to the pool; the
+    transport stays open for the next caller.
+    """
+
+    def __init__(self, pool: SSHConnectionPool, key: PoolKey, entry: _PooledConnection) -> None:
+        self._pool = pool
+        self._key = key
+        self._entry: Optional[_PooledConnection] = entry
+
+    @property
+    def user(self) -> str:
+        return self._key[1]
+
+    @property
+    def private_key_path(self) -> str:
+        return self._key[2]
+
+    def release(self) -> None:
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._pool._release(self._key, entry)  # noqa: SLF001
+
+    def discard(self) -> None:
+        """Release and close the connection, e.g. after a transport error."""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._pool._release(self._key, entry, discard=True)  # noqa: SLF001
+
+    # Callers written against SSHConnection end with ``disconnect()``.
+    disconnect = release
+
+    def __getattr__(self, name: str) -> Any:
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise AttributeError(f"SSH lease already released ({name})")
+        return getattr(entry.conn, name)
+
+    def __enter__(self) -> SSHLease:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+
+class SSHConnectionPool:
+    """Connected ``SSHConnection`` objects keyed by (ip, user, key)."""
+
+    def __init__(
+        self,
+        *,
+        connect: ConnectFn = _open_connection,
+        idle_ttl_s: float = SSH_POOL_IDLE_TTL_S,
+        keepalive_s: int = SSH_POOL_KEEPALIVE_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._connect = connect
+        self._idle_ttl_s = idle_ttl_s
+        self._keepalive_s = keepalive_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[PoolKey, _PooledConnection] = {}
+        self._connect_locks: dict[PoolKey, threading.Lock] = {}
+        self._credentials: dict[str, tuple[str, str]] = {}
+        self._reaper: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def acquire(
+        self,
+        ip: str,
+        candidates: Sequence[tuple[str, str]],
+        *,
+        job_id: str | None = None,
+        timeout: float = 30.0,
+    ) -> SSHLease:
+        """Lend a connection to ``ip`` using the first working (user, key) candidate.
+
+        Pooled connections are reused before any handshake is attempted.
+        Raises ``RuntimeError`` (chained to the last error) when no
+        candidate connects.
+        """
+        ordered = list(dict.fromkeys((str(user), str(key)) for user, key in candidates))
+        remembered = self._credentials.get(job_id) if job_id else None
+        if remembered is not None:
+            ordered = [remembered, *(candidate for candidate in ordered if candidate != remembered)]
+
+        for user, key in ordered:
+            lease = self._lease_existing((ip, user, key))
+            if lease is not None:
+                self._remember(job_id, user, key)
+                return lease
+
+        last_error: BaseException | None = None
+        for user, key in ordered:
+            pool_key = (ip, user, key)
+            with self._connect_lock(pool_key):
+                # Another caller may have connected while we waited.
+                lease = self._lease_existing(pool_key)
+                if lease is None:
+                    try:
+                        conn = self._connect(ip, user, key, timeout)
+                    except SystemExit as exc:
+                        last_error = exc
+                        continue
+                    except Exception as exc:
+                        last_error = exc
+                        continue
+                    lease = self._add(pool_key, conn)
+            self._remember(job_id, user, key)
+            return lease
+
+        if job_id:
+            with self._lock:
+                self._credentials.pop(job_id, None)
+        raise RuntimeError(f"SSH connection to {ip} failed: {last_error}") from last_error
+
+    def evict_idle(self) -> int:
+        """Close connections that are dead or unused for ``idle_ttl_s``."""
+        now = self._clock()
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.refs == 0
+                and (now - entry.last_used >= self._idle_ttl_s or not self._is_alive(entry.conn))
+            ]
+            evicted = [self._entries.pop(key) for key in stale]
+        for entry in evicted:
+            _close_quietly(entry.conn)
+        return len(evicted)
+
+    def close_all(self) -> None:
+        self._stop.set()
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                entry.evicted = True
+            idle = [entry for entry in entries if entry.refs == 0]
+        for entry in idle:
+            _close_quietly(entry.conn)
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lease_existing(self, key: PoolKey) -> Optional[SSHLease]:
+        dead: Optional[_PooledConnection] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_alive(entry.conn):
+                entry.refs += 1
+                entry.last_used = self._clock()
+                return SSHLease(self, key, entry)
+            del self._entries[key]
+            entry.evicted = True
+            if entry.refs == 0:
+                dead = entry
+        if dead is not None:
+            _close_quietly(dead.conn)
+        return None
+
+    def _add(self, key: PoolKey, conn: SSHConnection) -> SSHLease:
+        transport = _transport(conn)
+        if transport is not None and self._keepalive_s > 0:
+            transport.set_keepalive(self._keepalive_s)
+        entry = _PooledConnection(conn=conn, refs=1, last_used=self._clock())
+        with self._lock:
+            replaced = self._entries.get(key)
+            self._entries[key] = entry
+            if replaced is not None:
+                replaced.evicted = True
+        if replaced is not None and replaced.refs == 0:
+            _close_quietly(replaced.conn)
+        self._ensure_reaper()
+        return SSHLease(self, key, entry)
+
+    def _release(self, key: PoolKey, entry: _PooledConnection, *, discard: bool = False) -> None:
+        with self._lock:
+            entry.refs -= 1
+            entry.last_used = self._clock()
+            if discard and not entry.evicted:
+                entry.evicted = True
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            close = entry.evicted and entry.refs == 0
+        if close:
+            _close_quietly(entry.conn)
+
+    def _remember(self, job_id: str | None, user: str, key: str) -> None:
+        if job_id:
+            with self._lock:
+                self._credentials[job_id] = (user, key)
+
+    def _connect_lock(self, key: PoolKey) -> threading.Lock:
+        with self._lock:
+            lock = self._connect_locks.get(key)
+            if lock is None:
+                lock = self._connect_locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _is_alive(conn: SSHConnection) -> bool:
+        try:
+            transport = _transport(conn)
+            return transport is not None and transport.is_active()
+        except Exception:  # noqa: BLE001 - treat as dead
+            return False
+
+    def _ensure_reaper(self) -> None:
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._stop.clear()
+            self._reaper = threading.Thread(target=self._reap_loop, name="ssh-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        interval = max(min(self._idle_ttl_s / 2, 60.0), 1.0)
+        while not self._stop.wait(interval):
+            try:
+                evicted = self.evict_idle()
+            except Exception:  # noqa: BLE001 - keep reaping
+                logger.exception("SSH pool eviction failed")
+                continue
+            if evicted:
+                logger.debug("Closed %d idle SSH connection(s)", evicted)
+
+
+_pool: SSHConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_ssh_connection_pool() -> SSHConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SSHConnectionPool()
+    return _pool
@@ -23,6 +23,8 @@ _ACTIVE_STATES: set[StartupOperationState] = {"queued", "running"}
 _TERMINAL_STATES: set[StartupOperationState] = {"completed", "failed"}
 _DEFAULT_TTL_SECONDS = 1800
 STARTUP_OPERATION_TOPIC = "startup.operation"
+# Owner of operations started by the backend itself (visible to every user).
+SYSTEM_OPERATION_USER_ID = "system"
 
 ProgressCallback = Callable[[str, float, str, dict[str, Any] | None], None]
 
@@ -94,7 +96,7 @@ class StartupOperationsService:
         with self._lock:
             self._cleanup_locked()
             record = self._operations.get(operation_id)
-            if record is None or record.user_id != user_id:
+            if record is None or record.user_id not in (user_id, SYSTEM_OPERATION_USER_ID):
                 raise HTTPException(status_code=404, detail=f"Operation not found: {operation_id}")
             return record.to_response()
 
@@ -121,7 +123,7 @@ class StartupOperationsService:
         self,
         *,
         operation_id: str,
-        target_session_id: str,
+        target_session_id: str | None = None,
         message: str = "完了しました。",
     ) -> None:
         self._update(
@@ -0,0 +1,309 @@
+"""Checkpointed, non-blocking deployment of training jobs.
+
+Deploying a training job waits for the cloud instance (IP, running state,
+SSH), uploads the run scripts, runs remote setup and starts training. The
+steps run in order as one asyncio task per job:
+
+- blocking Verda/paramiko calls go through ``run_blocking`` on a bounded
+  thread pool, so provisioning never stalls API requests or SSE streams;
+- after each step a checkpoint (step outputs such as the IP and SSH user) is
+  written under the storage root, so a restarted backend resumes at the
+  first unfinished step;
+- progress with per-step timings is published on ``training.deploy``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from interfaces_backend.models.training import TrainingDeployStatus, TrainingDeployStep
+from interfaces_backend.services.realtime_events import RealtimeEventBus, get_realtime_event_bus
+
+logger = logging.getLogger(__name__)
+
+TRAINING_DEPLOY_TOPIC = "training.deploy"
+DEPLOY_STEPS = ("wait_ip", "wait_running", "wait_ssh", "upload", "setup", "start")
+# Remote setup holds a worker for its whole run; polling calls are short.
+_MAX_WORKERS = int(os.environ.get("TRAINING_DEPLOY_MAX_WORKERS", "8"))
+_CHECKPOINT_DIR_ENV = "TRAINING_DEPLOY_CHECKPOINT_DIR"
+
+T = TypeVar("T")
+DeployStep = Callable[[], Awaitable[None]]
+
+
+class DeploymentStepError(RuntimeError):
+    """A deployment step failed; ``failure_reason`` is stored on the job."""
+
+    def __init__(self, failure_reason: str, message: str) -> None:
+        super().__init__(message)
+        self.failure_reason = failure_reason
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(_MAX_WORKERS, 1),
+                thread_name_prefix="training-deploy",
+            )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the deployment pool (with the caller's context)."""
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(context.run, func, *args, **kwargs))
+
+
+@dataclass
+class DeploymentCheckpoint:
+    """Durable deployment state: inputs, step outputs and finished steps."""
+
+    job_id: str
+    inputs: dict[str, Any] = field(default_factory=dict)
+    values: dict[str, Any] = field(default_factory=dict)
+    completed: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "inputs": self.inputs,
+            "values": self.values,
+            "completed": self.completed,
+            "timings": self.timings,
+            "updated_at": _utcnow_iso(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> DeploymentCheckpoint:
+        return cls(
+            job_id=str(payload["job_id"]),
+            inputs=dict(payload.get("inputs") or {}),
+            values=dict(payload.get("values") or {}),
+            completed=[str(step) for step in payload.get("completed") or []],
+            timings={str(k): float(v) for k, v in (payload.get("timings") or {}).items()},
+        )
+
+
+class DeploymentCheckpointStore:
+    """One JSON file per in-flight deployment.
+
+    Inputs include the user's session tokens (needed to act for the user
+    after a restart), so files are written owner-only and removed as soon as
+    the deployment finishes.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        if self._root is None:
+            configured = str(os.environ.get(_CHECKPOINT_DIR_ENV) or "").strip()
+            if configured:
+                self._root = Path(configured).expanduser()
+            else:
+                from percus_ai.storage import get_storage_root
+
+                self._root = get_storage_root() / "training" / "deployments"
+        return self._root
+
+    def _path(self, job_id: str) -> Path:
+        return self.root / f"{job_id}.json"
+
+    def load(self, job_id: str) -> Optional[DeploymentCheckpoint]:
+        path = self._path(job_id)
+        if not path.is_file():
+            return None
+        try:
+            return DeploymentCheckpoint.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except Exception as exc:  # noqa: BLE001 - a broken checkpoint restarts nothing
+            logger.warning("Ignoring unreadable deployment checkpoint %s: %s", path, exc)
+            return None
+
+    def save(self, checkpoint: DeploymentCheckpoint) -> None:
+        path = self._path(checkpoint.job_id)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(checkpoint.to_dict(), handle, ensure_ascii=True)
+            os.replace(tmp_path, path)
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._path(job_id).unlink(missing_ok=True)
+
+    def pending_job_ids(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(path.stem for path in self.root.glob("*.json"))
+
+
+class TrainingDeployment:
+    """Runs deployment steps in order, checkpointing and timing each one."""
+
+    def __init__(
+        self,
+        checkpoint: DeploymentCheckpoint,
+        steps: Sequence[tuple[str, DeployStep]],
+        *,
+        store: DeploymentCheckpointStore,
+        bus: RealtimeEventBus | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._checkpoint = checkpoint
+        self._steps = list(steps)
+        self._store = store
+        self._bus = bus or get_realtime_event_bus()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._status = TrainingDeployStatus(
+            job_id=checkpoint.job_id,
+            resumed=bool(checkpoint.completed),
+            steps=[
+                TrainingDeployStep(
+                    name=name,
+                    state="completed" if name in checkpoint.completed else "pending",
+                    elapsed_s=checkpoint.timings.get(name),
+                )
+                for name, _step in self._steps
+            ],
+            updated_at=_utcnow_iso(),
+        )
+
+    @property
+    def job_id(self) -> str:
+        return self._checkpoint.job_id
+
+    def status(self) -> TrainingDeployStatus:
+        with self._lock:
+            return self._status.model_copy(deep=True)
+
+    async def run(self) -> None:
+        """Run the remaining steps; the checkpoint is dropped once the run ends.
+
+        Step failures are re-raised after the status is published. A cancelled
+        run (backend shutdown) keeps its checkpoint so it can be resumed.
+        """
+        for index, (name, step) in enumerate(self._steps):
+            if name in self._checkpoint.completed:
+                continue
+            self._update(index, "running", current_step=name)
+            started = self._clock()
+            try:
+                await step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                elapsed = round(self._clock() - started, 3)
+                self._update(index, "failed", elapsed_s=elapsed, state="failed", error=str(exc))
+                self._store.discard(self.job_id)
+                raise
+            elapsed = round(self._clock() - started, 3)
+            self._checkpoint.completed.append(name)
+            self._checkpoint.timings[name] = elapsed
+            self._store.save(self._checkpoint)
+            self._update(index, "completed", elapsed_s=elapsed)
+            logger.info("Training deploy %s: %s finished in %.1fs", self.job_id, name, elapsed)
+        self._store.discard(self.job_id)
+        self._update(None, None, state="completed", current_step=None)
+
+    def _update(
+        self,
+        index: int | None,
+        step_state: str | None,
+        *,
+        elapsed_s: float | None = None,
+        **changes: Any,
+    ) -> None:
+        with self._lock:
+            if index is not None and step_state is not None:
+                step = self._status.steps[index]
+                step.state = step_state  # type: ignore[assignment]
+                if elapsed_s is not None:
+                    step.elapsed_s = elapsed_s
+            for key, value in changes.items():
+                setattr(self._status, key, value)
+            self._status.updated_at = _utcnow_iso()
+            payload = self._status.model_dump(mode="json")
+        self._bus.publish_threadsafe(TRAINING_DEPLOY_TOPIC, self.job_id, payload)
+
+
+class TrainingDeploymentsService:
+    """Tracks deployment tasks so each job is deployed by at most one task."""
+
+    def __init__(self, store: DeploymentCheckpointStore | None = None) -> None:
+        self.store = store or DeploymentCheckpointStore()
+        self._lock = threading.Lock()
+        self._deployments: dict[str, TrainingDeployment] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def start(
+        self,
+        job_id: str,
+        runner: Callable[[], Awaitable[None]],
+    ) -> asyncio.Task[None]:
+        """Schedule ``runner`` for ``job_id`` unless a deployment is already running."""
+        with self._lock:
+            task = self._tasks.get(job_id)
+            if task is not None and not task.done():
+                return task
+            task = asyncio.get_running_loop().create_task(runner())
+            self._tasks[job_id] = task
+        task.add_done_callback(partial(self._forget_task, job_id))
+        return task
+
+    def track(self, deployment: TrainingDeployment) -> None:
+        with self._lock:
+            self._deployments[deployment.job_id] = deployment
+
+    def get(self, job_id: str) -> Optional[TrainingDeployStatus]:
+        with self._lock:
+            deployment = self._deployments.get(job_id)
+        return deployment.status() if deployment is not None else None
+
+    def _forget_task(self, job_id: str, task: asyncio.Task[None]) -> None:
+        with self._lock:
+            if self._tasks.get(job_id) is task:
+                del self._tasks[job_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Training deployment task for %s failed", job_id, exc_info=task.exception())
+
+
+_service: TrainingDeploymentsService | None = None
+_service_lock = threading.Lock()
+
+
+def get_training_deployments_service() -> TrainingDeploymentsService:
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TrainingDeploymentsService()
+    return _service
@@ -0,0 +1,416 @@
+"""Persistence of training job records with coalesced, changed-column writes.
+
+Saving a job used to SELECT the row and then UPDATE or INSERT it: two
+round-trips per save (four after a JWT-expired retry), although deployment
+and status flows save the same job many times. ``TrainingJobRepository``
+remembers the last row it loaded or wrote per job and:
+
+- writes with one request: an UPDATE of only the changed columns for jobs
+  it knows, or a native upsert (``on_conflict=job_id``) otherwise; saves
+  that change nothing but ``updated_at`` are skipped;
+- coalesces saves of the same job: saves made while a write is in flight
+  are merged into the next write, and ``wait=False`` saves are held for
+  ``flush_interval_s`` (write-behind) so successive updates go out together;
+- retries once with the fallback (service-role) client when ``use_fallback``
+  accepts the error, e.g. an expired user JWT.
+
+Loading a job flushes its pending writes first, so reads see them.
+Remembered rows expire after ``snapshot_ttl_s`` because other writers
+(remote training instances, dataset deletion) update the table too.
+
+``list_page`` serves list views: the ``created_at`` window, status filter
+and newest-first ordering run in the database, only ``JOB_LIST_COLUMNS``
+are fetched, and pages continue from an opaque keyset cursor over
+(``created_at``, ``job_id``), which an index on
+``(created_at desc, job_id desc) where deleted_at is null`` serves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import contextvars
+import copy
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from percus_ai.db import get_supabase_session
+
+logger = logging.getLogger(__name__)
+
+TRAINING_JOBS_TABLE = "training_jobs"
+TRAINING_JOB_COLUMNS = frozenset(
+    {
+        "job_id",
+        "job_name",
+        "model_id",
+        "policy_type",
+        "dataset_id",
+        "profile_instance_id",
+        "profile_snapshot",
+        "status",
+        "failure_reason",
+        "termination_reason",
+        "cleanup_status",
+        "deleted_at",
+        "training_config",
+        "author",
+        "base_checkpoint",
+        "notes",
+        "instance_id",
+        "ip",
+        "mode",
+        "ssh_user",
+        "ssh_private_key",
+        "remote_base_dir",
+        "checkpoint_repo_id",
+        "gpu_model",
+        "gpus_per_instance",
+        "exit_code",
+        "completed_at",
+        "created_at",
+        "updated_at",
+        "started_at",
+        "summary",
+        "early_stopping",
+    }
+)
+# JobInfo fields; the large JSON columns (training_config, profile_snapshot,
+# summary, early_stopping) are only read by the job detail view.
+JOB_LIST_COLUMNS = (
+    "job_id,job_name,instance_id,ip,status,dataset_id,profile_instance_id,policy_type,"
+    "failure_reason,termination_reason,cleanup_status,mode,ssh_user,ssh_private_key,"
+    "remote_base_dir,checkpoint_repo_id,created_at,updated_at,started_at,gpu_model,"
+    "gpus_per_instance,exit_code,completed_at,deleted_at"
+)
+WRITE_BEHIND_INTERVAL_S = float(os.environ.get("TRAINING_JOB_WRITE_BEHIND_S", "0.5"))
+SNAPSHOT_TTL_S = float(os.environ.get("TRAINING_JOB_SNAPSHOT_TTL_S", "60"))
+_MAX_SNAPSHOTS = 1024
+_MISSING = object()
+
+ClientFactory = Callable[[], Awaitable[Any]]
+
+
+def _columns(job_data: dict) -> dict[str, Any]:
+    return {key: copy.deepcopy(value) for key, value in job_data.items() if key in TRAINING_JOB_COLUMNS}
+
+
+def encode_job_cursor(row: dict) -> str:
+    """Cursor that continues a listing after ``row``."""
+    raw = json.dumps([row.get("created_at"), row.get("job_id")]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_job_cursor(cursor: str) -> tuple[str, str]:
+    """Return (created_at, job_id) of a cursor; ``ValueError`` when malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, job_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+    if not isinstance(created_at, str) or not isinstance(job_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created_at, job_id
+
+
+def _quoted(value: str) -> str:
+    # PostgREST logic-tree values containing reserved characters (".", ":", ",") must be quoted.
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@dataclass
+class TrainingJobPage:
+    jobs: list[dict]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class _Snapshot:
+    row: dict[str, Any]
+    seen_at: float
+
+
+@dataclass
+class _PendingSave:
+    record: dict[str, Any] = field(default_factory=dict)
+    owner_user_id: str = ""
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+    task: Optional[asyncio.Task[None]] = None
+
+
+class TrainingJobRepository:
+    """Loads and saves ``training_jobs`` rows keyed by ``job_id``."""
+
+    def __init__(
+        self,
+        *,
+        get_client: ClientFactory,
+        get_fallback_client: Optional[ClientFactory] = None,
+        use_fallback: Callable[[Exception], bool] = lambda _exc: False,
+        table: str = TRAINING_JOBS_TABLE,
+        flush_interval_s: float = WRITE_BEHIND_INTERVAL_S,
+        snapshot_ttl_s: float = SNAPSHOT_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._get_client = get_client
+        self._get_fallback_client = get_fallback_client
+        self._use_fallback = use_fallback
+        self._table = table
+        self._flush_interval_s = flush_interval_s
+        self._snapshot_ttl_s = snapshot_ttl_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshots: OrderedDict[str, _Snapshot] = OrderedDict()
+        # Pending saves per event loop (sync helpers run jobs on their own loop).
+        self._pending: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _PendingSave]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def load(self, job_id: str, *, include_deleted: bool = False) -> Optional[dict]:
+        try:
+            await self.flush(job_id)
+        except Exception:  # noqa: BLE001 - the read below shows what was stored
+            logger.warning("Pending save of training job %s failed", job_id, exc_info=True)
+
+        def _fetch(client: Any) -> Awaitable[Any]:
+            return client.table(self._table).select("*").eq("job_id", job_id).execute()
+
+        response = await self._execute(_fetch, f"loading training job {job_id}")
+        rows = response.data or []
+        if not rows:
+            with self._lock:
+                self._snapshots.pop(job_id, None)
+            return None
+        record = rows[0]
+        self.remember([record])
+        if not include_deleted and record.get("deleted_at"):
+            return None
+        return record
+
+    async def list_page(
+        self,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        created_since: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None,
+        always_include_statuses: Sequence[str] = (),
+        columns: str = JOB_LIST_COLUMNS,
+    ) -> TrainingJobPage:
+        """List non-deleted jobs newest first.
+
+        Args:
+            limit: Page size; ``None`` returns every matching job.
+            cursor: ``next_cursor`` of the previous page.
+            created_since: ISO timestamp; older jobs are skipped unless their
+                status is in ``always_include_statuses``.
+            statuses: Only return jobs with these statuses.
+
+        Raises ``ValueError`` for a malformed cursor.
+        """
+        after = decode_job_cursor(cursor) if cursor else None
+
+        def _fetch(client: Any) -> Awaitable[Any]:
+            query = client.table(self._table).select(columns).is_("deleted_at", "null")
+            if statuses:
+                query = query.in_("status", list(statuses))
+            if created_since and always_include_statuses:
+                query = query.or_(
+                    f"created_at.gte.{_quoted(created_since)},"
+                    f"status.in.({','.join(always_include_statuses)})"
+                )
+            elif created_since:
+                query = query.gte("created_at", created_since)
+            if after is not None:
+                created_at, job_id = _quoted(after[0]), _quoted(after[1])
+                query = query.or_(
+                    f"created_at.lt.{created_at},and(created_at.eq.{created_at},job_id.lt.{job_id})"
+                )
+            query = query.order("created_at", desc=True).order("job_id", desc=True)
+            if limit is not None:
+                # One extra row tells whether another page follows.
+                query = query.limit(limit + 1)
+            return query.execute()
+
+        response = await self._execute(_fetch, "listing training jobs")
+        rows = response.data or []
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_job_cursor(rows[-1])
+        self.remember(rows)
+        return TrainingJobPage(jobs=rows, next_cursor=next_cursor)
+
+    def remember(self, rows: Iterable[dict]) -> None:
+        """Record rows read from the table as the baseline for later saves."""
+        now = self._clock()
+        with self._lock:
+            for row in rows:
+                job_id = row.get("job_id")
+                if job_id:
+                    self._store_snapshot(str(job_id), _columns(row), now)
+
+    async def save(self, job_data: dict, *, wait: bool = True) -> None:
+        """Persist the job's columns.
+
+        With ``wait=False`` the save is queued and written within
+        ``flush_interval_s`` together with any later saves of the job;
+        failures of queued saves are logged.
+        """
+        record = _columns(job_data)
+        job_id = record.get("job_id")
+        if not job_id:
+            raise ValueError("Missing job_id in record")
+        owner_user_id = (
+            str(job_data.get("owner_user_id") or "").strip()
+            or str((get_supabase_session() or {}).get("user_id") or "").strip()
+        )
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending_for(loop).setdefault(job_id, _PendingSave())
+        pending.record.update(record)
+        if owner_user_id:
+            pending.owner_user_id = owner_user_id
+
+        if not wait:
+            if pending.task is None and pending.timer is None:
+                pending.timer = loop.call_later(
+                    self._flush_interval_s,
+                    self._start_flush,
+                    loop,
+                    job_id,
+                    context=contextvars.copy_context(),
+                )
+            return
+
+        waiter: asyncio.Future[None] = loop.create_future()
+        pending.waiters.append(waiter)
+        self._start_flush(loop, job_id)
+        await waiter
+
+    async def flush(self, job_id: Optional[str] = None) -> None:
+        """Write pending saves (of ``job_id`` or all jobs) now."""
+        loop = asyncio.get_running_loop()
+        pending_saves = self._pending_for(loop)
+        job_ids = [job_id] if job_id is not None else list(pending_saves)
+        waiters: list[asyncio.Future[None]] = []
+        for pending_id in job_ids:
+            pending = pending_saves.get(pending_id)
+            if pending is None:
+                continue
+            waiter: asyncio.Future[None] = loop.create_future()
+            pending.waiters.append(waiter)
+            waiters.append(waiter)
+            self._start_flush(loop, pending_id)
+        if waiters:
+            await asyncio.gather(*waiters)
+
+    def _pending_for(self, loop: asyncio.AbstractEventLoop) -> dict[str, _PendingSave]:
+        with self._lock:
+            pending = self._pending.get(loop)
+            if pending is None:
+                pending = self._pending[loop] = {}
+            return pending
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop, job_id: str) -> None:
+        pending = self._pending_for(loop).get(job_id)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+            pending.timer = None
+        if pending.task is None:
+            # The running write picks up anything merged meanwhile.
+            pending.task = loop.create_task(self._flush_job(loop, job_id, pending))
+
+    async def _flush_job(self, loop: asyncio.AbstractEventLoop, job_id: str, pending: _PendingSave) -> None:
+        try:
+            while pending.record or pending.waiters:
+                record, waiters = pending.record, pending.waiters
+                pending.record, pending.waiters = {}, []
+                try:
+                    if record:
+                        await self._write(job_id, record, pending.owner_user_id)
+                except Exception as exc:  # noqa: BLE001 - reported to the savers
+                    if not waiters:
+                        logger.exception("Deferred save of training job %s failed", job_id)
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(exc)
+                else:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            pending.task = None
+            if not pending.record and not pending.waiters and pending.timer is None:
+                self._pending_for(loop).pop(job_id, None)
+
+    async def _write(self, job_id: str, record: dict[str, Any], owner_user_id: str) -> None:
+        now = self._clock()
+        with self._lock:
+            snapshot = self._snapshots.get(job_id)
+        if snapshot is not None and now - snapshot.seen_at > self._snapshot_ttl_s:
+            # Known to exist but possibly changed elsewhere: rewrite every column.
+            snapshot = _Snapshot(row={}, seen_at=snapshot.seen_at)
+
+        if snapshot is not None:
+            changes = {
+                key: value
+                for key, value in record.items()
+                if key != "job_id" and snapshot.row.get(key, _MISSING) != value
+            }
+            if not changes.keys() - {"updated_at"}:
+                return
+
+            def _write_with(client: Any) -> Awaitable[Any]:
+                return client.table(self._table).update(changes).eq("job_id", job_id).execute()
+
+        elif owner_user_id:
+            payload = {**record, "owner_user_id": owner_user_id}
+
+            def _write_with(client: Any) -> Awaitable[Any]:
+                return client.table(self._table).upsert(payload, on_conflict="job_id").execute()
+
+        else:
+            # New rows need an owner; without one only an existing row can be updated.
+            changes = {key: value for key, value in record.items() if key != "job_id"}
+
+            def _write_with(client: Any) -> Awaitable[Any]:
+                return client.table(self._table).update(changes).eq("job_id", job_id).execute()
+
+        await self._execute(_write_with, f"saving training job {job_id}")
+
+        with self._lock:
+            row = dict(snapshot.row) if snapshot is not None else {}
+            row.update(record)
+            self._store_snapshot(job_id, row, self._clock())
+
+    async def _execute(self, operation: Callable[[Any], Awaitable[Any]], action: str) -> Any:
+        client = await self._get_client()
+        try:
+            return await operation(client)
+        except Exception as exc:
+            if not self._use_fallback(exc) or self._get_fallback_client is None:
+                raise
+            fallback_client = await self._get_fallback_client()
+            if fallback_client is None:
+                raise
+            logger.warning("JWT expired while %s; retrying with service key", action)
+            return await operation(fallback_client)
+
+    def _store_snapshot(self, job_id: str, row: dict[str, Any], seen_at: float) -> None:
+        self._snapshots[job_id] = _Snapshot(row=row, seen_at=seen_at)
+        self._snapshots.move_to_end(job_id)
+        while len(self._snapshots) > _MAX_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
@@ -0,0 +1,112 @@
+"""Periodic reconciliation of running training jobs.
+
+Job records only reflect spot preemptions or finished training processes
+after someone calls ``POST /api/training/jobs/check-status``.
+``TrainingStatusReconciler`` runs that check every ``interval_s`` seconds in
+the background while the training UI is in use.
+
+Job writes go through the caller's Supabase session (row-level security), so
+the reconciler runs with the session of the most recent request that called
+``ensure_started`` and stops after ``idle_ttl_s`` without one.
+
+Runs are single-flight per user: a periodic tick and ``check-status``
+requests arriving while a run is in flight await that run instead of saving,
+archiving and publishing the same status changes again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+from percus_ai.db import get_supabase_session, reset_request_session, set_request_session
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_INTERVAL_S = float(os.environ.get("TRAINING_STATUS_RECONCILE_INTERVAL_S", "60"))
+RECONCILE_IDLE_TTL_S = float(os.environ.get("TRAINING_STATUS_RECONCILE_IDLE_TTL_S", "900"))
+
+
+class TrainingStatusReconciler:
+    """Runs ``run_once`` periodically under the latest request session."""
+
+    def __init__(
+        self,
+        run_once: Callable[[], Awaitable[Any]],
+        *,
+        interval_s: float = RECONCILE_INTERVAL_S,
+        idle_ttl_s: float = RECONCILE_IDLE_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._run_once = run_once
+        self._interval_s = interval_s
+        self._idle_ttl_s = idle_ttl_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._session: Optional[dict[str, Any]] = None
+        self._last_demand = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._inflight: dict[Optional[str], asyncio.Future[Any]] = {}
+
+    @property
+    def running(self) -> bool:
+        with self._lock:
+            return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> None:
+        """Keep reconciling (no-op when disabled or without a session)."""
+        if self._interval_s <= 0:
+            return
+        session = get_supabase_session()
+        if not session:
+            return
+        with self._lock:
+            self._session = session
+            self._last_demand = self._clock()
+            if self._task is None or self._task.done():
+                self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def reconcile(self) -> Any:
+        """Run ``run_once`` now, or join the run in flight for the same user."""
+        user_id = (get_supabase_session() or {}).get("user_id")
+        with self._lock:
+            future = self._inflight.get(user_id)
+            if future is None:
+                # The task copies the current context, so it runs under this session.
+                future = asyncio.ensure_future(self._run_once())
+                self._inflight[user_id] = future
+                future.add_done_callback(lambda done: self._forget(user_id, done))
+        # One caller giving up must not cancel the run for the others.
+        return await asyncio.shield(future)
+
+    def _forget(self, user_id: Optional[str], future: asyncio.Future[Any]) -> None:
+        with self._lock:
+            if self._inflight.get(user_id) is future:
+                del self._inflight[user_id]
+
+    def stop(self) -> None:
+        with self._lock:
+            task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_s)
+            with self._lock:
+                if self._clock() - self._last_demand > self._idle_ttl_s:
+                    self._task = None
+                    return
+                session = self._session
+            token = set_request_session(session)
+            try:
+                await self.reconcile()
+            except Exception:  # noqa: BLE001 - retried on the next tick
+                logger.exception("Training job status reconciliation failed")
+            finally:
+                reset_request_session(token)
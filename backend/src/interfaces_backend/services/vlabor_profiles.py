@@ -2,13 +2,23 @@
 
 This module treats VLAbor profile YAML as the source of truth and stores only
 selection/session snapshots on backend side.
+
+Parsed profiles are held by :class:`VlaborProfileRegistry`, which re-parses a
+YAML file only when its (path, mtime, size) changes. A ``watchfiles`` watcher
+on the profile directories marks the registry dirty; without it every lookup
+re-checks file stats instead. Session setup reads derived specs (cameras, arm
+namespaces, topic suffixes, inference bridge config) from
+:func:`compile_profile`, which computes them once per snapshot.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +27,16 @@ from typing import Any, Optional
 import yaml
 from fastapi import HTTPException
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from watchfiles import watch as _watch_paths
+except ImportError:  # installed with uvicorn[standard]; fall back to stat checks
+    _watch_paths = None
+
 from percus_ai.db import get_current_user_id, get_supabase_async_client
 from percus_ai.storage.paths import get_project_root
 
@@ -24,6 +44,11 @@ logger = logging.getLogger(__name__)
 
 _SESSION_PROFILE_TABLE = "session_profile_bindings"
 _ACTIVE_PROFILE_FILE_ENV = "VLABOR_ACTIVE_PROFILE_FILE"
+_PROFILES_DIR_ENV = "VLABOR_PROFILES_DIR"
+_DEFAULTS_FILE_ENV = "VLABOR_DEFAULTS_FILE"
+
+# (path, st_mtime_ns, st_size)
+_FileKey = tuple[str, int, int]
 
 _SO101_DEFAULT_JOINT_SUFFIXES = [
     "shoulder_pan",
@@ -84,7 +109,7 @@ def _save_active_profile_name_local(profile_name: str) -> None:
 
 
 def _resolve_profiles_dir() -> Optional[Path]:
-    env_override = os.environ.get("VLABOR_PROFILES_DIR")
+    env_override = os.environ.get(_PROFILES_DIR_ENV)
     candidates = [
         Path(env_override).expanduser() if env_override else None,
         Path.home() / ".vlabor" / "profiles",
@@ -103,7 +128,7 @@ def _resolve_profiles_dir() -> Optional[Path]:
 
 
 def _resolve_defaults_path() -> Optional[Path]:
-    env_override = os.environ.get("VLABOR_DEFAULTS_FILE")
+    env_override = os.environ.get(_DEFAULTS_FILE_ENV)
     candidates = [
         Path(env_override).expanduser() if env_override else None,
         Path.home() / ".vlabor" / "vlabor_profiles.yaml",
@@ -123,7 +148,7 @@ def _resolve_defaults_path() -> Optional[Path]:
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        payload = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
     except Exception as exc:  # noqa: BLE001 - surfaced as API detail
         raise HTTPException(status_code=500, detail=f"Failed to load profile yaml: {path}") from exc
     if not isinstance(payload, dict):
@@ -151,25 +176,181 @@ def _build_profile_snapshot(path: Path, payload: dict[str, Any]) -> dict[str, An
     }
 
 
-def list_vlabor_profiles() -> list[VlaborProfileSpec]:
-    profiles_dir = _resolve_profiles_dir()
-    if not profiles_dir:
-        return []
+def _file_key(path: Path) -> Optional[_FileKey]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _load_profile_spec(path: Path) -> VlaborProfileSpec:
+    payload = _load_yaml(path)
+    snapshot = _build_profile_snapshot(path, payload)
+    return VlaborProfileSpec(
+        name=str(snapshot.get("name") or path.stem),
+        description=str(snapshot.get("description") or ""),
+        snapshot=snapshot,
+        source_path=str(path),
+        updated_at=datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc).isoformat(),
+    )
+
+
+def _defaults_from_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    defaults = payload.get("defaults")
+    if isinstance(defaults, dict):
+        return dict(defaults)
+    return {}
+
 
-    profiles: list[VlaborProfileSpec] = []
-    for path in sorted(profiles_dir.glob("*.yaml")):
-        payload = _load_yaml(path)
-        snapshot = _build_profile_snapshot(path, payload)
-        profiles.append(
-            VlaborProfileSpec(
-                name=str(snapshot.get("name") or path.stem),
-                description=str(snapshot.get("description") or ""),
-                snapshot=snapshot,
-                source_path=str(path),
-                updated_at=datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc).isoformat(),
-            )
+@dataclass
+class _RegistryEntry:
+    key: _FileKey
+    spec: VlaborProfileSpec
+    compiled: Optional[CompiledVlaborProfile] = None
+
+
+class VlaborProfileRegistry:
+    """Parsed VLAbor profiles and defaults, cached by (path, mtime, size).
+
+    ``profiles()``/``get()`` rescan only when the watcher reported a change
+    (or on every call while no watcher runs, which costs a stat per file).
+    """
+
+    def __init__(self, *, watch: bool = True) -> None:
+        self._lock = threading.RLock()
+        self._entries: dict[str, _RegistryEntry] = {}
+        self._by_name: dict[str, _RegistryEntry] = {}
+        self._profiles: tuple[VlaborProfileSpec, ...] = ()
+        self._defaults: dict[str, Any] = {}
+        self._defaults_key: Optional[_FileKey] = None
+        self._scan_env: Optional[tuple[Optional[str], Optional[str]]] = None
+        self._dirty = True
+        self._watch = watch and _watch_paths is not None
+        self._watch_targets: tuple[str, ...] = ()
+        self._watch_thread: threading.Thread | None = None
+        self._watch_stop = threading.Event()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dirty = True
+
+    def close(self) -> None:
+        self._watch_stop.set()
+
+    def profiles(self) -> list[VlaborProfileSpec]:
+        with self._lock:
+            self._refresh()
+            return list(self._profiles)
+
+    def get(self, profile_name: str) -> Optional[VlaborProfileSpec]:
+        with self._lock:
+            self._refresh()
+            entry = self._by_name.get(profile_name.strip())
+            return entry.spec if entry is not None else None
+
+    def default_settings(self) -> dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return dict(self._defaults)
+
+    def compiled(self, profile: VlaborProfileSpec) -> Optional[CompiledVlaborProfile]:
+        """Compiled form when ``profile`` is the registry's current parse of its file."""
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(profile.source_path)
+            if entry is None or entry.spec is not profile:
+                return None
+            if entry.compiled is None:
+                entry.compiled = _compile_snapshot(profile.snapshot, defaults=self._defaults)
+            return entry.compiled
+
+    def _watching(self) -> bool:
+        return self._watch_thread is not None and self._watch_thread.is_alive()
+
+    def _refresh(self) -> None:
+        scan_env = (os.environ.get(_PROFILES_DIR_ENV), os.environ.get(_DEFAULTS_FILE_ENV))
+        if not self._dirty and self._watching() and scan_env == self._scan_env:
+            return
+        # Cleared before scanning so a change reported mid-scan triggers another pass.
+        self._dirty = False
+        self._scan_env = scan_env
+
+        defaults_path = _resolve_defaults_path()
+        defaults_key = _file_key(defaults_path) if defaults_path else None
+        defaults_changed = defaults_key != self._defaults_key
+        if defaults_changed:
+            self._defaults = _defaults_from_payload(_load_yaml(defaults_path)) if defaults_path else {}
+            self._defaults_key = defaults_key
+
+        profiles_dir = _resolve_profiles_dir()
+        entries: dict[str, _RegistryEntry] = {}
+        for path in sorted(profiles_dir.glob("*.yaml")) if profiles_dir else []:
+            key = _file_key(path)
+            if key is None:
+                continue
+            entry = self._entries.get(str(path))
+            if entry is None or entry.key != key:
+                entry = _RegistryEntry(key=key, spec=_load_profile_spec(path))
+            elif defaults_changed:
+                # Compiled specs render ${...} settings, which include the defaults.
+                entry = _RegistryEntry(key=entry.key, spec=entry.spec)
+            entries[str(path)] = entry
+
+        by_name: dict[str, _RegistryEntry] = {}
+        for entry in entries.values():
+            by_name.setdefault(entry.spec.name, entry)
+        self._entries = entries
+        self._by_name = by_name
+        self._profiles = tuple(entry.spec for entry in entries.values())
+        self._ensure_watcher(profiles_dir, defaults_path)
+
+    def _ensure_watcher(self, profiles_dir: Optional[Path], defaults_path: Optional[Path]) -> None:
+        if not self._watch:
+            return
+        targets = tuple(
+            sorted({str(path) for path in (profiles_dir, defaults_path.parent if defaults_path else None) if path})
+        )
+        if targets == self._watch_targets and self._watching():
+            return
+        self._watch_stop.set()
+        self._watch_stop = threading.Event()
+        self._watch_targets = targets
+        self._watch_thread = None
+        if not targets:
+            return
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(targets, self._watch_stop),
+            name="vlabor-profile-watcher",
+            daemon=True,
         )
-    return profiles
+        self._watch_thread.start()
+
+    def _watch_loop(self, targets: tuple[str, ...], stop: threading.Event) -> None:
+        try:
+            for _changes in _watch_paths(*targets, stop_event=stop):
+                self.invalidate()
+        except Exception as exc:  # noqa: BLE001 - fall back to stat checks
+            logger.warning("VLAbor profile watcher stopped: %s", exc)
+        finally:
+            self.invalidate()
+
+
+_registry: VlaborProfileRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_vlabor_profile_registry() -> VlaborProfileRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = VlaborProfileRegistry()
+    return _registry
+
+
+def list_vlabor_profiles() -> list[VlaborProfileSpec]:
+    return get_vlabor_profile_registry().profiles()
 
 
 def _default_profile_name(available_names: list[str]) -> Optional[str]:
@@ -191,18 +372,15 @@ def _profile_by_name(profile_name: str) -> Optional[VlaborProfileSpec]:
 
 
 def _load_default_settings() -> dict[str, Any]:
-    path = _resolve_defaults_path()
-    if not path:
-        return {}
-    payload = _load_yaml(path)
-    defaults = payload.get("defaults")
-    if isinstance(defaults, dict):
-        return dict(defaults)
-    return {}
+    return get_vlabor_profile_registry().default_settings()
 
 
-def build_profile_settings(snapshot: dict[str, Any]) -> dict[str, Any]:
-    settings = _load_default_settings()
+def build_profile_settings(
+    snapshot: dict[str, Any],
+    *,
+    defaults: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    settings = dict(defaults) if defaults is not None else _load_default_settings()
     profile = snapshot.get("profile")
     if isinstance(profile, dict):
         variables = profile.get("variables")
@@ -254,13 +432,18 @@ def _topic_candidates(topic: object) -> list[str]:
     return candidates
 
 
-def extract_status_camera_specs(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+def extract_status_camera_specs(
+    snapshot: dict[str, Any],
+    *,
+    settings: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
     """Extract camera specs for device status UI.
 
     This intentionally includes both operator-facing camera nodes and recorder
     camera topics so setup UI can show per-camera connectivity.
     """
-    settings = build_profile_settings(snapshot)
+    if settings is None:
+        settings = build_profile_settings(snapshot)
     profile = snapshot.get("profile")
     if not isinstance(profile, dict):
         return []
@@ -354,9 +537,14 @@ def extract_status_camera_specs(snapshot: dict[str, Any]) -> list[dict[str, Any]
     return results
 
 
-def extract_status_arm_specs(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
+def extract_status_arm_specs(
+    snapshot: dict[str, Any],
+    *,
+    settings: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
     """Extract arm specs for device status UI."""
-    settings = build_profile_settings(snapshot)
+    if settings is None:
+        settings = build_profile_settings(snapshot)
     profile = snapshot.get("profile")
     if not isinstance(profile, dict):
         return []
@@ -464,8 +652,13 @@ def extract_status_arm_specs(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
     return results
 
 
-def extract_camera_specs(snapshot: dict[str, Any]) -> list[dict[str, Any]]:
-    settings = build_profile_settings(snapshot)
+def extract_camera_specs(
+    snapshot: dict[str, Any],
+    *,
+    settings: Optional[dict[str, Any]] = None,
+) -> list[dict[str, Any]]:
+    if settings is None:
+        settings = build_profile_settings(snapshot)
     profile = snapshot.get("profile")
     if not isinstance(profile, dict):
         return []
@@ -580,6 +773,7 @@ def extract_recorder_topic_suffixes(
     snapshot: dict[str, Any],
     *,
     arm_namespaces: Optional[list[str]] = None,
+    settings: Optional[dict[str, Any]] = None,
 ) -> dict[str, str]:
     """Extract recorder topic suffixes from profile snapshot.
 
@@ -599,7 +793,8 @@ def extract_recorder_topic_suffixes(
     if not target_namespaces:
         return {}
 
-    settings = build_profile_settings(snapshot)
+    if settings is None:
+        settings = build_profile_settings(snapshot)
     state_suffixes: dict[str, set[str]] = {namespace: set() for namespace in target_namespaces}
     action_suffixes: dict[str, set[str]] = {namespace: set() for namespace in target_namespaces}
 
@@ -645,26 +840,14 @@ def extract_recorder_topic_suffixes(
     return result
 
 
-def build_inference_bridge_config(snapshot: dict[str, Any]) -> dict[str, Any]:
-    """Build inference bridge stream config from VLAbor profile snapshot.
-
-    This uses the same profile-derived source of truth as recording:
-    arm namespaces, recorder topic suffixes, and lerobot camera definitions.
-    """
-    arm_namespaces: list[str] = []
-    for namespace in extract_arm_namespaces(snapshot):
-        text = str(namespace or "").strip()
-        if text and text not in arm_namespaces:
-            arm_namespaces.append(text)
-
-    topic_suffixes = extract_recorder_topic_suffixes(
-        snapshot,
-        arm_namespaces=arm_namespaces,
-    )
-
+def _bridge_config_from(
+    arm_namespaces: list[str],
+    topic_suffixes: dict[str, str],
+    camera_specs: list[dict[str, Any]],
+) -> dict[str, Any]:
     camera_streams: list[dict[str, str]] = []
     seen_camera_names: set[str] = set()
-    for spec in extract_camera_specs(snapshot):
+    for spec in camera_specs:
         if not _as_bool(spec.get("enabled", True)):
             continue
         topic = str(spec.get("topic") or "").strip()
@@ -677,14 +860,47 @@ def build_inference_bridge_config(snapshot: dict[str, Any]) -> dict[str, Any]:
         camera_streams.append({"name": name, "topic": topic})
 
     return {
-        "arm_namespaces": arm_namespaces,
+        "arm_namespaces": list(arm_namespaces),
         "state_topic_suffix": str(topic_suffixes.get("state_topic_suffix") or "").strip(),
         "action_topic_suffix": str(topic_suffixes.get("action_topic_suffix") or "").strip(),
         "camera_streams": camera_streams,
     }
 
 
-def build_inference_joint_names(snapshot: dict[str, Any]) -> list[str]:
+def _unique_namespaces(namespaces: list[str]) -> list[str]:
+    unique: list[str] = []
+    for namespace in namespaces:
+        text = str(namespace or "").strip()
+        if text and text not in unique:
+            unique.append(text)
+    return unique
+
+
+def build_inference_bridge_config(snapshot: dict[str, Any]) -> dict[str, Any]:
+    """Build inference bridge stream config from VLAbor profile snapshot.
+
+    This uses the same profile-derived source of truth as recording:
+    arm namespaces, recorder topic suffixes, and lerobot camera definitions.
+    """
+    settings = build_profile_settings(snapshot)
+    arm_namespaces = _unique_namespaces(extract_arm_namespaces(snapshot))
+    topic_suffixes = extract_recorder_topic_suffixes(
+        snapshot,
+        arm_namespaces=arm_namespaces,
+        settings=settings,
+    )
+    return _bridge_config_from(
+        arm_namespaces,
+        topic_suffixes,
+        extract_camera_specs(snapshot, settings=settings),
+    )
+
+
+def build_inference_joint_names(
+    snapshot: dict[str, Any],
+    *,
+    arm_namespaces: Optional[list[str]] = None,
+) -> list[str]:
     profile = snapshot.get("profile")
     if not isinstance(profile, dict):
         return []
@@ -707,14 +923,16 @@ def build_inference_joint_names(snapshot: dict[str, Any]) -> list[str]:
             return names
 
     names: list[str] = []
-    for namespace in extract_arm_namespaces(snapshot):
+    if arm_namespaces is None:
+        arm_namespaces = extract_arm_namespaces(snapshot)
+    for namespace in arm_namespaces:
         names.extend(f"{namespace}_{suffix}" for suffix in _SO101_DEFAULT_JOINT_SUFFIXES)
     return names
 
 
-def build_inference_camera_aliases(snapshot: dict[str, Any]) -> dict[str, str]:
+def _camera_aliases_from(camera_specs: list[dict[str, Any]]) -> dict[str, str]:
     aliases: dict[str, str] = {}
-    for spec in extract_camera_specs(snapshot):
+    for spec in camera_specs:
         if not _as_bool(spec.get("enabled", True)):
             continue
         source_name = str(spec.get("source") or "").strip()
@@ -725,6 +943,118 @@ def build_inference_camera_aliases(snapshot: dict[str, Any]) -> dict[str, str]:
     return aliases
 
 
+def build_inference_camera_aliases(snapshot: dict[str, Any]) -> dict[str, str]:
+    return _camera_aliases_from(extract_camera_specs(snapshot))
+
+
+def _recorder_cameras_from(camera_specs: list[dict[str, Any]]) -> list[dict[str, str]]:
+    cameras: list[dict[str, str]] = []
+    for spec in camera_specs:
+        if not bool(spec.get("enabled", True)):
+            continue
+        name = str(spec.get("name") or "").strip()
+        topic = str(spec.get("topic") or "").strip()
+        if name and topic:
+            cameras.append({"name": name, "topic": topic})
+    return cameras
+
+
+def snapshot_hash(snapshot: dict[str, Any], settings: dict[str, Any]) -> str:
+    """Content hash of a profile snapshot together with its resolved settings."""
+    encoded = json.dumps([snapshot, settings], sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledVlaborProfile:
+    """Every profile-derived artifact, computed once per snapshot hash.
+
+    Instances are shared by all sessions using the same profile; treat the
+    contained lists and dicts as read-only.
+    """
+
+    snapshot_hash: str
+    settings: dict[str, Any]
+    camera_specs: list[dict[str, Any]]
+    status_camera_specs: list[dict[str, Any]]
+    status_arm_specs: list[dict[str, Any]]
+    arm_namespaces: list[str]
+    recorder_topic_suffixes: dict[str, str]
+    recorder_cameras: list[dict[str, str]]
+    inference_bridge_config: dict[str, Any]
+    inference_joint_names: list[str]
+    inference_camera_aliases: dict[str, str]
+
+    @classmethod
+    def build(cls, snapshot: dict[str, Any], *, settings: dict[str, Any], digest: str) -> CompiledVlaborProfile:
+        camera_specs = extract_camera_specs(snapshot, settings=settings)
+        arm_namespaces = extract_arm_namespaces(snapshot)
+        topic_suffixes = extract_recorder_topic_suffixes(
+            snapshot,
+            arm_namespaces=arm_namespaces,
+            settings=settings,
+        )
+        bridge_namespaces = _unique_namespaces(arm_namespaces)
+        bridge_topic_suffixes = (
+            topic_suffixes
+            if bridge_namespaces == arm_namespaces
+            else extract_recorder_topic_suffixes(snapshot, arm_namespaces=bridge_namespaces, settings=settings)
+        )
+        return cls(
+            snapshot_hash=digest,
+            settings=settings,
+            camera_specs=camera_specs,
+            status_camera_specs=extract_status_camera_specs(snapshot, settings=settings),
+            status_arm_specs=extract_status_arm_specs(snapshot, settings=settings),
+            arm_namespaces=arm_namespaces,
+            recorder_topic_suffixes=topic_suffixes,
+            recorder_cameras=_recorder_cameras_from(camera_specs),
+            inference_bridge_config=_bridge_config_from(bridge_namespaces, bridge_topic_suffixes, camera_specs),
+            inference_joint_names=build_inference_joint_names(snapshot, arm_namespaces=arm_namespaces),
+            inference_camera_aliases=_camera_aliases_from(camera_specs),
+        )
+
+
+_compiled_profiles: OrderedDict[str, CompiledVlaborProfile] = OrderedDict()
+_compiled_profiles_lock = threading.Lock()
+_COMPILED_PROFILES_MAX = 32
+
+
+def _compile_snapshot(
+    snapshot: dict[str, Any],
+    *,
+    defaults: Optional[dict[str, Any]] = None,
+) -> CompiledVlaborProfile:
+    settings = build_profile_settings(snapshot, defaults=defaults)
+    digest = snapshot_hash(snapshot, settings)
+    with _compiled_profiles_lock:
+        compiled = _compiled_profiles.get(digest)
+        if compiled is not None:
+            _compiled_profiles.move_to_end(digest)
+            return compiled
+    compiled = CompiledVlaborProfile.build(snapshot, settings=settings, digest=digest)
+    with _compiled_profiles_lock:
+        _compiled_profiles[digest] = compiled
+        while len(_compiled_profiles) > _COMPILED_PROFILES_MAX:
+            _compiled_profiles.popitem(last=False)
+    return compiled
+
+
+def compile_profile(profile: VlaborProfileSpec | dict[str, Any]) -> CompiledVlaborProfile:
+    """Compiled artifacts for a profile spec or a raw snapshot (e.g. a stored binding).
+
+    Profiles parsed by the registry keep their compiled form until the file
+    or the defaults change; other snapshots are cached by content hash.
+    """
+    if isinstance(profile, dict):
+        return _compile_snapshot(profile)
+    if isinstance(profile, VlaborProfileSpec):
+        compiled = get_vlabor_profile_registry().compiled(profile)
+        if compiled is not None:
+            return compiled
+    return _compile_snapshot(profile.snapshot)
+
+
 async def get_active_profile_spec() -> VlaborProfileSpec:
     profiles = list_vlabor_profiles()
     if not profiles:
@@ -6,15 +6,16 @@ import logging
 import os
 import shutil
 import subprocess
-import threading
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Sequence
 
+from interfaces_backend.services.command_runner import get_command_runner
 from percus_ai.storage.paths import get_project_root
 
 _DEFAULT_SCRIPT_TIMEOUT_S = int(os.environ.get("VLABOR_SCRIPT_TIMEOUT_S", "120"))
-_VLABOR_LOCK = threading.Lock()
+# VLAbor scripts drive the same compose project and must not overlap.
+_VLABOR_LOCK_NAME = "vlabor"
 
 
 class VlaborCommandError(RuntimeError):
@@ -29,7 +30,7 @@ def _vlabor_script_path(script_name: str) -> Path:
     return get_project_root() / "docker" / "vlabor" / script_name
 
 
-def _run_vlabor_script(
+async def _run_vlabor_script(
     script_name: str,
     args: Sequence[str] | None = None,
     *,
@@ -51,13 +52,12 @@ def _run_vlabor_script(
             raise VlaborCommandError(message)
         return _failed_result(cmd, message)
 
+    runner = get_command_runner()
     try:
-        with _VLABOR_LOCK:
-            result = subprocess.run(
+        async with runner.exclusive(_VLABOR_LOCK_NAME):
+            result = await runner.run(
                 cmd,
                 cwd=get_project_root(),
-                capture_output=True,
-                text=True,
                 timeout=timeout or _DEFAULT_SCRIPT_TIMEOUT_S,
             )
     except subprocess.TimeoutExpired as exc:
@@ -67,6 +67,8 @@ def _run_vlabor_script(
         stdout = exc.stdout if isinstance(exc.stdout, str) else ""
         stderr = exc.stderr if isinstance(exc.stderr, str) else message
         return subprocess.CompletedProcess(args=cmd, returncode=124, stdout=stdout, stderr=stderr)
+    finally:
+        runner.invalidate()
 
     if result.returncode != 0 and strict:
         detail = (result.stderr or result.stdout).strip() or f"exit code={result.returncode}"
@@ -75,7 +77,7 @@ def _run_vlabor_script(
     return result
 
 
-def start_vlabor(
+async def start_vlabor(
     *,
     profile: str | None = None,
     domain_id: int | None = None,
@@ -91,14 +93,14 @@ def start_vlabor(
         args.extend(["--domain-id", str(domain_id)])
     if dev_mode:
         args.append("--dev")
-    return _run_vlabor_script("up", args, strict=strict)
+    return await _run_vlabor_script("up", args, strict=strict)
 
 
-def stop_vlabor(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
-    return _run_vlabor_script("down", strict=strict)
+async def stop_vlabor(*, strict: bool = True) -> subprocess.CompletedProcess[str]:
+    return await _run_vlabor_script("down", strict=strict)
 
 
-def restart_vlabor(
+async def restart_vlabor(
     *,
     profile: str | None = None,
     domain_id: int | None = None,
@@ -114,15 +116,15 @@ def restart_vlabor(
         args.extend(["--domain-id", str(domain_id)])
     if dev_mode:
         args.append("--dev")
-    return _run_vlabor_script("restart", args, strict=strict, timeout=300)
+    return await _run_vlabor_script("restart", args, strict=strict, timeout=300)
 
 
-def stream_vlabor_script(
+async def stream_vlabor_script(
     script_name: str,
     args: Sequence[str] | None = None,
     *,
     timeout: int | None = None,
-) -> Generator[dict[str, str], None, None]:
+) -> AsyncGenerator[dict[str, str], None]:
     """Run a VLAbor script and yield output lines as they arrive.
 
     Yields dicts like:
@@ -142,52 +144,47 @@ def stream_vlabor_script(
         return
 
     effective_timeout = timeout or _DEFAULT_SCRIPT_TIMEOUT_S
+    runner = get_command_runner()
+    stream = runner.stream_lines(cmd, cwd=get_project_root(), timeout=effective_timeout)
 
-    with _VLABOR_LOCK:
-        proc = subprocess.Popen(
-            cmd,
-            cwd=get_project_root(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
-        try:
-            assert proc.stdout is not None
-            for raw_line in proc.stdout:
+    try:
+        async with runner.exclusive(_VLABOR_LOCK_NAME):
+            async for raw_line in stream:
                 # Docker outputs progress bars using \r to overwrite the same line.
                 # Keep only the final segment after the last \r.
-                line = raw_line.rstrip("\n")
+                line = raw_line
                 if "\r" in line:
                     line = line.rsplit("\r", 1)[-1]
                 line = line.strip()
                 if line:
                     yield {"type": "log", "line": line}
-            proc.wait(timeout=effective_timeout)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            proc.wait()
-            yield {"type": "error", "message": f"Timeout after {effective_timeout}s"}
-            return
+    except subprocess.TimeoutExpired:
+        yield {"type": "error", "message": f"Timeout after {effective_timeout}s"}
+        return
+    finally:
+        runner.invalidate()
 
-    exit_code = proc.returncode
-    yield {"type": "complete", "exit_code": str(exit_code)}
+    yield {"type": "complete", "exit_code": str(stream.returncode)}
 
 
-def start_vlabor_on_backend_startup(
+async def start_vlabor_on_backend_startup(
     profile: str | None = None,
     logger: logging.Logger | None = None,
-) -> None:
-    """Start VLAbor container on backend startup with the given profile."""
+) -> subprocess.CompletedProcess[str] | None:
+    """Start VLAbor container on backend startup with the given profile.
+
+    Returns ``None`` when docker is not available and startup was skipped.
+    """
     active_logger = logger or logging.getLogger(__name__)
     if shutil.which("docker") is None:
         active_logger.warning("docker command not found; skip VLAbor startup")
-        return
+        return None
 
-    result = start_vlabor(profile=profile, strict=False)
+    result = await start_vlabor(profile=profile, strict=False)
     if result.returncode != 0:
         detail = (result.stderr or result.stdout).strip() or f"exit code={result.returncode}"
         active_logger.warning("VLAbor startup failed: %s", detail)
     else:
         active_logger.info("VLAbor started with profile=%s", profile or "(default)")
+    return result
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import os
 import platform
 from pathlib import Path
+from typing import Any
 
 from percus_ai.storage.paths import get_project_root
 
@@ -73,3 +75,16 @@ def build_compose_command(compose_file: Path, env_file: Path | None = None) -> l
     if env_file and env_file.exists():
         cmd.extend(["--env-file", str(env_file)])
     return cmd
+
+
+def parse_compose_ps_entry(stdout: str) -> dict[str, Any] | None:
+    """First service row of ``docker compose ps --format json`` output.
+
+    Raises ``ValueError`` when the output is not JSON.
+    """
+    data = json.loads(stdout)
+    if isinstance(data, list):
+        return data[0] if data else None
+    if isinstance(data, dict):
+        return data
+    return None
@@ -0,0 +1,104 @@
+"""Minimal JSON Patch (RFC 6902) diff for realtime stream deltas.
+
+Only ``add``, ``remove`` and ``replace`` operations are produced. Lists that
+grow at the end (optionally dropping items from the front, as a sliding
+window of metric rows does) are diffed as removes from the front plus
+appends, so only the changed rows are sent.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+JsonPatch = list[dict[str, Any]]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _sliding_offset(old: list[Any], new: list[Any]) -> int | None:
+    """Return ``k`` such that ``old[k:]`` is a prefix of ``new``, if any."""
+    if not old:
+        return 0
+    if not new:
+        return None
+    for offset, item in enumerate(old):
+        kept = len(old) - offset
+        if kept > len(new) or item != new[0]:
+            continue
+        if old[offset:] == new[:kept]:
+            return offset
+    return None
+
+
+def _diff_list(old: list[Any], new: list[Any], path: str, ops: JsonPatch) -> None:
+    offset = _sliding_offset(old, new)
+    if offset is not None:
+        ops.extend({"op": "remove", "path": f"{path}/0"} for _ in range(offset))
+        kept = len(old) - offset
+        ops.extend({"op": "add", "path": f"{path}/-", "value": item} for item in new[kept:])
+        return
+    if len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff(old_item, new_item, f"{path}/{index}", ops)
+        return
+    ops.append({"op": "replace", "path": path, "value": new})
+
+
+def _diff(old: Any, new: Any, path: str, ops: JsonPatch) -> None:
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key in old:
+                _diff(old[key], value, child, ops)
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, ops)
+        return
+    ops.append({"op": "replace", "path": path, "value": new})
+
+
+def diff(old: Any, new: Any) -> JsonPatch:
+    """Return a JSON Patch transforming ``old`` into ``new``."""
+    ops: JsonPatch = []
+    _diff(old, new, "", ops)
+    return ops
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply(document: Any, patch: JsonPatch) -> Any:
+    """Apply a patch produced by :func:`diff`; ``document`` is modified in place."""
+    for op in patch:
+        path = op["path"]
+        if path == "":
+            document = op.get("value")
+            continue
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        kind = op["op"]
+        if isinstance(target, list):
+            if kind == "remove":
+                del target[int(last)]
+            elif last == "-":
+                target.append(op["value"])
+            elif kind == "add":
+                target.insert(int(last), op["value"])
+            else:
+                target[int(last)] = op["value"]
+        elif kind == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return document
@@ -3,21 +3,46 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 
+from interfaces_backend.utils import json_patch
 from percus_ai.observability import ArmId, CommOverheadReporter, PointId, new_trace_id
 
 JsonBuilder = Callable[[], Awaitable[dict]]
 _COMM_REPORTER = CommOverheadReporter("backend")
+# Pre-serialized fields carried by realtime bus events; never part of the payload.
+WIRE_KEYS = ("encoded", "frame", "deltas")
 
 
-def _format_event(data: str, event: Optional[str]) -> str:
+def format_sse_event(data: str, event: Optional[str], event_id: Optional[str] = None) -> str:
+    prefix = f"id: {event_id}\n" if event_id else ""
     if event:
-        return f"event: {event}\ndata: {data}\n\n"
-    return f"data: {data}\n\n"
+        return f"{prefix}event: {event}\ndata: {data}\n\n"
+    return f"{prefix}data: {data}\n\n"
+
+
+def event_stream_response(frames: AsyncIterator[Any]) -> StreamingResponse:
+    return StreamingResponse(
+        frames,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def wants_delta(request: Request) -> bool:
+    """Clients opt into delta frames with ``?delta=1``."""
+    return request.query_params.get("delta", "").strip().lower() in {"1", "true", "yes"}
+
+
+def last_event_id(request: Request) -> Optional[str]:
+    value = request.headers.get("last-event-id", "").strip()
+    return value or None
 
 
 def sse_response(
@@ -70,21 +95,14 @@ def sse_response(
                         tags=tags,
                     )
                     last_sent_ns = now_ns
-                yield _format_event(encoded, event)
+                yield format_sse_event(encoded, event)
             elif now - last_sent >= heartbeat:
                 last_sent = now
                 yield ": ping\n\n"
 
             await asyncio.sleep(interval)
 
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return event_stream_response(event_stream())
 
 
 def sse_queue_response(
@@ -95,8 +113,66 @@ def sse_queue_response(
     heartbeat: float = 25.0,
     payload_key: Optional[str] = "payload",
     on_close: Optional[Callable[[], None]] = None,
+    resume_event: Optional[dict[str, Any]] = None,
+    delta: Optional[bool] = None,
 ) -> StreamingResponse:
+    """Stream queued bus events as SSE frames.
+
+    Frames carry the event ``id`` so browsers resume with ``Last-Event-ID``.
+    In delta mode, a frame whose JSON Patch against the previously sent
+    payload is smaller than the payload itself is sent as a ``delta`` event
+    (``<event>.delta`` for named events) instead; ``resume_event`` is the
+    event the client already holds after a reconnect.
+
+    Pre-encoded bus events (``encoded``/``frame``/``deltas``) are sent as-is,
+    so fan-out to many subscribers does not re-serialize the payload.
+    """
+    use_delta = wants_delta(request) if delta is None else delta
+    delta_event = f"{event}.delta" if event else "delta"
+    uses_bus_encoding = payload_key == "payload"
+
+    def extract(item: dict[str, Any]) -> Any:
+        if payload_key is None:
+            return {key: value for key, value in item.items() if key not in WIRE_KEYS}
+        payload = item.get(payload_key)
+        return item if payload is None else payload
+
+    def encoded_payload(item: dict[str, Any]) -> str:
+        encoded = item.get("encoded") if uses_bus_encoding else None
+        if isinstance(encoded, str):
+            return encoded
+        return json.dumps(extract(item), ensure_ascii=False, sort_keys=True)
+
+    def full_frame(item: dict[str, Any]) -> bytes:
+        frame = item.get("frame") if uses_bus_encoding and event is None else None
+        if isinstance(frame, bytes):
+            return frame
+        return format_sse_event(encoded_payload(item), event, item.get("id")).encode("utf-8")
+
+    def delta_frame(base: dict[str, Any], item: dict[str, Any]) -> Optional[bytes]:
+        """Delta frame from ``base`` to ``item``; ``None`` when a full frame is smaller."""
+        cache = item.get("deltas")
+        cache_key = (base.get("id"), delta_event, payload_key)
+        if isinstance(cache, dict) and cache_key in cache:
+            return cache[cache_key]
+        event_id = item.get("id")
+        patch = json_patch.diff(extract(base), extract(item))
+        frame: Optional[bytes]
+        if not patch:
+            # An id-only frame advances Last-Event-ID without dispatching a message.
+            frame = f"id: {event_id}\n\n".encode("utf-8") if event_id else b""
+        else:
+            encoded_patch = json.dumps(patch, ensure_ascii=False)
+            if len(encoded_patch) < len(encoded_payload(item)):
+                frame = format_sse_event(encoded_patch, delta_event, event_id).encode("utf-8")
+            else:
+                frame = None
+        if isinstance(cache, dict) and base.get("id"):
+            cache[cache_key] = frame
+        return frame
+
     async def event_stream():
+        previous: Optional[dict[str, Any]] = resume_event if use_delta else None
         try:
             while True:
                 if await request.is_disconnected():
@@ -104,26 +180,18 @@ def sse_queue_response(
                 try:
                     item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
                 except asyncio.TimeoutError:
-                    yield ": ping\n\n"
+                    yield b": ping\n\n"
                     continue
 
-                if payload_key is None:
-                    payload = item
-                else:
-                    payload = item.get(payload_key)
-                    if payload is None:
-                        payload = item
-                encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
-                yield _format_event(encoded, event)
+                frame = delta_frame(previous, item) if previous is not None else None
+                if frame is None:
+                    frame = full_frame(item)
+                if use_delta:
+                    previous = item
+                if frame:
+                    yield frame
         finally:
             if on_close is not None:
                 on_close()
 
-    return StreamingResponse(
-        event_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return event_stream_response(event_stream())
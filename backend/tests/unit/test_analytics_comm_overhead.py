@@ -47,6 +47,15 @@ class _DummyStore:
             "recent_events": [],
         }
 
+    def get_ingest_stats(self):
+        return {
+            "file_path": "/tmp/comm_events.jsonl",
+            "tailer_running": True,
+            "events_total": 3,
+            "parse_errors_total": 1,
+            "lag_bytes": 0,
+        }
+
     def get_trace(self, *, trace_id: str, window_sec: int, limit: int):
         return {
             "window_sec": window_sec,
@@ -69,3 +78,11 @@ def test_comm_overhead_point_rejects_invalid_point(monkeypatch):
     monkeypatch.setattr(analytics, "get_comm_overhead_store", lambda: _DummyStore())
     with pytest.raises(HTTPException):
         asyncio.run(analytics.get_comm_overhead_point(point_id="INVALID", window_sec=60))
+
+
+def test_comm_overhead_ingest_stats_uses_store(monkeypatch):
+    monkeypatch.setattr(analytics, "get_comm_overhead_store", lambda: _DummyStore())
+    response = asyncio.run(analytics.get_comm_overhead_ingest_stats())
+    assert response.tailer_running is True
+    assert response.events_total == 3
+    assert response.parse_errors_total == 1
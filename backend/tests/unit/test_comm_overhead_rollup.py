@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+
+import numpy as np
+
+from interfaces_backend.services.comm_overhead_rollup import CommOverheadRollup, LogSketch
+
+
+def _record(point_id: str, timestamp_ns: int, *, session_id: str = "s", arm: str = "none", **fields) -> dict:
+    record = {
+        "point_id": point_id,
+        "timestamp_ns": timestamp_ns,
+        "session_id": session_id,
+        "trace_id": "t",
+        "arm": arm,
+        "status": "ok",
+        "latency_ns": None,
+        "queue_depth": None,
+        "payload_bytes": None,
+        "drop_count": None,
+        "tags": {},
+    }
+    record.update(fields)
+    return record
+
+
+def test_log_sketch_quantiles_within_relative_error() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(2.0, 1.0) for _ in range(5000)]
+    left = LogSketch()
+    right = LogSketch()
+    for index, value in enumerate(values):
+        (left if index % 2 else right).add(value)
+    left.merge(right)
+
+    ordered = sorted(values)
+    stats = left.stats()
+    for name, p in (("p50", 50.0), ("p95", 95.0), ("p99", 99.0)):
+        exact = ordered[max(0, math.ceil(p / 100.0 * len(ordered)) - 1)]
+        assert abs(stats[name] - exact) <= exact * 0.011
+    assert stats["max"] == max(values)
+    assert math.isclose(stats["avg"], sum(values) / len(values))
+
+
+def test_rollup_summarize_merges_buckets_and_filters() -> None:
+    now_ns = time.time_ns()
+    rollup = CommOverheadRollup()
+    records = []
+    for second in range(1800):
+        ts = now_ns - second * 1_000_000_000
+        records.append(_record("CP-01", ts, latency_ns=10_000_000, queue_depth=2, payload_bytes=100))
+        records.append(_record("CP-01", ts, session_id="other", status="drop", drop_count=1))
+    rollup.add(records)
+
+    resolution_sec, merged = rollup.summarize(window_sec=3600, session_id="s", now_ns=now_ns)
+    assert resolution_sec == 60
+    cp01 = merged["CP-01"].to_point_metrics("CP-01")
+    assert cp01["sample_count"] == 1800
+    assert abs(cp01["latency_ms"]["p95"] - 10.0) <= 0.1
+    assert cp01["drop_rate"] == 0.0
+
+    resolution_sec, merged = rollup.summarize(window_sec=120, session_id="other", now_ns=now_ns)
+    assert resolution_sec == 1
+    other = merged["CP-01"].to_point_metrics("CP-01")
+    assert other["sample_count"] in (120, 121)
+    assert other["drop_rate"] == 1.0
+    assert other["latency_ms"]["max"] == 0.0
+
+
+def test_rollup_bounds_memory_by_retention() -> None:
+    now_ns = time.time_ns()
+    rollup = CommOverheadRollup(resolutions=((1, 10), (10, 10)))
+    rollup.add([_record("CP-02", now_ns - second * 1_000_000_000, latency_ns=1_000_000) for second in range(500)])
+
+    assert rollup.resolution_for(10) == 1
+    assert rollup.resolution_for(100) == 10
+    assert rollup.resolution_for(1000) is None
+    _, merged = rollup.summarize(window_sec=100, now_ns=now_ns)
+    assert merged["CP-02"].sample_count <= 110
+
+
+def test_rollup_add_arrays_matches_add() -> None:
+    now_ns = time.time_ns()
+    rng = random.Random(3)
+    records = []
+    for second in range(4000):
+        ts = now_ns - second * 1_000_000_000 - rng.randrange(1_000_000_000)
+        status = "drop" if second % 7 == 0 else "ok"
+        records.append(
+            _record(
+                "CP-01" if second % 3 else "CP-02",
+                ts,
+                session_id=f"s{second % 2}",
+                status=status,
+                latency_ns=None if second % 5 == 0 else rng.randrange(0, 50_000_000),
+                queue_depth=second % 4,
+                payload_bytes=None if second % 11 == 0 else rng.randrange(1, 10_000),
+                drop_count=1 if status == "drop" else None,
+            )
+        )
+    by_record = CommOverheadRollup()
+    by_record.add(records)
+
+    keys = sorted({(r["point_id"], r["session_id"], r["arm"]) for r in records})
+    codes = {key: code for code, key in enumerate(keys)}
+
+    def column(name: str, scale: float = 1.0) -> np.ndarray:
+        return np.array([np.nan if r[name] is None else r[name] / scale for r in records])
+
+    status = np.array([r["status"] for r in records])
+    by_array = CommOverheadRollup()
+    by_array.add_arrays(
+        np.array([r["timestamp_ns"] for r in records], dtype=np.int64),
+        np.array([codes[(r["point_id"], r["session_id"], r["arm"])] for r in records]),
+        keys,
+        ok_mask=status == "ok",
+        drop_mask=status == "drop",
+        latency_ms=column("latency_ns", 1_000_000.0),
+        queue_depth=column("queue_depth"),
+        payload_bytes=column("payload_bytes"),
+        drop_count=np.nan_to_num(column("drop_count")),
+    )
+
+    for window_sec, session_id in ((60, None), (3600, "s1"), (86400, None)):
+        expected = by_record.summarize(window_sec=window_sec, session_id=session_id, now_ns=now_ns)
+        actual = by_array.summarize(window_sec=window_sec, session_id=session_id, now_ns=now_ns)
+        assert actual[0] == expected[0]
+        assert actual[1].keys() == expected[1].keys()
+        for point_id, bucket in expected[1].items():
+            want = bucket.to_point_metrics(point_id)
+            got = actual[1][point_id].to_point_metrics(point_id)
+            assert got["sample_count"] == want["sample_count"]
+            assert math.isclose(got["drop_rate"], want["drop_rate"])
+            assert math.isclose(got["jitter_ms"], want["jitter_ms"], rel_tol=1e-6, abs_tol=1e-9)
+            for name in ("latency_ms", "queue_depth", "payload_bytes"):
+                for stat, value in want[name].items():
+                    assert math.isclose(got[name][stat], value, rel_tol=1e-9, abs_tol=1e-9), (name, stat)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+from interfaces_backend.services.comm_overhead_segments import CommOverheadSegmentStore, table_to_records
+from interfaces_backend.services.comm_overhead_store import CommOverheadStore
+from percus_ai.observability import PointId
+
+
+def _record(point_id: str, timestamp_ns: int, *, latency_ms: int, session_id: str = "s") -> dict:
+    return {
+        "point_id": point_id,
+        "timestamp_ns": timestamp_ns,
+        "session_id": session_id,
+        "trace_id": "t",
+        "arm": "none",
+        "status": "ok",
+        "latency_ns": latency_ms * 1_000_000,
+        "obs_id": None,
+        "frame_id": None,
+        "chunk_id": None,
+        "queue_depth": 1,
+        "payload_bytes": None,
+        "drop_count": None,
+        "tags": {"path": "/api/inference"},
+    }
+
+
+def _point(points: list[dict], point_id: str) -> dict:
+    return next(point for point in points if point["point_id"] == point_id)
+
+
+def test_segment_store_flush_and_load_recent_round_trip(tmp_path) -> None:
+    now_ns = time.time_ns()
+    segments = CommOverheadSegmentStore(tmp_path, segment_max_rows=3)
+    records = [_record("CP-01", now_ns + i, latency_ms=i) for i in range(7)]
+    segments.append(records, position={"inode": [1, 2], "offset": 700})
+    assert segments.maybe_flush() is True
+
+    assert len(list(tmp_path.glob("*/seg-*.arrow"))) == 3
+    assert segments.read_checkpoint() == {"inode": [1, 2], "offset": 700}
+    recent = table_to_records(segments.load_recent(5))
+    assert [record["latency_ns"] for record in recent] == [i * 1_000_000 for i in range(2, 7)]
+    assert recent[0]["tags"] == {"path": "/api/inference"}
+
+
+def test_segment_store_compacts_closed_days_and_reads_ranges(tmp_path) -> None:
+    now = datetime.now(timezone.utc)
+    yesterday_ns = int((now - timedelta(days=1)).timestamp() * 1_000_000_000)
+    expired_ns = int((now - timedelta(days=60)).timestamp() * 1_000_000_000)
+    segments = CommOverheadSegmentStore(tmp_path, retention_days=30)
+    for offset in range(3):
+        segments.append([_record("CP-02", yesterday_ns + offset, latency_ms=5)], position={"inode": [1, 1], "offset": offset})
+        segments.flush()
+    segments.append([_record("CP-02", expired_ns, latency_ms=5)], position={"inode": [1, 1], "offset": 9})
+    segments.flush()
+
+    segments.compact(now=now)
+
+    assert list(tmp_path.glob("*/seg-*.arrow")) == []
+    assert len(list(tmp_path.glob("*/compacted.parquet"))) == 1
+    table = segments.read_range(yesterday_ns - 1, yesterday_ns + 10)
+    assert table.num_rows == 3
+    assert segments.read_range(expired_ns, expired_ns + 1).num_rows == 0
+
+
+def test_comm_overhead_store_restores_from_segments_without_reparsing(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    with path.open("w", encoding="utf-8") as handle:
+        for i in range(5):
+            handle.write(json.dumps(_record("CP-03", now_ns - i * 1_000_000, latency_ms=10)) + "\n")
+
+    first = CommOverheadStore(file_path=str(path))
+    first.refresh()
+    first.stop()
+
+    second = CommOverheadStore(file_path=str(path))
+    second.refresh()
+    assert second.get_ingest_stats()["lines_total"] == 0
+    assert _point(second.get_summary(window_sec=60)["points"], "CP-03")["sample_count"] == 5
+
+    history = second.get_history(start_ns=now_ns - 60_000_000_000, end_ns=now_ns + 1)
+    cp03 = _point(history["points"], "CP-03")
+    assert cp03["sample_count"] == 5
+    assert cp03["latency_ms"]["p99"] == 10.0
+
+
+def test_comm_overhead_store_restores_columns_and_rollups_from_arrow(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    with path.open("w", encoding="utf-8") as handle:
+        for i in range(6):
+            record = _record("CP-04", now_ns - i * 1_000_000, latency_ms=i, session_id=f"s{i % 2}")
+            handle.write(json.dumps(record) + "\n")
+
+    first = CommOverheadStore(file_path=str(path))
+    first.refresh()
+    first.stop()
+
+    second = CommOverheadStore(file_path=str(path))
+    second.refresh()
+
+    # No per-event records are built while restoring; events materialise on demand.
+    assert all(event is None for event in second._columns.events[: len(second._columns)])
+    rollup_summary = second.get_summary(window_sec=3600, session_id="s1")
+    assert rollup_summary["resolution_sec"] is not None
+    assert _point(rollup_summary["points"], "CP-04")["sample_count"] == 3
+    point = second.get_point(point_id=PointId.CP_04, window_sec=60, session_id="s0", recent_limit=2)
+    assert point["point"]["sample_count"] == 3
+    assert [event["latency_ns"] for event in point["recent_events"]] == [0, 2_000_000]
+    assert point["recent_events"][0]["tags"] == {"path": "/api/inference"}
@@ -4,6 +4,7 @@ import json
 import time
 
 from interfaces_backend.services.comm_overhead_store import CommOverheadStore
+from percus_ai.observability import PointId
 
 
 def _point(points: list[dict], point_id: str) -> dict:
@@ -61,6 +62,7 @@ def test_comm_overhead_store_summary_and_trace(tmp_path) -> None:
             handle.write(json.dumps(line, ensure_ascii=True) + "\n")
 
     store = CommOverheadStore(file_path=str(path))
+    store.refresh()
     summary = store.get_summary(window_sec=60, session_id="session-1", arm="none")
     cp01 = _point(summary["points"], "CP-01")
 
@@ -74,3 +76,139 @@ def test_comm_overhead_store_summary_and_trace(tmp_path) -> None:
     trace = store.get_trace(trace_id="trace-1", window_sec=60, limit=100)
     assert len(trace["events"]) == 3
     assert trace["events"][0]["point_id"] == "CP-01"
+
+
+def _write_events(path, events: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event, ensure_ascii=True) + "\n")
+
+
+def _event(point_id: str, timestamp_ns: int, *, session_id: str, trace_id: str, latency_ms: int) -> dict:
+    return {
+        "point_id": point_id,
+        "timestamp_ns": timestamp_ns,
+        "session_id": session_id,
+        "trace_id": trace_id,
+        "arm": "none",
+        "status": "ok",
+        "latency_ns": latency_ms * 1_000_000,
+        "tags": {},
+    }
+
+
+def test_comm_overhead_store_ring_buffer_evicts_and_keeps_indexes(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    store = CommOverheadStore(file_path=str(path), max_events=4)
+
+    # Enough appends to force several compactions of the column buffer.
+    for batch in range(3000):
+        _write_events(
+            path,
+            [
+                _event(
+                    "CP-02" if batch % 2 else "CP-01",
+                    now_ns - 10_000_000 + batch,
+                    session_id=f"session-{batch % 3}",
+                    trace_id=f"trace-{batch}",
+                    latency_ms=batch,
+                )
+            ],
+        )
+        store.refresh()
+
+    summary = store.get_summary(window_sec=60)
+    assert sum(point["sample_count"] for point in summary["points"]) == 4
+    assert _point(summary["points"], "CP-01")["latency_ms"]["max"] == 2998.0
+    assert _point(summary["points"], "CP-02")["latency_ms"]["max"] == 2999.0
+
+    point = store.get_point(point_id=PointId.CP_02, window_sec=60, session_id="session-2")
+    assert point["point"]["sample_count"] == 1
+    assert [event["trace_id"] for event in point["recent_events"]] == ["trace-2999"]
+
+    assert len(store.get_trace(trace_id="trace-2999", window_sec=60)["events"]) == 1
+    assert store.get_trace(trace_id="trace-10", window_sec=60)["events"] == []
+
+
+def test_comm_overhead_store_window_handles_out_of_order_events(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    _write_events(
+        path,
+        [
+            _event("CP-01", now_ns - 1_000_000, session_id="s", trace_id="t", latency_ms=1),
+            _event("CP-01", now_ns - 120_000_000_000, session_id="s", trace_id="t", latency_ms=2),
+            _event("CP-01", now_ns - 2_000_000, session_id="s", trace_id="t", latency_ms=3),
+        ],
+    )
+    store = CommOverheadStore(file_path=str(path))
+    store.refresh()
+
+    cp01 = _point(store.get_summary(window_sec=60)["points"], "CP-01")
+    assert cp01["sample_count"] == 2
+    assert cp01["latency_ms"]["max"] == 3.0
+
+    trace = store.get_trace(trace_id="t", window_sec=60)
+    assert [event["latency_ns"] for event in trace["events"]] == [3_000_000, 1_000_000]
+
+
+def test_comm_overhead_store_refresh_skips_partial_lines_and_counts_errors(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    complete = json.dumps(_event("CP-01", now_ns, session_id="s", trace_id="t", latency_ms=1))
+    partial = json.dumps(_event("CP-01", now_ns, session_id="s", trace_id="t", latency_ms=2))
+    path.write_text(complete + "\n{not json\n" + partial[:20], encoding="utf-8")
+
+    store = CommOverheadStore(file_path=str(path))
+    store.refresh()
+    stats = store.get_ingest_stats()
+    assert stats["events_total"] == 1
+    assert stats["fast_path_events_total"] == 1
+    assert stats["parse_errors_total"] == 1
+    assert stats["lag_bytes"] == 20
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(partial[20:] + "\n")
+    store.refresh()
+    cp01 = _point(store.get_summary(window_sec=60)["points"], "CP-01")
+    assert cp01["sample_count"] == 2
+    assert store.get_ingest_stats()["lag_bytes"] == 0
+
+
+def test_comm_overhead_store_tailer_ingests_in_background(tmp_path) -> None:
+    path = tmp_path / "comm_events.jsonl"
+    path.touch()
+    store = CommOverheadStore(file_path=str(path), poll_interval_sec=0.05)
+    store.start()
+    try:
+        _write_events(path, [_event("CP-03", time.time_ns(), session_id="s", trace_id="t", latency_ms=5)])
+        deadline = time.monotonic() + 5.0
+        while store.get_ingest_stats()["events_total"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert store.get_ingest_stats()["tailer_running"] is True
+        assert _point(store.get_summary(window_sec=60)["points"], "CP-03")["sample_count"] == 1
+    finally:
+        store.stop()
+
+
+def test_comm_overhead_store_long_window_uses_rollup(tmp_path) -> None:
+    now_ns = time.time_ns()
+    path = tmp_path / "comm_events.jsonl"
+    _write_events(
+        path,
+        [
+            _event("CP-04", now_ns - second * 1_000_000_000, session_id="s", trace_id="t", latency_ms=20)
+            for second in range(600)
+        ],
+    )
+    store = CommOverheadStore(file_path=str(path))
+    store.refresh()
+
+    summary = store.get_summary(window_sec=900)
+    assert summary["resolution_sec"] == 10
+    cp04 = _point(summary["points"], "CP-04")
+    assert cp04["sample_count"] == 600
+    assert abs(cp04["latency_ms"]["p50"] - 20.0) <= 0.2
+
+    assert store.get_summary(window_sec=60)["resolution_sec"] is None
@@ -0,0 +1,88 @@
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from interfaces_backend.services.command_runner import AsyncCommandRunner
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_shared_single_flight_and_ttl_cache(tmp_path) -> None:
+    counter = tmp_path / "count"
+    counter.write_text("", encoding="utf-8")
+    code = (
+        "import time, pathlib; p = pathlib.Path(r'%s'); "
+        "p.write_text(p.read_text() + 'x'); time.sleep(0.2); print(len(p.read_text()))" % counter
+    )
+    now = {"t": 0.0}
+    runner = AsyncCommandRunner(clock=lambda: now["t"])
+
+    async def _run() -> None:
+        first = await asyncio.gather(*(runner.run_shared(_python(code), ttl_s=1.0) for _ in range(5)))
+        assert {result.stdout.strip() for result in first} == {"1"}
+
+        cached = await runner.run_shared(_python(code), ttl_s=1.0)
+        assert cached.stdout.strip() == "1"
+
+        now["t"] = 2.0
+        expired = await runner.run_shared(_python(code), ttl_s=1.0)
+        assert expired.stdout.strip() == "2"
+
+        runner.invalidate()
+        fresh = await runner.run_shared(_python(code), ttl_s=1.0)
+        assert fresh.stdout.strip() == "3"
+
+    asyncio.run(_run())
+
+
+def test_run_bounds_concurrency(tmp_path) -> None:
+    runner = AsyncCommandRunner(max_concurrency=2)
+    code = (
+        "import os, time; fd = os.open(r'%s', os.O_WRONLY | os.O_CREAT | os.O_APPEND); "
+        "os.write(fd, b'+'); time.sleep(0.2); os.write(fd, b'-')" % (tmp_path / "log")
+    )
+
+    async def _run() -> None:
+        await asyncio.gather(*(runner.run(_python(code)) for _ in range(4)))
+
+    asyncio.run(_run())
+
+    depth = peak = 0
+    for mark in (tmp_path / "log").read_text():
+        depth += 1 if mark == "+" else -1
+        peak = max(peak, depth)
+    assert peak == 2
+
+
+def test_run_and_stream_timeout_kill_the_process() -> None:
+    runner = AsyncCommandRunner()
+
+    async def _run() -> None:
+        with pytest.raises(subprocess.TimeoutExpired):
+            await runner.run(_python("import time; time.sleep(5)"), timeout=0.2)
+
+        stream = runner.stream_lines(_python("print('a', flush=True); import time; time.sleep(5)"), timeout=0.5)
+        lines: list[str] = []
+        with pytest.raises(subprocess.TimeoutExpired):
+            async for line in stream:
+                lines.append(line)
+        assert lines == ["a"]
+        assert stream.returncode is None
+
+    asyncio.run(asyncio.wait_for(_run(), timeout=5.0))
+
+
+def test_stream_lines_merges_stderr_and_reports_exit_code() -> None:
+    runner = AsyncCommandRunner()
+    code = "import sys; print('out', flush=True); print('err', file=sys.stderr, flush=True); sys.exit(2)"
+
+    async def _run() -> tuple[list[str], int | None]:
+        stream = runner.stream_lines(_python(code))
+        lines = [line async for line in stream]
+        return lines, stream.returncode
+
+    assert asyncio.run(_run()) == (["out", "err"], 2)
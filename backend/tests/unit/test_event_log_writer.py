@@ -0,0 +1,80 @@
+import gzip
+import json
+import time
+
+from interfaces_backend.services.event_log_writer import BufferedEventLogWriter
+
+
+def _read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_events_are_buffered_until_size_threshold(tmp_path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = BufferedEventLogWriter(path, flush_bytes=200, flush_interval_s=60.0)
+    try:
+        writer.write({"seq": 0, "code": "X"})
+        assert not path.exists() or path.read_text() == ""
+        assert writer.stats()["buffered_events"] == 1
+
+        for seq in range(1, 10):
+            writer.write({"seq": seq, "code": "X"})
+
+        stats = writer.stats()
+        assert stats["flushes"] >= 1
+        assert stats["written_events"] + stats["buffered_events"] == 10
+    finally:
+        writer.close()
+
+    assert [item["seq"] for item in _read_lines(path)] == list(range(10))
+    assert writer.stats()["written_events"] == 10
+
+
+def test_maybe_flush_respects_interval(tmp_path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = BufferedEventLogWriter(path, flush_bytes=1 << 20, flush_interval_s=0.05)
+    try:
+        writer.write({"seq": 0})
+        writer.maybe_flush()
+        assert writer.stats()["written_events"] == 0
+        time.sleep(0.06)
+        writer.maybe_flush()
+        assert writer.stats()["written_events"] == 1
+    finally:
+        writer.close()
+
+
+def test_rotation_keeps_bounded_compressed_segments(tmp_path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = BufferedEventLogWriter(path, flush_bytes=1, max_bytes=100, max_segments=2, compress=True)
+    for seq in range(20):
+        writer.write({"seq": seq, "message": "x" * 40})
+    writer.close()
+
+    stats = writer.stats()
+    assert stats["rotations"] > 2
+    rotations = stats["rotations"]
+    segments = {p.name for p in tmp_path.iterdir() if p.name != "events.jsonl"}
+    assert segments == {f"events.jsonl.{rotations - 1}.gz", f"events.jsonl.{rotations}.gz"}
+
+    kept = []
+    for index in (rotations - 1, rotations):
+        kept += gzip.decompress((tmp_path / f"events.jsonl.{index}.gz").read_bytes()).splitlines()
+    seqs = [json.loads(line)["seq"] for line in kept]
+    if path.exists():
+        seqs += [item["seq"] for item in _read_lines(path)]
+    assert seqs == list(range(20 - len(seqs), 20))
+
+
+def test_writes_after_close_and_overflow_are_counted_as_dropped(tmp_path) -> None:
+    path = tmp_path / "missing-dir" / "events.jsonl"
+    writer = BufferedEventLogWriter(path, flush_bytes=1 << 20, max_buffered_events=2)
+    writer.write({"seq": 0})
+    writer.write({"seq": 1})
+    writer.write({"seq": 2})
+    writer.close()
+    writer.write({"seq": 3})
+
+    stats = writer.stats()
+    assert stats["written_events"] == 2
+    assert stats["dropped_events"] == 2
@@ -0,0 +1,52 @@
+import json
+
+import msgpack
+import pytest
+
+from interfaces_backend.services.inference_codec import (
+    BLOB_FRAME_MIN_BYTES,
+    ENCODING_JSON,
+    ENCODING_MSGPACK,
+    decode_message,
+    encode_message,
+    frames_nbytes,
+)
+
+
+def test_msgpack_moves_large_bytes_into_separate_frames() -> None:
+    blob = b"x" * BLOB_FRAME_MIN_BYTES
+    message = {"type": "event", "detail": {"trace": blob, "small": b"abc"}, "seq": 7}
+
+    frames = encode_message(message, ENCODING_MSGPACK)
+
+    assert len(frames) == 2
+    assert frames[1] is blob
+    assert frames_nbytes(frames) == len(frames[0]) + len(blob)
+    decoded = decode_message(frames)
+    assert decoded["seq"] == 7
+    assert decoded["detail"]["small"] == b"abc"
+    assert bytes(decoded["detail"]["trace"]) == blob
+
+
+def test_decode_without_blobs_stays_json_serializable() -> None:
+    frames = encode_message({"detail": b"y" * BLOB_FRAME_MIN_BYTES}, ENCODING_MSGPACK)
+
+    decoded = decode_message(frames, keep_blobs=False)
+
+    assert json.loads(json.dumps(decoded)) == {"detail": {"blob_bytes": BLOB_FRAME_MIN_BYTES}}
+
+
+def test_decode_sniffs_json_frames() -> None:
+    frames = encode_message({"type": "state", "payload": {"state": "running"}}, ENCODING_JSON)
+
+    assert len(frames) == 1
+    assert decode_message(frames) == {"type": "state", "payload": {"state": "running"}}
+
+
+def test_decode_rejects_missing_blob_frame() -> None:
+    frames = encode_message({"detail": b"z" * BLOB_FRAME_MIN_BYTES}, ENCODING_MSGPACK)
+
+    with pytest.raises(ValueError):
+        decode_message(frames[:1])
+    with pytest.raises(ValueError):
+        decode_message([msgpack.packb({"a": 1})[:-1]])
@@ -0,0 +1,107 @@
+import json
+import threading
+import time
+
+import msgpack
+import pytest
+import zmq
+
+from interfaces_backend.services.inference_codec import ENCODING_JSON, ENCODING_MSGPACK, encode_message
+from interfaces_backend.services.inference_control import ControlTimeoutError, InferenceControlClient
+
+
+def _bind(ctx: zmq.Context, socket_type: int, tmp_path) -> tuple[zmq.Socket, str]:
+    endpoint = f"ipc://{tmp_path / 'ctrl.sock'}"
+    sock = ctx.socket(socket_type)
+    sock.setsockopt(zmq.LINGER, 0)
+    sock.bind(endpoint)
+    return sock, endpoint
+
+
+def _submit(client: InferenceControlClient, request: dict, timeout_ms: int, encoding: str = ENCODING_JSON):
+    return client.submit(request["request_id"], encode_message(request, encoding), timeout_ms)
+
+
+def test_pipelined_requests_are_matched_by_request_id(tmp_path) -> None:
+    ctx = zmq.Context()
+    router, endpoint = _bind(ctx, zmq.ROUTER, tmp_path)
+
+    def serve() -> None:
+        # Receive both requests, then answer them in reverse order.
+        received = [router.recv_multipart() for _ in range(2)]
+        for identity, delimiter, frame in reversed(received):
+            request = json.loads(frame)
+            reply = {"ok": True, "request_id": request["request_id"], "payload": {"type": request["type"]}}
+            router.send_multipart([identity, delimiter, json.dumps(reply).encode()])
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+    client = InferenceControlClient(ctx, endpoint)
+    try:
+        slow = _submit(client, {"request_id": "req-1", "type": "start_session"}, 2000)
+        fast = _submit(client, {"request_id": "req-2", "type": "set_task"}, 2000)
+
+        assert fast.result(timeout=2).message["payload"] == {"type": "set_task"}
+        assert slow.result(timeout=2).message["payload"] == {"type": "start_session"}
+    finally:
+        server.join(timeout=2)
+        client.close()
+        router.close(0)
+        ctx.term()
+
+
+def test_timed_out_request_does_not_break_rep_peer(tmp_path) -> None:
+    ctx = zmq.Context()
+    rep, endpoint = _bind(ctx, zmq.REP, tmp_path)
+
+    def serve() -> None:
+        first = json.loads(rep.recv())
+        time.sleep(0.3)
+        rep.send_json({"ok": True, "payload": {"late": first["request_id"]}})
+        second = json.loads(rep.recv())
+        rep.send_json({"ok": True, "payload": {"answer": second["request_id"]}})
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+    client = InferenceControlClient(ctx, endpoint)
+    try:
+        expired = _submit(client, {"request_id": "req-1", "type": "get_state"}, 50)
+        with pytest.raises(ControlTimeoutError):
+            expired.result(timeout=2)
+
+        # REP replies carry no request_id; the late reply to req-1 must not be taken for req-2.
+        reply = _submit(client, {"request_id": "req-2", "type": "get_state"}, 2000).result(timeout=3)
+        assert reply.message["payload"] == {"answer": "req-2"}
+    finally:
+        server.join(timeout=2)
+        client.close()
+        rep.close(0)
+        ctx.term()
+
+
+def test_msgpack_reply_blob_frames_are_zero_copy(tmp_path) -> None:
+    ctx = zmq.Context()
+    router, endpoint = _bind(ctx, zmq.ROUTER, tmp_path)
+    blob = bytes(range(256)) * 128
+
+    def serve() -> None:
+        identity, delimiter, *frames = router.recv_multipart()
+        request = msgpack.unpackb(frames[0])
+        reply = {"ok": True, "request_id": request["request_id"], "payload": {"image": blob}}
+        router.send_multipart([identity, delimiter, *encode_message(reply, ENCODING_MSGPACK)])
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+    client = InferenceControlClient(ctx, endpoint)
+    try:
+        reply = _submit(client, {"request_id": "req-1", "type": "get_frame"}, 2000, ENCODING_MSGPACK).result(timeout=2)
+
+        image = reply.message["payload"]["image"]
+        assert isinstance(image, memoryview)
+        assert image.tobytes() == blob
+        assert reply.nbytes > len(blob)
+    finally:
+        server.join(timeout=2)
+        client.close()
+        router.close(0)
+        ctx.term()
@@ -33,6 +33,9 @@ class _FakeRecorder:
     def status(self) -> dict:
         return dict(self._status)
 
+    async def status_async(self) -> dict:
+        return self.status()
+
     def update(self, payload: dict) -> dict:
         self.updated_payloads.append(payload)
         return {"success": True, "message": "updated"}
@@ -70,15 +73,15 @@ class _FakeRuntime:
         self.policy_calls: list[tuple[str, int | None]] = []
         self.pause_calls: list[tuple[str, bool]] = []
 
-    def set_task(self, *, session_id: str, task: str) -> int:
+    async def set_task_async(self, *, session_id: str, task: str) -> int:
         self.task_calls.append((session_id, task))
         return 1
 
-    def set_policy_options(self, *, session_id: str, denoising_steps: int | None = None) -> int:
+    async def set_policy_options_async(self, *, session_id: str, denoising_steps: int | None = None) -> int:
         self.policy_calls.append((session_id, denoising_steps))
         return 1
 
-    def set_paused(self, session_id: str, *, paused: bool) -> int:
+    async def set_paused_async(self, session_id: str, *, paused: bool) -> int:
         self.pause_calls.append((session_id, paused))
         return 1
 
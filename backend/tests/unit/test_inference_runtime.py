@@ -0,0 +1,120 @@
+import os
+import time
+from concurrent.futures import Future
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+import interfaces_backend.services.inference_runtime as inference_runtime
+from interfaces_backend.services.inference_runtime import InferenceRuntimeManager
+
+
+class _FakeProc:
+    def __init__(self, returncode=None):
+        self.pid = 4242
+        self.returncode = returncode
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def wait(self, timeout=None):
+        _ = timeout
+        return self.returncode
+
+
+def _build_manager(monkeypatch, proc: _FakeProc) -> InferenceRuntimeManager:
+    manager = InferenceRuntimeManager()
+
+    def fail_ctrl(*_args, **_kwargs):
+        raise AssertionError("status reads must not issue control requests")
+
+    monkeypatch.setattr(manager, "_submit_ctrl_command", fail_ctrl)
+    manager._worker_proc = proc
+    manager._session_id = "session-1"
+    manager._runner_state = "starting"
+    return manager
+
+
+def test_get_status_reads_pushed_worker_state_without_ipc(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc())
+
+    manager._apply_worker_state({"state": "running", "task": "pick", "queue_depth": 3})
+    status = manager.get_status()
+
+    assert status.runner_status.active is True
+    assert status.runner_status.task == "pick"
+    assert status.runner_status.queue_length == 3
+    assert status.runner_status.state_stale is False
+    assert status.runner_status.state_age_ms is not None
+    assert status.gpu_host_status.status == "running"
+
+
+def test_get_status_reports_stale_state(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc())
+    manager._apply_worker_state({"state": "running"})
+    manager._state_updated_at = time.monotonic() - inference_runtime._STATE_STALE_AFTER_S - 1.0
+
+    status = manager.get_status()
+    diagnostics = manager.get_diagnostics()
+
+    assert status.runner_status.state_stale is True
+    assert diagnostics["state_stale"] is True
+    check = next(item for item in diagnostics["checks"] if item["key"] == "worker_state_fresh")
+    assert check["ok"] is False
+
+
+def test_get_status_marks_exited_worker_as_error(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc(returncode=1))
+
+    status = manager.get_status()
+
+    assert status.runner_status.active is False
+    assert status.runner_status.state_stale is False
+    assert status.gpu_host_status.status == "error"
+    assert "code=1" in (status.runner_status.last_error or "")
+
+
+def test_refresh_state_skips_when_pushed_state_is_recent(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc())
+    manager._apply_worker_state({"state": "running"})
+
+    # Would raise via the fake control channel if a get_state round-trip were issued.
+    manager._refresh_state_if_due()
+
+    assert manager.get_status().runner_status.active is True
+
+
+def test_refresh_state_applies_background_get_state(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc())
+    calls: list[str] = []
+
+    def submit(command_type, payload, timeout_ms=0, raise_on_error=True):
+        _ = (payload, timeout_ms, raise_on_error)
+        calls.append(command_type)
+        future = Future()
+        future.set_result({"state": "paused", "queue_depth": 2})
+        return future
+
+    monkeypatch.setattr(manager, "_submit_ctrl_command", submit)
+    manager._refresh_state_if_due()
+    manager._refresh_state_if_due()
+
+    status = manager.get_status()
+    assert calls == ["get_state"]
+    assert status.runner_status.queue_length == 2
+    assert manager._runner_state == "paused"
+
+
+def test_encoding_negotiation_falls_back_to_json(monkeypatch) -> None:
+    manager = _build_manager(monkeypatch, _FakeProc())
+
+    manager._negotiate_encoding({"state": "ready"})
+    assert manager._protocol_descriptor()["encoding"] == "json"
+
+    manager._negotiate_encoding({"state": "ready", "encoding": "msgpack"})
+    assert manager._protocol_descriptor()["encoding"] == "msgpack"
+
+    manager._negotiate_encoding({"state": "ready", "encoding": "cbor"})
+    assert manager._protocol_descriptor()["encoding"] == "json"
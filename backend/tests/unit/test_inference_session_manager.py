@@ -21,15 +21,15 @@ class _FakeRuntime:
         self.stop_calls.append(session_id)
         return True
 
-    def set_paused(self, session_id: str, *, paused: bool) -> int:
+    async def set_paused_async(self, session_id: str, *, paused: bool) -> int:
         self.pause_calls.append((session_id, paused))
         return 1
 
-    def set_task(self, *, session_id: str, task: str) -> int:
+    async def set_task_async(self, *, session_id: str, task: str) -> int:
         self.task_calls.append((session_id, task))
         return 1
 
-    def set_policy_options(self, *, session_id: str, denoising_steps: int | None = None) -> int:
+    async def set_policy_options_async(self, *, session_id: str, denoising_steps: int | None = None) -> int:
         self.policy_calls.append((session_id, denoising_steps))
         return 1
 
@@ -51,15 +51,16 @@ class _FakeRecorder:
             raise self.stop_exception
         return {"success": True, "message": "stopped"}
 
-    def wait_until_finalized(
-        self,
-        dataset_id: str,
-        timeout_s: float = 30.0,
-        poll_interval_s: float = 0.5,
-    ) -> dict | None:
-        _ = (dataset_id, timeout_s, poll_interval_s)
-        self.wait_calls += 1
-        return self.final_status
+
+
+class _FakeStatusStream:
+    def __init__(self, recorder: _FakeRecorder):
+        self._recorder = recorder
+
+    async def wait_until_finalized(self, dataset_id: str, timeout_s: float = 30.0) -> dict | None:
+        _ = (dataset_id, timeout_s)
+        self._recorder.wait_calls += 1
+        return self._recorder.final_status
 
 
 class _FakeDataset:
@@ -98,6 +99,7 @@ def _build_manager(
         recorder=recorder,
         dataset=dataset,
         recording_sessions=recording_sessions,
+        status_stream=_FakeStatusStream(recorder),
     )
     manager._sessions["session-1"] = SessionState(
         id="session-1",
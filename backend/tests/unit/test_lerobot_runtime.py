@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import subprocess
+
 import interfaces_backend.services.lerobot_runtime as lerobot_runtime
 
 
+class _FakeRunner:
+    def __init__(self) -> None:
+        self.commands: list[list[str]] = []
+        self.invalidated = False
+
+    async def run(self, cmd, **_kwargs):
+        self.commands.append(list(cmd))
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def invalidate(self) -> None:
+        self.invalidated = True
+
+
 def test_start_lerobot_starts_all_compose_services(monkeypatch, tmp_path):
     compose_file = tmp_path / "docker-compose.ros2.yml"
     compose_file.write_text("services: {}\n", encoding="utf-8")
-    called: dict[str, object] = {}
+    runner = _FakeRunner()
 
     monkeypatch.setattr(lerobot_runtime, "get_lerobot_compose_file", lambda: compose_file)
     monkeypatch.setattr(
@@ -14,18 +30,11 @@ def test_start_lerobot_starts_all_compose_services(monkeypatch, tmp_path):
         "build_compose_command",
         lambda _compose_file: ["docker", "compose", "-f", str(compose_file)],
     )
+    monkeypatch.setattr(lerobot_runtime, "get_command_runner", lambda: runner)
 
-    def _fake_run(cmd, **kwargs):
-        called["cmd"] = cmd
-        called["capture_output"] = kwargs.get("capture_output")
-        called["text"] = kwargs.get("text")
-        return lerobot_runtime.subprocess.CompletedProcess(cmd, 0, "", "")
-
-    monkeypatch.setattr(lerobot_runtime.subprocess, "run", _fake_run)
-
-    result = lerobot_runtime.start_lerobot(strict=True)
+    result = asyncio.run(lerobot_runtime.start_lerobot(strict=True))
 
     assert result.returncode == 0
-    assert called["cmd"] == ["docker", "compose", "-f", str(compose_file), "up", "-d", "--build"]
-    assert called["capture_output"] is True
-    assert called["text"] is True
+    assert runner.commands == [["docker", "compose", "-f", str(compose_file), "up", "-d", "--build"]]
+    # Cached `compose ps` answers predate the start.
+    assert runner.invalidated is True
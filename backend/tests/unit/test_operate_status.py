@@ -0,0 +1,74 @@
+import os
+import socket
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.operate_status import (
+    ContainerState,
+    LinkState,
+    LinkTarget,
+    OperateStatusMonitor,
+    is_container_state_event,
+    probe_link,
+)
+
+
+class _FakeBus:
+    def __init__(self):
+        self.published: list[tuple[str, str, dict]] = []
+
+    def publish_threadsafe(self, topic: str, key: str, payload: dict) -> None:
+        self.published.append((topic, key, payload))
+
+
+def test_monitor_publishes_and_notifies_only_on_change() -> None:
+    bus = _FakeBus()
+    monitor = OperateStatusMonitor(
+        bus=bus,
+        services=("vlabor",),
+        link_targets=[LinkTarget(name="zenoh", host_port=("127.0.0.1", 7447))],
+    )
+    changes: list[str] = []
+    monitor.add_listener(changes.append)
+
+    running = ContainerState(service="vlabor", entry={"State": "running", "Status": "Up 1 minute"})
+    monitor.set_container_state(running)
+    monitor.set_container_state(ContainerState(service="vlabor", entry={"State": "running", "Status": "Up 1 minute"}))
+    monitor.set_link_state(LinkState(name="zenoh", ok=True, message="ok"))
+    monitor.set_link_state(LinkState(name="zenoh", ok=True, message="ok"))
+
+    assert changes == ["vlabor", "network"]
+    assert [(topic, key) for topic, key, _payload in bus.published] == [
+        ("operate.component", "vlabor"),
+        ("operate.component", "network"),
+    ]
+    assert monitor.container_state("vlabor") == running
+    assert monitor._ready.is_set() is False  # noqa: SLF001 - driver info still pending
+
+    monitor.set_driver_info({"torch_version": "2.5.0", "cuda_available": True})
+
+    assert monitor._ready.is_set() is True  # noqa: SLF001
+    assert monitor.version == 3
+
+
+def test_container_state_event_filter_ignores_exec_events() -> None:
+    assert is_container_state_event({"type": "container", "action": "die"}) is True
+    assert is_container_state_event({"type": "container", "action": "health_status: healthy"}) is True
+    assert is_container_state_event({"type": "container", "action": "exec_create: ros2 topic list"}) is False
+    assert is_container_state_event({"type": "network", "action": "connect"}) is False
+
+
+def test_probe_link_reports_reachability() -> None:
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+
+        reachable = probe_link(LinkTarget(name="zenoh", host_port=("127.0.0.1", port)))
+
+    unreachable = probe_link(LinkTarget(name="zenoh", host_port=("127.0.0.1", port)))
+    invalid = probe_link(LinkTarget(name="zmq", host_port=None, endpoint="ipc://bridge"))
+
+    assert reachable == LinkState(name="zenoh", ok=True, message="ok")
+    assert unreachable.ok is False
+    assert invalid == LinkState(name="zmq", ok=False, message="invalid endpoint", endpoint="ipc://bridge")
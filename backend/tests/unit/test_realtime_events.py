@@ -0,0 +1,171 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from starlette.requests import Request
+
+from interfaces_backend.services.realtime_events import RealtimeEventBus
+from interfaces_backend.utils import json_patch, sse
+from interfaces_backend.utils.sse import sse_queue_response
+
+
+def _request(query: str = "") -> Request:
+    async def receive() -> dict:
+        await asyncio.Event().wait()
+        return {}
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/stream/demo",
+        "query_string": query.encode(),
+        "headers": [],
+    }
+    return Request(scope, receive)
+
+
+async def _frames(response, count: int) -> list[dict]:
+    frames = []
+    iterator = response.body_iterator
+    while len(frames) < count:
+        chunk = await asyncio.wait_for(iterator.__anext__(), timeout=1.0)
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        frame = {}
+        for line in chunk.strip().splitlines():
+            name, _, value = line.partition(": ")
+            frame[name] = value
+        frames.append(frame)
+    await iterator.aclose()
+    return frames
+
+
+def test_json_patch_appends_sliding_window_rows() -> None:
+    old = {"metrics": {"train": [{"step": 1}, {"step": 2}, {"step": 3}]}, "status": "running", "gone": 1}
+    new = {"metrics": {"train": [{"step": 2}, {"step": 3}, {"step": 4}]}, "status": "completed"}
+
+    patch = json_patch.diff(old, new)
+
+    assert {"op": "remove", "path": "/metrics/train/0"} in patch
+    assert {"op": "add", "path": "/metrics/train/-", "value": {"step": 4}} in patch
+    assert {"op": "remove", "path": "/gone"} in patch
+    assert json_patch.apply(json.loads(json.dumps(old)), patch) == new
+
+
+def test_subscribe_with_last_event_id_replays_only_missed_events() -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        first = bus.subscribe("demo", "k")
+        for count in range(3):
+            await bus.publish("demo", "k", {"count": count})
+        seen = [await first.queue.get() for _ in range(3)]
+        first.close()
+
+        resumed = bus.subscribe("demo", "k", last_event_id=seen[0]["id"])
+        assert resumed.resume_event["payload"] == {"count": 0}
+        assert [resumed.queue.get_nowait()["payload"]["count"] for _ in range(2)] == [1, 2]
+        assert resumed.queue.empty()
+
+        fresh = bus.subscribe("demo", "k", last_event_id="other-epoch:1")
+        assert fresh.resume_event is None
+        assert fresh.queue.get_nowait()["payload"] == {"count": 2}
+        assert fresh.queue.empty()
+
+    asyncio.run(_run())
+
+
+def test_sse_delta_mode_sends_ids_and_patches() -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        subscription = bus.subscribe("demo", "k")
+        rows = [{"step": step, "loss": 1.0 / (step + 1)} for step in range(50)]
+        await bus.publish("demo", "k", {"rows": rows})
+        await bus.publish("demo", "k", {"rows": rows})
+        await bus.publish("demo", "k", {"rows": rows + [{"step": 50, "loss": 0.01}]})
+
+        response = sse_queue_response(_request("delta=1"), subscription.queue, on_close=subscription.close)
+        full, unchanged, delta = await _frames(response, 3)
+
+        assert "event" not in full and full["id"].endswith(":1")
+        assert unchanged == {"id": unchanged["id"]}
+        assert delta["event"] == "delta"
+        assert json.loads(delta["data"]) == [{"op": "add", "path": "/rows/-", "value": {"step": 50, "loss": 0.01}}]
+
+    asyncio.run(_run())
+
+
+def test_published_frame_is_encoded_once_and_shared_by_subscribers(monkeypatch) -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        subscriptions = [bus.subscribe("demo", "k") for _ in range(3)]
+        await bus.publish("demo", "k", {"state": "running"})
+        events = [subscription.queue.get_nowait() for subscription in subscriptions]
+        assert all(event is events[0] for event in events)
+
+        def fail_dumps(*_args, **_kwargs):
+            raise AssertionError("fan-out must reuse the pre-encoded frame")
+
+        monkeypatch.setattr(sse.json, "dumps", fail_dumps)
+        subscription = bus.subscribe("demo", "k")
+        response = sse_queue_response(_request(), subscription.queue, on_close=subscription.close)
+        chunk = await asyncio.wait_for(response.body_iterator.__anext__(), timeout=1.0)
+        await response.body_iterator.aclose()
+
+        assert chunk is events[0]["frame"]
+        assert chunk.decode("utf-8").endswith('data: {"state": "running"}\n\n')
+
+    asyncio.run(_run())
+
+
+def test_history_keeps_wire_forms_on_newest_event_only() -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        subscription = bus.subscribe("demo", "k")
+        for count in range(3):
+            await bus.publish("demo", "k", {"count": count})
+        first = subscription.queue.get_nowait()
+        subscription.close()
+
+        history = list(bus._history[("demo", "k")].events)  # noqa: SLF001
+        assert [set(sse.WIRE_KEYS) & event.keys() for event in history] == [set(), set(), set(sse.WIRE_KEYS)]
+
+        # Replaying older events re-encodes them from the payload.
+        resumed = bus.subscribe("demo", "k", last_event_id=first["id"])
+        response = sse_queue_response(_request(), resumed.queue, on_close=resumed.close)
+        frames = await _frames(response, 2)
+        assert [json.loads(frame["data"]) for frame in frames] == [{"count": 1}, {"count": 2}]
+
+    asyncio.run(_run())
+
+
+def test_history_is_bounded_by_bytes_and_trimmed_when_unsubscribed() -> None:
+    now = [0.0]
+
+    async def _run() -> None:
+        bus = RealtimeEventBus(history_size=8, history_max_bytes=150, resume_ttl_s=60.0, clock=lambda: now[0])
+        subscription = bus.subscribe("demo", "k")
+        for count in range(5):
+            await bus.publish("demo", "k", {"blob": "x" * 30, "count": count})
+        history = bus._history[("demo", "k")]  # noqa: SLF001
+        assert [event["payload"]["count"] for event in history.events] == [3, 4]
+        subscription.close()
+
+        # Within the resume window a reconnecting client still gets what it missed.
+        now[0] = 30.0
+        await bus.publish("demo", "k", {"count": 5})
+        assert len(history.events) == 3
+
+        now[0] = 91.0
+        await bus.publish("other", "k", {"count": 0})
+        assert [event["payload"]["count"] for event in history.events] == [5]
+        assert history.total_bytes == len(history.events[0]["encoded"])
+        assert bus._idle_since == {}  # noqa: SLF001
+
+        # Without subscribers past the window only the latest event is kept.
+        await bus.publish("demo", "k", {"count": 6})
+        assert [event["payload"]["count"] for event in history.events] == [6]
+        assert history.events[0]["channel_seq"] == 7
+
+    asyncio.run(_run())
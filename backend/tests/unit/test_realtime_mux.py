@@ -0,0 +1,74 @@
+import asyncio
+import json
+import os
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.realtime_events import ChannelQueue, RealtimeEventBus
+from interfaces_backend.services.realtime_mux import RealtimeMuxHub
+
+
+def _parse(frame: bytes) -> dict:
+    fields = {}
+    for line in frame.decode("utf-8").strip().splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields
+
+
+def test_channel_queue_bounds_each_channel_separately() -> None:
+    async def _run() -> None:
+        queue = ChannelQueue(max_per_channel=2)
+        for seq in range(5):
+            queue.put_nowait({"topic": "busy", "key": "k", "seq": seq})
+        queue.put_nowait({"topic": "quiet", "key": "k", "seq": 99})
+
+        drained = [queue.get_nowait() for _ in range(queue.qsize())]
+
+        assert [(item["topic"], item["seq"]) for item in drained] == [("busy", 3), ("quiet", 99), ("busy", 4)]
+
+    asyncio.run(_run())
+
+
+def test_mux_connection_streams_many_channels_with_per_channel_seq() -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        hub = RealtimeMuxHub(bus)
+        connection = hub.open("user-1")
+
+        async def connected() -> bool:
+            return False
+
+        frames = connection.frames(connected)
+        hello = _parse(await frames.__anext__())
+        assert hello["event"] == "hello"
+        assert json.loads(hello["data"]) == {"connection_id": connection.connection_id}
+
+        assert connection.subscribe("operate.status", "global") is True
+        assert connection.subscribe("operate.status", "global") is False
+        assert connection.subscribe("recording.upload", "ds-1") is True
+        await bus.publish("operate.status", "global", {"tick": 1})
+        await bus.publish("recording.upload", "ds-1", {"state": "uploading"})
+        await bus.publish("operate.status", "global", {"tick": 2})
+        await bus.publish("profiles.vlabor", "global", {"ignored": True})
+
+        messages = [json.loads(_parse(await asyncio.wait_for(frames.__anext__(), 1.0))["data"]) for _ in range(3)]
+        received = sorted((item["topic"], item["seq"], json.dumps(item["payload"])) for item in messages)
+        assert received == [
+            ("operate.status", 1, '{"tick": 1}'),
+            ("operate.status", 2, '{"tick": 2}'),
+            ("recording.upload", 1, '{"state": "uploading"}'),
+        ]
+
+        connection.unsubscribe("operate.status", "global")
+        await bus.publish("operate.status", "global", {"tick": 3})
+        assert bus.subscriber_count("operate.status", "global") == 0
+        assert connection.channels() == ["recording.upload/ds-1"]
+
+        assert hub.get(connection.connection_id, user_id="someone-else") is None
+        hub.close(connection.connection_id)
+        assert bus.subscriber_count("recording.upload", "ds-1") == 0
+        assert hub.connection_count() == 0
+        await frames.aclose()
+
+    asyncio.run(_run())
@@ -50,3 +50,34 @@ def test_realtime_producer_hub_shares_single_producer_and_stops_when_idle():
         assert len(hub._producers) == 0  # noqa: SLF001
 
     asyncio.run(_run())
+
+
+def test_realtime_producer_hub_request_refresh_rebuilds_before_interval():
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        hub = RealtimeProducerHub(bus)
+        state = {"value": 1}
+
+        async def build_payload() -> dict:
+            return {"value": state["value"]}
+
+        sub = bus.subscribe("demo", "k2")
+        hub.ensure_polling(
+            topic="demo",
+            key="k2",
+            build_payload=build_payload,
+            interval=60.0,
+            idle_ttl=60.0,
+        )
+        first = await asyncio.wait_for(sub.queue.get(), timeout=1.0)
+        assert first["payload"] == {"value": 1}
+
+        state["value"] = 2
+        hub.request_refresh("demo", "k2")
+        second = await asyncio.wait_for(sub.queue.get(), timeout=1.0)
+        assert second["payload"] == {"value": 2}
+
+        sub.close()
+        hub._producers[("demo", "k2")].task.cancel()  # noqa: SLF001
+
+    asyncio.run(_run())
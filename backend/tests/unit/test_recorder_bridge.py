@@ -0,0 +1,72 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.recorder_bridge import RecorderBridge
+
+
+def _bridge(handler) -> RecorderBridge:
+    transport = httpx.MockTransport(handler)
+    return RecorderBridge("http://recorder.test", transport=transport, async_transport=transport)
+
+
+def test_async_status_uses_pooled_client_and_status_timeout():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.extensions["timeout"]["read"]))
+        return httpx.Response(200, json={"state": "recording", "dataset_id": "ds-1"})
+
+    bridge = _bridge(handler)
+
+    async def run():
+        first = await bridge.status_async()
+        second = await bridge.status_async()
+        return first, second, len(bridge._async_clients)
+
+    first, second, client_count = asyncio.run(run())
+    assert first == second == {"state": "recording", "dataset_id": "ds-1"}
+    assert client_count == 1
+    assert seen == [("GET", "/api/session/status", 3.0)] * 2
+
+
+def test_sync_call_posts_json_and_maps_http_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/session/pause":
+            return httpx.Response(409, text="not recording")
+        return httpx.Response(200, json={"success": True, "echo": json.loads(request.content)})
+
+    bridge = _bridge(handler)
+    assert bridge.stop(save_current=False) == {"success": True, "echo": {"save_current": False}}
+    with pytest.raises(HTTPException) as exc_info:
+        bridge.pause()
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.detail == "not recording"
+
+
+def test_wait_until_finalized_async_polls_until_inactive():
+    states = iter(["recording", "recording", "idle"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"state": next(states), "dataset_id": "ds-1"})
+
+    bridge = _bridge(handler)
+    status = asyncio.run(bridge.wait_until_finalized_async("ds-1", timeout_s=5.0, poll_interval_s=0.1))
+    assert status == {"state": "idle", "dataset_id": "ds-1"}
+
+
+def test_async_timeout_maps_to_503():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    bridge = _bridge(handler)
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(bridge.status_async())
+    assert exc_info.value.status_code == 503
+    assert "timed out" in exc_info.value.detail
@@ -0,0 +1,96 @@
+import asyncio
+import os
+import threading
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.recorder_status_stream import RecorderStatusStream
+
+
+class _FakeRecorder:
+    def __init__(self, statuses: list[dict] | None = None):
+        self.statuses = list(statuses or [])
+        self.status_calls = 0
+
+    async def status_async(self) -> dict:
+        self.status_calls += 1
+        if len(self.statuses) > 1:
+            return self.statuses.pop(0)
+        return self.statuses[0]
+
+
+class _FakeBus:
+    def __init__(self):
+        self.published: list[tuple[str, str, dict]] = []
+
+    def publish_threadsafe(self, topic: str, key: str, payload: dict) -> None:
+        self.published.append((topic, key, payload))
+
+
+def test_wait_for_wakes_on_websocket_status_without_http() -> None:
+    recorder = _FakeRecorder([{"state": "idle"}])
+    stream = RecorderStatusStream(recorder=recorder, bus=_FakeBus())
+    stream._set_connected(True)
+
+    async def scenario():
+        waiter = asyncio.create_task(
+            stream.wait_for(lambda status: status.get("state") == "completed", timeout_s=2.0)
+        )
+        await asyncio.sleep(0.01)
+        sender = threading.Thread(
+            target=lambda: [
+                stream._handle_status({"state": "recording", "dataset_id": "ds-1"}),
+                stream._handle_status({"state": "completed", "dataset_id": "ds-1"}),
+            ]
+        )
+        sender.start()
+        sender.join()
+        return await waiter
+
+    snapshot = asyncio.run(scenario())
+
+    assert snapshot is not None
+    assert snapshot.status == {"state": "completed", "dataset_id": "ds-1"}
+    assert snapshot.version == 2
+    assert snapshot.source == "websocket"
+    assert recorder.status_calls == 0
+
+
+def test_wait_until_finalized_polls_http_while_disconnected() -> None:
+    recorder = _FakeRecorder(
+        [
+            {"state": "recording", "dataset_id": "ds-1"},
+            {"state": "recording", "dataset_id": "ds-1"},
+            {"state": "idle", "dataset_id": ""},
+        ]
+    )
+    stream = RecorderStatusStream(recorder=recorder, bus=_FakeBus(), fallback_poll_interval_s=0.05)
+
+    final_status = asyncio.run(stream.wait_until_finalized("ds-1", timeout_s=2.0))
+
+    assert final_status == {"state": "idle", "dataset_id": ""}
+    assert recorder.status_calls == 3
+    assert stream.snapshot().source == "http"
+
+
+def test_wait_for_times_out_with_latest_version_unchanged() -> None:
+    recorder = _FakeRecorder([{"state": "recording", "dataset_id": "ds-1"}])
+    stream = RecorderStatusStream(recorder=recorder, bus=_FakeBus())
+    stream._set_connected(True)
+    stream._handle_status({"state": "recording", "dataset_id": "ds-1"})
+
+    snapshot = asyncio.run(stream.wait_for_change(stream.snapshot().version, timeout_s=0.05))
+
+    assert snapshot is None
+    assert recorder.status_calls == 0
+
+
+def test_duplicate_status_bumps_version_but_publishes_once() -> None:
+    bus = _FakeBus()
+    stream = RecorderStatusStream(recorder=_FakeRecorder([{}]), bus=bus)
+
+    stream._handle_status({"state": "recording", "dataset_id": "ds-1"})
+    stream._handle_status({"state": "recording", "dataset_id": "ds-1"})
+
+    assert stream.snapshot().version == 2
+    assert len(bus.published) == 1
@@ -21,7 +21,7 @@ class _FakeRecorder:
         self.status_payload = {"state": "recording", "dataset_id": "session-1"}
         self.status_exception = None
 
-    def ensure_running(self):
+    async def ensure_running_async(self):
         self.ensure_running_called = True
 
     def build_cameras(self, _snapshot):
@@ -42,10 +42,6 @@ class _FakeRecorder:
         self.stop_called = True
         return {"success": True, "message": "stopped", "save_current": save_current}
 
-    def wait_until_finalized(self, dataset_id: str, timeout_s: float = 30.0, poll_interval_s: float = 0.5):
-        _ = (dataset_id, timeout_s, poll_interval_s)
-        return self.status_payload
-
     def pause(self):
         return {"success": True, "message": "paused"}
 
@@ -53,6 +49,22 @@ class _FakeRecorder:
         return {"success": True, "message": "resumed"}
 
 
+class _FakeStatusStream:
+    def __init__(self, recorder):
+        self._recorder = recorder
+
+    async def wait_for(self, predicate, *, after_version=0, timeout_s=None):
+        status = self._recorder.status()
+        if not predicate(status):
+            await asyncio.sleep(timeout_s or 0)
+            return None
+        return SimpleNamespace(version=after_version + 1, status=status)
+
+    async def wait_until_finalized(self, dataset_id: str, timeout_s: float = 30.0):
+        _ = (dataset_id, timeout_s)
+        return self._recorder.status_payload
+
+
 class _FakeDataset:
     def __init__(self):
         self.upserts = []
@@ -82,7 +94,11 @@ def _install_fake_base_stop(monkeypatch):
 
 
 def _build_manager(recorder, dataset):
-    manager = RecordingSessionManager(recorder=recorder, dataset=dataset)
+    manager = RecordingSessionManager(
+        recorder=recorder,
+        dataset=dataset,
+        status_stream=_FakeStatusStream(recorder),
+    )
     manager._sessions["session-1"] = SessionState(
         id="session-1",
         kind="recording",
@@ -224,19 +240,25 @@ def test_create_includes_profile_topic_suffixes(monkeypatch):
         "save_session_profile_binding",
         fake_save_session_profile_binding,
     )
-    monkeypatch.setattr(recording_session, "extract_arm_namespaces", lambda _snapshot: ["follower_arm"])
     monkeypatch.setattr(
         recording_session,
-        "extract_recorder_topic_suffixes",
-        lambda _snapshot, arm_namespaces: {
-            "state_topic_suffix": "joint_states_single",
-            "action_topic_suffix": "joint_ctrl_single",
-        },
+        "compile_profile",
+        lambda _profile: SimpleNamespace(
+            arm_namespaces=["follower_arm"],
+            recorder_topic_suffixes={
+                "state_topic_suffix": "joint_states_single",
+                "action_topic_suffix": "joint_ctrl_single",
+            },
+        ),
     )
 
     recorder = _FakeRecorder()
     dataset = _FakeDataset()
-    manager = RecordingSessionManager(recorder=recorder, dataset=dataset)
+    manager = RecordingSessionManager(
+        recorder=recorder,
+        dataset=dataset,
+        status_stream=_FakeStatusStream(recorder),
+    )
 
     state = asyncio.run(
         manager.create(
@@ -273,18 +295,24 @@ def test_create_raises_when_action_suffix_unresolved(monkeypatch):
         "save_session_profile_binding",
         fake_save_session_profile_binding,
     )
-    monkeypatch.setattr(recording_session, "extract_arm_namespaces", lambda _snapshot: ["follower_arm"])
     monkeypatch.setattr(
         recording_session,
-        "extract_recorder_topic_suffixes",
-        lambda _snapshot, arm_namespaces: {
-            "state_topic_suffix": "joint_states_single",
-        },
+        "compile_profile",
+        lambda _profile: SimpleNamespace(
+            arm_namespaces=["follower_arm"],
+            recorder_topic_suffixes={
+                "state_topic_suffix": "joint_states_single",
+            },
+        ),
     )
 
     recorder = _FakeRecorder()
     dataset = _FakeDataset()
-    manager = RecordingSessionManager(recorder=recorder, dataset=dataset)
+    manager = RecordingSessionManager(
+        recorder=recorder,
+        dataset=dataset,
+        status_stream=_FakeStatusStream(recorder),
+    )
 
     try:
         asyncio.run(
@@ -307,7 +335,11 @@ def test_create_raises_when_action_suffix_unresolved(monkeypatch):
 def test_register_external_session_tracks_inference_recording():
     recorder = _FakeRecorder()
     dataset = _FakeDataset()
-    manager = RecordingSessionManager(recorder=recorder, dataset=dataset)
+    manager = RecordingSessionManager(
+        recorder=recorder,
+        dataset=dataset,
+        status_stream=_FakeStatusStream(recorder),
+    )
 
     profile = SimpleNamespace(name="profile-a", snapshot={"raw": {}})
     state = manager.register_external_session(
@@ -344,20 +376,26 @@ def test_create_raises_when_cameras_unresolved(monkeypatch):
         "save_session_profile_binding",
         fake_save_session_profile_binding,
     )
-    monkeypatch.setattr(recording_session, "extract_arm_namespaces", lambda _snapshot: ["follower_arm"])
     monkeypatch.setattr(
         recording_session,
-        "extract_recorder_topic_suffixes",
-        lambda _snapshot, arm_namespaces: {
-            "state_topic_suffix": "joint_states_single",
-            "action_topic_suffix": "joint_ctrl_single",
-        },
+        "compile_profile",
+        lambda _profile: SimpleNamespace(
+            arm_namespaces=["follower_arm"],
+            recorder_topic_suffixes={
+                "state_topic_suffix": "joint_states_single",
+                "action_topic_suffix": "joint_ctrl_single",
+            },
+        ),
     )
 
     recorder = _FakeRecorder()
     recorder.build_cameras = lambda _snapshot: []
     dataset = _FakeDataset()
-    manager = RecordingSessionManager(recorder=recorder, dataset=dataset)
+    manager = RecordingSessionManager(
+        recorder=recorder,
+        dataset=dataset,
+        status_stream=_FakeStatusStream(recorder),
+    )
 
     try:
         asyncio.run(
@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.ros2_topic_monitor import (
+    Ros2TopicMonitor,
+    TopicRateMeter,
+    cbor_publish_topic,
+)
+
+
+class _FakeBus:
+    def __init__(self):
+        self.published: list[tuple[str, str, dict]] = []
+
+    def publish_threadsafe(self, topic: str, key: str, payload: dict) -> None:
+        self.published.append((topic, key, payload))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _topics_response(topics: list[str]) -> dict:
+    return {
+        "op": "service_response",
+        "id": "ros2-topic-monitor:topics",
+        "service": "/rosapi/topics",
+        "result": True,
+        "values": {"topics": topics, "types": ["" for _ in topics]},
+    }
+
+
+def _cbor_text(value: str) -> bytes:
+    data = value.encode()
+    return (bytes([0x60 | len(data)]) if len(data) < 24 else bytes([0x78, len(data)])) + data
+
+
+def _cbor_raw_publish(topic: str, payload: bytes) -> bytes:
+    # {"op": "publish", "topic": topic, "msg": {"bytes": payload}} as rosbridge encodes it
+    frame = bytes([0xA3]) + _cbor_text("op") + _cbor_text("publish") + _cbor_text("topic") + _cbor_text(topic)
+    msg = bytes([0xA1]) + _cbor_text("bytes") + bytes([0x5A]) + len(payload).to_bytes(4, "big") + payload
+    return frame + _cbor_text("msg") + msg
+
+
+def test_monitor_publishes_topic_set_only_on_change() -> None:
+    bus = _FakeBus()
+    monitor = Ros2TopicMonitor(bus=bus)
+    changes: list[None] = []
+    monitor.add_listener(lambda: changes.append(None))
+
+    monitor.handle_message(_topics_response(["/top_camera/image_raw", "/follower/joint_states"]))
+    monitor.handle_message(_topics_response(["/follower/joint_states", "/top_camera/image_raw"]))
+    monitor.handle_message({"op": "service_response", "id": "other", "values": {"topics": []}})
+    monitor.handle_message(_topics_response(["/follower/joint_states"]))
+
+    assert monitor.topics() == ["/follower/joint_states"]
+    assert len(changes) == 2
+    assert bus.published == [
+        ("ros2.topics", "global", {"topics": ["/follower/joint_states", "/top_camera/image_raw"]}),
+        ("ros2.topics", "global", {"topics": ["/follower/joint_states"]}),
+    ]
+
+
+def test_monitor_reports_rates_for_tracked_topics_only() -> None:
+    clock = _Clock()
+    monitor = Ros2TopicMonitor(bus=_FakeBus(), rate_window_s=2.0, clock=clock)
+    monitor.track_rates(["/follower/joint_states"])
+
+    for _ in range(11):
+        monitor.handle_message({"op": "publish", "topic": "/follower/joint_states", "msg": {}})
+        monitor.handle_message({"op": "publish", "topic": "/untracked", "msg": {}})
+        clock.now += 0.1
+
+    assert monitor.message_rate("/follower/joint_states") == pytest.approx(10.0)
+    assert monitor.message_rate("/untracked") is None
+
+    clock.now += 5.0
+    assert monitor.message_rate("/follower/joint_states") == 0.0
+
+    monitor.track_rates([])
+    assert monitor.message_rate("/follower/joint_states") is None
+
+
+def test_rate_meter_needs_two_messages() -> None:
+    meter = TopicRateMeter(window_s=1.0)
+    meter.record(10.0)
+    assert meter.rate(10.0) == 0.0
+    meter.record(10.5)
+    assert meter.rate(10.5) == 2.0
+
+
+def test_cbor_publish_topic_reads_header_only() -> None:
+    frame = _cbor_raw_publish("/top_camera/camera_info", b"\xff" * 100_000)
+
+    assert cbor_publish_topic(frame) == "/top_camera/camera_info"
+    assert cbor_publish_topic(frame[:12]) is None
+    assert cbor_publish_topic(b'{"op": "publish"}') is None
+    not_publish = bytes([0xA2]) + _cbor_text("op") + _cbor_text("status") + _cbor_text("topic") + _cbor_text("/x")
+    assert cbor_publish_topic(not_publish) is None
+
+
+def test_monitor_is_connecting_until_first_topic_list() -> None:
+    bus = _FakeBus()
+    monitor = Ros2TopicMonitor(bus=bus)
+    changes: list[None] = []
+    monitor.add_listener(lambda: changes.append(None))
+
+    assert monitor.state() == "connecting"
+    assert monitor.wait_for_topics(0.01) is False
+
+    monitor.handle_message(_topics_response([]))
+
+    assert monitor.wait_for_topics(0.01) is True
+    assert monitor.state() == "disconnected"
+    assert len(changes) == 1
+    assert bus.published == [("ros2.topics", "global", {"topics": []})]
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import subprocess
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.service_bringup import ServiceBringup
+from interfaces_backend.services.startup_operations import StartupOperationsService
+
+
+def test_bringup_runs_in_background_and_reports_readiness() -> None:
+    async def _run() -> None:
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def start_vlabor():
+            order.append("vlabor")
+            await release.wait()
+            return subprocess.CompletedProcess(["up"], 0, "", "")
+
+        async def start_lerobot():
+            order.append("lerobot")
+            return subprocess.CompletedProcess(["up"], 1, "", "pull failed")
+
+        async def start_optional():
+            return None
+
+        operations = StartupOperationsService()
+        bringup = ServiceBringup(
+            operations,
+            steps=(
+                ("vlabor", "VLAbor", start_vlabor),
+                ("lerobot", "lerobot stack", start_lerobot),
+                ("optional", "optional", start_optional),
+            ),
+        )
+
+        task = bringup.start()
+        assert bringup.start() is task
+        await asyncio.sleep(0)
+
+        pending = bringup.readiness()
+        assert pending.ready is False
+        assert [(c.name, c.state) for c in pending.components] == [
+            ("vlabor", "starting"),
+            ("lerobot", "pending"),
+            ("optional", "pending"),
+        ]
+        vlabor_op = operations.get(user_id="any-user", operation_id=pending.components[0].operation_id)
+        assert vlabor_op.kind == "service_bringup"
+        assert vlabor_op.state == "running"
+
+        release.set()
+        await task
+
+        done = bringup.readiness()
+        assert order == ["vlabor", "lerobot"]
+        assert done.ready is True
+        assert [(c.name, c.state) for c in done.components] == [
+            ("vlabor", "ready"),
+            ("lerobot", "failed"),
+            ("optional", "skipped"),
+        ]
+        assert done.components[1].message == "pull failed"
+        lerobot_op = operations.get(user_id="any-user", operation_id=done.components[1].operation_id)
+        assert lerobot_op.state == "failed"
+        assert lerobot_op.error == "pull failed"
+
+    asyncio.run(_run())
@@ -0,0 +1,169 @@
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.ssh_connection_pool import SSHConnectionPool
+
+
+class _FakeTransport:
+    def __init__(self) -> None:
+        self.active = True
+        self.keepalive: int | None = None
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, interval: int) -> None:
+        self.keepalive = interval
+
+
+class _FakeClient:
+    def __init__(self, transport: _FakeTransport) -> None:
+        self._transport = transport
+
+    def get_transport(self) -> _FakeTransport:
+        return self._transport
+
+
+class _FakeConnection:
+    def __init__(self, ip: str, user: str, key: str) -> None:
+        self.ip = ip
+        self.user = user
+        self.key = key
+        self.transport = _FakeTransport()
+        self.client = _FakeClient(self.transport)
+        self.disconnected = False
+
+    def exec_command(self, command: str) -> tuple[int, str, str]:
+        return 0, command, ""
+
+    def disconnect(self) -> None:
+        self.disconnected = True
+        self.transport.active = False
+
+
+class _Connector:
+    def __init__(self, accept: set[tuple[str, str]]) -> None:
+        self.accept = accept
+        self.attempts: list[tuple[str, str]] = []
+        self.opened: list[_FakeConnection] = []
+
+    def __call__(self, ip: str, user: str, key: str, timeout: float) -> _FakeConnection:
+        self.attempts.append((user, key))
+        if (user, key) not in self.accept:
+            raise RuntimeError(f"auth failed for {user}")
+        conn = _FakeConnection(ip, user, key)
+        self.opened.append(conn)
+        return conn
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_CANDIDATES = [("root", "/keys/a"), ("root", "/keys/b"), ("ubuntu", "/keys/a"), ("ubuntu", "/keys/b")]
+
+
+def test_pool_reuses_connection_and_remembers_credential() -> None:
+    connector = _Connector({("ubuntu", "/keys/b")})
+    pool = SSHConnectionPool(connect=connector, keepalive_s=15)
+
+    lease = pool.acquire("10.0.0.5", _CANDIDATES, job_id="job-1")
+    assert lease.exec_command("echo hi") == (0, "echo hi", "")
+    assert (lease.user, lease.private_key_path) == ("ubuntu", "/keys/b")
+    lease.release()
+
+    again = pool.acquire("10.0.0.5", _CANDIDATES, job_id="job-1")
+    again.release()
+
+    assert connector.attempts == _CANDIDATES
+    assert len(connector.opened) == 1
+    assert connector.opened[0].transport.keepalive == 15
+    assert connector.opened[0].disconnected is False
+
+
+def test_pool_tries_remembered_credential_first_after_reconnect() -> None:
+    connector = _Connector({("ubuntu", "/keys/b")})
+    pool = SSHConnectionPool(connect=connector)
+    pool.acquire("10.0.0.5", _CANDIDATES, job_id="job-1").release()
+    connector.opened[0].transport.active = False
+    connector.attempts.clear()
+
+    pool.acquire("10.0.0.5", _CANDIDATES, job_id="job-1").release()
+
+    assert connector.attempts == [("ubuntu", "/keys/b")]
+    assert connector.opened[0].disconnected is True
+    assert len(connector.opened) == 2
+
+
+def test_pool_shares_connection_between_concurrent_leases() -> None:
+    connector = _Connector({("root", "/keys/a")})
+    pool = SSHConnectionPool(connect=connector)
+    barrier = threading.Barrier(4)
+    leases = []
+    lock = threading.Lock()
+
+    def borrow() -> None:
+        barrier.wait()
+        lease = pool.acquire("10.0.0.6", _CANDIDATES)
+        with lock:
+            leases.append(lease)
+
+    threads = [threading.Thread(target=borrow) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(connector.opened) == 1
+    assert {lease.ip for lease in leases} == {"10.0.0.6"}
+    for lease in leases:
+        lease.release()
+    assert pool.size() == 1
+
+
+def test_pool_evicts_idle_connections_only_when_unused() -> None:
+    clock = _Clock()
+    connector = _Connector({("root", "/keys/a")})
+    pool = SSHConnectionPool(connect=connector, idle_ttl_s=60, clock=clock)
+
+    held = pool.acquire("10.0.0.7", _CANDIDATES)
+    clock.now += 120
+    assert pool.evict_idle() == 0
+
+    held.release()
+    clock.now += 30
+    assert pool.evict_idle() == 0
+    clock.now += 31
+    assert pool.evict_idle() == 1
+    assert connector.opened[0].disconnected is True
+    assert pool.size() == 0
+
+
+def test_discarded_lease_closes_after_last_holder_releases() -> None:
+    connector = _Connector({("root", "/keys/a")})
+    pool = SSHConnectionPool(connect=connector)
+    first = pool.acquire("10.0.0.8", _CANDIDATES)
+    second = pool.acquire("10.0.0.8", _CANDIDATES)
+
+    first.discard()
+    assert connector.opened[0].disconnected is False
+    second.release()
+    assert connector.opened[0].disconnected is True
+
+    with pytest.raises(AttributeError):
+        second.exec_command("true")
+
+
+def test_pool_raises_when_no_candidate_connects() -> None:
+    pool = SSHConnectionPool(connect=_Connector(set()))
+
+    with pytest.raises(RuntimeError, match="10.0.0.9"):
+        pool.acquire("10.0.0.9", _CANDIDATES, job_id="job-2")
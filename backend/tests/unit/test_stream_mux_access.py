@@ -0,0 +1,51 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+import interfaces_backend.api.stream as stream_api
+from interfaces_backend.models.stream import StreamChannelRequest
+from interfaces_backend.services.realtime_events import RealtimeEventBus
+from interfaces_backend.services.realtime_mux import RealtimeMuxHub
+
+
+def test_mux_subscribe_checks_access_before_replaying_history(monkeypatch) -> None:
+    async def _run() -> None:
+        bus = RealtimeEventBus()
+        hub = RealtimeMuxHub(bus)
+        monkeypatch.setattr(stream_api, "get_realtime_mux_hub", lambda: hub)
+        monkeypatch.setattr(stream_api, "_require_user_id", lambda: "user-2")
+        await bus.publish(stream_api.TRAINING_JOB_TOPIC, "job-1", {"job_detail": {"owner": "user-1"}})
+
+        async def deny(_user_id: str, job_id: str) -> None:
+            await asyncio.sleep(0.05)
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+        monkeypatch.setitem(stream_api._CHANNEL_ACCESS_CHECKS, stream_api.TRAINING_JOB_TOPIC, deny)
+
+        connection = hub.open("user-2")
+
+        async def connected() -> bool:
+            return False
+
+        frames = connection.frames(connected)
+        await frames.__anext__()  # hello
+        next_frame = asyncio.ensure_future(frames.__anext__())
+
+        with pytest.raises(HTTPException):
+            await stream_api.subscribe_multiplexed_channel(
+                connection.connection_id,
+                StreamChannelRequest(topic=stream_api.TRAINING_JOB_TOPIC, key="job-1"),
+            )
+        await asyncio.sleep(0.05)
+
+        assert not next_frame.done()
+        assert connection.channels() == []
+        assert bus.subscriber_count(stream_api.TRAINING_JOB_TOPIC, "job-1") == 0
+        next_frame.cancel()
+        hub.close(connection.connection_id)
+
+    asyncio.run(_run())
@@ -0,0 +1,180 @@
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.training_deployment import (
+    DeploymentCheckpoint,
+    DeploymentCheckpointStore,
+    DeploymentStepError,
+    TrainingDeployment,
+    TrainingDeploymentsService,
+    run_blocking,
+)
+
+
+class _FakeBus:
+    def __init__(self):
+        self.published: list[tuple[str, str, dict]] = []
+
+    def publish_threadsafe(self, topic: str, key: str, payload: dict) -> None:
+        self.published.append((topic, key, payload))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _steps(calls: list[str], clock: _Clock, checkpoint: DeploymentCheckpoint, *, fail_at: str | None = None):
+    def make(name: str):
+        async def step() -> None:
+            calls.append(name)
+            clock.now += 2.0
+            if name == fail_at:
+                raise DeploymentStepError("SETUP_FAILED", "setup failed")
+            checkpoint.values[name] = True
+
+        return step
+
+    return [(name, make(name)) for name in ("wait_ip", "wait_ssh", "setup", "start")]
+
+
+def test_deployment_checkpoints_each_step_and_publishes_timings(tmp_path) -> None:
+    store = DeploymentCheckpointStore(tmp_path)
+    bus = _FakeBus()
+    clock = _Clock()
+    checkpoint = DeploymentCheckpoint(job_id="job-1", inputs={"policy_type": "act"})
+    store.save(checkpoint)
+    calls: list[str] = []
+    saved_completed: list[list[str]] = []
+    original_save = store.save
+
+    def record_save(value: DeploymentCheckpoint) -> None:
+        saved_completed.append(list(value.completed))
+        original_save(value)
+
+    store.save = record_save  # type: ignore[method-assign]
+    deployment = TrainingDeployment(checkpoint, _steps(calls, clock, checkpoint), store=store, bus=bus, clock=clock)
+
+    asyncio.run(deployment.run())
+
+    assert calls == ["wait_ip", "wait_ssh", "setup", "start"]
+    assert [len(completed) for completed in saved_completed] == [1, 2, 3, 4]
+    assert saved_completed[-1] == ["wait_ip", "wait_ssh", "setup", "start"]
+    assert store.pending_job_ids() == []
+
+    final = bus.published[-1]
+    assert final[0] == "training.deploy" and final[1] == "job-1"
+    assert final[2]["state"] == "completed"
+    assert [(step["name"], step["state"], step["elapsed_s"]) for step in final[2]["steps"]] == [
+        ("wait_ip", "completed", 2.0),
+        ("wait_ssh", "completed", 2.0),
+        ("setup", "completed", 2.0),
+        ("start", "completed", 2.0),
+    ]
+
+
+def test_deployment_resumes_after_last_completed_step(tmp_path) -> None:
+    store = DeploymentCheckpointStore(tmp_path)
+    store.save(
+        DeploymentCheckpoint(
+            job_id="job-2",
+            values={"wait_ip": True, "wait_ssh": True},
+            completed=["wait_ip", "wait_ssh"],
+            timings={"wait_ip": 30.0, "wait_ssh": 5.0},
+        )
+    )
+    checkpoint = store.load("job-2")
+    assert checkpoint is not None
+    calls: list[str] = []
+    clock = _Clock()
+    bus = _FakeBus()
+    deployment = TrainingDeployment(checkpoint, _steps(calls, clock, checkpoint), store=store, bus=bus, clock=clock)
+
+    assert deployment.status().resumed is True
+    asyncio.run(deployment.run())
+
+    assert calls == ["setup", "start"]
+    assert bus.published[-1][2]["steps"][0]["elapsed_s"] == 30.0
+
+
+def test_deployment_failure_reports_step_and_drops_checkpoint(tmp_path) -> None:
+    store = DeploymentCheckpointStore(tmp_path)
+    checkpoint = DeploymentCheckpoint(job_id="job-3")
+    store.save(checkpoint)
+    calls: list[str] = []
+    clock = _Clock()
+    bus = _FakeBus()
+    deployment = TrainingDeployment(
+        checkpoint,
+        _steps(calls, clock, checkpoint, fail_at="setup"),
+        store=store,
+        bus=bus,
+        clock=clock,
+    )
+
+    with pytest.raises(DeploymentStepError) as exc_info:
+        asyncio.run(deployment.run())
+
+    assert exc_info.value.failure_reason == "SETUP_FAILED"
+    assert calls == ["wait_ip", "wait_ssh", "setup"]
+    status = bus.published[-1][2]
+    assert status["state"] == "failed"
+    assert status["current_step"] == "setup"
+    assert [step["state"] for step in status["steps"]] == ["completed", "completed", "failed", "pending"]
+    assert store.pending_job_ids() == []
+
+
+def test_checkpoint_files_are_owner_only(tmp_path) -> None:
+    store = DeploymentCheckpointStore(tmp_path)
+    store.save(DeploymentCheckpoint(job_id="job-4", inputs={"supabase_refresh_token": "secret"}))
+
+    assert store.pending_job_ids() == ["job-4"]
+    assert (tmp_path / "job-4.json").stat().st_mode & 0o077 == 0
+    assert store.load("job-4").inputs == {"supabase_refresh_token": "secret"}
+
+
+def test_service_runs_one_deployment_per_job() -> None:
+    service = TrainingDeploymentsService(DeploymentCheckpointStore())
+    started: list[str] = []
+
+    async def main() -> None:
+        release = asyncio.Event()
+
+        async def runner() -> None:
+            started.append("run")
+            await release.wait()
+
+        first = service.start("job-5", runner)
+        second = service.start("job-5", runner)
+        assert first is second
+        await asyncio.sleep(0)
+        release.set()
+        await first
+
+    asyncio.run(main())
+    assert started == ["run"]
+
+
+def test_run_blocking_keeps_event_loop_responsive() -> None:
+    import time
+
+    async def main() -> list[str]:
+        order: list[str] = []
+
+        async def ticker() -> None:
+            order.append("tick")
+
+        blocking = asyncio.ensure_future(run_blocking(time.sleep, 0.2))
+        await asyncio.wait_for(ticker(), timeout=0.1)
+        await blocking
+        order.append("done")
+        return order
+
+    assert asyncio.run(main()) == ["tick", "done"]
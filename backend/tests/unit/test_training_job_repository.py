@@ -0,0 +1,307 @@
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.training_job_repository import TrainingJobRepository
+from percus_ai.db import reset_request_session, set_request_session
+
+
+class _Response:
+    def __init__(self, data: list[dict]) -> None:
+        self.data = data
+
+
+class _Query:
+    def __init__(self, db: "_FakeDB", op: str, payload: dict | None = None, **kwargs) -> None:
+        self.db = db
+        self.op = op
+        self.payload = payload
+        self.kwargs = kwargs
+        self.job_id: str | None = None
+
+    def eq(self, column: str, value: str) -> "_Query":
+        assert column == "job_id"
+        self.job_id = value
+        return self
+
+    async def execute(self) -> _Response:
+        self.db.requests.append((self.op, dict(self.payload or {})))
+        await asyncio.sleep(0)
+        if self.db.fail_with is not None:
+            exc, self.db.fail_with = self.db.fail_with, None
+            raise exc
+        if self.op == "select":
+            row = self.db.rows.get(self.job_id)
+            return _Response([dict(row)] if row else [])
+        if self.op == "upsert":
+            assert self.kwargs == {"on_conflict": "job_id"}
+            self.db.rows.setdefault(self.payload["job_id"], {}).update(self.payload)
+        if self.op == "update" and self.job_id in self.db.rows:
+            self.db.rows[self.job_id].update(self.payload)
+        return _Response([])
+
+
+class _Table:
+    def __init__(self, db: "_FakeDB") -> None:
+        self.db = db
+
+    def select(self, _columns: str) -> _Query:
+        return _Query(self.db, "select")
+
+    def update(self, payload: dict) -> _Query:
+        return _Query(self.db, "update", payload)
+
+    def upsert(self, payload: dict, **kwargs) -> _Query:
+        return _Query(self.db, "upsert", payload, **kwargs)
+
+
+class _FakeDB:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict] = {}
+        self.requests: list[tuple[str, dict]] = []
+        self.fail_with: Exception | None = None
+
+    def table(self, name: str) -> _Table:
+        assert name == "training_jobs"
+        return _Table(self)
+
+
+def _repository(db: _FakeDB, **kwargs) -> TrainingJobRepository:
+    async def get_client() -> _FakeDB:
+        return db
+
+    return TrainingJobRepository(get_client=get_client, **kwargs)
+
+
+def _job(**fields) -> dict:
+    return {"job_id": "job-1", "status": "starting", "training_config": {"steps": 10}, **fields}
+
+
+def test_first_save_is_a_single_upsert_with_owner() -> None:
+    db = _FakeDB()
+    repo = _repository(db)
+
+    async def main() -> None:
+        token = set_request_session({"user_id": "user-1"})
+        try:
+            await repo.save(_job())
+        finally:
+            reset_request_session(token)
+
+    asyncio.run(main())
+
+    assert db.requests == [
+        (
+            "upsert",
+            {
+                "job_id": "job-1",
+                "status": "starting",
+                "training_config": {"steps": 10},
+                "owner_user_id": "user-1",
+            },
+        )
+    ]
+
+
+def test_known_job_updates_only_changed_columns() -> None:
+    db = _FakeDB()
+    db.rows["job-1"] = _job(owner_user_id="user-1", ip=None)
+    repo = _repository(db)
+
+    async def main() -> None:
+        job = await repo.load("job-1")
+        job["ip"] = "10.0.0.1"
+        job["training_config"]["steps"] = 10
+        await repo.save(job)
+        job["updated_at"] = "2026-01-01T00:00:00"
+        await repo.save(job)
+
+    asyncio.run(main())
+
+    assert db.requests == [("select", {}), ("update", {"ip": "10.0.0.1"})]
+
+
+def test_write_behind_coalesces_saves_and_load_flushes() -> None:
+    db = _FakeDB()
+    db.rows["job-1"] = _job(owner_user_id="user-1")
+    repo = _repository(db, flush_interval_s=60.0)
+
+    async def main() -> dict:
+        job = await repo.load("job-1")
+        job["ip"] = "10.0.0.1"
+        await repo.save(job, wait=False)
+        job["status"] = "deploying"
+        await repo.save(job, wait=False)
+        job["remote_base_dir"] = "/root/.physical-ai"
+        await repo.save(job, wait=False)
+        assert [op for op, _ in db.requests] == ["select"]
+        return await repo.load("job-1")
+
+    loaded = asyncio.run(main())
+
+    assert db.requests[1] == (
+        "update",
+        {"ip": "10.0.0.1", "status": "deploying", "remote_base_dir": "/root/.physical-ai"},
+    )
+    assert [op for op, _ in db.requests] == ["select", "update", "select"]
+    assert loaded["status"] == "deploying"
+
+
+def test_concurrent_saves_share_in_flight_write() -> None:
+    db = _FakeDB()
+    db.rows["job-1"] = _job(owner_user_id="user-1")
+    repo = _repository(db)
+
+    async def main() -> None:
+        job = await repo.load("job-1")
+        saves = []
+        for status in ("deploying", "starting", "running", "completed"):
+            job = {**job, "status": status}
+            saves.append(repo.save(job))
+        await asyncio.gather(*saves)
+
+    asyncio.run(main())
+
+    writes = [payload for op, payload in db.requests if op == "update"]
+    assert writes == [{"status": "completed"}]
+    assert db.rows["job-1"]["status"] == "completed"
+
+
+def test_save_retries_with_fallback_client() -> None:
+    db = _FakeDB()
+    fallback = _FakeDB()
+    db.fail_with = RuntimeError("JWT expired")
+
+    async def get_fallback() -> _FakeDB:
+        return fallback
+
+    repo = _repository(
+        db,
+        get_fallback_client=get_fallback,
+        use_fallback=lambda exc: "JWT expired" in str(exc),
+    )
+
+    asyncio.run(repo.save(_job(owner_user_id="user-1")))
+
+    assert [op for op, _ in db.requests] == ["upsert"]
+    assert [op for op, _ in fallback.requests] == ["upsert"]
+    assert fallback.rows["job-1"]["owner_user_id"] == "user-1"
+
+
+def test_failed_save_is_raised_and_resent() -> None:
+    db = _FakeDB()
+    db.rows["job-1"] = _job(owner_user_id="user-1")
+    repo = _repository(db)
+
+    async def main() -> None:
+        job = await repo.load("job-1")
+        job["status"] = "failed"
+        db.fail_with = RuntimeError("connection reset")
+        with pytest.raises(RuntimeError, match="connection reset"):
+            await repo.save(job)
+        await repo.save(job)
+
+    asyncio.run(main())
+
+    assert [payload for op, payload in db.requests if op == "update"] == [
+        {"status": "failed"},
+        {"status": "failed"},
+    ]
+
+
+def test_expired_snapshot_rewrites_known_row_without_upsert() -> None:
+    db = _FakeDB()
+    db.rows["job-1"] = _job(owner_user_id="user-1")
+    now = [0.0]
+    repo = _repository(db, snapshot_ttl_s=60.0, clock=lambda: now[0])
+
+    async def main() -> None:
+        repo.remember([{"job_id": "job-1", "status": "running"}])
+        now[0] = 120.0
+        await repo.save({"job_id": "job-1", "status": "running", "owner_user_id": "user-1"})
+
+    asyncio.run(main())
+
+    assert db.requests == [("update", {"status": "running"})]
+
+
+class _ListQuery:
+    def __init__(self, rows: list[dict], calls: list[tuple]) -> None:
+        self.rows = rows
+        self.calls = calls
+
+    def __getattr__(self, name: str):
+        def record(*args, **kwargs) -> "_ListQuery":
+            self.calls.append((name, *args, *kwargs.values()))
+            return self
+
+        return record
+
+    async def execute(self) -> _Response:
+        limit = next((call[1] for call in self.calls if call[0] == "limit"), None)
+        return _Response(self.rows[:limit])
+
+
+class _ListClient:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.calls: list[tuple] = []
+
+    def table(self, _name: str) -> _ListQuery:
+        return _ListQuery(self.rows, self.calls)
+
+
+def test_list_page_filters_orders_and_pages_in_the_database() -> None:
+    rows = [
+        {"job_id": f"job-{n}", "status": "completed", "created_at": f"2026-01-0{9 - n}T00:00:00+00:00"}
+        for n in range(3)
+    ]
+    client = _ListClient(rows)
+
+    async def get_client() -> _ListClient:
+        return client
+
+    repo = TrainingJobRepository(get_client=get_client)
+    page = asyncio.run(
+        repo.list_page(
+            limit=2,
+            created_since="2025-01-01T00:00:00",
+            statuses=["completed"],
+            always_include_statuses=("running", "starting"),
+        )
+    )
+
+    assert [job["job_id"] for job in page.jobs] == ["job-0", "job-1"]
+    assert page.next_cursor is not None
+    select = client.calls[0]
+    assert select[0] == "select" and "training_config" not in select[1]
+    assert client.calls[1:] == [
+        ("is_", "deleted_at", "null"),
+        ("in_", "status", ["completed"]),
+        ("or_", 'created_at.gte."2025-01-01T00:00:00",status.in.(running,starting)'),
+        ("order", "created_at", True),
+        ("order", "job_id", True),
+        ("limit", 3),
+    ]
+
+    client.calls.clear()
+    client.rows = rows[2:]
+    last = asyncio.run(repo.list_page(limit=2, cursor=page.next_cursor))
+
+    assert [job["job_id"] for job in last.jobs] == ["job-2"]
+    assert last.next_cursor is None
+    assert (
+        "or_",
+        'created_at.lt."2026-01-08T00:00:00+00:00",'
+        'and(created_at.eq."2026-01-08T00:00:00+00:00",job_id.lt."job-1")',
+    ) in client.calls
+
+
+def test_list_page_rejects_malformed_cursor() -> None:
+    repo = _repository(_FakeDB())
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        asyncio.run(repo.list_page(limit=10, cursor="not-a-cursor"))
@@ -76,7 +76,7 @@ class _DummyCheckpointManager:
 
 class _DummyConn:
     def __init__(self) -> None:
-        self.disconnected = False
+        self.released = False
 
     def exec_command(self, _cmd: str, timeout: int = 0):
         return 0, "", ""
@@ -84,8 +84,8 @@ class _DummyConn:
     def download_directory(self, _remote_path: str, _local_path):
         return None
 
-    def disconnect(self):
-        self.disconnected = True
+    def release(self):
+        self.released = True
 
 
 def _job() -> dict:
@@ -143,7 +143,7 @@ def test_upload_selected_remote_checkpoint_registers_model(monkeypatch):
     assert saved_jobs[-1]["model_size_bytes"] == 1234
     assert upserted and upserted[-1]["model_id"] == "job-1"
     assert any(msg.get("type") == "model_registered" for msg in progress)
-    assert conn.disconnected is True
+    assert conn.released is True
 
 
 def test_upload_selected_remote_checkpoint_reports_db_failure(monkeypatch):
@@ -183,7 +183,7 @@ def test_upload_selected_remote_checkpoint_reports_db_failure(monkeypatch):
     except HTTPException as exc:
         assert exc.status_code == 500
         assert "R2登録は完了しましたが、モデルのDB登録に失敗しました" in str(exc.detail)
-    assert conn.disconnected is True
+    assert conn.released is True
 
 
 def test_upload_selected_remote_checkpoint_skips_r2_reupload_if_step_exists(monkeypatch):
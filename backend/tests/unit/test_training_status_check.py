@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+from interfaces_backend.api import training
+from interfaces_backend.services.training_job_repository import TrainingJobPage
+
+
+class _FakeRealtimeManager:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+
+    def publish_status(self, job_id: str, status: str) -> None:
+        self.published.append((job_id, status))
+
+
+def _jobs() -> list[dict]:
+    return [
+        {"job_id": "job-done", "status": "running", "instance_id": "inst-1", "ip": "10.0.0.1"},
+        {"job_id": "job-preempted", "status": "running", "instance_id": "inst-2", "ip": "10.0.0.2"},
+        {"job_id": "job-deleted", "status": "starting", "instance_id": "inst-3"},
+        {"job_id": "job-training", "status": "running", "instance_id": "inst-4", "ip": "10.0.0.4"},
+        {"job_id": "job-old", "status": "completed", "instance_id": "inst-5"},
+    ]
+
+
+def _patch(monkeypatch, *, remote_delay_s: float = 0.0, instance_statuses=None):
+    saved: list[dict] = []
+    completed: list[str] = []
+    list_calls: list[None] = []
+    remote_threads: set[int] = set()
+    manager = _FakeRealtimeManager()
+
+    async def fake_list_jobs_page(days: int = 365, *, statuses=None, **_kwargs):
+        jobs = [job for job in _jobs() if statuses is None or job["status"] in statuses]
+        return TrainingJobPage(jobs=jobs)
+
+    def fake_fetch_instance_statuses():
+        list_calls.append(None)
+        if instance_statuses is not None:
+            return instance_statuses
+        return {"inst-1": "running", "inst-2": "offline", "inst-4": "running"}
+
+    def fake_check_remote_status(job_data: dict) -> str:
+        remote_threads.add(threading.get_ident())
+        time.sleep(remote_delay_s)
+        return "stopped" if job_data["job_id"] == "job-done" else "running"
+
+    async def fake_save_job(job_data: dict) -> None:
+        saved.append(dict(job_data))
+
+    async def fake_archive(_job_id: str) -> bool:
+        return True
+
+    async def fake_mark_completed(job_id: str, termination_reason: str = "REMOTE_EXIT") -> None:
+        completed.append(job_id)
+
+    monkeypatch.setattr(training, "_list_jobs_page", fake_list_jobs_page)
+    monkeypatch.setattr(training, "_fetch_instance_statuses", fake_fetch_instance_statuses)
+    monkeypatch.setattr(training, "_check_remote_status", fake_check_remote_status)
+    monkeypatch.setattr(training, "_save_job", fake_save_job)
+    monkeypatch.setattr(training, "_archive_job_metrics", fake_archive)
+    monkeypatch.setattr(training, "_mark_job_completed", fake_mark_completed)
+    monkeypatch.setattr(training, "_get_training_job_realtime_manager", lambda: manager)
+    return saved, completed, list_calls, remote_threads, manager
+
+
+def test_reconcile_uses_one_instance_listing_and_pushes_changes(monkeypatch) -> None:
+    saved, completed, list_calls, _threads, manager = _patch(monkeypatch)
+
+    result = asyncio.run(training._reconcile_running_jobs())
+
+    assert len(list_calls) == 1
+    assert result.checked_count == 4
+    assert [(u.job_id, u.new_status) for u in result.updates] == [
+        ("job-done", "completed"),
+        ("job-preempted", "terminated"),
+        ("job-deleted", "terminated"),
+        ("job-training", "running"),
+    ]
+    assert completed == ["job-done"]
+    assert {job["job_id"]: job["termination_reason"] for job in saved} == {
+        "job-preempted": "INSTANCE_TERMINATED",
+        "job-deleted": "INSTANCE_NOT_FOUND",
+    }
+    assert sorted(manager.published) == [
+        ("job-deleted", "terminated"),
+        ("job-done", "completed"),
+        ("job-preempted", "terminated"),
+    ]
+
+
+def test_reconcile_checks_remote_processes_concurrently(monkeypatch) -> None:
+    _saved, _completed, _calls, remote_threads, _manager = _patch(monkeypatch, remote_delay_s=0.3)
+
+    started = time.perf_counter()
+    asyncio.run(training._reconcile_running_jobs())
+    elapsed = time.perf_counter() - started
+
+    assert len(remote_threads) == 2
+    assert elapsed < 0.55
+
+
+def test_reconcile_times_out_slow_jobs(monkeypatch) -> None:
+    _patch(monkeypatch, remote_delay_s=0.3)
+    monkeypatch.setattr(training, "RECONCILE_JOB_TIMEOUT_SEC", 0.05)
+
+    result = asyncio.run(training._reconcile_running_jobs())
+
+    timed_out = {u.job_id: u for u in result.updates if u.reason.startswith("Status check timed out")}
+    assert set(timed_out) == {"job-done", "job-training"}
+    assert all(u.new_status == u.old_status for u in timed_out.values())
+
+
+def test_reconcile_keeps_jobs_when_verda_is_unavailable(monkeypatch) -> None:
+    saved, _completed, _calls, _threads, manager = _patch(monkeypatch)
+    monkeypatch.setattr(training, "_fetch_instance_statuses", lambda: None)
+
+    result = asyncio.run(training._reconcile_running_jobs())
+
+    assert all(u.new_status == u.old_status for u in result.updates)
+    assert saved == []
+    assert manager.published == []
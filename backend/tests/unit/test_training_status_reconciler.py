@@ -0,0 +1,126 @@
+import asyncio
+import os
+
+os.environ.setdefault("COMM_EXPORTER_MODE", "noop")
+
+from interfaces_backend.services.training_status_reconciler import TrainingStatusReconciler
+from percus_ai.db import get_supabase_session, reset_request_session, set_request_session
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reconciler_runs_with_latest_request_session() -> None:
+    sessions: list[object] = []
+
+    async def run_once() -> None:
+        sessions.append(get_supabase_session())
+
+    reconciler = TrainingStatusReconciler(run_once, interval_s=0.01)
+
+    async def main() -> None:
+        token = set_request_session({"user_id": "u1", "access_token": "a"})
+        try:
+            reconciler.ensure_started()
+        finally:
+            reset_request_session(token)
+        await asyncio.sleep(0.035)
+        token = set_request_session({"user_id": "u1", "access_token": "b"})
+        try:
+            reconciler.ensure_started()
+        finally:
+            reset_request_session(token)
+        await asyncio.sleep(0.035)
+        reconciler.stop()
+
+    asyncio.run(main())
+
+    tokens = [session["access_token"] for session in sessions]
+    assert tokens[0] == "a"
+    assert tokens[-1] == "b"
+
+
+def test_reconciler_needs_session_and_stops_when_idle() -> None:
+    clock = _Clock()
+    runs: list[None] = []
+
+    async def run_once() -> None:
+        runs.append(None)
+        clock.now += 10.0
+
+    reconciler = TrainingStatusReconciler(run_once, interval_s=0.01, idle_ttl_s=25.0, clock=clock)
+
+    async def main() -> None:
+        reconciler.ensure_started()
+        assert reconciler.running is False
+
+        token = set_request_session({"user_id": "u1"})
+        try:
+            reconciler.ensure_started()
+        finally:
+            reset_request_session(token)
+        assert reconciler.running is True
+        for _ in range(50):
+            if not reconciler.running:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+
+    assert reconciler.running is False
+    assert len(runs) == 3
+
+
+def test_reconciler_survives_failed_runs() -> None:
+    calls: list[None] = []
+
+    async def run_once() -> None:
+        calls.append(None)
+        raise RuntimeError("verda down")
+
+    reconciler = TrainingStatusReconciler(run_once, interval_s=0.01)
+
+    async def main() -> None:
+        token = set_request_session({"user_id": "u1"})
+        try:
+            reconciler.ensure_started()
+        finally:
+            reset_request_session(token)
+        await asyncio.sleep(0.05)
+        assert reconciler.running is True
+        reconciler.stop()
+
+    asyncio.run(main())
+    assert len(calls) >= 2
+
+
+def test_concurrent_reconciles_share_one_run() -> None:
+    runs: list[None] = []
+    release = asyncio.Event()
+
+    async def run_once() -> int:
+        runs.append(None)
+        await release.wait()
+        return len(runs)
+
+    reconciler = TrainingStatusReconciler(run_once, interval_s=0)
+
+    async def main() -> list[int]:
+        token = set_request_session({"user_id": "u1"})
+        try:
+            callers = [asyncio.ensure_future(reconciler.reconcile()) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+            results.append(await reconciler.reconcile())
+        finally:
+            reset_request_session(token)
+        return results
+
+    assert asyncio.run(main()) == [1, 1, 1, 2]
+    assert len(runs) == 2
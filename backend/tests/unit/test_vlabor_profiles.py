@@ -1,5 +1,11 @@
+import copy
+
 from interfaces_backend.services.vlabor_profiles import (
     build_inference_bridge_config,
+    build_inference_camera_aliases,
+    build_inference_joint_names,
+    compile_profile,
+    extract_arm_namespaces,
     extract_camera_specs,
     extract_recorder_topic_suffixes,
 )
@@ -172,3 +178,54 @@ def test_build_inference_bridge_config_uses_profile_resolution() -> None:
             {"name": "side_camera", "topic": "/side_camera/image_raw/compressed"},
         ],
     }
+
+
+def test_compile_profile_matches_individual_builders_and_is_cached() -> None:
+    snapshot = {
+        "profile": {
+            "teleop": {
+                "topic_mappings": [
+                    {"dst": "/follower_left/joint_ctrl_single"},
+                    {"dst": "/follower_right/joint_ctrl_single"},
+                ]
+            },
+            "lerobot": {
+                "follower_left": {
+                    "namespace": "follower_left",
+                    "topic": "/follower_left/joint_states_single",
+                },
+                "follower_right": {
+                    "namespace": "follower_right",
+                    "topic": "/follower_right/joint_states_single",
+                },
+                "cameras": [
+                    {
+                        "name": "cam_top",
+                        "source": "top_camera",
+                        "topic": "/top_camera/image_raw/compressed",
+                        "enabled": True,
+                    },
+                    {
+                        "name": "cam_side",
+                        "source": "side_camera",
+                        "topic": "/side_camera/image_raw/compressed",
+                        "enabled": True,
+                    },
+                ],
+            },
+        }
+    }
+
+    compiled = compile_profile(snapshot)
+
+    assert compiled.camera_specs == extract_camera_specs(snapshot)
+    assert compiled.arm_namespaces == extract_arm_namespaces(snapshot)
+    assert compiled.recorder_topic_suffixes == extract_recorder_topic_suffixes(snapshot)
+    assert compiled.inference_bridge_config == build_inference_bridge_config(snapshot)
+    assert compiled.inference_joint_names == build_inference_joint_names(snapshot)
+    assert compiled.inference_camera_aliases == build_inference_camera_aliases(snapshot)
+    assert compiled.recorder_cameras == [
+        {"name": "cam_top", "topic": "/top_camera/image_raw/compressed"},
+        {"name": "cam_side", "topic": "/side_camera/image_raw/compressed"},
+    ]
+    assert compile_profile(copy.deepcopy(snapshot)) is compiled
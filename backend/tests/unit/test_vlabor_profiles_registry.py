@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+
+from interfaces_backend.services.vlabor_profiles import VlaborProfileRegistry
+
+
+def _write(path, text: str, *, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+_CAMERA_PROFILE = """
+profile:
+  name: {name}
+  variables:
+    camera_topic: /top_camera/image_raw/compressed
+  lerobot:
+    cameras:
+      - name: cam_top
+        source: top_camera
+        topic: ${{camera_topic}}
+        enabled: ${{camera_enabled}}
+"""
+
+
+def test_registry_reparses_only_changed_files(monkeypatch, tmp_path):
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+    defaults_file = tmp_path / "vlabor_profiles.yaml"
+    _write(profiles_dir / "a.yaml", _CAMERA_PROFILE.format(name="alpha"), mtime_ns=1_000_000_000)
+    _write(profiles_dir / "b.yaml", _CAMERA_PROFILE.format(name="beta"), mtime_ns=1_000_000_000)
+    _write(defaults_file, "defaults:\n  camera_enabled: 'true'\n", mtime_ns=1_000_000_000)
+    monkeypatch.setenv("VLABOR_PROFILES_DIR", str(profiles_dir))
+    monkeypatch.setenv("VLABOR_DEFAULTS_FILE", str(defaults_file))
+
+    registry = VlaborProfileRegistry(watch=False)
+    alpha, beta = registry.profiles()
+    assert [alpha.name, beta.name] == ["alpha", "beta"]
+    assert registry.get("beta") is beta
+
+    compiled = registry.compiled(alpha)
+    assert compiled is not None
+    assert compiled.camera_specs[0]["enabled"] is True
+    assert registry.compiled(alpha) is compiled
+
+    _write(profiles_dir / "b.yaml", _CAMERA_PROFILE.format(name="beta2"), mtime_ns=2_000_000_000)
+    alpha_again, beta_again = registry.profiles()
+    assert alpha_again is alpha
+    assert beta_again.name == "beta2"
+    assert registry.get("beta") is None
+    assert registry.compiled(beta) is None
+
+    _write(defaults_file, "defaults:\n  camera_enabled: 'false'\n", mtime_ns=2_000_000_000)
+    assert registry.default_settings() == {"camera_enabled": "false"}
+    assert registry.profiles()[0] is alpha
+    refreshed = registry.compiled(alpha)
+    assert refreshed is not compiled
+    assert refreshed.camera_specs[0]["enabled"] is False
@@ -1,3 +1,5 @@
+import asyncio
+
 import interfaces_backend.services.vlabor_runtime as vlabor_runtime
 
 
@@ -5,23 +7,33 @@ def test_start_vlabor_invokes_up_script_with_profile(tmp_path, monkeypatch):
     repo_root = tmp_path
     script = repo_root / "docker" / "vlabor" / "up"
     script.parent.mkdir(parents=True, exist_ok=True)
-    script.write_text("#!/bin/bash\nexit 0\n", encoding="utf-8")
+    script.write_text('#!/bin/bash\necho "$(pwd) $*"\n', encoding="utf-8")
     script.chmod(0o755)
 
-    calls: dict[str, object] = {}
+    monkeypatch.setattr(vlabor_runtime, "get_project_root", lambda: repo_root)
+
+    result = asyncio.run(vlabor_runtime.start_vlabor(profile="so101_dual_teleop", domain_id=3))
 
-    def fake_run(cmd, **kwargs):
-        calls["cmd"] = cmd
-        calls["cwd"] = kwargs.get("cwd")
-        return vlabor_runtime.subprocess.CompletedProcess(cmd, 0, "", "")
+    assert result.args == [str(script), "so101_dual_teleop", "--domain-id", "3"]
+    assert result.stdout.strip() == f"{repo_root} so101_dual_teleop --domain-id 3"
 
-    monkeypatch.setattr(vlabor_runtime, "get_project_root", lambda: repo_root)
-    monkeypatch.setattr(vlabor_runtime.subprocess, "run", fake_run)
 
-    vlabor_runtime.start_vlabor(profile="so101_dual_teleop", domain_id=3)
+def test_stream_vlabor_script_yields_last_progress_segment(tmp_path, monkeypatch):
+    script = tmp_path / "docker" / "vlabor" / "restart"
+    script.parent.mkdir(parents=True, exist_ok=True)
+    script.write_text("#!/bin/bash\nprintf 'pull 10%%\\rpull 100%%\\n'\necho done >&2\nexit 3\n", encoding="utf-8")
+    script.chmod(0o755)
+
+    monkeypatch.setattr(vlabor_runtime, "get_project_root", lambda: tmp_path)
+
+    async def collect() -> list[dict[str, str]]:
+        return [event async for event in vlabor_runtime.stream_vlabor_script("restart")]
 
-    assert calls["cmd"] == [str(script), "so101_dual_teleop", "--domain-id", "3"]
-    assert calls["cwd"] == repo_root
+    assert asyncio.run(collect()) == [
+        {"type": "log", "line": "pull 100%"},
+        {"type": "log", "line": "done"},
+        {"type": "complete", "exit_code": "3"},
+    ]
 
 
 def test_stop_vlabor_on_backend_startup_skips_without_docker(monkeypatch):
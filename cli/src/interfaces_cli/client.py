@@ -882,9 +882,25 @@ class PhiClient:
 
         return results
 
-    def list_training_jobs(self) -> Dict[str, Any]:
-        """GET /api/training/jobs - List training jobs."""
-        response = self._client.get("/api/training/jobs")
+    def list_training_jobs(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """GET /api/training/jobs - List training jobs, newest first.
+
+        With ``limit`` the response is one page; pass its ``next_cursor`` as
+        ``cursor`` to fetch the next one (``None`` on the last page).
+        """
+        params: Dict[str, Any] = {}
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+        if status:
+            params["status"] = status
+        response = self._client.get("/api/training/jobs", params=params or None)
         response.raise_for_status()
         return response.json()
 
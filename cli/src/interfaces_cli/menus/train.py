@@ -2717,13 +2717,29 @@ class TrainingJobsMenu(BaseMenu):
     """View and manage training jobs."""
 
     title = "学習ジョブ"
+    PAGE_SIZE = 15
+
+    def __init__(self, app: "PhiApplication"):
+        super().__init__(app)
+        self._jobs: List[dict] = []
+        self._next_cursor: Optional[str] = None
+        self._load_more = False
+
+    def _load_jobs(self) -> None:
+        """Reload the first page, or append the next one after "more"."""
+        cursor = self._next_cursor if self._load_more else None
+        self._load_more = False
+        result = self.api.list_training_jobs(limit=self.PAGE_SIZE, cursor=cursor)
+        if cursor is None:
+            self._jobs = []
+        self._jobs.extend(result.get("jobs", []))
+        self._next_cursor = result.get("next_cursor")
 
     def get_choices(self) -> List[Choice]:
         choices = []
         try:
-            result = self.api.list_training_jobs()
-            jobs = result.get("jobs", [])
-            for job in jobs[:15]:
+            self._load_jobs()
+            for job in self._jobs:
                 job_id = job.get("job_id", "unknown")
                 job_name = job.get("job_name") or job_id
                 status = job.get("status", "unknown")
@@ -2748,6 +2764,8 @@ class TrainingJobsMenu(BaseMenu):
 
         if not choices:
             choices.append(Choice(value="__none__", name="(学習ジョブなし)"))
+        elif self._next_cursor:
+            choices.append(Choice(value="__more__", name="▼ さらに表示"))
 
         choices.append(Choice(value="__refresh__", name="🔄 更新"))
         choices.append(Choice(value="__check_all__", name="📊 全ステータス確認"))
@@ -2815,6 +2833,9 @@ class TrainingJobsMenu(BaseMenu):
             return MenuResult.BACK
         if choice == "__refresh__":
             return MenuResult.CONTINUE
+        if choice == "__more__":
+            self._load_more = True
+            return MenuResult.CONTINUE
         if choice == "__check_all__":
             return self._check_all_status()
 
@@ -83,7 +83,7 @@ export type StartupOperationAcceptedResponse = {
 
 export type StartupOperationStatusResponse = {
   operation_id: string;
-  kind: 'inference_start' | 'recording_create';
+  kind: 'inference_start' | 'recording_create' | 'service_bringup';
   state: 'queued' | 'running' | 'completed' | 'failed';
   phase?: string;
   progress_percent?: number;
@@ -0,0 +1,124 @@
+import { browser } from '$app/environment';
+import { getBackendUrl } from '$lib/config';
+
+type ChannelOptions<T> = {
+  topic: string;
+  key?: string;
+  onMessage: (payload: T) => void;
+  onError?: (event: Event) => void;
+};
+
+type ChannelMessage = {
+  topic: string;
+  key: string;
+  seq: number;
+  id: string;
+  payload: unknown;
+};
+
+type ChannelState = {
+  topic: string;
+  key: string;
+  listeners: Set<(payload: unknown) => void>;
+  errorListeners: Set<(event: Event) => void>;
+  lastEventId?: string;
+  payload?: unknown;
+};
+
+// All channels of the page share one EventSource to /api/stream/mux.
+const channels = new Map<string, ChannelState>();
+let source: EventSource | null = null;
+let connectionId: string | null = null;
+
+const channelName = (topic: string, key: string) => `${topic}/${key}`;
+
+const channelsUrl = (id: string) => new URL(`/api/stream/mux/${encodeURIComponent(id)}/channels`, getBackendUrl());
+
+const subscribeRemote = (state: ChannelState) => {
+  if (!connectionId) return;
+  void fetch(channelsUrl(connectionId), {
+    method: 'POST',
+    credentials: 'include',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ topic: state.topic, key: state.key, last_event_id: state.lastEventId ?? null })
+  }).catch(() => {
+    // the next hello (after reconnect) subscribes again
+  });
+};
+
+const unsubscribeRemote = (state: ChannelState) => {
+  if (!connectionId) return;
+  const url = channelsUrl(connectionId);
+  url.searchParams.set('topic', state.topic);
+  url.searchParams.set('key', state.key);
+  void fetch(url, { method: 'DELETE', credentials: 'include' }).catch(() => {});
+};
+
+const ensureSource = () => {
+  if (source) return;
+  source = new EventSource(new URL('/api/stream/mux', getBackendUrl()).toString(), { withCredentials: true });
+
+  // Sent on every (re)connect: subscribe all channels, resuming from their last event.
+  source.addEventListener('hello', (event: MessageEvent<string>) => {
+    try {
+      connectionId = (JSON.parse(event.data) as { connection_id: string }).connection_id;
+    } catch {
+      return;
+    }
+    for (const state of channels.values()) subscribeRemote(state);
+  });
+
+  source.addEventListener('message', (event: MessageEvent<string>) => {
+    if (!event.data) return;
+    let message: ChannelMessage;
+    try {
+      message = JSON.parse(event.data) as ChannelMessage;
+    } catch {
+      return;
+    }
+    const state = channels.get(channelName(message.topic, message.key));
+    if (!state) return;
+    state.lastEventId = message.id;
+    state.payload = message.payload;
+    for (const listener of state.listeners) listener(message.payload);
+  });
+
+  source.onerror = (event) => {
+    connectionId = null;
+    for (const state of channels.values()) {
+      for (const listener of state.errorListeners) listener(event);
+    }
+  };
+};
+
+export const connectChannel = <T>({ topic, key = 'global', onMessage, onError }: ChannelOptions<T>) => {
+  if (!browser) return () => {};
+
+  const name = channelName(topic, key);
+  const listener = (payload: unknown) => onMessage(payload as T);
+  let state = channels.get(name);
+  if (!state) {
+    state = { topic, key, listeners: new Set(), errorListeners: new Set() };
+    channels.set(name, state);
+    ensureSource();
+    subscribeRemote(state);
+  } else if (state.payload !== undefined) {
+    listener(state.payload);
+  }
+  state.listeners.add(listener);
+  if (onError) state.errorListeners.add(onError);
+
+  const current = state;
+  return () => {
+    current.listeners.delete(listener);
+    if (onError) current.errorListeners.delete(onError);
+    if (current.listeners.size > 0) return;
+    channels.delete(name);
+    unsubscribeRemote(current);
+    if (channels.size === 0) {
+      source?.close();
+      source = null;
+      connectionId = null;
+    }
+  };
+};
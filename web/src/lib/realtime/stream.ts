@@ -1,5 +1,6 @@
 import { browser } from '$app/environment';
 import { getBackendUrl } from '$lib/config';
+import { connectChannel } from '$lib/realtime/mux';
 
 type StreamOptions<T> = {
   path: string;
@@ -7,24 +8,120 @@ type StreamOptions<T> = {
   onError?: (event: Event) => void;
 };
 
+type PatchOperation = {
+  op: 'add' | 'remove' | 'replace';
+  path: string;
+  value?: unknown;
+};
+
+const unescapeToken = (token: string) => token.replace(/~1/g, '/').replace(/~0/g, '~');
+
+// Applies the JSON Patch subset produced by the backend (utils/json_patch.py).
+const applyPatch = (document: unknown, patch: PatchOperation[]): unknown => {
+  let root = structuredClone(document);
+  for (const operation of patch) {
+    if (operation.path === '') {
+      root = operation.value;
+      continue;
+    }
+    const tokens = operation.path.split('/').slice(1).map(unescapeToken);
+    const last = tokens.pop() as string;
+    let target = root as Record<string, unknown> | unknown[];
+    for (const token of tokens) {
+      target = (Array.isArray(target) ? target[Number(token)] : target[token]) as typeof target;
+    }
+    if (Array.isArray(target)) {
+      if (operation.op === 'remove') target.splice(Number(last), 1);
+      else if (last === '-') target.push(operation.value);
+      else if (operation.op === 'add') target.splice(Number(last), 0, operation.value);
+      else target[Number(last)] = operation.value;
+    } else if (operation.op === 'remove') {
+      delete target[last];
+    } else {
+      target[last] = operation.value;
+    }
+  }
+  return root;
+};
+
+type Channel = { topic: string; key: string };
+
+const segment = (value: string) => decodeURIComponent(value);
+
+// Stream routes served over the shared multiplexed connection. Training job
+// streams keep their own connection because they benefit from delta frames.
+const MUX_ROUTES: [RegExp, (match: RegExpMatchArray) => Channel][] = [
+  [/^\/api\/stream\/profiles\/active$/, () => ({ topic: 'profiles.active', key: 'global' })],
+  [/^\/api\/stream\/profiles\/vlabor$/, () => ({ topic: 'profiles.vlabor', key: 'global' })],
+  [/^\/api\/stream\/operate\/status$/, () => ({ topic: 'operate.status', key: 'global' })],
+  [
+    /^\/api\/stream\/recording\/sessions\/([^/]+)\/upload-status$/,
+    (match) => ({ topic: 'recording.upload', key: segment(match[1]) })
+  ],
+  [
+    /^\/api\/stream\/recording\/sessions\/([^/]+)$/,
+    (match) => ({ topic: 'recording.session_status', key: segment(match[1]) })
+  ],
+  [
+    /^\/api\/stream\/startup\/operations\/([^/]+)$/,
+    (match) => ({ topic: 'startup.operation', key: segment(match[1]) })
+  ],
+  [
+    /^\/api\/stream\/storage\/model-sync\/jobs\/([^/]+)$/,
+    (match) => ({ topic: 'storage.model_sync.job', key: segment(match[1]) })
+  ],
+  [
+    /^\/api\/stream\/sessions\/([^/]+)\/([^/]+)\/events$/,
+    (match) => ({
+      topic: 'session.control',
+      key: `${segment(match[1]).toLowerCase()}:${segment(match[2]).trim() || 'global'}`
+    })
+  ]
+];
+
+const muxChannelForPath = (path: string): Channel | null => {
+  for (const [pattern, toChannel] of MUX_ROUTES) {
+    const match = path.match(pattern);
+    if (match) return toChannel(match);
+  }
+  return null;
+};
+
 export const connectStream = <T>({ path, onMessage, onError }: StreamOptions<T>) => {
   if (!browser) return () => {};
 
+  const channel = muxChannelForPath(path);
+  if (channel) return connectChannel<T>({ ...channel, onMessage, onError });
+
   const baseUrl = getBackendUrl();
   const url = new URL(path, baseUrl);
+  url.searchParams.set('delta', '1');
   const source = new EventSource(url.toString(), { withCredentials: true });
+  // Deltas apply to the last payload; on reconnect the browser sends Last-Event-ID for it.
+  let current: unknown = undefined;
 
   const handleMessage = (event: MessageEvent<string>) => {
     if (!event.data) return;
     try {
-      const payload = JSON.parse(event.data) as T;
-      onMessage(payload);
+      current = JSON.parse(event.data);
+      onMessage(current as T);
     } catch {
       // ignore parse errors
     }
   };
 
+  const handleDelta = (event: MessageEvent<string>) => {
+    if (!event.data || current === undefined) return;
+    try {
+      current = applyPatch(current, JSON.parse(event.data) as PatchOperation[]);
+      onMessage(current as T);
+    } catch {
+      // ignore malformed deltas
+    }
+  };
+
   source.addEventListener('message', handleMessage);
+  source.addEventListener('delta', handleDelta);
 
   source.onerror = (event) => {
     onError?.(event);
@@ -32,6 +129,7 @@ export const connectStream = <T>({ path, onMessage, onError }: StreamOptions<T>)
 
   return () => {
     source.removeEventListener('message', handleMessage);
+    source.removeEventListener('delta', handleDelta);
     source.close();
   };
 };